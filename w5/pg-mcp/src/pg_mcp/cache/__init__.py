@@ -1,11 +1,18 @@
-"""Caching layer for database schemas.
+"""Caching layer for database schemas, generated SQL and query results.
 
 This package provides caching functionality to improve performance by
-reducing repeated schema introspection queries.
+reducing repeated schema introspection queries, LLM round trips and query
+executions.
 """
 
+from pg_mcp.cache.query_cache import QueryCache
+from pg_mcp.cache.result_cache import ResultCache
 from pg_mcp.cache.schema_cache import SchemaCache
+from pg_mcp.cache.snapshot import SchemaSnapshotStore
 
 __all__ = [
+    "QueryCache",
+    "ResultCache",
     "SchemaCache",
+    "SchemaSnapshotStore",
 ]
@@ -0,0 +1,222 @@
+"""Question-to-SQL answer cache.
+
+This module caches validated SQL per question so that repeated questions are
+answered without an LLM round trip. Entries are keyed by database, schema
+definition fingerprint and a normalised form of the question, so a schema
+change makes every answer generated against the previous version unreachable;
+those entries are purged the first time the new version is seen.
+"""
+
+import logging
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from pg_mcp.config.settings import QueryCacheConfig
+from pg_mcp.models.query import ValidationResult
+from pg_mcp.models.schema import DatabaseSchema
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_question(question: str) -> str:
+    """Fold a question into its cache key form.
+
+    Case is folded, punctuation is replaced by whitespace and runs of
+    whitespace are collapsed, so ``"How many users?"`` and
+    ``"how  many users"`` share an entry.
+
+    Args:
+        question: Natural language question.
+
+    Returns:
+        str: Normalised question.
+
+    Example:
+        >>> normalize_question("  How many USERS signed up, today? ")
+        'how many users signed up today'
+    """
+    folded = "".join(
+        " " if unicodedata.category(char).startswith("P") else char for char in question.casefold()
+    )
+    return " ".join(folded.split())
+
+
+class CachedAnswer(BaseModel):
+    """Validated SQL stored for a question."""
+
+    sql: str = Field(..., description="Validated SQL query")
+    validation: ValidationResult = Field(..., description="Validation result of the SQL")
+    created_at: float = Field(..., description="Monotonic time the answer was stored")
+
+
+class QueryCache:
+    """Bounded LRU + TTL cache of validated SQL answers.
+
+    Example:
+        >>> cache = QueryCache(QueryCacheConfig())
+        >>> answer = cache.get("mydb", schema, "How many users?")
+        >>> if answer is None:
+        ...     sql, validation, _ = await generate(...)
+        ...     cache.put("mydb", schema, "How many users?", sql, validation)
+    """
+
+    def __init__(self, config: QueryCacheConfig):
+        """Initialize answer cache.
+
+        Args:
+            config: Answer cache configuration.
+        """
+        self.config = config
+        self._entries: OrderedDict[tuple[str, str, str], CachedAnswer] = OrderedDict()
+        # Last seen schema object and its fingerprint per database; the schema
+        # cache publishes a new object per version, so identity is a cheap
+        # change check before hashing the definition.
+        self._versions: dict[str, tuple[DatabaseSchema, str]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, database: str, schema: DatabaseSchema, question: str) -> CachedAnswer | None:
+        """Look up the answer for a question.
+
+        Args:
+            database: Database name.
+            schema: Current schema of the database.
+            question: Natural language question.
+
+        Returns:
+            CachedAnswer | None: Cached answer, or None on a miss or if the
+                entry has expired.
+        """
+        key = (database, self._schema_version(database, schema), normalize_question(question))
+        entry = self._entries.get(key)
+
+        if entry is not None and time.monotonic() - entry.created_at >= self.config.ttl:
+            del self._entries[key]
+            self._expirations += 1
+            entry = None
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def put(
+        self,
+        database: str,
+        schema: DatabaseSchema,
+        question: str,
+        sql: str,
+        validation: ValidationResult,
+    ) -> None:
+        """Store the validated SQL for a question.
+
+        Args:
+            database: Database name.
+            schema: Schema the SQL was generated against.
+            question: Natural language question.
+            sql: Validated SQL query.
+            validation: Validation result of the SQL.
+        """
+        key = (database, self._schema_version(database, schema), normalize_question(question))
+        self._entries[key] = CachedAnswer(
+            sql=sql, validation=validation, created_at=time.monotonic()
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.config.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, database: str | None = None) -> int:
+        """Remove cached answers.
+
+        Args:
+            database: Database whose answers to remove. If None, all answers
+                are removed.
+
+        Returns:
+            int: Number of removed answers.
+        """
+        if database is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._versions.clear()
+        else:
+            removed = self._purge(lambda key: key[0] == database)
+            self._versions.pop(database, None)
+        self._invalidations += removed
+        return removed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with size, hit, miss, eviction, expiration and
+            invalidation counters and the hit rate.
+
+        Example:
+            >>> print(cache.get_stats()["hit_rate"])
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.config.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "invalidations": self._invalidations,
+        }
+
+    def _schema_version(self, database: str, schema: DatabaseSchema) -> str:
+        """Get the schema fingerprint, purging answers for older versions.
+
+        Args:
+            database: Database name.
+            schema: Current schema of the database.
+
+        Returns:
+            str: Schema definition fingerprint.
+        """
+        known = self._versions.get(database)
+        if known is not None and known[0] is schema:
+            return known[1]
+
+        fingerprint = schema.definition_fingerprint()
+        self._versions[database] = (schema, fingerprint)
+
+        if known is not None and known[1] != fingerprint:
+            removed = self._purge(lambda key: key[0] == database and key[1] != fingerprint)
+            self._invalidations += removed
+            logger.info(
+                "Schema changed, invalidated cached answers",
+                extra={"database": database, "invalidated": removed},
+            )
+
+        return fingerprint
+
+    def _purge(self, predicate: Callable[[tuple[str, str, str]], bool]) -> int:
+        """Remove every entry whose key matches a predicate.
+
+        Args:
+            predicate: Function called with each entry key.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
@@ -0,0 +1,345 @@
+"""Executed-result cache.
+
+This module caches the rows returned by generated SQL so that repeated
+queries, e.g. from dashboards polling the same question, are answered
+without touching the database. Entries are keyed by database and normalised
+SQL, bounded by a memory budget with LRU eviction, and tagged with the tables
+they read.
+
+Invalidation is table-aware: every tag records a version of its table built
+from ``pg_stat_user_tables`` insert/update/delete counters and the table's
+relfilenode (which changes on TRUNCATE). Once ``max_staleness`` seconds have
+passed since the last check, the next lookup re-reads the versions of every
+tagged table in one query and drops the entries whose tables changed.
+
+Note that PostgreSQL publishes table statistics asynchronously: writing
+backends flush their counters when a transaction ends, but no more often than
+once per second and, under contention, up to a minute later. Results can
+therefore be up to ``max_staleness`` plus that flush delay out of date, which
+is why the cache is opt-in. Queries reading views, foreign tables, system
+catalogs or no tables at all are never cached, nor are queries whose result
+changes without any table changing (``now()``, ``random()``, ``nextval()``).
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+import asyncpg
+from asyncpg import Pool
+from pydantic import BaseModel, Field
+from pydantic_core import to_json
+
+from pg_mcp.config.settings import ResultCacheConfig
+from pg_mcp.models.query import ExecutionResult
+
+logger = logging.getLogger(__name__)
+
+# One row per referenced relation name, matched case-insensitively because
+# SQLValidator.extract_tables lowercases names. A name is trackable only if
+# every relation carrying it is an ordinary or partitioned user table; its
+# version covers those tables and, when partitioned, every leaf partition.
+# Names that are not relations at all (CTE aliases, set-returning functions)
+# return no row.
+TABLE_VERSIONS_QUERY = """
+    SELECT
+        lower(c.relname) AS table_name,
+        bool_and(
+            c.relkind IN ('r', 'p')
+            AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+        ) AS trackable,
+        string_agg(
+            coalesce(pg_relation_filenode(leaf.oid)::text, '') || ':'
+            || coalesce((s.n_tup_ins + s.n_tup_upd + s.n_tup_del)::text, ''),
+            ',' ORDER BY leaf.oid
+        ) AS version
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    CROSS JOIN LATERAL (
+        SELECT c.oid
+        UNION ALL
+        SELECT t.relid FROM pg_partition_tree(c.oid) AS t
+        WHERE c.relkind = 'p' AND t.isleaf
+    ) AS leaf (oid)
+    LEFT JOIN pg_stat_user_tables s ON s.relid = leaf.oid
+    WHERE lower(c.relname) = ANY($1::text[])
+      AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+    GROUP BY lower(c.relname)
+"""
+
+_STAT_KEYS = (
+    "hits",
+    "misses",
+    "uncacheable",
+    "evictions",
+    "invalidations",
+    "polls",
+    "poll_failures",
+)
+
+ExecuteFn = Callable[[], Awaitable[ExecutionResult]]
+
+
+class CachedResult(BaseModel):
+    """Execution result stored for a normalised SQL query."""
+
+    result: ExecutionResult = Field(..., description="Result reported by the executor")
+    table_versions: dict[str, str] = Field(
+        ..., description="Version of each table read by the query at execution time"
+    )
+    size_bytes: int = Field(..., description="Serialized size of the rows")
+
+
+class ResultCache:
+    """Memory-bounded LRU cache of query results with table-aware invalidation.
+
+    Example:
+        >>> cache = ResultCache(ResultCacheConfig(enabled=True))
+        >>> result = await cache.get_or_execute(
+        ...     "mydb",
+        ...     pool,
+        ...     validator.normalize_sql(sql),
+        ...     validator.extract_tables(sql),
+        ...     lambda: executor.execute(sql),
+        ... )
+    """
+
+    def __init__(self, config: ResultCacheConfig):
+        """Initialize result cache.
+
+        Args:
+            config: Result cache configuration.
+        """
+        self.config = config
+        self._entries: OrderedDict[tuple[str, str], CachedResult] = OrderedDict()
+        self._bytes = 0
+        # (database, table) -> keys of the entries that read the table
+        self._tagged: dict[tuple[str, str], set[tuple[str, str]]] = defaultdict(set)
+        self._checked_at: dict[str, float] = {}
+        self._poll_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._stats = dict.fromkeys(_STAT_KEYS, 0)
+
+    async def get_or_execute(
+        self,
+        database: str,
+        pool: Pool,
+        sql_key: str,
+        tables: Iterable[str],
+        execute: ExecuteFn,
+        cacheable: bool = True,
+    ) -> ExecutionResult:
+        """Return the cached result of a query, or execute it and cache it.
+
+        Args:
+            database: Database name.
+            pool: Connection pool of the database, used to read table versions.
+            sql_key: Normalised SQL of the query.
+            tables: Names of the tables the query reads.
+            execute: Coroutine function executing the query and returning its
+                ExecutionResult. Not called on a hit.
+            cacheable: False when the result of the query can change while
+                its tables do not, e.g. it reads the clock. Such queries are
+                always executed and counted as uncacheable.
+
+        Returns:
+            ExecutionResult: Result of the query. Cached results are shared
+                between hits and must not be mutated.
+
+        Raises:
+            Exception: Whatever ``execute`` raises.
+        """
+        if not cacheable:
+            self._stats["misses"] += 1
+            self._stats["uncacheable"] += 1
+            return await execute()
+
+        key = (database, sql_key)
+        if key in self._entries:
+            await self._revalidate(database, pool)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                logger.debug("Result cache hit", extra={"database": database})
+                return entry.result
+
+        self._stats["misses"] += 1
+
+        # Read versions before executing so a concurrent write is never
+        # attributed to the cached rows.
+        versions = await self._table_versions(pool, tables)
+        result = await execute()
+
+        if versions is None:
+            self._stats["uncacheable"] += 1
+        else:
+            self._store(key, result, versions)
+
+        return result
+
+    def invalidate(self, database: str | None = None) -> int:
+        """Remove cached results.
+
+        Args:
+            database: Database whose results to remove. If None, all results
+                are removed.
+
+        Returns:
+            int: Number of removed results.
+        """
+        keys = [key for key in self._entries if database is None or key[0] == database]
+        for key in keys:
+            self._remove(key)
+        self._stats["invalidations"] += len(keys)
+        return len(keys)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, memory use and budget, hit rate and
+            hit, miss, uncacheable, eviction, invalidation and poll counters.
+
+        Example:
+            >>> print(cache.get_stats()["bytes"])
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.config.max_bytes,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            **self._stats,
+        }
+
+    async def _revalidate(self, database: str, pool: Pool) -> None:
+        """Drop entries whose tables changed, if the last check is too old.
+
+        Args:
+            database: Database name.
+            pool: Connection pool of the database.
+        """
+        if time.monotonic() - self._checked_at.get(database, 0.0) < self.config.max_staleness:
+            return
+
+        async with self._poll_locks[database]:
+            # Another request may have polled while we waited for the lock
+            checked_at = time.monotonic()
+            if checked_at - self._checked_at.get(database, 0.0) < self.config.max_staleness:
+                return
+
+            tables = sorted({table for db, table in self._tagged if db == database})
+            try:
+                async with pool.acquire() as conn:
+                    rows = await conn.fetch(TABLE_VERSIONS_QUERY, tables)
+            except (asyncpg.PostgresError, OSError) as e:
+                self._stats["poll_failures"] += 1
+                removed = self.invalidate(database)
+                logger.warning(
+                    "Failed to check table versions, dropped cached results",
+                    extra={"database": database, "removed": removed, "error": str(e)},
+                )
+                return
+
+            self._stats["polls"] += 1
+            self._checked_at[database] = checked_at
+            current = {row["table_name"]: row["version"] for row in rows}
+
+            stale: set[tuple[str, str]] = set()
+            for table in tables:
+                for key in self._tagged.get((database, table), ()):
+                    if self._entries[key].table_versions[table] != current.get(table):
+                        stale.add(key)
+
+            for key in stale:
+                self._remove(key)
+            self._stats["invalidations"] += len(stale)
+
+            if stale:
+                logger.debug(
+                    "Invalidated cached results for changed tables",
+                    extra={"database": database, "removed": len(stale)},
+                )
+
+    async def _table_versions(self, pool: Pool, tables: Iterable[str]) -> dict[str, str] | None:
+        """Read the current version of every table a query reads.
+
+        Args:
+            pool: Connection pool of the database.
+            tables: Names of the tables the query reads.
+
+        Returns:
+            dict | None: Version per table, or None if the query reads an
+                untrackable relation or no table at all, or the versions could
+                not be read.
+        """
+        names = sorted(set(tables))
+        if not names:
+            return None
+
+        try:
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(TABLE_VERSIONS_QUERY, names)
+        except (asyncpg.PostgresError, OSError) as e:
+            self._stats["poll_failures"] += 1
+            logger.warning("Failed to read table versions", extra={"error": str(e)})
+            return None
+
+        if not rows or not all(row["trackable"] for row in rows):
+            return None
+        return {row["table_name"]: row["version"] for row in rows}
+
+    def _store(
+        self,
+        key: tuple[str, str],
+        result: ExecutionResult,
+        versions: dict[str, str],
+    ) -> None:
+        """Add an entry, evicting least recently used entries over budget.
+
+        Args:
+            key: (database, normalised SQL) cache key.
+            result: Result reported by the executor.
+            versions: Version of each table read by the query.
+        """
+        size = len(to_json(result.rows, fallback=str))
+        if size > self.config.max_bytes:
+            self._stats["uncacheable"] += 1
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        database = key[0]
+        # The result comes straight from the executor; skip re-validating it
+        self._entries[key] = CachedResult.model_construct(
+            result=result, table_versions=versions, size_bytes=size
+        )
+        self._bytes += size
+        for table in versions:
+            self._tagged[(database, table)].add(key)
+        # The versions were read just now, so the entry is fresh even if the
+        # database has not been polled yet.
+        self._checked_at.setdefault(database, time.monotonic())
+
+        while self._bytes > self.config.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._stats["evictions"] += 1
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        """Remove an entry and its table tags.
+
+        Args:
+            key: (database, normalised SQL) cache key.
+        """
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size_bytes
+        for table in entry.table_versions:
+            tag = (key[0], table)
+            keys = self._tagged[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tagged[tag]
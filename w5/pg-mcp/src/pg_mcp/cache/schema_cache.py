@@ -2,27 +2,63 @@
 
 This module provides caching functionality for database schemas to avoid
 repeated introspection queries and improve performance.
+
+Refreshes are incremental: cached relations carry a catalog fingerprint, and
+a refresh re-introspects only the relations whose fingerprint was added,
+dropped or changed, patching the cached schema in place of a full reload.
+
+Loads are single-flight: concurrent loads or refreshes of the same database
+share one in-flight introspection task. With ``stale_while_revalidate``
+enabled, an expired schema keeps being served while one background task
+reloads it, instead of every request blocking on its own introspection.
+
+When ``snapshot_dir`` is configured, every loaded schema is also persisted to
+disk, and ``restore_snapshot`` lets a restarted server start serving from that
+snapshot while validating it against the catalog in the background.
 """
 
 import asyncio
 import contextlib
 import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
 from asyncpg import Pool
 
+from pg_mcp.cache.snapshot import SchemaSnapshotStore
 from pg_mcp.config.settings import CacheConfig
 from pg_mcp.db.introspection import SchemaIntrospector
 from pg_mcp.models.schema import DatabaseSchema
 
+if TYPE_CHECKING:
+    from pg_mcp.observability.metrics import MetricsCollector
+
 logger = logging.getLogger(__name__)
 
+# Minimum delay in seconds before retrying a failed background revalidation
+REVALIDATION_RETRY_SECONDS = 30.0
+
+_STAT_KEYS = (
+    "hits",
+    "misses",
+    "stale_hits",
+    "loads",
+    "coalesced_loads",
+    "revalidations",
+    "revalidation_failures",
+    "snapshot_restores",
+)
+
 
 class SchemaCache:
     """Schema cache manager with TTL and auto-refresh capabilities.
 
     This class manages cached database schemas with configurable TTL and
-    supports automatic background refresh.
+    supports automatic background refresh, single-flight loading and
+    stale-while-revalidate serving.
 
     Attributes:
         config: Cache configuration.
@@ -34,27 +70,44 @@ class SchemaCache:
         >>> await cache.start_auto_refresh(60, pools)  # Refresh every 60 minutes
     """
 
-    def __init__(self, config: CacheConfig):
+    def __init__(self, config: CacheConfig, metrics: "MetricsCollector | None" = None):
         """Initialize schema cache.
 
         Args:
             config: Cache configuration with TTL and size limits.
+            metrics: Optional metrics collector receiving the per-database
+                hit, miss, load, coalesced load and revalidation counters.
         """
         self.config = config
+        self.metrics = metrics
         self._cache: dict[str, DatabaseSchema] = {}
         self._cache_timestamps: dict[str, datetime] = {}
         self._refresh_task: asyncio.Task[None] | None = None
         self._stop_refresh = False
+        # Pools seen by load()/refresh(), used for background revalidation
+        self._pools: dict[str, Pool] = {}
+        self._inflight: dict[str, asyncio.Task[DatabaseSchema]] = {}
+        self._revalidation_failed_at: dict[str, float] = {}
+        # Databases served from a snapshot that is still being revalidated
+        self._restored: set[str] = set()
+        self._stats: dict[str, dict[str, int]] = defaultdict(lambda: dict.fromkeys(_STAT_KEYS, 0))
+        self._snapshots = (
+            SchemaSnapshotStore(config.snapshot_dir) if config.snapshot_dir is not None else None
+        )
 
     def get(self, database_name: str) -> DatabaseSchema | None:
         """Get cached schema if available and not expired.
 
+        With ``stale_while_revalidate`` enabled, an expired schema that is at
+        most ``max_stale_age`` seconds past its TTL is still returned, and a
+        single background reload is started if none is already running.
+
         Args:
             database_name: Name of the database.
 
         Returns:
-            DatabaseSchema | None: Cached schema if available and valid,
-                None otherwise.
+            DatabaseSchema | None: Cached schema if available and valid
+                (or servable while stale), None otherwise.
 
         Example:
             >>> schema = cache.get("mydb")
@@ -65,17 +118,31 @@ class SchemaCache:
             return None
 
         if database_name not in self._cache:
+            self._count(database_name, "misses")
             return None
 
         # Check if cache is expired
         cache_age = self.get_cache_age(database_name)
-        if cache_age is None or cache_age > self.config.schema_ttl:
-            # Cache expired, remove it
-            self._cache.pop(database_name, None)
-            self._cache_timestamps.pop(database_name, None)
-            return None
-
-        return self._cache[database_name]
+        if (
+            cache_age is not None and cache_age <= self.config.schema_ttl
+        ) or database_name in self._restored:
+            self._count(database_name, "hits")
+            return self._cache[database_name]
+
+        if (
+            self.config.stale_while_revalidate
+            and cache_age is not None
+            and cache_age <= self.config.schema_ttl + self.config.max_stale_age
+            and self._revalidate_in_background(database_name)
+        ):
+            self._count(database_name, "stale_hits")
+            return self._cache[database_name]
+
+        # Cache expired, remove it
+        self._cache.pop(database_name, None)
+        self._cache_timestamps.pop(database_name, None)
+        self._count(database_name, "misses")
+        return None
 
     async def load(
         self,
@@ -85,7 +152,8 @@ class SchemaCache:
         """Load and cache database schema.
 
         This method performs schema introspection and stores the result
-        in cache with current timestamp.
+        in cache with current timestamp. Concurrent calls for the same
+        database share a single in-flight introspection.
 
         Args:
             database_name: Name of the database to introspect.
@@ -101,12 +169,24 @@ class SchemaCache:
             >>> schema = await cache.load("mydb", pool)
             >>> print(f"Loaded {len(schema.tables)} tables")
         """
+        return await self._single_flight(database_name, pool, self._load_schema)
+
+    async def _load_schema(self, database_name: str, pool: Pool) -> DatabaseSchema:
+        """Run a full introspection and store the result.
+
+        Args:
+            database_name: Name of the database to introspect.
+            pool: Connection pool for the database.
+
+        Returns:
+            DatabaseSchema: Loaded database schema.
+        """
+        self._count(database_name, "loads")
         introspector = SchemaIntrospector(pool, database_name)
         schema = await introspector.introspect()
 
         if self.config.enabled:
-            self._cache[database_name] = schema
-            self._cache_timestamps[database_name] = datetime.now(UTC)
+            await self._store(database_name, schema)
 
         return schema
 
@@ -117,7 +197,11 @@ class SchemaCache:
     ) -> None:
         """Refresh schema cache for a specific database.
 
-        This method reloads the schema and updates the cache.
+        If the cached schema carries relation fingerprints, only the relations
+        that were added, dropped or altered since it was loaded are
+        re-introspected and patched into the cached schema. Otherwise the
+        schema is fully reloaded. A refresh joins any load already in flight
+        for the database.
 
         Args:
             database_name: Name of the database to refresh.
@@ -126,7 +210,253 @@ class SchemaCache:
         Example:
             >>> await cache.refresh("mydb", pool)
         """
-        await self.load(database_name, pool)
+        await self._single_flight(database_name, pool, self._refresh_schema)
+
+    async def _refresh_schema(self, database_name: str, pool: Pool) -> DatabaseSchema:
+        """Incrementally refresh the cached schema, or fully reload it.
+
+        Args:
+            database_name: Name of the database to refresh.
+            pool: Connection pool for the database.
+
+        Returns:
+            DatabaseSchema: Refreshed database schema.
+        """
+        cached = self._cache.get(database_name)
+        if (
+            not self.config.enabled
+            or cached is None
+            or any(table.fingerprint is None for table in cached.tables)
+        ):
+            return await self._load_schema(database_name, pool)
+
+        introspector = SchemaIntrospector(pool, database_name)
+        fingerprints = await introspector.fetch_fingerprints()
+
+        cached_tables = {table.oid: table for table in cached.tables}
+        changed_oids = [
+            fp.oid
+            for fp in fingerprints
+            if fp.oid not in cached_tables or cached_tables[fp.oid].fingerprint != fp.fingerprint
+        ]
+        dropped_count = len(cached_tables.keys() - {fp.oid for fp in fingerprints})
+
+        changed_tables = {
+            table.oid: table for table in await introspector.introspect_relations(changed_oids)
+        }
+
+        tables = []
+        for fp in fingerprints:
+            if fp.oid in changed_tables:
+                tables.append(changed_tables[fp.oid])
+            elif fp.oid in cached_tables:
+                table = cached_tables[fp.oid]
+                if table.row_count_estimate != fp.row_count_estimate:
+                    table = table.model_copy(update={"row_count_estimate": fp.row_count_estimate})
+                tables.append(table)
+            # else: created and dropped again between the two queries
+
+        enum_types = await introspector.introspect_enum_types()
+
+        schema = cached.model_copy(update={"tables": tables, "enum_types": enum_types})
+        await self._store(database_name, schema)
+
+        logger.info(
+            "Schema refreshed incrementally",
+            extra={
+                "database": database_name,
+                "relations": len(tables),
+                "reintrospected": len(changed_tables),
+                "dropped": dropped_count,
+            },
+        )
+
+        return schema
+
+    async def _store(self, database_name: str, schema: DatabaseSchema) -> None:
+        """Cache a freshly loaded schema and persist its snapshot.
+
+        Snapshot write failures are logged and otherwise ignored; the
+        in-memory cache is always updated.
+
+        Args:
+            database_name: Name of the database.
+            schema: Schema to store.
+        """
+        self._cache[database_name] = schema
+        self._cache_timestamps[database_name] = datetime.now(UTC)
+        self._restored.discard(database_name)
+
+        if self._snapshots is None:
+            return
+
+        try:
+            await asyncio.to_thread(self._snapshots.save, schema)
+        except OSError as e:
+            logger.warning(
+                "Failed to write schema snapshot",
+                extra={"database": database_name, "error": str(e)},
+            )
+
+    async def restore_snapshot(self, database_name: str, pool: Pool) -> DatabaseSchema | None:
+        """Serve a database's schema from its on-disk snapshot.
+
+        The snapshot is cached immediately and validated in the background:
+        its relation fingerprints are compared against the catalog and only
+        relations that changed since it was written are re-introspected.
+        Requests arriving before validation completes are served from the
+        snapshot, however old it is; explicit loads join the validation
+        instead of starting another introspection. The cache age reports the
+        age of the snapshot until validation replaces it.
+
+        Args:
+            database_name: Name of the database.
+            pool: Connection pool for the database.
+
+        Returns:
+            DatabaseSchema | None: The restored schema, or None if caching or
+                snapshots are disabled or no usable snapshot exists.
+
+        Example:
+            >>> schema = await cache.restore_snapshot("mydb", pool)
+            >>> if schema is None:
+            ...     schema = await cache.load("mydb", pool)
+        """
+        if not self.config.enabled or self._snapshots is None:
+            return None
+
+        snapshot = await asyncio.to_thread(self._snapshots.load_snapshot, database_name)
+        if snapshot is None:
+            return None
+
+        schema = snapshot.schema
+        self._pools[database_name] = pool
+        self._cache[database_name] = schema
+        # Keep the snapshot's age, so the cache age reports how old it really is
+        self._cache_timestamps[database_name] = snapshot.saved_at
+        self._restored.add(database_name)
+        self._count(database_name, "snapshot_restores")
+
+        if database_name not in self._inflight:
+            self._count(database_name, "revalidations")
+            self._start_flight(database_name, self._revalidate(database_name, pool))
+
+        return schema
+
+    async def _single_flight(
+        self,
+        database_name: str,
+        pool: Pool,
+        loader: Callable[[str, Pool], Coroutine[Any, Any, DatabaseSchema]],
+    ) -> DatabaseSchema:
+        """Run a load, or join the one already in flight for the database.
+
+        The load runs in its own task and is awaited through
+        ``asyncio.shield``, so a cancelled caller does not cancel the load
+        for the other callers sharing it.
+
+        Args:
+            database_name: Name of the database.
+            pool: Connection pool for the database.
+            loader: Coroutine function performing the load.
+
+        Returns:
+            DatabaseSchema: Schema produced by the shared load.
+        """
+        self._pools[database_name] = pool
+
+        task = self._inflight.get(database_name)
+        if task is None:
+            task = self._start_flight(database_name, loader(database_name, pool))
+        else:
+            self._count(database_name, "coalesced_loads")
+
+        return await asyncio.shield(task)
+
+    def _start_flight(
+        self,
+        database_name: str,
+        coro: Coroutine[Any, Any, DatabaseSchema],
+    ) -> asyncio.Task[DatabaseSchema]:
+        """Start a load task and register it as in flight.
+
+        Args:
+            database_name: Name of the database.
+            coro: Load coroutine to run.
+
+        Returns:
+            asyncio.Task: The registered task.
+        """
+        task = asyncio.create_task(coro)
+        self._inflight[database_name] = task
+
+        def _on_done(done: asyncio.Task[DatabaseSchema]) -> None:
+            if self._inflight.get(database_name) is done:
+                del self._inflight[database_name]
+            if not done.cancelled():
+                # Mark the exception retrieved even if every caller went away
+                done.exception()
+
+        task.add_done_callback(_on_done)
+        return task
+
+    def _revalidate_in_background(self, database_name: str) -> bool:
+        """Make sure a background reload of a stale schema is running.
+
+        Args:
+            database_name: Name of the database.
+
+        Returns:
+            bool: True if the stale schema may be served (a reload is running,
+                was started, or recently failed and is backing off), False if
+                no reload can be started.
+        """
+        if database_name in self._inflight:
+            return True
+
+        pool = self._pools.get(database_name)
+        if pool is None:
+            return False
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        failed_at = self._revalidation_failed_at.get(database_name)
+        if failed_at is not None and time.monotonic() - failed_at < REVALIDATION_RETRY_SECONDS:
+            return True
+
+        self._count(database_name, "revalidations")
+        self._start_flight(database_name, self._revalidate(database_name, pool))
+        return True
+
+    async def _revalidate(self, database_name: str, pool: Pool) -> DatabaseSchema:
+        """Background reload of a stale or restored schema.
+
+        Args:
+            database_name: Name of the database.
+            pool: Connection pool for the database.
+
+        Returns:
+            DatabaseSchema: Refreshed database schema.
+        """
+        try:
+            schema = await self._refresh_schema(database_name, pool)
+        except Exception:
+            self._revalidation_failed_at[database_name] = time.monotonic()
+            # A snapshot that could not be revalidated expires with its TTL
+            self._restored.discard(database_name)
+            self._count(database_name, "revalidation_failures")
+            logger.warning(
+                "Background schema revalidation failed",
+                exc_info=True,
+                extra={"database": database_name},
+            )
+            raise
+
+        self._revalidation_failed_at.pop(database_name, None)
+        return schema
 
     async def start_auto_refresh(
         self,
@@ -159,7 +489,8 @@ class SchemaCache:
     async def stop_auto_refresh(self) -> None:
         """Stop automatic refresh task.
 
-        This method immediately cancels the background refresh task if running.
+        This method immediately cancels the background refresh task if running,
+        along with any schema loads still in flight.
 
         Example:
             >>> await cache.stop_auto_refresh()
@@ -174,6 +505,10 @@ class SchemaCache:
                 await self._refresh_task
             logger.debug("Auto-refresh task cancelled")
 
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+
     async def _auto_refresh_loop(
         self,
         interval_minutes: int,
@@ -207,6 +542,17 @@ class SchemaCache:
                 # Log error but continue
                 logger.exception("Error during schema refresh: %s", e)
 
+    def _count(self, database_name: str, event: str) -> None:
+        """Increment a per-database cache counter and its metric.
+
+        Args:
+            database_name: Name of the database.
+            event: Counter name, one of ``_STAT_KEYS``.
+        """
+        self._stats[database_name][event] += 1
+        if self.metrics is not None:
+            self.metrics.increment_schema_cache_event(database_name, event)
+
     def get_cache_age(self, database_name: str) -> float | None:
         """Get cache age in seconds.
 
@@ -241,9 +587,11 @@ class SchemaCache:
         if database_name is None:
             self._cache.clear()
             self._cache_timestamps.clear()
+            self._restored.clear()
         else:
             self._cache.pop(database_name, None)
             self._cache_timestamps.pop(database_name, None)
+            self._restored.discard(database_name)
 
     def get_cached_databases(self) -> list[str]:
         """Get list of currently cached database names.
@@ -256,3 +604,24 @@ class SchemaCache:
             >>> print(f"Cached: {', '.join(databases)}")
         """
         return list(self._cache.keys())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-database cache statistics.
+
+        Returns:
+            Dictionary mapping database names to hit, miss, stale hit, load,
+            coalesced load and revalidation counters, plus cache age and
+            whether a load is currently in flight.
+
+        Example:
+            >>> stats = cache.get_stats()
+            >>> print(stats["mydb"]["stale_hits"])
+        """
+        return {
+            database_name: {
+                **counters,
+                "cache_age": self.get_cache_age(database_name),
+                "loading": database_name in self._inflight,
+            }
+            for database_name, counters in self._stats.items()
+        }
@@ -0,0 +1,180 @@
+"""Persistent schema snapshots.
+
+This module stores introspected database schemas on disk so that a restarted
+server can serve from a snapshot within milliseconds instead of blocking on a
+full catalog scan. Snapshots are compact, versioned JSON documents; a snapshot
+written by an incompatible format version is ignored rather than migrated.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from pg_mcp.models.schema import DatabaseSchema
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the snapshot layout or the DatabaseSchema model changes in a
+# way that older snapshots can no longer be loaded faithfully.
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SchemaSnapshot:
+    """A stored schema and the time it was introspected and saved."""
+
+    schema: DatabaseSchema
+    saved_at: datetime
+
+
+class SchemaSnapshotStore:
+    """On-disk store for DatabaseSchema snapshots, one file per database.
+
+    Writes are atomic (temporary file plus rename), so a crash mid-write never
+    leaves a truncated snapshot behind.
+
+    Attributes:
+        directory: Directory holding the snapshot files.
+
+    Example:
+        >>> store = SchemaSnapshotStore(Path("/var/cache/pg-mcp"))
+        >>> store.save(schema)
+        >>> restored = store.load("mydb")
+    """
+
+    def __init__(self, directory: Path):
+        """Initialize snapshot store.
+
+        Args:
+            directory: Directory holding the snapshot files. It is created on
+                first save if it does not exist.
+        """
+        self.directory = directory
+
+    def path_for(self, database_name: str) -> Path:
+        """Get the snapshot file path for a database.
+
+        Args:
+            database_name: Name of the database.
+
+        Returns:
+            Path: Snapshot file path. Characters outside ``[A-Za-z0-9_.-]``
+                are replaced so the name is always a single safe file name.
+        """
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", database_name).lstrip(".") or "_"
+        return self.directory / f"{safe_name}.schema.json"
+
+    def save(self, schema: DatabaseSchema) -> Path:
+        """Write a schema snapshot atomically.
+
+        Args:
+            schema: Schema to persist.
+
+        Returns:
+            Path: Path of the written snapshot.
+
+        Raises:
+            OSError: If the snapshot directory or file cannot be written.
+        """
+        path = self.path_for(schema.database_name)
+        payload = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "saved_at": datetime.now(UTC).isoformat(),
+            "schema": schema.model_dump(mode="json"),
+        }
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        return path
+
+    def load(self, database_name: str) -> DatabaseSchema | None:
+        """Read a schema snapshot.
+
+        Args:
+            database_name: Name of the database.
+
+        Returns:
+            DatabaseSchema | None: The stored schema, or None if there is no
+                snapshot or it is unreadable, corrupt, from another format
+                version or for another database.
+        """
+        snapshot = self.load_snapshot(database_name)
+        return snapshot.schema if snapshot is not None else None
+
+    def load_snapshot(self, database_name: str) -> SchemaSnapshot | None:
+        """Read a schema snapshot together with the time it was saved.
+
+        Args:
+            database_name: Name of the database.
+
+        Returns:
+            SchemaSnapshot | None: The stored schema and its save time (the
+                file modification time if the snapshot does not record
+                one), or None if the snapshot cannot be used (see ``load``).
+        """
+        path = self.path_for(database_name)
+        try:
+            with path.open(encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable schema snapshot",
+                extra={"database": database_name, "path": str(path), "error": str(e)},
+            )
+            return None
+
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format_version") != SNAPSHOT_FORMAT_VERSION
+        ):
+            logger.info(
+                "Ignoring schema snapshot with incompatible format version",
+                extra={"database": database_name, "path": str(path)},
+            )
+            return None
+
+        try:
+            schema = DatabaseSchema.model_validate(payload.get("schema"))
+        except ValidationError as e:
+            logger.warning(
+                "Ignoring invalid schema snapshot",
+                extra={"database": database_name, "path": str(path), "error": str(e)},
+            )
+            return None
+
+        if schema.database_name != database_name:
+            return None
+
+        try:
+            saved_at = datetime.fromisoformat(payload["saved_at"])
+        except (KeyError, TypeError, ValueError):
+            saved_at = datetime.fromtimestamp(path.stat().st_mtime, UTC)
+        if saved_at.tzinfo is None:
+            saved_at = saved_at.replace(tzinfo=UTC)
+
+        return SchemaSnapshot(schema=schema, saved_at=saved_at)
+
+    def delete(self, database_name: str) -> None:
+        """Remove the snapshot for a database if it exists.
+
+        Args:
+            database_name: Name of the database.
+        """
+        self.path_for(database_name).unlink(missing_ok=True)
@@ -2,12 +2,20 @@
 
 from pg_mcp.config.settings import (
     CacheConfig,
+    CoalescingConfig,
     DatabaseConfig,
+    HedgingConfig,
     ObservabilityConfig,
     OpenAIConfig,
+    QueryCacheConfig,
+    RateLimitConfig,
     ResilienceConfig,
+    ResultCacheConfig,
+    ResultExportConfig,
+    RetrievalConfig,
     SecurityConfig,
     Settings,
+    StartupConfig,
     ValidationConfig,
     get_settings,
     reset_settings,
@@ -15,12 +23,20 @@ from pg_mcp.config.settings import (
 
 __all__ = [
     "CacheConfig",
+    "CoalescingConfig",
     "DatabaseConfig",
+    "HedgingConfig",
     "ObservabilityConfig",
     "OpenAIConfig",
+    "QueryCacheConfig",
+    "RateLimitConfig",
     "ResilienceConfig",
+    "ResultCacheConfig",
+    "ResultExportConfig",
+    "RetrievalConfig",
     "SecurityConfig",
     "Settings",
+    "StartupConfig",
     "ValidationConfig",
     "get_settings",
     "reset_settings",
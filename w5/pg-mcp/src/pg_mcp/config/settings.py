@@ -5,9 +5,10 @@ and type safety. Configuration is loaded from environment variables with
 sensible defaults.
 """
 
+from pathlib import Path
 from typing import Literal
 
-from pydantic import Field, SecretStr, field_validator
+from pydantic import Field, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -89,15 +90,52 @@ class SecurityConfig(BaseSettings):
         description="List of blocked PostgreSQL functions",
     )
     max_rows: int = Field(default=10000, ge=1, le=100000, description="Maximum rows to return")
+    row_count_mode: Literal["none", "capped", "estimate"] = Field(
+        default="none",
+        description=(
+            "How to report the total row count of truncated results: not at all, "
+            "with a count(*) capped at row_count_cap, or from the planner estimate"
+        ),
+    )
+    row_count_cap: int = Field(
+        default=100_000,
+        ge=1,
+        le=1_000_000_000,
+        description="Maximum rows counted when row_count_mode is 'capped'",
+    )
     max_execution_time: float = Field(
         default=30.0, ge=1.0, le=300.0, description="Maximum query execution time in seconds"
     )
+    max_plan_cost: float | None = Field(
+        default=None,
+        gt=0.0,
+        description=(
+            "Reject queries whose EXPLAIN total cost exceeds this before executing them "
+            "(in planner cost units; unset disables the check)"
+        ),
+    )
+    max_plan_rows: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Reject queries with a plan step expected to process more rows than this, "
+            "allowing for LIMIT (unset disables the check)"
+        ),
+    )
     readonly_role: str | None = Field(
         default=None, description="PostgreSQL role to switch to for read-only access"
     )
     safe_search_path: str = Field(
         default="public", description="Safe search_path to set during query execution"
     )
+    session_setup: Literal["per_query", "per_connection"] = Field(
+        default="per_query",
+        description=(
+            "Where search_path and readonly_role are applied: with SET statements before "
+            "every query, or once per pooled connection as startup parameters (the "
+            "timeout is then sent as SET LOCAL in the same call as BEGIN)"
+        ),
+    )
 
     @field_validator("blocked_functions", mode="before")
     @classmethod
@@ -131,6 +169,29 @@ class ValidationConfig(BaseSettings):
     confidence_threshold: int = Field(
         default=70, ge=0, le=100, description="Minimum confidence for acceptable results"
     )
+    heuristics: bool = Field(
+        default=True,
+        description=(
+            "Skip LLM validation of results local checks vouch for: empty results, "
+            "single-row aggregates and row counts matching the question's top N"
+        ),
+    )
+    sample_rate: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="Share of requests validated by the LLM"
+    )
+    mode: Literal["sync", "async"] = Field(
+        default="sync",
+        description=(
+            "sync: wait for validation before responding; async: respond immediately "
+            "and validate in the background, recording confidence to metrics and logs"
+        ),
+    )
+    max_deferred: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Maximum background validations in flight in async mode",
+    )
 
 
 class CacheConfig(BaseSettings):
@@ -143,6 +204,134 @@ class CacheConfig(BaseSettings):
     )
     max_size: int = Field(default=100, ge=1, le=1000, description="Maximum cache entries")
     enabled: bool = Field(default=True, description="Enable schema caching")
+    stale_while_revalidate: bool = Field(
+        default=False,
+        description="Serve an expired schema while a single background task reloads it",
+    )
+    max_stale_age: int = Field(
+        default=3600,
+        ge=0,
+        le=86400,
+        description="Seconds past schema_ttl an expired schema may still be served",
+    )
+    snapshot_dir: Path | None = Field(
+        default=None,
+        description="Directory for persistent schema snapshots (disabled when unset)",
+    )
+
+
+class QueryCacheConfig(BaseSettings):
+    """Question-to-SQL answer cache configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="QUERY_CACHE_")
+
+    enabled: bool = Field(default=True, description="Reuse validated SQL for repeated questions")
+    ttl: int = Field(default=3600, ge=1, le=604800, description="Answer cache TTL in seconds")
+    max_size: int = Field(default=1000, ge=1, le=100000, description="Maximum cached answers")
+
+
+class CoalescingConfig(BaseSettings):
+    """Coalescing of identical concurrent query requests."""
+
+    model_config = SettingsConfigDict(env_prefix="COALESCING_")
+
+    enabled: bool = Field(
+        default=True,
+        description=(
+            "Run identical concurrent questions once and share the response "
+            "(never applied when write operations are allowed)"
+        ),
+    )
+
+
+class ResultCacheConfig(BaseSettings):
+    """Executed-result cache configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="RESULT_CACHE_")
+
+    enabled: bool = Field(default=False, description="Reuse results of repeated SQL queries")
+    max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1024,
+        le=16 * 1024 * 1024 * 1024,
+        description="Memory budget for cached results in bytes (serialized size)",
+    )
+    max_staleness: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=3600.0,
+        description="Seconds a cached result may be served before its tables are re-checked",
+    )
+
+
+class ResultExportConfig(BaseSettings):
+    """Configuration of results exported to temporary MCP resources."""
+
+    model_config = SettingsConfigDict(env_prefix="RESULT_EXPORT_")
+
+    ttl: float = Field(
+        default=600.0,
+        ge=1.0,
+        le=86400.0,
+        description="Seconds an exported result remains readable as a resource",
+    )
+    max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=1024,
+        le=16 * 1024 * 1024 * 1024,
+        description="Memory budget for exported results in bytes; the oldest are evicted first",
+    )
+
+
+class StartupConfig(BaseSettings):
+    """Server startup and schema warm-up configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="STARTUP_")
+
+    background_warmup: bool = Field(
+        default=True,
+        description="Accept requests immediately and connect and load schemas in the background",
+    )
+    ready_timeout: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=600.0,
+        description="Seconds a request waits for its database to finish warming up",
+    )
+    retry_delay: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=3600.0,
+        description="Seconds before a request retries the warm-up of a failed database",
+    )
+
+
+class RetrievalConfig(BaseSettings):
+    """Schema retrieval (prompt pruning) configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="RETRIEVAL_")
+
+    enabled: bool = Field(
+        default=False, description="Send only question-relevant tables to the LLM"
+    )
+    top_k: int = Field(
+        default=8, ge=1, le=100, description="Number of best-matching tables to select"
+    )
+    max_tables: int = Field(
+        default=20,
+        ge=1,
+        le=500,
+        description="Maximum tables in the prompt after foreign key expansion",
+    )
+    min_tables: int = Field(
+        default=30,
+        ge=0,
+        le=10000,
+        description="Schemas with at most this many tables are always sent in full",
+    )
+    expand_foreign_keys: bool = Field(
+        default=True, description="Add tables joined to the selected ones by foreign keys"
+    )
 
 
 class ResilienceConfig(BaseSettings):
@@ -157,6 +346,24 @@ class ResilienceConfig(BaseSettings):
     backoff_factor: float = Field(
         default=2.0, ge=1.0, le=10.0, description="Exponential backoff factor"
     )
+    max_retry_delay: float = Field(
+        default=30.0, ge=0.1, le=300.0, description="Upper bound of a retry delay in seconds"
+    )
+    retry_budget_ratio: float = Field(
+        default=0.2,
+        ge=0.0,
+        le=1.0,
+        description="Transient-error retries allowed per LLM call across all requests",
+    )
+    retry_budget_min_retries: int = Field(
+        default=10,
+        ge=0,
+        le=1000,
+        description="Retries allowed per budget window even at low traffic",
+    )
+    retry_budget_window: float = Field(
+        default=10.0, ge=1.0, le=300.0, description="Retry budget window in seconds"
+    )
     circuit_breaker_threshold: int = Field(
         default=5, ge=1, le=100, description="Failures before circuit opens"
     )
@@ -165,6 +372,135 @@ class ResilienceConfig(BaseSettings):
     )
 
 
+class HedgingConfig(BaseSettings):
+    """Hedged SQL generation configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="HEDGING_")
+
+    enabled: bool = Field(
+        default=False,
+        description="Run several SQL generations concurrently and keep the first valid one",
+    )
+    max_candidates: int = Field(
+        default=2, ge=2, le=5, description="Maximum concurrent generations per attempt"
+    )
+    mode: Literal["delayed", "parallel"] = Field(
+        default="delayed",
+        description=(
+            "Launch further candidates only once the previous one is slower than usual "
+            "(delayed) or all at once (parallel)"
+        ),
+    )
+    delay_percentile: float = Field(
+        default=95.0,
+        gt=0.0,
+        lt=100.0,
+        description="Percentile of recent generation latencies after which a hedge is launched",
+    )
+    initial_delay: float = Field(
+        default=3.0,
+        gt=0.0,
+        le=60.0,
+        description="Hedge delay in seconds until enough generation latencies are known",
+    )
+    temperatures: list[float] = Field(
+        default_factory=list,
+        description=(
+            "Sampling temperature of each candidate in launch order, as a JSON list; "
+            "candidates not listed use OPENAI_TEMPERATURE"
+        ),
+    )
+
+    @field_validator("temperatures")
+    @classmethod
+    def validate_temperatures(cls, v: list[float]) -> list[float]:
+        """Ensure every temperature is accepted by the API."""
+        if any(not 0.0 <= temperature <= 2.0 for temperature in v):
+            raise ValueError("Temperatures must be between 0 and 2")
+        return v
+
+
+class RateLimitConfig(BaseSettings):
+    """Concurrency limits for database queries and LLM calls."""
+
+    model_config = SettingsConfigDict(env_prefix="RATE_LIMIT_")
+
+    enabled: bool = Field(default=True, description="Limit concurrent queries and LLM calls")
+    max_concurrent_queries: int = Field(
+        default=10, ge=1, le=1000, description="Maximum concurrent queries per database"
+    )
+    max_concurrent_llm_calls: int = Field(
+        default=5, ge=1, le=1000, description="Maximum concurrent LLM API calls"
+    )
+    queue_timeout: float = Field(
+        default=30.0,
+        gt=0.0,
+        le=600.0,
+        description="Seconds a request waits for a free slot before failing",
+    )
+    client_weights: dict[str, float] = Field(
+        default_factory=dict,
+        description=(
+            "Relative share of slots per client id while clients are queued, as a JSON "
+            "object; clients not listed weigh 1"
+        ),
+    )
+
+    # Adaptive limits: the max_concurrent_* values become starting points
+    adaptive: bool = Field(
+        default=False,
+        description="Adjust the limits to observed latency and overload errors (AIMD)",
+    )
+    adaptive_min_limit: int = Field(
+        default=1, ge=1, le=1000, description="Lowest limit an adaptive limiter sheds to"
+    )
+    adaptive_max_queries: int = Field(
+        default=50, ge=1, le=1000, description="Highest adaptive limit for database queries"
+    )
+    adaptive_max_llm_calls: int = Field(
+        default=20, ge=1, le=1000, description="Highest adaptive limit for LLM API calls"
+    )
+    adaptive_latency_tolerance: float = Field(
+        default=2.0,
+        gt=1.0,
+        le=10.0,
+        description="Smoothed latency, as a multiple of no-load latency, that shrinks the limit",
+    )
+    adaptive_backoff_ratio: float = Field(
+        default=0.7, gt=0.0, lt=1.0, description="Factor applied to the limit when shrinking"
+    )
+    adaptive_smoothing: float = Field(
+        default=0.05, gt=0.0, le=1.0, description="Weight of a new latency sample in the average"
+    )
+    adaptive_baseline_window: float = Field(
+        default=60.0,
+        gt=0.0,
+        le=3600.0,
+        description="Seconds after which the no-load latency is re-measured",
+    )
+
+    @field_validator("client_weights")
+    @classmethod
+    def validate_client_weights(cls, v: dict[str, float]) -> dict[str, float]:
+        """Ensure every client weight is positive."""
+        invalid = sorted(client for client, weight in v.items() if weight <= 0)
+        if invalid:
+            raise ValueError(f"Client weights must be > 0: {', '.join(invalid)}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_adaptive_limits(self) -> "RateLimitConfig":
+        """Ensure each starting limit lies within the adaptive bounds."""
+        if self.adaptive:
+            for start, upper in (
+                ("max_concurrent_queries", "adaptive_max_queries"),
+                ("max_concurrent_llm_calls", "adaptive_max_llm_calls"),
+            ):
+                if not self.adaptive_min_limit <= getattr(self, start) <= getattr(self, upper):
+                    raise ValueError(f"{start} must lie between adaptive_min_limit and {upper}")
+        return self
+
+
 class ObservabilityConfig(BaseSettings):
     """Observability and monitoring configuration."""
 
@@ -174,10 +510,26 @@ class ObservabilityConfig(BaseSettings):
     metrics_port: int = Field(
         default=9090, ge=1024, le=65535, description="Metrics HTTP server port"
     )
+    metrics_sample_interval: float = Field(
+        default=15.0,
+        ge=1.0,
+        le=3600.0,
+        description="Seconds between samples of connection pool sizes and schema cache ages",
+    )
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO", description="Logging level"
     )
     log_format: Literal["json", "text"] = Field(default="text", description="Log format")
+    trace_exporter: Literal["none", "console", "file"] = Field(
+        default="none",
+        description=(
+            "Where request spans are exported as OTLP JSON lines: nowhere, standard error "
+            "(standard output carries the stdio MCP transport) or trace_file"
+        ),
+    )
+    trace_file: str = Field(
+        default="pg-mcp-traces.jsonl", description="File spans are appended to (file exporter)"
+    )
 
 
 class Settings(BaseSettings):
@@ -196,13 +548,42 @@ class Settings(BaseSettings):
 
     # Nested configurations
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    databases: list[DatabaseConfig] = Field(
+        default_factory=list,
+        description=(
+            "Additional databases to serve, as a JSON list of database configurations; "
+            "fields left out fall back to the DATABASE_* values"
+        ),
+    )
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
     security: SecurityConfig = Field(default_factory=SecurityConfig)
     validation: ValidationConfig = Field(default_factory=ValidationConfig)
     cache: CacheConfig = Field(default_factory=CacheConfig)
+    query_cache: QueryCacheConfig = Field(default_factory=QueryCacheConfig)
+    result_cache: ResultCacheConfig = Field(default_factory=ResultCacheConfig)
+    result_export: ResultExportConfig = Field(default_factory=ResultExportConfig)
+    coalescing: CoalescingConfig = Field(default_factory=CoalescingConfig)
+    retrieval: RetrievalConfig = Field(default_factory=RetrievalConfig)
+    startup: StartupConfig = Field(default_factory=StartupConfig)
     resilience: ResilienceConfig = Field(default_factory=ResilienceConfig)
+    hedging: HedgingConfig = Field(default_factory=HedgingConfig)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
     observability: ObservabilityConfig = Field(default_factory=ObservabilityConfig)
 
+    @model_validator(mode="after")
+    def validate_database_names(self) -> "Settings":
+        """Ensure every configured database has a distinct name."""
+        names = [config.name for config in self.database_configs]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate database names: {', '.join(duplicates)}")
+        return self
+
+    @property
+    def database_configs(self) -> list[DatabaseConfig]:
+        """Get the primary database followed by the additional databases."""
+        return [self.database, *self.databases]
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
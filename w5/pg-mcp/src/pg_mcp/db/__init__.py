@@ -5,10 +5,11 @@ introspection capabilities for PostgreSQL.
 """
 
 from pg_mcp.db.introspection import SchemaIntrospector
-from pg_mcp.db.pool import close_pools, create_pool, create_pools
+from pg_mcp.db.pool import build_pool, close_pools, create_pool, create_pools
 
 __all__ = [
     "SchemaIntrospector",
+    "build_pool",
     "create_pool",
     "create_pools",
     "close_pools",
@@ -3,8 +3,21 @@
 This module provides functionality to introspect PostgreSQL database schemas,
 extracting comprehensive metadata about tables, columns, constraints, indexes,
 and custom types.
+
+Introspection is set-based: every component (relations, columns, constraints,
+indexes, enum types) is fetched for all relations at once with a single
+``pg_catalog`` query, and ``TableInfo`` objects are assembled in memory. The
+number of round trips is therefore constant and does not grow with the number
+of tables or columns in the database.
+
+Each relation also carries a fingerprint: an md5 hash of its column,
+constraint and index definitions. Comparing fingerprints lets callers detect
+added, dropped or altered relations with one cheap query and re-introspect
+only those.
 """
 
+from collections import defaultdict
+from typing import Any
 
 from asyncpg import Pool
 from asyncpg.connection import Connection
@@ -15,9 +28,58 @@ from pg_mcp.models.schema import (
     EnumTypeInfo,
     ForeignKeyInfo,
     IndexInfo,
+    RelationFingerprint,
     TableInfo,
 )
 
+# Shared WHERE clause restricting catalog queries to user tables and views.
+# $1 is an optional oid[] used to narrow introspection to specific relations.
+_RELATION_FILTER = """
+    c.relkind IN ('r', 'v')  -- regular tables and views
+    AND n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
+    AND ($1::oid[] IS NULL OR c.oid = ANY($1::oid[]))
+"""
+
+# Per-relation hash of everything introspection reports except the row count
+# estimate, which changes with every ANALYZE and is refreshed separately.
+_FINGERPRINT_EXPR = """
+    md5(concat_ws(
+        '|',
+        n.nspname,
+        c.relname,
+        c.relkind,
+        obj_description(c.oid, 'pg_class'),
+        (
+            SELECT string_agg(
+                concat_ws(
+                    ':',
+                    a.attname,
+                    pg_catalog.format_type(a.atttypid, a.atttypmod),
+                    a.attnotnull,
+                    pg_get_expr(ad.adbin, ad.adrelid),
+                    col_description(a.attrelid, a.attnum)
+                ),
+                ',' ORDER BY a.attnum
+            )
+            FROM pg_attribute a
+            LEFT JOIN pg_attrdef ad ON a.attrelid = ad.adrelid AND a.attnum = ad.adnum
+            WHERE a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+        ),
+        (
+            SELECT string_agg(
+                con.conname || ' ' || pg_get_constraintdef(con.oid), ',' ORDER BY con.conname
+            )
+            FROM pg_constraint con
+            WHERE con.conrelid = c.oid
+        ),
+        (
+            SELECT string_agg(pg_get_indexdef(idx.indexrelid), ',' ORDER BY idx.indexrelid)
+            FROM pg_index idx
+            WHERE idx.indrelid = c.oid
+        )
+    ))
+"""
+
 
 class SchemaIntrospector:
     """PostgreSQL schema introspection service.
@@ -44,7 +106,9 @@ class SchemaIntrospector:
         """Execute complete schema introspection.
 
         This method fetches all schema metadata including tables, views,
-        columns, constraints, indexes, and custom types.
+        columns, constraints, indexes, and custom types. Each component is
+        loaded for all relations with one catalog query, so the whole
+        introspection takes a fixed number of round trips.
 
         Returns:
             DatabaseSchema: Complete database schema information.
@@ -59,309 +123,335 @@ class SchemaIntrospector:
             version_result = await conn.fetchval("SELECT version()")
             version = version_result.split(",")[0] if version_result else None
 
-            # Fetch all schema components concurrently
-            tables = await self._get_tables(conn)
-            views = await self._get_views(conn)
+            tables = await self._get_relations(conn)
             enum_types = await self._get_enum_types(conn)
 
-            # Enrich tables with detailed information
-            for table in tables + views:
-                table.columns = await self._get_columns(conn, table.table_name, table.schema_name)
-                primary_keys = await self._get_primary_keys(
-                    conn, table.table_name, table.schema_name
-                )
-
-                # Mark primary key columns
-                for col in table.columns:
-                    if col.name in primary_keys:
-                        col.is_primary_key = True
-
-                table.foreign_keys = await self._get_foreign_keys(
-                    conn, table.table_name, table.schema_name
-                )
-                table.indexes = await self._get_indexes(conn, table.table_name, table.schema_name)
-                table.row_count_estimate = await self._get_row_count_estimate(
-                    conn, table.table_name, table.schema_name
-                )
-
             return DatabaseSchema(
                 database_name=self.database_name,
-                tables=tables + views,
+                tables=tables,
                 enum_types=enum_types,
                 version=version,
             )
 
-    async def _get_tables(self, conn: Connection) -> list[TableInfo]:
-        """Get all user tables (excluding system tables).
+    async def fetch_fingerprints(self) -> list[RelationFingerprint]:
+        """Fetch the current fingerprint of every user table and view.
 
-        Args:
-            conn: Database connection.
+        This is a single catalog query and is much cheaper than a full
+        introspection, so it can be run on every refresh to find out which
+        relations need to be re-introspected.
 
         Returns:
-            list[TableInfo]: List of table information objects.
+            list[RelationFingerprint]: Fingerprints in the same order as
+                ``DatabaseSchema.tables`` (tables first, then views).
+
+        Example:
+            >>> fingerprints = await introspector.fetch_fingerprints()
+            >>> changed = [f.oid for f in fingerprints if f.fingerprint != known.get(f.oid)]
         """
-        query = """
+        query = f"""
             SELECT
-                n.nspname AS schema_name,
-                c.relname AS table_name,
-                obj_description(c.oid, 'pg_class') AS comment
+                c.oid AS oid,
+                {_FINGERPRINT_EXPR} AS fingerprint,
+                c.reltuples::bigint AS row_count_estimate
             FROM pg_class c
             JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE c.relkind = 'r'  -- regular tables only
-              AND n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
-            ORDER BY n.nspname, c.relname
-        """
+            WHERE {_RELATION_FILTER}
+            ORDER BY c.relkind = 'v', n.nspname, c.relname
+        """  # noqa: S608 - only constant fragments are interpolated
 
-        rows = await conn.fetch(query)
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, None)
 
-        return [
-            TableInfo(
-                schema_name=row["schema_name"],
-                table_name=row["table_name"],
-                comment=row["comment"],
-                row_count_estimate=None,
+        fingerprints = []
+        for row in rows:
+            estimate = row["row_count_estimate"]
+            fingerprints.append(
+                RelationFingerprint(
+                    oid=row["oid"],
+                    fingerprint=row["fingerprint"],
+                    row_count_estimate=int(estimate) if estimate is not None else 0,
+                )
             )
-            for row in rows
-        ]
 
-    async def _get_columns(
-        self, conn: Connection, table_name: str, schema_name: str
-    ) -> list[ColumnInfo]:
-        """Get column information for a specific table.
+        return fingerprints
+
+    async def introspect_relations(self, relation_oids: list[int]) -> list[TableInfo]:
+        """Introspect only the given relations.
 
         Args:
-            conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
+            relation_oids: OIDs of the tables or views to introspect.
 
         Returns:
-            list[ColumnInfo]: List of column information objects.
+            list[TableInfo]: Introspected relations that still exist, tables
+                first, then views.
+
+        Example:
+            >>> tables = await introspector.introspect_relations([16384, 16390])
         """
-        query = """
-            SELECT
-                a.attname AS column_name,
-                pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
-                NOT a.attnotnull AS is_nullable,
-                pg_get_expr(ad.adbin, ad.adrelid) AS default_value,
-                col_description(a.attrelid, a.attnum) AS comment
-            FROM pg_attribute a
-            JOIN pg_class c ON a.attrelid = c.oid
-            JOIN pg_namespace n ON c.relnamespace = n.oid
-            LEFT JOIN pg_attrdef ad ON a.attrelid = ad.adrelid AND a.attnum = ad.adnum
-            WHERE c.relname = $1
-              AND n.nspname = $2
-              AND a.attnum > 0
-              AND NOT a.attisdropped
-            ORDER BY a.attnum
+        if not relation_oids:
+            return []
+
+        async with self.pool.acquire() as conn:
+            return await self._get_relations(conn, relation_oids)
+
+    async def introspect_enum_types(self) -> list[EnumTypeInfo]:
+        """Introspect custom ENUM types only.
+
+        Returns:
+            list[EnumTypeInfo]: Enum type definitions.
         """
+        async with self.pool.acquire() as conn:
+            return await self._get_enum_types(conn)
 
-        rows = await conn.fetch(query, table_name, schema_name)
+    async def _get_relations(
+        self, conn: Connection, relation_oids: list[int] | None = None
+    ) -> list[TableInfo]:
+        """Fetch and assemble tables and views with all their details.
 
-        columns = []
-        for row in rows:
-            # Check if column has unique constraint
-            is_unique = await self._is_column_unique(
-                conn, table_name, schema_name, row["column_name"]
-            )
+        Args:
+            conn: Database connection.
+            relation_oids: Optional relation OIDs to restrict introspection to.
+                If None, all user tables and views are introspected.
 
-            columns.append(
-                ColumnInfo(
-                    name=row["column_name"],
-                    data_type=row["data_type"],
-                    is_nullable=row["is_nullable"],
-                    default_value=row["default_value"],
-                    is_unique=is_unique,
-                    comment=row["comment"],
-                )
-            )
+        Returns:
+            list[TableInfo]: Tables (ordered by schema and name) followed by
+                views (ordered by schema and name).
+        """
+        relation_rows = await self._fetch_relation_rows(conn, relation_oids)
+        column_rows = await self._fetch_column_rows(conn, relation_oids)
+        constraint_rows = await self._fetch_constraint_rows(conn, relation_oids)
+        index_rows = await self._fetch_index_rows(conn, relation_oids)
 
-        return columns
+        return self._assemble_tables(relation_rows, column_rows, constraint_rows, index_rows)
 
-    async def _is_column_unique(
-        self, conn: Connection, table_name: str, schema_name: str, column_name: str
-    ) -> bool:
-        """Check if a column has a unique constraint (excluding primary key).
+    async def _fetch_relation_rows(
+        self, conn: Connection, relation_oids: list[int] | None
+    ) -> list[Any]:
+        """Fetch one row per user table or view.
 
         Args:
             conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
-            column_name: Name of the column.
+            relation_oids: Optional relation OIDs filter.
 
         Returns:
-            bool: True if column has a unique constraint.
-        """
-        query = """
-            SELECT EXISTS(
-                SELECT 1
-                FROM pg_constraint con
-                JOIN pg_class c ON con.conrelid = c.oid
-                JOIN pg_namespace n ON c.relnamespace = n.oid
-                JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = ANY(con.conkey)
-                WHERE c.relname = $1
-                  AND n.nspname = $2
-                  AND a.attname = $3
-                  AND con.contype = 'u'  -- unique constraint
-            )
+            list: Rows with oid, relkind, schema_name, table_name, comment,
+                row_count_estimate and fingerprint.
         """
+        query = f"""
+            SELECT
+                c.oid AS oid,
+                c.relkind::text AS relkind,  -- asyncpg decodes "char" as bytes
+                n.nspname AS schema_name,
+                c.relname AS table_name,
+                obj_description(c.oid, 'pg_class') AS comment,
+                c.reltuples::bigint AS row_count_estimate,
+                {_FINGERPRINT_EXPR} AS fingerprint
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE {_RELATION_FILTER}
+            ORDER BY c.relkind = 'v', n.nspname, c.relname
+        """  # noqa: S608 - only constant fragments are interpolated
 
-        result = await conn.fetchval(query, table_name, schema_name, column_name)
-        return bool(result) if result is not None else False
+        rows: list[Any] = await conn.fetch(query, relation_oids)
+        return rows
 
-    async def _get_primary_keys(
-        self, conn: Connection, table_name: str, schema_name: str
-    ) -> list[str]:
-        """Get primary key column names for a table.
+    async def _fetch_column_rows(
+        self, conn: Connection, relation_oids: list[int] | None
+    ) -> list[Any]:
+        """Fetch columns of all user tables and views.
 
         Args:
             conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
+            relation_oids: Optional relation OIDs filter.
 
         Returns:
-            list[str]: List of primary key column names.
+            list: Column rows ordered by relation and attribute number.
         """
-        query = """
-            SELECT a.attname AS column_name
-            FROM pg_index i
-            JOIN pg_class c ON i.indrelid = c.oid
+        query = f"""
+            SELECT
+                a.attrelid AS relid,
+                a.attname AS column_name,
+                pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
+                NOT a.attnotnull AS is_nullable,
+                pg_get_expr(ad.adbin, ad.adrelid) AS default_value,
+                col_description(a.attrelid, a.attnum) AS comment
+            FROM pg_attribute a
+            JOIN pg_class c ON a.attrelid = c.oid
             JOIN pg_namespace n ON c.relnamespace = n.oid
-            JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = ANY(i.indkey)
-            WHERE c.relname = $1
-              AND n.nspname = $2
-              AND i.indisprimary
-            ORDER BY array_position(i.indkey, a.attnum)
-        """
+            LEFT JOIN pg_attrdef ad ON a.attrelid = ad.adrelid AND a.attnum = ad.adnum
+            WHERE {_RELATION_FILTER}
+              AND a.attnum > 0
+              AND NOT a.attisdropped
+            ORDER BY a.attrelid, a.attnum
+        """  # noqa: S608 - only a constant filter is interpolated
+
+        rows: list[Any] = await conn.fetch(query, relation_oids)
+        return rows
 
-        rows = await conn.fetch(query, table_name, schema_name)
-        return [row["column_name"] for row in rows]
+    async def _fetch_constraint_rows(
+        self, conn: Connection, relation_oids: list[int] | None
+    ) -> list[Any]:
+        """Fetch primary key, unique and foreign key constraint columns.
 
-    async def _get_foreign_keys(
-        self, conn: Connection, table_name: str, schema_name: str
-    ) -> list[ForeignKeyInfo]:
-        """Get foreign key relationships for a table.
+        Constraint keys are unnested pairwise, so multi-column foreign keys map
+        each local column to its matching referenced column.
 
         Args:
             conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
+            relation_oids: Optional relation OIDs filter.
 
         Returns:
-            list[ForeignKeyInfo]: List of foreign key information objects.
+            list: One row per constraint column, ordered by relation,
+                constraint name and key position.
         """
-        query = """
+        query = f"""
             SELECT
+                con.conrelid AS relid,
                 con.conname AS constraint_name,
+                con.contype::text AS constraint_type,  -- asyncpg decodes "char" as bytes
                 a.attname AS column_name,
                 ref_c.relname AS referenced_table,
                 ref_a.attname AS referenced_column
             FROM pg_constraint con
             JOIN pg_class c ON con.conrelid = c.oid
             JOIN pg_namespace n ON c.relnamespace = n.oid
-            JOIN pg_attribute a
-                ON a.attrelid = c.oid AND a.attnum = ANY(con.conkey)
-            JOIN pg_class ref_c ON con.confrelid = ref_c.oid
-            JOIN pg_attribute ref_a
-                ON ref_a.attrelid = ref_c.oid
-                AND ref_a.attnum = ANY(con.confkey)
-            WHERE c.relname = $1
-              AND n.nspname = $2
-              AND con.contype = 'f'  -- foreign key
-            ORDER BY con.conname
-        """
-
-        rows = await conn.fetch(query, table_name, schema_name)
-
-        return [
-            ForeignKeyInfo(
-                constraint_name=row["constraint_name"],
-                column_name=row["column_name"],
-                referenced_table=row["referenced_table"],
-                referenced_column=row["referenced_column"],
-            )
-            for row in rows
-        ]
-
-    async def _get_indexes(
-        self, conn: Connection, table_name: str, schema_name: str
-    ) -> list[IndexInfo]:
-        """Get index information for a table.
+            CROSS JOIN LATERAL unnest(con.conkey, con.confkey)
+                WITH ORDINALITY AS k(attnum, ref_attnum, ord)
+            JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+            LEFT JOIN pg_class ref_c ON ref_c.oid = con.confrelid
+            LEFT JOIN pg_attribute ref_a
+                ON ref_a.attrelid = con.confrelid AND ref_a.attnum = k.ref_attnum
+            WHERE {_RELATION_FILTER}
+              AND con.contype IN ('p', 'u', 'f')  -- primary key, unique, foreign key
+            ORDER BY con.conrelid, con.conname, k.ord
+        """  # noqa: S608 - only a constant filter is interpolated
+
+        rows: list[Any] = await conn.fetch(query, relation_oids)
+        return rows
+
+    async def _fetch_index_rows(
+        self, conn: Connection, relation_oids: list[int] | None
+    ) -> list[Any]:
+        """Fetch non-primary-key indexes of all user tables.
 
         Args:
             conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
+            relation_oids: Optional relation OIDs filter.
 
         Returns:
-            list[IndexInfo]: List of index information objects.
+            list: Index rows ordered by relation and index name.
         """
-        query = """
+        query = f"""
             SELECT
+                idx.indrelid AS relid,
                 i.relname AS index_name,
                 idx.indisunique AS is_unique,
                 am.amname AS index_type,
                 ARRAY(
                     SELECT a.attname
-                    FROM pg_attribute a
-                    WHERE a.attrelid = idx.indrelid
-                      AND a.attnum = ANY(idx.indkey)
-                    ORDER BY array_position(idx.indkey, a.attnum)
+                    FROM unnest(idx.indkey::int2[]) WITH ORDINALITY AS k(attnum, ord)
+                    JOIN pg_attribute a
+                        ON a.attrelid = idx.indrelid AND a.attnum = k.attnum
+                    ORDER BY k.ord
                 ) AS columns
             FROM pg_index idx
             JOIN pg_class i ON i.oid = idx.indexrelid
             JOIN pg_class c ON c.oid = idx.indrelid
             JOIN pg_namespace n ON c.relnamespace = n.oid
             JOIN pg_am am ON i.relam = am.oid
-            WHERE c.relname = $1
-              AND n.nspname = $2
+            WHERE {_RELATION_FILTER}
               AND NOT idx.indisprimary  -- exclude primary key indexes
-            ORDER BY i.relname
-        """
+            ORDER BY idx.indrelid, i.relname
+        """  # noqa: S608 - only a constant filter is interpolated
 
-        rows = await conn.fetch(query, table_name, schema_name)
+        rows: list[Any] = await conn.fetch(query, relation_oids)
+        return rows
 
-        return [
-            IndexInfo(
-                name=row["index_name"],
-                columns=list(row["columns"]),
-                is_unique=row["is_unique"],
-                index_type=row["index_type"],
-            )
-            for row in rows
-        ]
-
-    async def _get_views(self, conn: Connection) -> list[TableInfo]:
-        """Get all user views.
+    def _assemble_tables(
+        self,
+        relation_rows: list[Any],
+        column_rows: list[Any],
+        constraint_rows: list[Any],
+        index_rows: list[Any],
+    ) -> list[TableInfo]:
+        """Assemble TableInfo objects from bulk catalog rows.
 
         Args:
-            conn: Database connection.
+            relation_rows: Rows from ``_fetch_relation_rows``.
+            column_rows: Rows from ``_fetch_column_rows``.
+            constraint_rows: Rows from ``_fetch_constraint_rows``.
+            index_rows: Rows from ``_fetch_index_rows``.
 
         Returns:
-            list[TableInfo]: List of view information objects.
-        """
-        query = """
-            SELECT
-                n.nspname AS schema_name,
-                c.relname AS table_name,
-                obj_description(c.oid, 'pg_class') AS comment
-            FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE c.relkind = 'v'  -- views only
-              AND n.nspname NOT IN ('pg_catalog', 'information_schema')
-            ORDER BY n.nspname, c.relname
+            list[TableInfo]: Fully populated tables, in relation row order.
         """
+        primary_keys: dict[int, set[str]] = defaultdict(set)
+        unique_columns: dict[int, set[str]] = defaultdict(set)
+        foreign_keys: dict[int, list[ForeignKeyInfo]] = defaultdict(list)
+
+        for row in constraint_rows:
+            relid = row["relid"]
+            constraint_type = row["constraint_type"]
+            if constraint_type == "p":
+                primary_keys[relid].add(row["column_name"])
+            elif constraint_type == "u":
+                unique_columns[relid].add(row["column_name"])
+            elif constraint_type == "f":
+                foreign_keys[relid].append(
+                    ForeignKeyInfo(
+                        constraint_name=row["constraint_name"],
+                        column_name=row["column_name"],
+                        referenced_table=row["referenced_table"],
+                        referenced_column=row["referenced_column"],
+                    )
+                )
 
-        rows = await conn.fetch(query)
+        columns: dict[int, list[ColumnInfo]] = defaultdict(list)
+        for row in column_rows:
+            relid = row["relid"]
+            name = row["column_name"]
+            columns[relid].append(
+                ColumnInfo(
+                    name=name,
+                    data_type=row["data_type"],
+                    is_nullable=row["is_nullable"],
+                    default_value=row["default_value"],
+                    is_primary_key=name in primary_keys[relid],
+                    is_unique=name in unique_columns[relid],
+                    comment=row["comment"],
+                )
+            )
 
-        return [
-            TableInfo(
-                schema_name=row["schema_name"],
-                table_name=row["table_name"],
-                comment=row["comment"],
-                row_count_estimate=None,
+        indexes: dict[int, list[IndexInfo]] = defaultdict(list)
+        for row in index_rows:
+            indexes[row["relid"]].append(
+                IndexInfo(
+                    name=row["index_name"],
+                    columns=list(row["columns"]),
+                    is_unique=row["is_unique"],
+                    index_type=row["index_type"],
+                )
             )
-            for row in rows
-        ]
+
+        tables = []
+        for row in relation_rows:
+            relid = row["oid"]
+            estimate = row["row_count_estimate"]
+            tables.append(
+                TableInfo(
+                    schema_name=row["schema_name"],
+                    table_name=row["table_name"],
+                    columns=columns.get(relid, []),
+                    foreign_keys=foreign_keys.get(relid, []),
+                    indexes=indexes.get(relid, []),
+                    comment=row["comment"],
+                    row_count_estimate=int(estimate) if estimate is not None else 0,
+                    oid=relid,
+                    fingerprint=row["fingerprint"],
+                )
+            )
+
+        return tables
 
     async def _get_enum_types(self, conn: Connection) -> list[EnumTypeInfo]:
         """Get custom ENUM type definitions.
@@ -399,30 +489,3 @@ class SchemaIntrospector:
             )
             for row in rows
         ]
-
-    async def _get_row_count_estimate(
-        self, conn: Connection, table_name: str, schema_name: str
-    ) -> int:
-        """Get estimated row count for a table.
-
-        This uses PostgreSQL's statistics rather than COUNT(*) for better
-        performance on large tables.
-
-        Args:
-            conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
-
-        Returns:
-            int: Estimated number of rows.
-        """
-        query = """
-            SELECT reltuples::bigint AS estimate
-            FROM pg_class c
-            JOIN pg_namespace n ON c.relnamespace = n.oid
-            WHERE c.relname = $1
-              AND n.nspname = $2
-        """
-
-        result = await conn.fetchval(query, table_name, schema_name)
-        return int(result) if result is not None else 0
@@ -4,32 +4,72 @@ This module provides utilities for creating and managing asyncpg connection
 pools for PostgreSQL databases.
 """
 
+import asyncio
+
 import asyncpg
 from asyncpg import Pool
 
-from pg_mcp.config.settings import DatabaseConfig
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
 
 
-async def create_pool(config: DatabaseConfig) -> Pool:
-    """Create a connection pool for a single database.
+def session_settings(security_config: SecurityConfig) -> dict[str, str]:
+    """Build the per-connection session settings for a security configuration.
+
+    With ``session_setup="per_connection"`` the safe search_path and the
+    read-only role are sent as startup parameters when each physical
+    connection is opened, instead of as SET statements before every query.
+    Startup parameters become the session defaults, so they cost no round
+    trip and survive the ``RESET ALL`` the pool runs when a connection is
+    released.
+
+    Args:
+        security_config: Security configuration.
+
+    Returns:
+        dict[str, str]: Server settings to pass to ``asyncpg.create_pool``;
+            empty for ``session_setup="per_query"``.
+
+    Example:
+        >>> session_settings(SecurityConfig(session_setup="per_connection"))
+        {'search_path': 'public'}
+    """
+    if security_config.session_setup != "per_connection":
+        return {}
+
+    settings = {"search_path": security_config.safe_search_path}
+    if security_config.readonly_role:
+        settings["role"] = security_config.readonly_role
+    return settings
+
+
+def build_pool(
+    config: DatabaseConfig,
+    security_config: SecurityConfig | None = None,
+) -> Pool:
+    """Build a connection pool for a single database without connecting.
+
+    The returned pool opens no connection until it is awaited, so services
+    can be wired to it straight away while the connections are established
+    in the background (see ``DatabaseWarmup``). Acquiring from the pool
+    before it has been awaited raises ``asyncpg.InterfaceError``.
 
     Args:
         config: Database configuration containing connection parameters
             and pool settings.
+        security_config: Optional security configuration. With
+            ``session_setup="per_connection"`` its search_path and read-only
+            role are applied once per connection (see ``session_settings``).
 
     Returns:
-        Pool: An asyncpg connection pool instance.
-
-    Raises:
-        asyncpg.PostgresError: If connection to the database fails.
+        Pool: An uninitialized asyncpg connection pool.
 
     Example:
-        >>> config = DatabaseConfig(host="localhost", name="mydb")
-        >>> pool = await create_pool(config)
-        >>> async with pool.acquire() as conn:
-        ...     result = await conn.fetch("SELECT 1")
+        >>> pool = build_pool(DatabaseConfig(host="localhost", name="mydb"))
+        >>> await pool  # connect
     """
-    pool = await asyncpg.create_pool(
+    server_settings = session_settings(security_config) if security_config else {}
+
+    return asyncpg.create_pool(
         host=config.host,
         port=config.port,
         database=config.name,
@@ -39,15 +79,48 @@ async def create_pool(config: DatabaseConfig) -> Pool:
         max_size=config.max_pool_size,
         timeout=config.pool_timeout,
         command_timeout=config.command_timeout,
+        server_settings=server_settings or None,
     )
 
+
+async def create_pool(
+    config: DatabaseConfig,
+    security_config: SecurityConfig | None = None,
+) -> Pool:
+    """Create a connection pool for a single database.
+
+    Args:
+        config: Database configuration containing connection parameters
+            and pool settings.
+        security_config: Optional security configuration. With
+            ``session_setup="per_connection"`` its search_path and read-only
+            role are applied once per connection (see ``session_settings``).
+
+    Returns:
+        Pool: An asyncpg connection pool instance.
+
+    Raises:
+        asyncpg.PostgresError: If connection to the database fails, e.g.
+            because the configured read-only role does not exist.
+
+    Example:
+        >>> config = DatabaseConfig(host="localhost", name="mydb")
+        >>> pool = await create_pool(config)
+        >>> async with pool.acquire() as conn:
+        ...     result = await conn.fetch("SELECT 1")
+    """
+    pool = await build_pool(config, security_config)
+
     if pool is None:
         raise RuntimeError(f"Failed to create connection pool for {config.name}")
 
     return pool
 
 
-async def create_pools(configs: list[DatabaseConfig]) -> dict[str, Pool]:
+async def create_pools(
+    configs: list[DatabaseConfig],
+    security_config: SecurityConfig | None = None,
+) -> dict[str, Pool]:
     """Create connection pools for multiple databases.
 
     This function creates pools concurrently for all provided database
@@ -55,12 +128,15 @@ async def create_pools(configs: list[DatabaseConfig]) -> dict[str, Pool]:
 
     Args:
         configs: List of database configurations.
+        security_config: Optional security configuration passed to
+            ``create_pool`` for every database.
 
     Returns:
         dict[str, Pool]: Dictionary mapping database names to their pools.
 
     Raises:
-        asyncpg.PostgresError: If any database connection fails.
+        asyncpg.PostgresError: If any database connection fails. Pools that
+            were created successfully are closed before the error is raised.
 
     Example:
         >>> configs = [
@@ -70,13 +146,21 @@ async def create_pools(configs: list[DatabaseConfig]) -> dict[str, Pool]:
         >>> pools = await create_pools(configs)
         >>> assert "db1" in pools and "db2" in pools
     """
-    pools: dict[str, Pool] = {}
+    results = await asyncio.gather(
+        *(create_pool(config, security_config) for config in configs),
+        return_exceptions=True,
+    )
 
-    for config in configs:
-        pool = await create_pool(config)
-        pools[config.name] = pool
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        # Don't leak the pools that were created before reporting the failure
+        await asyncio.gather(
+            *(result.close() for result in results if not isinstance(result, BaseException)),
+            return_exceptions=True,
+        )
+        raise errors[0]
 
-    return pools
+    return {config.name: pool for config, pool in zip(configs, results, strict=True)}
 
 
 async def close_pools(pools: dict[str, Pool], timeout: float = 10.0) -> None:
@@ -108,11 +192,13 @@ async def close_pools(pools: dict[str, Pool], timeout: float = 10.0) -> None:
             logger.info(f"Connection pool for '{db_name}' closed gracefully")
         except asyncio.TimeoutError:
             # Force termination if graceful close times out
-            logger.warning(
-                f"Graceful close timed out for '{db_name}', forcing termination"
-            )
+            logger.warning(f"Graceful close timed out for '{db_name}', forcing termination")
             pool.terminate()
             logger.info(f"Connection pool for '{db_name}' terminated")
+        except asyncpg.InterfaceError:
+            # The pool was never initialized (e.g. shutdown during warm-up),
+            # so it holds no connections
+            logger.info(f"Connection pool for '{db_name}' was never opened")
         except Exception as e:
             # Log error but continue closing other pools
             logger.error(f"Error closing pool for '{db_name}': {e!s}")
@@ -10,17 +10,24 @@ from pg_mcp.models.errors import (
     LLMTimeoutError,
     LLMUnavailableError,
     PgMcpError,
+    QueryCostExceededError,
     RateLimitExceededError,
+    ResultExportError,
     SchemaLoadError,
     SecurityViolationError,
     SQLParseError,
     ValidationError,
 )
 from pg_mcp.models.query import (
+    ExecutionResult,
     QueryRequest,
     QueryResponse,
     QueryResult,
+    RequestTimings,
+    ResultFormat,
+    ResultResource,
     ReturnType,
+    SpanTiming,
     ValidationResult,
 )
 from pg_mcp.models.schema import (
@@ -29,6 +36,7 @@ from pg_mcp.models.schema import (
     EnumTypeInfo,
     ForeignKeyInfo,
     IndexInfo,
+    RelationFingerprint,
     TableInfo,
 )
 
@@ -38,14 +46,20 @@ __all__ = [
     "ForeignKeyInfo",
     "IndexInfo",
     "TableInfo",
+    "RelationFingerprint",
     "EnumTypeInfo",
     "DatabaseSchema",
     # Query models
     "ReturnType",
+    "ResultFormat",
     "QueryRequest",
     "ValidationResult",
     "QueryResult",
+    "ResultResource",
+    "SpanTiming",
+    "RequestTimings",
     "QueryResponse",
+    "ExecutionResult",
     # Error models
     "ErrorCode",
     "ErrorDetail",
@@ -61,4 +75,6 @@ __all__ = [
     "SchemaLoadError",
     "ExecutionTimeoutError",
     "RateLimitExceededError",
+    "QueryCostExceededError",
+    "ResultExportError",
 ]
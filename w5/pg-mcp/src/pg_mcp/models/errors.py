@@ -34,6 +34,7 @@ class ErrorCode(StrEnum):
     # Resource errors
     RATE_LIMIT_EXCEEDED = "rate_limit_exceeded"
     RESOURCE_EXHAUSTED = "resource_exhausted"
+    QUERY_TOO_EXPENSIVE = "query_too_expensive"
 
 
 class ErrorDetail:
@@ -280,3 +281,40 @@ class RateLimitExceededError(PgMcpError):
             details: Optional rate limit details (e.g., retry_after).
         """
         super().__init__(message=message, code=ErrorCode.RATE_LIMIT_EXCEEDED, details=details)
+
+
+class QueryCostExceededError(PgMcpError):
+    """Exception raised when a query's estimated plan cost exceeds the limits.
+
+    Raised before execution, from the ``EXPLAIN`` plan, so that queries which
+    would only end at ``statement_timeout`` never hold a connection for it.
+    """
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        """Initialize query cost error.
+
+        Args:
+            message: Error message describing the expensive part of the plan.
+            details: Optional plan estimates and the limits they exceed.
+        """
+        super().__init__(message=message, code=ErrorCode.QUERY_TOO_EXPENSIVE, details=details)
+
+
+class ResultExportError(PgMcpError):
+    """Exception raised when a query result cannot be exported to a resource."""
+
+    def __init__(
+        self,
+        message: str,
+        details: dict[str, Any] | None = None,
+        code: ErrorCode = ErrorCode.RESOURCE_EXHAUSTED,
+    ) -> None:
+        """Initialize result export error.
+
+        Args:
+            message: Error message describing why the export failed.
+            details: Optional export size and limits.
+            code: Error code; defaults to RESOURCE_EXHAUSTED for exports over
+                the memory budget.
+        """
+        super().__init__(message=message, code=code, details=details)
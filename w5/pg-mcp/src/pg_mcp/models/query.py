@@ -17,6 +17,15 @@ class ReturnType(StrEnum):
     RESULT = "result"  # Execute and return query results
 
 
+class ResultFormat(StrEnum):
+    """Format of executed query results returned to the client."""
+
+    ROWS = "rows"  # One dict per row
+    COLUMNAR = "columnar"  # Column names plus one value array per column
+    ARROW = "arrow"  # Arrow IPC stream in a temporary MCP resource
+    CSV = "csv"  # CSV in a temporary MCP resource
+
+
 class QueryRequest(BaseModel):
     """Query request from client containing natural language question."""
 
@@ -32,6 +41,12 @@ class QueryRequest(BaseModel):
     return_type: ReturnType = Field(
         default=ReturnType.RESULT, description="Whether to return SQL or execute and return results"
     )
+    result_format: ResultFormat = Field(
+        default=ResultFormat.ROWS, description="Format of executed results in the response"
+    )
+    include_timings: bool = Field(
+        default=False, description="Whether to report where the request spent its time"
+    )
 
     @field_validator("question")
     @classmethod
@@ -102,13 +117,57 @@ class ResultValidationResult(BaseModel):
     )
 
 
+class ExecutionResult(BaseModel):
+    """Rows fetched by the SQL executor, with truncation information."""
+
+    rows: list[dict[str, Any]] = Field(default_factory=list, description="Serialized result rows")
+    truncated: bool = Field(
+        default=False, description="Whether the query produced more rows than were fetched"
+    )
+    total_row_count: int | None = Field(
+        None, ge=0, description="Total rows produced by the query, if known"
+    )
+    total_row_count_exact: bool = Field(
+        default=True,
+        description="Whether total_row_count is exact rather than an estimate or lower bound",
+    )
+
+
+class ResultResource(BaseModel):
+    """Temporary MCP resource holding an exported query result."""
+
+    uri: str = Field(..., description="Resource URI to read the result from")
+    mime_type: str = Field(..., description="MIME type of the resource content")
+    size_bytes: int = Field(..., ge=0, description="Size of the exported result in bytes")
+    expires_in: float = Field(..., ge=0.0, description="Seconds the resource remains readable")
+
+
 class QueryResult(BaseModel):
     """Result data from query execution."""
 
     columns: list[str] = Field(default_factory=list, description="Column names in result set")
-    rows: list[dict[str, Any]] = Field(default_factory=list, description="Result rows as dicts")
+    rows: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Result rows as dicts (empty for the columnar, arrow and csv formats)",
+    )
+    column_values: list[list[Any]] | None = Field(
+        default=None, description="One value array per column, in column order (columnar format)"
+    )
+    resource: ResultResource | None = Field(
+        default=None, description="Resource holding the exported result (arrow and csv formats)"
+    )
     row_count: int = Field(default=0, ge=0, description="Number of rows returned")
     execution_time_ms: float = Field(default=0.0, ge=0.0, description="Query execution time in ms")
+    truncated: bool = Field(
+        default=False, description="Whether rows were cut off at the configured row limit"
+    )
+    total_row_count: int | None = Field(
+        None, ge=0, description="Total rows produced by the query, if known"
+    )
+    total_row_count_exact: bool = Field(
+        default=True,
+        description="Whether total_row_count is exact rather than an estimate or lower bound",
+    )
 
     @field_validator("row_count", mode="before")
     @classmethod
@@ -122,9 +181,17 @@ class QueryResult(BaseModel):
         Returns:
             int: Validated row count.
         """
-        # If rows exist in values, use its length
-        if hasattr(info, "data") and "rows" in info.data:
-            return len(info.data["rows"])
+        if hasattr(info, "data"):
+            # Columnar results count the values of a column
+            column_values = info.data.get("column_values")
+            if column_values:
+                return len(column_values[0])
+            # Exported results keep the count of rows written to the resource
+            if info.data.get("resource") is not None:
+                return v
+            # If rows exist in values, use its length
+            if "rows" in info.data:
+                return len(info.data["rows"])
         return v
 
     def to_dict(self) -> dict[str, Any]:
@@ -144,18 +211,53 @@ class ErrorDetail(BaseModel):
     details: dict[str, Any] | None = Field(None, description="Additional error context")
 
 
+class SpanTiming(BaseModel):
+    """Time spent in one traced part of a request."""
+
+    name: str = Field(..., description="Span name (pipeline stage or operation)")
+    parent: str | None = Field(None, description="Name of the enclosing span, if any")
+    start_ms: float = Field(..., ge=0.0, description="Start, in ms after the request started")
+    duration_ms: float = Field(..., ge=0.0, description="Duration in ms")
+    attributes: dict[str, Any] | None = Field(None, description="Span attributes")
+
+
+class RequestTimings(BaseModel):
+    """Latency breakdown of a request."""
+
+    total_ms: float = Field(..., ge=0.0, description="Total request duration in ms")
+    spans: list[SpanTiming] = Field(
+        default_factory=list, description="Traced spans, in order of their start"
+    )
+
+
 class QueryResponse(BaseModel):
     """Complete query response to client."""
 
     success: bool = Field(..., description="Whether query succeeded")
     generated_sql: str | None = Field(None, description="Generated SQL query")
+    executed_sql: str | None = Field(
+        default=None,
+        description="SQL actually executed, with the row limit pushed down (if executed)",
+    )
     validation: ValidationResult | None = Field(None, description="SQL validation results")
     data: QueryResult | None = Field(None, description="Query result data (if executed)")
     error: ErrorDetail | None = Field(None, description="Error information if failed")
     confidence: int = Field(
         default=100, ge=0, le=100, description="Confidence score of generated SQL (0-100)"
     )
+    result_validation: str | None = Field(
+        default=None,
+        description=(
+            "How the results were validated: 'validate' if they were sent to the LLM, otherwise "
+            "why confidence is the default of 100 (deferred, backlog_full, empty_result, "
+            "single_row_aggregate, top_n, sampled_out); None if validation is disabled"
+        ),
+    )
     tokens_used: int | None = Field(None, ge=0, description="LLM tokens used for generation")
+    request_id: str | None = Field(None, description="ID of the request, for tracing in logs")
+    timings: RequestTimings | None = Field(
+        default=None, description="Latency breakdown, if requested with include_timings"
+    )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert response to dictionary for MCP tool return.
@@ -2,11 +2,20 @@
 
 This module defines data models representing PostgreSQL database schema
 including tables, columns, foreign keys, indexes, and enum types.
+
+Rendering a large schema into prompt text is comparatively expensive, so
+``TableInfo.to_prompt_section`` and ``DatabaseSchema.to_prompt_context``
+memoise their output on the instance. Assigning a field or producing an
+updated copy with ``model_copy(update=...)`` discards the memo; in-place
+mutation of nested lists does not, so call ``invalidate_prompt_cache()``
+after editing e.g. ``table.columns`` directly.
 """
 
-from typing import Any
+import hashlib
+from collections.abc import Callable, Mapping
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ColumnInfo(BaseModel):
@@ -83,7 +92,68 @@ class IndexInfo(BaseModel):
         return f"  - {idx_type}{self.index_type.upper()} INDEX on ({cols})"
 
 
-class TableInfo(BaseModel):
+class _PromptMemo:
+    """Holder for memoised prompt text.
+
+    Always compares equal so that two models differing only in whether they
+    have been rendered yet still compare equal.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str | None = None):
+        self.text = text
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _PromptMemo)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class _PromptRenderedModel(BaseModel):
+    """Base for models that memoise their rendered prompt text."""
+
+    _prompt_memo: _PromptMemo = PrivateAttr(default_factory=_PromptMemo)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._prompt_memo = _PromptMemo()
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the model, keeping the rendered prompt only if nothing changed.
+
+        Args:
+            update: Field values to replace in the copy.
+            deep: Whether to deep copy field values.
+
+        Returns:
+            Self: The copied model.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied._prompt_memo = _PromptMemo(None if update else self._prompt_memo.text)
+        return copied
+
+    def invalidate_prompt_cache(self) -> None:
+        """Discard the memoised prompt text after in-place nested edits."""
+        self._prompt_memo = _PromptMemo()
+
+    def _memoised_prompt(self, render: Callable[[], str]) -> str:
+        """Return the memoised prompt text, rendering it on first use.
+
+        Args:
+            render: Function producing the prompt text.
+
+        Returns:
+            str: Rendered prompt text.
+        """
+        memo = self._prompt_memo
+        if memo.text is None:
+            memo.text = render()
+        return memo.text
+
+
+class TableInfo(_PromptRenderedModel):
     """Complete information about a database table."""
 
     schema_name: str = Field(default="public", description="Schema name")
@@ -95,6 +165,10 @@ class TableInfo(BaseModel):
     indexes: list[IndexInfo] = Field(default_factory=list, description="Table indexes")
     comment: str | None = Field(None, description="Table comment/description")
     row_count_estimate: int | None = Field(None, description="Estimated row count")
+    oid: int | None = Field(None, description="Relation OID in pg_class")
+    fingerprint: str | None = Field(
+        None, description="Hash of the relation's catalog definition, used for change detection"
+    )
 
     @property
     def full_name(self) -> str:
@@ -108,9 +182,20 @@ class TableInfo(BaseModel):
     def to_prompt_section(self) -> str:
         """Format table info for LLM prompt.
 
+        The result is memoised until the table is modified, so a table the
+        schema cache carries over unchanged across refreshes is rendered once.
+
         Returns:
             str: Formatted table description for inclusion in schema context.
         """
+        return self._memoised_prompt(self._render_prompt_section)
+
+    def _render_prompt_section(self) -> str:
+        """Render the prompt section without consulting the memo.
+
+        Returns:
+            str: Formatted table description.
+        """
         lines = [f"\nTable: {self.full_name}"]
 
         if self.comment:
@@ -136,6 +221,14 @@ class TableInfo(BaseModel):
         return "\n".join(lines)
 
 
+class RelationFingerprint(BaseModel):
+    """Cheap per-relation change marker used for incremental schema refresh."""
+
+    oid: int = Field(..., description="Relation OID in pg_class")
+    fingerprint: str = Field(..., description="Hash of the relation's catalog definition")
+    row_count_estimate: int = Field(default=0, description="Estimated row count")
+
+
 class EnumTypeInfo(BaseModel):
     """Information about a PostgreSQL ENUM type."""
 
@@ -162,7 +255,7 @@ class EnumTypeInfo(BaseModel):
         return f"  - {self.type_name}: {values}"
 
 
-class DatabaseSchema(BaseModel):
+class DatabaseSchema(_PromptRenderedModel):
     """Complete database schema information."""
 
     database_name: str = Field(..., description="Database name")
@@ -185,12 +278,52 @@ class DatabaseSchema(BaseModel):
                 return table
         return None
 
+    def definition_fingerprint(self) -> str:
+        """Compute a hash identifying this version of the schema definition.
+
+        Row count estimates are ignored, so the fingerprint only changes when
+        tables, columns, constraints, indexes or enum types change. Tables
+        carrying a catalog fingerprint contribute that instead of their full
+        definition.
+
+        Returns:
+            str: Hex digest of the schema definition.
+        """
+        digest = hashlib.sha256(self.database_name.encode())
+        for table in self.tables:
+            digest.update(b"\0T")
+            digest.update(
+                table.fingerprint.encode()
+                if table.fingerprint
+                else table.model_dump_json(
+                    exclude={"row_count_estimate", "oid", "fingerprint"}
+                ).encode()
+            )
+        for enum in self.enum_types:
+            digest.update(b"\0E")
+            digest.update(enum.model_dump_json().encode())
+        return digest.hexdigest()
+
     def to_prompt_context(self) -> str:
         """Generate complete schema context for LLM prompt.
 
         This method creates a comprehensive yet concise representation of the
         database schema suitable for inclusion in LLM prompts for SQL generation.
 
+        The schema cache publishes a new DatabaseSchema object for every
+        schema version, so the context is rendered once per version and then
+        reused across requests and retry attempts. Rendering a new version
+        joins the memoised sections of the tables it shares with the previous
+        one and only renders the tables that were refreshed.
+
+        Returns:
+            str: Formatted schema context string.
+        """
+        return self._memoised_prompt(self._render_prompt_context)
+
+    def _render_prompt_context(self) -> str:
+        """Render the schema context without consulting the memo.
+
         Returns:
             str: Formatted schema context string.
         """
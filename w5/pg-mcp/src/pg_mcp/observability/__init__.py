@@ -2,8 +2,9 @@
 
 This module provides comprehensive observability features including:
 - Prometheus metrics collection
+- Per-stage query pipeline instrumentation
 - Structured JSON logging
-- Request tracing and context propagation
+- Request tracing, context propagation and span export
 
 Example:
     >>> from pg_mcp.observability import metrics, configure_logging, request_context
@@ -20,6 +21,14 @@ Example:
     ...     logger.info("Query completed", extra={"request_id": request_id})
 """
 
+from pg_mcp.observability.instrumentation import (
+    MetricsSampler,
+    Stage,
+    current_database,
+    database_scope,
+    record_llm_call,
+    stage_timer,
+)
 from pg_mcp.observability.logging import (
     JSONFormatter,
     SensitiveDataFilter,
@@ -29,15 +38,22 @@ from pg_mcp.observability.logging import (
 )
 from pg_mcp.observability.metrics import MetricsCollector, metrics
 from pg_mcp.observability.tracing import (
+    JsonLinesSpanExporter,
+    RequestTrace,
+    Span,
+    SpanExporter,
     TraceContext,
     TracingLogger,
     clear_request_id,
     generate_request_id,
+    get_current_trace,
     get_request_id,
     get_tracing_logger,
     request_context,
     set_request_id,
+    span,
     trace_async,
+    trace_scope,
     trace_sync,
 )
 
@@ -45,6 +61,13 @@ __all__ = [
     # Metrics
     "MetricsCollector",
     "metrics",
+    # Instrumentation
+    "Stage",
+    "stage_timer",
+    "database_scope",
+    "current_database",
+    "record_llm_call",
+    "MetricsSampler",
     # Logging
     "configure_logging",
     "get_logger",
@@ -62,4 +85,12 @@ __all__ = [
     "TraceContext",
     "TracingLogger",
     "get_tracing_logger",
+    # Spans
+    "Span",
+    "RequestTrace",
+    "span",
+    "trace_scope",
+    "get_current_trace",
+    "SpanExporter",
+    "JsonLinesSpanExporter",
 ]
@@ -0,0 +1,201 @@
+"""Query pipeline instrumentation.
+
+Services that take an optional ``MetricsCollector`` record the duration of
+their part of the query pipeline with ``stage_timer``, which also adds a span
+to the request trace when the request is traced. Stages are labelled
+with the database of the request, which the orchestrator sets once per
+request with ``database_scope`` so that services shared by every database
+(the SQL generator and validators) need not be told which one they serve.
+
+Values that are not tied to a request, such as connection pool sizes and
+cache ages, are sampled periodically by ``MetricsSampler``.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from pg_mcp.observability.tracing import get_current_trace
+
+if TYPE_CHECKING:
+    from asyncpg import Pool
+
+    from pg_mcp.cache.schema_cache import SchemaCache
+    from pg_mcp.observability.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+# Label used for stages recorded outside a database scope
+UNKNOWN_DATABASE = "unknown"
+
+_database: ContextVar[str] = ContextVar("pg_mcp_database", default=UNKNOWN_DATABASE)
+
+
+class Stage(StrEnum):
+    """Stages of the query pipeline."""
+
+    SCHEMA_LOOKUP = "schema_lookup"  # Wait for warm-up and get the schema
+    PROMPT_BUILD = "prompt_build"  # Render the SQL generation prompt
+    LLM_GENERATE = "llm_generate"  # SQL generation API call
+    VALIDATE = "validate"  # Security validation of generated SQL
+    EXECUTE = "execute"  # Run the SQL and fetch rows
+    SERIALIZE = "serialize"  # Convert fetched records to JSON-native rows
+    RESULT_VALIDATION = "result_validation"  # LLM check of the results
+
+
+@contextlib.contextmanager
+def database_scope(database: str) -> Iterator[None]:
+    """Label the stages recorded in this context with a database.
+
+    Args:
+        database: Database name of the current request.
+
+    Yields:
+        None
+    """
+    token = _database.set(database)
+    try:
+        yield
+    finally:
+        _database.reset(token)
+
+
+def current_database() -> str:
+    """Get the database of the current request.
+
+    Returns:
+        str: Database name, or "unknown" outside a database scope.
+    """
+    return _database.get()
+
+
+@contextlib.contextmanager
+def stage_timer(
+    metrics: "MetricsCollector | None", stage: Stage, database: str | None = None
+) -> Iterator[None]:
+    """Record the duration of a pipeline stage, whether or not it succeeds.
+
+    The duration goes to the metrics collector and, if the request is traced,
+    to a span of the request trace.
+
+    Args:
+        metrics: Metrics collector, or None to record no metric.
+        stage: Pipeline stage.
+        database: Database label; defaults to the current database scope.
+
+    Yields:
+        None
+    """
+    trace = get_current_trace()
+    if metrics is None and trace is None:
+        yield
+        return
+
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        end = time.perf_counter_ns()
+        database = database or current_database()
+        if metrics is not None:
+            metrics.observe_stage(stage.value, database, (end - start) / 1e9)
+        if trace is not None:
+            trace.record(stage.value, start, end, {"database": database})
+
+
+def record_llm_call(
+    metrics: "MetricsCollector | None", operation: str, duration: float, usage: Any
+) -> None:
+    """Record a completed LLM API call.
+
+    Args:
+        metrics: Metrics collector, or None to record nothing.
+        operation: LLM operation (generate_sql, validate_result).
+        duration: Call latency in seconds.
+        usage: ``usage`` field of the API response, or None if not reported.
+    """
+    if metrics is None:
+        return
+    metrics.increment_llm_call(operation)
+    metrics.observe_llm_latency(operation, duration)
+    tokens = getattr(usage, "total_tokens", None)
+    if tokens:
+        metrics.increment_llm_tokens(operation, tokens)
+
+
+class MetricsSampler:
+    """Periodically samples connection pool sizes and schema cache ages.
+
+    Example:
+        >>> sampler = MetricsSampler(metrics, pools, schema_cache, interval=15.0)
+        >>> sampler.start()
+        >>> ...
+        >>> await sampler.stop()
+    """
+
+    def __init__(
+        self,
+        metrics: "MetricsCollector",
+        pools: "dict[str, Pool]",
+        schema_cache: "SchemaCache | None" = None,
+        interval: float = 15.0,
+    ) -> None:
+        """Initialize metrics sampler.
+
+        Args:
+            metrics: Metrics collector receiving the gauges.
+            pools: Dictionary mapping database names to connection pools.
+            schema_cache: Optional schema cache whose ages are sampled.
+            interval: Seconds between samples.
+        """
+        self.metrics = metrics
+        self.pools = pools
+        self.schema_cache = schema_cache
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    def sample(self) -> None:
+        """Sample every pool and schema cache age once."""
+        for database, pool in self.pools.items():
+            try:
+                self.metrics.set_db_pool_connections(
+                    database,
+                    size=pool.get_size(),
+                    idle=pool.get_idle_size(),
+                    max_size=pool.get_max_size(),
+                )
+            except Exception as e:
+                logger.debug(
+                    "Failed to sample connection pool",
+                    extra={"database": database, "error": str(e)},
+                )
+
+            if self.schema_cache is not None:
+                age = self.schema_cache.get_cache_age(database)
+                if age is not None:
+                    self.metrics.set_schema_cache_age(database, age)
+
+    def start(self) -> None:
+        """Start sampling in the background (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="pg-mcp-metrics-sampler")
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Sample until cancelled."""
+        while True:
+            self.sample()
+            await asyncio.sleep(self.interval)
@@ -15,10 +15,15 @@ class MetricsCollector:
 
     Metrics Categories:
     - Query metrics: Request counts and durations
+    - Pipeline metrics: Duration of each query pipeline stage per database
     - LLM metrics: API calls, latency, and token usage
-    - Database metrics: Connection pool and query performance
+    - Result validation metrics: Validation decisions and LLM confidence
+    - Retry metrics: Retries and retries refused by the retry budget
+    - SQL generation metrics: Time to valid SQL and hedged candidates
+    - Database metrics: Connection pool sizes and query performance
     - Security metrics: Rejected queries
-    - Cache metrics: Schema cache age
+    - Rate limiting metrics: Queue wait time and concurrency limit per limiter
+    - Cache metrics: Schema cache age, hits, loads and revalidations
 
     Example:
         >>> metrics = MetricsCollector()
@@ -52,9 +57,50 @@ class MetricsCollector:
         self.query_duration: Histogram = Histogram(
             "pg_mcp_query_duration_seconds",
             "Query request processing duration in seconds",
+            labelnames=["database"],
             buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0),
         )
 
+        self.stage_duration: Histogram = Histogram(
+            "pg_mcp_stage_duration_seconds",
+            "Duration of a query pipeline stage in seconds",
+            labelnames=["stage", "database"],
+            buckets=(
+                0.0005,
+                0.001,
+                0.005,
+                0.01,
+                0.05,
+                0.1,
+                0.25,
+                0.5,
+                1.0,
+                2.5,
+                5.0,
+                10.0,
+                30.0,
+            ),
+        )
+
+        self.coalesced_requests: Counter = Counter(
+            "pg_mcp_coalesced_requests_total",
+            "Query requests that joined an identical request already in flight",
+        )
+
+        # Result Validation Metrics
+        self.result_validations: Counter = Counter(
+            "pg_mcp_result_validations_total",
+            "Result validation decisions (LLM call, deferred LLM call, or skip reason)",
+            labelnames=["decision"],
+        )
+
+        self.result_validation_confidence: Histogram = Histogram(
+            "pg_mcp_result_validation_confidence",
+            "Confidence score (0-100) of LLM result validations",
+            labelnames=["database"],
+            buckets=(10, 20, 30, 40, 50, 60, 70, 80, 90, 100),
+        )
+
         # LLM Metrics
         self.llm_calls: Counter = Counter(
             "pg_mcp_llm_calls_total",
@@ -75,6 +121,39 @@ class MetricsCollector:
             labelnames=["operation"],
         )
 
+        # Retry Metrics
+        self.retries: Counter = Counter(
+            "pg_mcp_retries_total",
+            "Retries of transient upstream failures",
+            labelnames=["operation"],
+        )
+
+        self.retry_budget_exhausted: Counter = Counter(
+            "pg_mcp_retry_budget_exhausted_total",
+            "Retries refused because the retry budget was exhausted",
+            labelnames=["operation"],
+        )
+
+        # SQL Generation Metrics
+        self.sql_generation_duration: Histogram = Histogram(
+            "pg_mcp_sql_generation_seconds",
+            "Time from starting a generation attempt to its SQL passing validation",
+            labelnames=["hedged"],
+            buckets=(0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0),
+        )
+
+        self.sql_hedge_candidates: Counter = Counter(
+            "pg_mcp_sql_hedge_candidates_total",
+            "Hedged SQL generation candidates by outcome",
+            labelnames=["outcome"],
+        )
+
+        self.sql_hedge_tokens: Counter = Counter(
+            "pg_mcp_sql_hedge_tokens_total",
+            "Tokens used by hedged SQL generation candidates, accepted or discarded",
+            labelnames=["outcome"],
+        )
+
         # Security Metrics
         self.sql_rejected: Counter = Counter(
             "pg_mcp_sql_rejected_total",
@@ -89,12 +168,32 @@ class MetricsCollector:
             labelnames=["database"],
         )
 
+        self.db_pool_connections: Gauge = Gauge(
+            "pg_mcp_db_pool_connections",
+            "Connections of a database pool by state (size, idle, in_use, max)",
+            labelnames=["database", "state"],
+        )
+
         self.db_query_duration: Histogram = Histogram(
             "pg_mcp_db_query_duration_seconds",
             "Database query execution duration in seconds",
             buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0),
         )
 
+        # Rate Limiting Metrics
+        self.rate_limit_wait: Histogram = Histogram(
+            "pg_mcp_rate_limit_wait_seconds",
+            "Time spent queued for a rate limiter slot in seconds",
+            labelnames=["limiter"],
+            buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+        )
+
+        self.concurrency_limit: Gauge = Gauge(
+            "pg_mcp_concurrency_limit",
+            "Current concurrency limit of a rate limiter",
+            labelnames=["limiter"],
+        )
+
         # Cache Metrics
         self.schema_cache_age: Gauge = Gauge(
             "pg_mcp_schema_cache_age_seconds",
@@ -102,6 +201,12 @@ class MetricsCollector:
             labelnames=["database"],
         )
 
+        self.schema_cache_events: Counter = Counter(
+            "pg_mcp_schema_cache_events_total",
+            "Schema cache lookups, loads and background revalidations",
+            labelnames=["database", "event"],
+        )
+
     def start_metrics_server(self, port: int) -> None:
         """Start the Prometheus metrics HTTP server.
 
@@ -124,6 +229,48 @@ class MetricsCollector:
         """
         self.query_requests.labels(status=status, database=database).inc()
 
+    def observe_query_duration(self, database: str, duration: float) -> None:
+        """Record the duration of a query request.
+
+        Args:
+            database: Target database name.
+            duration: Duration in seconds.
+        """
+        self.query_duration.labels(database=database).observe(duration)
+
+    def observe_stage(self, stage: str, database: str, duration: float) -> None:
+        """Record the duration of a query pipeline stage.
+
+        Args:
+            stage: Pipeline stage (schema_lookup, prompt_build, llm_generate,
+                validate, execute, serialize, result_validation).
+            database: Target database name.
+            duration: Duration in seconds.
+        """
+        self.stage_duration.labels(stage=stage, database=database).observe(duration)
+
+    def increment_coalesced_request(self) -> None:
+        """Increment the counter of requests sharing an in-flight request."""
+        self.coalesced_requests.inc()
+
+    def increment_result_validation(self, decision: str) -> None:
+        """Increment the result validation decision counter.
+
+        Args:
+            decision: Validation decision (validate, deferred, backlog_full,
+                empty_result, single_row_aggregate, top_n, sampled_out).
+        """
+        self.result_validations.labels(decision=decision).inc()
+
+    def observe_result_validation_confidence(self, database: str, confidence: int) -> None:
+        """Record the confidence score of an LLM result validation.
+
+        Args:
+            database: Target database name.
+            confidence: Confidence score (0-100).
+        """
+        self.result_validation_confidence.labels(database=database).observe(confidence)
+
     def increment_llm_call(self, operation: str) -> None:
         """Increment LLM call counter.
 
@@ -150,6 +297,49 @@ class MetricsCollector:
         """
         self.llm_tokens_used.labels(operation=operation).inc(tokens)
 
+    def increment_retry(self, operation: str) -> None:
+        """Increment retry counter.
+
+        Args:
+            operation: Retried operation (sql_generation, result_validation).
+        """
+        self.retries.labels(operation=operation).inc()
+
+    def increment_retry_budget_exhausted(self, operation: str) -> None:
+        """Increment the counter of retries refused by the retry budget.
+
+        Args:
+            operation: Operation that was not retried.
+        """
+        self.retry_budget_exhausted.labels(operation=operation).inc()
+
+    def observe_sql_generation(self, hedged: bool, duration: float) -> None:
+        """Record the time a generation attempt took to produce valid SQL.
+
+        Args:
+            hedged: Whether more than one candidate was launched.
+            duration: Duration in seconds.
+        """
+        self.sql_generation_duration.labels(hedged=str(hedged).lower()).observe(duration)
+
+    def increment_sql_hedge_candidate(self, outcome: str) -> None:
+        """Increment hedged candidate counter.
+
+        Args:
+            outcome: Candidate outcome (accepted, invalid, failed, unused,
+                cancelled).
+        """
+        self.sql_hedge_candidates.labels(outcome=outcome).inc()
+
+    def increment_sql_hedge_tokens(self, outcome: str, tokens: int) -> None:
+        """Increment tokens used by hedged candidates.
+
+        Args:
+            outcome: accepted for the winning candidate, discarded otherwise.
+            tokens: Number of tokens used.
+        """
+        self.sql_hedge_tokens.labels(outcome=outcome).inc(tokens)
+
     def increment_sql_rejected(self, reason: str) -> None:
         """Increment SQL rejection counter.
 
@@ -167,6 +357,24 @@ class MetricsCollector:
         """
         self.db_connections_active.labels(database=database).set(count)
 
+    def set_db_pool_connections(self, database: str, size: int, idle: int, max_size: int) -> None:
+        """Set the connection counts of a database pool.
+
+        Also sets ``pg_mcp_db_connections_active`` to the connections in use.
+
+        Args:
+            database: Database name.
+            size: Open connections.
+            idle: Open connections not acquired by a query.
+            max_size: Maximum connections of the pool.
+        """
+        in_use = max(size - idle, 0)
+        self.db_pool_connections.labels(database=database, state="size").set(size)
+        self.db_pool_connections.labels(database=database, state="idle").set(idle)
+        self.db_pool_connections.labels(database=database, state="in_use").set(in_use)
+        self.db_pool_connections.labels(database=database, state="max").set(max_size)
+        self.db_connections_active.labels(database=database).set(in_use)
+
     def observe_db_query_duration(self, duration: float) -> None:
         """Record database query duration.
 
@@ -175,6 +383,24 @@ class MetricsCollector:
         """
         self.db_query_duration.observe(duration)
 
+    def observe_rate_limit_wait(self, limiter: str, duration: float) -> None:
+        """Record the time a caller waited for a rate limiter slot.
+
+        Args:
+            limiter: Rate limiter name (queries, llm).
+            duration: Wait duration in seconds.
+        """
+        self.rate_limit_wait.labels(limiter=limiter).observe(duration)
+
+    def set_concurrency_limit(self, limiter: str, limit: int) -> None:
+        """Set the current concurrency limit of a rate limiter.
+
+        Args:
+            limiter: Rate limiter name (queries, llm).
+            limit: Maximum concurrent operations currently allowed.
+        """
+        self.concurrency_limit.labels(limiter=limiter).set(limit)
+
     def set_schema_cache_age(self, database: str, age_seconds: float) -> None:
         """Set schema cache age.
 
@@ -184,6 +410,17 @@ class MetricsCollector:
         """
         self.schema_cache_age.labels(database=database).set(age_seconds)
 
+    def increment_schema_cache_event(self, database: str, event: str) -> None:
+        """Increment schema cache event counter.
+
+        Args:
+            database: Database name.
+            event: Cache event (hits, misses, stale_hits, loads,
+                coalesced_loads, revalidations, revalidation_failures,
+                snapshot_restores).
+        """
+        self.schema_cache_events.labels(database=database, event=event).inc()
+
     def reset_all_metrics(self) -> None:
         """Reset all metrics to initial state.
 
@@ -2,23 +2,48 @@
 
 This module provides request ID generation and context propagation throughout
 the query processing pipeline, enabling end-to-end tracing of requests.
+
+Requests can also record spans (name, start, duration, attributes). A
+``RequestTrace`` bound to the context with ``trace_scope`` collects the spans
+of one request; ``span`` and ``pg_mcp.observability.instrumentation.
+stage_timer`` add to it. Without a bound trace they only read a context
+variable, so tracing costs next to nothing when disabled. Finished traces can
+be written as OTLP JSON by ``JsonLinesSpanExporter`` and summarised for the
+client with ``RequestTrace.timings``.
 """
 
 import contextvars
+import json
 import logging
+import queue
+import random
+import sys
+import threading
+import time
 import uuid
-from collections.abc import AsyncIterator, Awaitable, Callable
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from functools import wraps
-from typing import Any, ParamSpec, TypeVar
+from pathlib import Path
+from typing import IO, Any, ParamSpec, Protocol, TypeVar
+
+from pydantic import BaseModel, Field
+
+from pg_mcp.models.query import RequestTimings, SpanTiming
 
-from pydantic import BaseModel
+logger = logging.getLogger(__name__)
 
 # Context variable for current request ID
 _request_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "request_id", default=None
 )
 
+# Trace of the current request and the span new spans are nested in
+_trace_var: contextvars.ContextVar["RequestTrace | None"] = contextvars.ContextVar(
+    "trace", default=None
+)
+_span_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar("span_id", default=None)
+
 # Type variables for decorators
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -119,6 +144,385 @@ async def request_context(request_id: str | None = None) -> AsyncIterator[str]:
         _request_id_var.reset(token)
 
 
+class Span(BaseModel):
+    """A timed operation within a request trace.
+
+    Attributes:
+        name: Operation name (pipeline stage or orchestrator step).
+        span_id: Unique span identifier (16 hex digits).
+        parent_id: Span this one is nested in, or None for the root span.
+        start_ns: Start time in nanoseconds since the epoch.
+        duration_ns: Duration in nanoseconds.
+        attributes: Additional information about the operation.
+    """
+
+    name: str
+    span_id: str
+    parent_id: str | None = None
+    start_ns: int
+    duration_ns: int
+    attributes: dict[str, Any] = Field(default_factory=dict)
+
+
+def _new_span_id() -> str:
+    """Generate a span ID (64 random bits, as used by OpenTelemetry)."""
+    return f"{random.getrandbits(64):016x}"
+
+
+class RequestTrace:
+    """Spans recorded for one request.
+
+    Span times are measured with the monotonic ``perf_counter_ns`` and
+    anchored to the wall clock once, when the trace starts.
+
+    Example:
+        >>> trace = RequestTrace(request_id)
+        >>> with trace_scope(trace):
+        ...     with span("generate_sql", cached=False):
+        ...         ...
+        >>> trace.finish("query")
+        >>> print(trace.timings())
+    """
+
+    def __init__(self, request_id: str):
+        """Initialize request trace.
+
+        Args:
+            request_id: ID of the traced request. A UUID request ID is also
+                used as the trace ID; any other gets a random trace ID.
+        """
+        self.request_id = request_id
+        try:
+            self.trace_id = uuid.UUID(request_id).hex
+        except ValueError:
+            self.trace_id = uuid.uuid4().hex
+        self.root_span_id = _new_span_id()
+        self.spans: list[Span] = []
+        self._start_ns = time.time_ns()
+        self._start_perf_ns = time.perf_counter_ns()
+
+    def record(
+        self,
+        name: str,
+        start_perf_ns: int,
+        end_perf_ns: int,
+        attributes: dict[str, Any] | None = None,
+        span_id: str | None = None,
+        parent_id: str | None = None,
+    ) -> Span:
+        """Record a finished span.
+
+        Args:
+            name: Operation name.
+            start_perf_ns: ``time.perf_counter_ns()`` when the operation started.
+            end_perf_ns: ``time.perf_counter_ns()`` when it ended.
+            attributes: Optional span attributes.
+            span_id: Span ID; generated if not given.
+            parent_id: Enclosing span; defaults to the current span of the
+                context, or the root span.
+
+        Returns:
+            Span: The recorded span.
+        """
+        recorded = Span.model_construct(
+            name=name,
+            span_id=span_id or _new_span_id(),
+            parent_id=parent_id or _span_id_var.get() or self.root_span_id,
+            start_ns=self._start_ns + start_perf_ns - self._start_perf_ns,
+            duration_ns=end_perf_ns - start_perf_ns,
+            attributes=attributes or {},
+        )
+        self.spans.append(recorded)
+        return recorded
+
+    def finish(self, name: str, **attributes: Any) -> Span:
+        """Record the root span, covering the request from the trace start.
+
+        Args:
+            name: Root operation name.
+            **attributes: Root span attributes.
+
+        Returns:
+            Span: The root span.
+        """
+        root = Span.model_construct(
+            name=name,
+            span_id=self.root_span_id,
+            parent_id=None,
+            start_ns=self._start_ns,
+            duration_ns=time.perf_counter_ns() - self._start_perf_ns,
+            attributes={"request_id": self.request_id, **attributes},
+        )
+        self.spans.append(root)
+        return root
+
+    def timings(self) -> RequestTimings:
+        """Summarise the trace as a latency breakdown for the client.
+
+        Returns:
+            RequestTimings: Total duration (of the root span if finished) and
+                every other span in order of its start. Spans directly under
+                the root span have no parent.
+        """
+        names = {recorded.span_id: recorded.name for recorded in self.spans}
+        root = next((s for s in self.spans if s.span_id == self.root_span_id), None)
+        total_ns = (
+            root.duration_ns if root is not None else time.perf_counter_ns() - self._start_perf_ns
+        )
+        spans = sorted(
+            (s for s in self.spans if s.span_id != self.root_span_id),
+            key=lambda s: (s.start_ns, -s.duration_ns),
+        )
+        return RequestTimings(
+            total_ms=total_ns / 1e6,
+            spans=[
+                SpanTiming(
+                    name=s.name,
+                    parent=(
+                        names.get(s.parent_id)
+                        if s.parent_id is not None and s.parent_id != self.root_span_id
+                        else None
+                    ),
+                    start_ms=max(s.start_ns - self._start_ns, 0) / 1e6,
+                    duration_ms=s.duration_ns / 1e6,
+                    attributes=s.attributes or None,
+                )
+                for s in spans
+            ],
+        )
+
+    def to_otlp(self, service_name: str = "pg-mcp") -> dict[str, Any]:
+        """Convert the trace to an OTLP/JSON ``ExportTraceServiceRequest``.
+
+        Args:
+            service_name: Value of the ``service.name`` resource attribute.
+
+        Returns:
+            dict: Document readable by OpenTelemetry tooling, e.g. the
+                collector's ``otlpjsonfile`` receiver.
+        """
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "pg_mcp"},
+                            "spans": [
+                                {
+                                    "traceId": self.trace_id,
+                                    "spanId": s.span_id,
+                                    "parentSpanId": s.parent_id or "",
+                                    "name": s.name,
+                                    "kind": 1,  # SPAN_KIND_INTERNAL
+                                    "startTimeUnixNano": str(s.start_ns),
+                                    "endTimeUnixNano": str(s.start_ns + s.duration_ns),
+                                    "attributes": [
+                                        _otlp_attribute(key, value)
+                                        for key, value in s.attributes.items()
+                                    ],
+                                }
+                                for s in self.spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    """Convert an attribute to an OTLP/JSON ``KeyValue``.
+
+    Args:
+        key: Attribute name.
+        value: Attribute value; types other than bool, int and float are
+            exported as strings.
+
+    Returns:
+        dict: OTLP/JSON key-value pair.
+    """
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def get_current_trace() -> RequestTrace | None:
+    """Get the trace of the current request.
+
+    Returns:
+        RequestTrace | None: Trace recording spans, or None if not traced.
+    """
+    return _trace_var.get()
+
+
+@contextmanager
+def trace_scope(trace: RequestTrace | None) -> Iterator[RequestTrace | None]:
+    """Record the spans of this context in a request trace.
+
+    Args:
+        trace: Trace to record into, or None to record nothing.
+
+    Yields:
+        The trace.
+    """
+    trace_token = _trace_var.set(trace)
+    span_token = _span_id_var.set(trace.root_span_id if trace is not None else None)
+    try:
+        yield trace
+    finally:
+        _span_id_var.reset(span_token)
+        _trace_var.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+    """Record a span in the current request trace, if any.
+
+    Spans opened inside this one are nested in it.
+
+    Args:
+        name: Operation name.
+        **attributes: Span attributes.
+
+    Yields:
+        The attributes, which may be added to until the span ends.
+
+    Example:
+        >>> with span("generate_sql") as attributes:
+        ...     attributes["cached"] = True
+    """
+    trace = _trace_var.get()
+    if trace is None:
+        yield attributes
+        return
+
+    span_id = _new_span_id()
+    parent_id = _span_id_var.get()
+    token = _span_id_var.set(span_id)
+    start = time.perf_counter_ns()
+    try:
+        yield attributes
+    finally:
+        _span_id_var.reset(token)
+        trace.record(name, start, time.perf_counter_ns(), attributes, span_id, parent_id)
+
+
+class SpanExporter(Protocol):
+    """Destination of finished request traces."""
+
+    def export(self, trace: RequestTrace) -> None:
+        """Export a finished trace."""
+        ...
+
+
+class JsonLinesSpanExporter:
+    """Writes each finished trace as one OTLP/JSON line.
+
+    Output goes to a file (appended to) or to a stream. Standard output is
+    not used by default because the stdio MCP transport owns it; the
+    console exporter writes to standard error.
+
+    ``export`` only queues the trace: a writer thread serializes and writes
+    queued traces, flushing once per batch, so a slow disk never blocks the
+    event loop. Traces arriving while ``max_pending`` are already queued are
+    dropped.
+
+    Example:
+        >>> exporter = JsonLinesSpanExporter(path="traces.jsonl")
+        >>> exporter.export(trace)
+        >>> exporter.close()
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        stream: IO[str] | None = None,
+        service_name: str = "pg-mcp",
+        max_pending: int = 10000,
+    ) -> None:
+        """Initialize exporter and start its writer thread.
+
+        Args:
+            path: File to append traces to.
+            stream: Stream to write traces to if no path is given; defaults
+                to standard error.
+            service_name: Value of the ``service.name`` resource attribute.
+            max_pending: Maximum traces queued for writing.
+        """
+        self.service_name = service_name
+        self._owned = path is not None
+        self._stream: IO[str] = (
+            Path(path).open("a", encoding="utf-8")  # noqa: SIM115 - closed by close()
+            if path is not None
+            else stream or sys.stderr
+        )
+        self._queue: queue.Queue[RequestTrace | None] = queue.Queue(max_pending)
+        self._dropped = 0
+        self._writer = threading.Thread(
+            target=self._write_loop, name="pg-mcp-span-exporter", daemon=True
+        )
+        self._writer.start()
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of traces dropped because the queue was full.
+
+        Returns:
+            Number of dropped traces.
+        """
+        return self._dropped
+
+    def export(self, trace: RequestTrace) -> None:
+        """Queue a finished trace for writing.
+
+        Args:
+            trace: Finished request trace.
+        """
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self._dropped += 1
+            if self._dropped == 1:
+                logger.warning("Trace export queue full, dropping traces")
+
+    def close(self) -> None:
+        """Write the queued traces, stop the writer and close the output file.
+
+        A stream passed by the caller is left open.
+        """
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        if self._owned:
+            self._stream.close()
+
+    def _write_loop(self) -> None:
+        """Write queued traces until ``close`` queues the end marker."""
+        while True:
+            batch = [self._queue.get()]
+            # Take whatever else is queued so the batch is flushed once
+            while batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            traces = [trace for trace in batch if trace is not None]
+            try:
+                for trace in traces:
+                    line = json.dumps(trace.to_otlp(self.service_name), separators=(",", ":"))
+                    self._stream.write(line + "\n")
+                self._stream.flush()
+            except Exception as e:
+                logger.warning("Failed to write request traces", extra={"error": str(e)})
+            if batch[-1] is None:
+                return
+
+
 def trace_async(
     operation: str | None = None,
 ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
@@ -44,6 +44,7 @@ def build_user_prompt(
     context: str | None = None,
     previous_attempt: str | None = None,
     error_feedback: str | None = None,
+    schema_context: str | None = None,
 ) -> str:
     """Build user prompt for SQL generation.
 
@@ -56,6 +57,8 @@ def build_user_prompt(
         context: Optional additional context to guide SQL generation.
         previous_attempt: Previous SQL that failed (used for retry scenarios).
         error_feedback: Error message from previous attempt (used for retry scenarios).
+        schema_context: Pre-rendered schema context to use instead of the full
+            ``schema.to_prompt_context()``, e.g. a relevance-pruned subset.
 
     Returns:
         str: Formatted user prompt ready for LLM consumption.
@@ -71,7 +74,7 @@ def build_user_prompt(
 
     # Schema context
     parts.append("## Database Schema:")
-    parts.append(schema.to_prompt_context())
+    parts.append(schema_context if schema_context is not None else schema.to_prompt_context())
     parts.append("")
 
     # Additional context
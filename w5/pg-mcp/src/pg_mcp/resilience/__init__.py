@@ -1,11 +1,26 @@
 """Resilience components for fault tolerance and rate limiting."""
 
 from pg_mcp.resilience.circuit_breaker import CircuitBreaker, CircuitState
-from pg_mcp.resilience.rate_limiter import MultiRateLimiter, RateLimiter
+from pg_mcp.resilience.rate_limiter import (
+    AdaptiveRateLimiter,
+    AIMDLimit,
+    MultiRateLimiter,
+    RateLimiter,
+    client_id_var,
+    client_scope,
+)
+from pg_mcp.resilience.retry import RetryBudget, RetryPolicy, is_retryable
 
 __all__ = [
     "CircuitBreaker",
     "CircuitState",
     "RateLimiter",
+    "AdaptiveRateLimiter",
+    "AIMDLimit",
     "MultiRateLimiter",
+    "client_id_var",
+    "client_scope",
+    "RetryBudget",
+    "RetryPolicy",
+    "is_retryable",
 ]
@@ -1,21 +1,96 @@
 """Rate limiting implementation for controlling concurrent access.
 
 This module provides rate limiters that control concurrent access to resources
-using semaphores. It helps prevent resource exhaustion by limiting the number
-of concurrent operations.
+such as database queries and LLM calls. When every slot is taken, waiters are
+served by weighted fair queuing across clients rather than in arrival order,
+so one client flooding the server cannot monopolise the slots: each client's
+waiters are served in turn, in proportion to the client's weight.
+
+The client of the current request is read from ``client_id_var``, which the
+server sets per tool call.
+
+``AdaptiveRateLimiter`` additionally adjusts its concurrency limit with
+``AIMDLimit``: it grows while upstream latency stays near its no-load level
+and shrinks when latency inflates or overload errors occur.
 """
 
 import asyncio
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from typing import Any
+import heapq
+import itertools
+import logging
+import math
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+import asyncpg
+import openai
+
+from pg_mcp.models.errors import (
+    ExecutionTimeoutError,
+    LLMTimeoutError,
+    LLMUnavailableError,
+    RateLimitExceededError,
+)
+
+if TYPE_CHECKING:
+    from pg_mcp.observability.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLIENT_ID = "default"
+
+# Errors raised inside a slot that mean the upstream is overloaded rather
+# than that the request itself is bad. They are matched along the
+# ``__cause__`` chain: services wrap OpenAI client errors in ``LLMError``
+LLM_OVERLOAD_ERRORS: tuple[type[BaseException], ...] = (
+    LLMTimeoutError,
+    LLMUnavailableError,
+    openai.APIConnectionError,  # Includes APITimeoutError
+    openai.RateLimitError,  # HTTP 429
+    openai.InternalServerError,  # HTTP 5xx
+)
+QUERY_OVERLOAD_ERRORS: tuple[type[BaseException], ...] = (
+    ExecutionTimeoutError,
+    TimeoutError,  # Waiting for a pooled connection
+    asyncpg.QueryCanceledError,
+    asyncpg.TooManyConnectionsError,
+)
+
+client_id_var: ContextVar[str] = ContextVar("pg_mcp_client_id", default=DEFAULT_CLIENT_ID)
+
+
+@contextmanager
+def client_scope(client_id: str | None) -> Iterator[None]:
+    """Attribute rate-limited operations in this context to a client.
+
+    Args:
+        client_id: Client or session identifier. If None, operations are
+            attributed to the default client.
+
+    Example:
+        >>> with client_scope("agent-42"):
+        ...     await orchestrator.execute_query(request)
+    """
+    token = client_id_var.set(client_id or DEFAULT_CLIENT_ID)
+    try:
+        yield
+    finally:
+        client_id_var.reset(token)
 
 
 class RateLimiter:
-    """Async rate limiter using semaphore for concurrent request control.
+    """Async concurrency limiter with weighted fair queuing across clients.
 
-    This rate limiter controls the maximum number of concurrent operations
-    using an asyncio.Semaphore. It's designed for use with async/await code.
+    Up to ``max_concurrent`` operations run at once. Further callers wait in
+    a queue ordered by virtual finish time: each waiter is tagged with its
+    client's previous tag (or the current virtual time, if later) plus
+    ``1 / weight``, and a released slot goes to the waiter with the smallest
+    tag. A client with ten queued requests therefore gets one slot for every
+    slot given to a client with one queued request, instead of ten. Tags are
+    forgotten whenever the queue drains, so uncontended use earns no penalty.
 
     Example:
         >>> limiter = RateLimiter(max_concurrent=5)
@@ -27,24 +102,63 @@ class RateLimiter:
         max_concurrent: Maximum number of concurrent operations allowed.
     """
 
-    def __init__(self, max_concurrent: int) -> None:
+    def __init__(
+        self,
+        max_concurrent: int,
+        *,
+        name: str = "default",
+        queue_timeout: float | None = None,
+        client_weights: dict[str, float] | None = None,
+        metrics: "MetricsCollector | None" = None,
+    ) -> None:
         """Initialize rate limiter.
 
         Args:
             max_concurrent: Maximum number of concurrent operations allowed.
+            name: Name of the limiter, used in errors and metrics labels.
+            queue_timeout: Default seconds ``slot()`` waits for a slot. If
+                None, it waits indefinitely.
+            client_weights: Relative share of slots per client id while
+                clients are queued. Clients not listed weigh 1.
+            metrics: Optional metrics collector receiving the queue wait of
+                every acquired slot.
 
         Raises:
-            ValueError: If max_concurrent is less than 1.
+            ValueError: If max_concurrent is less than 1 or a weight is not
+                positive.
         """
         if max_concurrent < 1:
             raise ValueError("max_concurrent must be >= 1")
+        if client_weights and min(client_weights.values()) <= 0:
+            raise ValueError("client weights must be > 0")
 
         self._max_concurrent = max_concurrent
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._name = name
+        self._queue_timeout = queue_timeout
+        self._weights = dict(client_weights or {})
+        self._metrics = metrics
         self._active_count = 0
+        # (finish tag, arrival order, client id, waiter) heap; waiters that
+        # timed out stay in it until popped
+        self._queue: list[tuple[float, int, str, asyncio.Future[None]]] = []
+        self._arrivals = itertools.count()
+        self._waiting = 0
+        self._virtual_time = 0.0
+        self._finish_tags: dict[str, float] = {}
         self._total_requests = 0
         self._total_rejections = 0
-        self._lock = asyncio.Lock()
+        self._total_granted = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def name(self) -> str:
+        """Get the limiter name.
+
+        Returns:
+            Limiter name.
+        """
+        return self._name
 
     @property
     def max_concurrent(self) -> int:
@@ -71,72 +185,123 @@ class RateLimiter:
         Returns:
             Number of available concurrent slots.
         """
-        return self._max_concurrent - self._active_count
+        return max(0, self._max_concurrent - self._active_count)
+
+    @property
+    def waiting(self) -> int:
+        """Get number of callers waiting for a slot.
 
-    async def acquire(self, *, timeout: float | None = None) -> bool:  # noqa: ASYNC109
+        Returns:
+            Number of queued callers.
+        """
+        return self._waiting
+
+    async def acquire(
+        self,
+        *,
+        timeout: float | None = None,  # noqa: ASYNC109
+        client_id: str | None = None,
+    ) -> bool:
         """Acquire a slot for concurrent operation.
 
         Args:
             timeout: Optional timeout in seconds. If None, waits indefinitely.
+            client_id: Client to queue under. Defaults to the client of the
+                current context (see ``client_scope``).
 
         Returns:
             True if slot was acquired, False if timeout occurred.
-
-        Raises:
-            asyncio.TimeoutError: If timeout is exceeded.
         """
-        async with self._lock:
-            self._total_requests += 1
+        self._total_requests += 1
+
+        if self._active_count < self._max_concurrent and not self._waiting:
+            self._active_count += 1
+            self._record_wait(0.0)
+            return True
+
+        client = client_id or client_id_var.get()
+        weight = self._weights.get(client, 1.0)
+        tag = max(self._virtual_time, self._finish_tags.get(client, 0.0)) + 1.0 / weight
+        self._finish_tags[client] = tag
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (tag, next(self._arrivals), client, waiter))
+        self._waiting += 1
+        start = time.perf_counter()
 
         try:
             if timeout is not None:
                 async with asyncio.timeout(timeout):
-                    await self._semaphore.acquire()
+                    await waiter
             else:
-                await self._semaphore.acquire()
-
-            async with self._lock:
-                self._active_count += 1
-
-            return True
-
-        except TimeoutError:
-            async with self._lock:
-                self._total_rejections += 1
+                await waiter
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait ended
+                if isinstance(e, TimeoutError):
+                    self._record_wait(time.perf_counter() - start)
+                    return True
+                self.release()
+                raise
+            waiter.cancel()
+            self._waiting -= 1
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self._total_rejections += 1
             return False
 
+        self._record_wait(time.perf_counter() - start)
+        return True
+
     def release(self) -> None:
         """Release a slot after operation completes.
 
-        This should be called after acquire() when the operation is complete.
-        Use the async context manager to handle this automatically.
+        The slot is handed straight to the waiter with the smallest finish
+        tag, if any. Use the async context manager to release automatically.
         """
-        self._semaphore.release()
-        # Note: We use a try-except here because release() is not async
-        # but we need to update the counter. The counter update is not
-        # critical for correctness.
-        try:
-            loop = asyncio.get_running_loop()
-            _task = loop.create_task(self._decrement_counter())  # noqa: RUF006
-        except RuntimeError:
-            # No event loop running, just decrement directly (testing scenario)
-            self._active_count = max(0, self._active_count - 1)
+        self._active_count = max(0, self._active_count - 1)
+        self._dispatch()
 
-    async def _decrement_counter(self) -> None:
-        """Decrement active counter (internal helper)."""
-        async with self._lock:
-            self._active_count = max(0, self._active_count - 1)
+    def _set_max_concurrent(self, max_concurrent: int) -> None:
+        """Change the concurrency limit, granting slots to waiters if it grew.
+
+        Operations already running over a lowered limit are not interrupted;
+        no slot is granted until enough of them have finished.
+
+        Args:
+            max_concurrent: New maximum number of concurrent operations.
+        """
+        self._max_concurrent = max(1, max_concurrent)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiters in finish tag order."""
+        while self._queue and self._active_count < self._max_concurrent:
+            tag, _, _, waiter = heapq.heappop(self._queue)
+            if waiter.done():
+                continue
+            self._waiting -= 1
+            self._active_count += 1
+            self._virtual_time = tag
+            waiter.set_result(None)
+
+        if not self._waiting:
+            # Nobody is queued: forget the tags so past bursts earn no penalty
+            self._virtual_time = 0.0
+            self._finish_tags.clear()
 
     @asynccontextmanager
     async def __call__(
         self,
         *,
         timeout: float | None = None,  # noqa: ASYNC109
+        client_id: str | None = None,
     ) -> AsyncIterator[None]:
         """Context manager for rate-limited operations.
 
         Args:
             timeout: Optional timeout in seconds.
+            client_id: Client to queue under (defaults to the current context).
 
         Yields:
             None
@@ -149,7 +314,7 @@ class RateLimiter:
             >>> async with limiter(timeout=10.0):
             ...     await perform_operation()
         """
-        acquired = await self.acquire(timeout=timeout)
+        acquired = await self.acquire(timeout=timeout, client_id=client_id)
         if not acquired:
             raise TimeoutError("Rate limiter timeout exceeded")
 
@@ -158,18 +323,56 @@ class RateLimiter:
         finally:
             self.release()
 
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot, failing with a structured error if none frees up.
+
+        Waits at most ``queue_timeout`` seconds.
+
+        Yields:
+            None
+
+        Raises:
+            RateLimitExceededError: If no slot became available in time.
+
+        Example:
+            >>> async with limiter.slot():
+            ...     response = await client.chat.completions.create(...)
+        """
+        if not await self.acquire(timeout=self._queue_timeout):
+            raise RateLimitExceededError(
+                message=(
+                    f"Too many concurrent {self._name} requests: no slot became available "
+                    f"within {self._queue_timeout} seconds"
+                ),
+                details={
+                    "limiter": self._name,
+                    "max_concurrent": self._max_concurrent,
+                    "queue_timeout_seconds": self._queue_timeout,
+                },
+            )
+
+        try:
+            yield
+        finally:
+            self.release()
+
     def get_stats(self) -> dict[str, Any]:
         """Get rate limiter statistics.
 
         Returns:
             Dictionary containing current metrics.
         """
+        granted = self._total_granted
         return {
             "max_concurrent": self._max_concurrent,
             "active_count": self._active_count,
             "available": self.available,
+            "waiting": self._waiting,
             "total_requests": self._total_requests,
             "total_rejections": self._total_rejections,
+            "avg_wait_seconds": self._total_wait / granted if granted else 0.0,
+            "max_wait_seconds": self._max_wait,
         }
 
     def reset_stats(self) -> None:
@@ -180,6 +383,21 @@ class RateLimiter:
         """
         self._total_requests = 0
         self._total_rejections = 0
+        self._total_granted = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _record_wait(self, seconds: float) -> None:
+        """Record the queue wait of an acquired slot.
+
+        Args:
+            seconds: Time spent waiting for the slot.
+        """
+        self._total_granted += 1
+        self._total_wait += seconds
+        self._max_wait = max(self._max_wait, seconds)
+        if self._metrics is not None:
+            self._metrics.observe_rate_limit_wait(self._name, seconds)
 
     def __repr__(self) -> str:
         """String representation of rate limiter.
@@ -194,18 +412,352 @@ class RateLimiter:
         )
 
 
+class AIMDLimit:
+    """Latency-driven additive-increase/multiplicative-decrease limit.
+
+    Each completed operation reports its latency. The latencies are smoothed
+    with an exponentially weighted moving average, so a single slow query
+    does not count as congestion, and compared with a baseline: the lowest
+    smoothed latency seen within the last one to two ``baseline_window``
+    periods, i.e. the latency of the upstream when it is not queueing our
+    requests. While the smoothed latency stays within ``latency_tolerance``
+    times the baseline and the limit is actually being used, the limit grows
+    by about one per limit's worth of completions. When latency inflates
+    beyond that, or an operation fails with an overload error, the limit is
+    multiplied by ``backoff_ratio``. After a decrease, further decreases are
+    held off until the moving average has caught up with the new limit.
+
+    Because the baseline is re-measured every window, a lasting change of
+    the upstream's normal latency is adopted within two windows.
+
+    Example:
+        >>> limit = AIMDLimit(initial_limit=5, max_limit=50)
+        >>> limit.on_success(latency=0.12, inflight=5)
+        >>> limit.on_overload()
+        >>> print(limit.limit)
+        3
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.7,
+        smoothing: float = 0.05,
+        baseline_window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize AIMD limit.
+
+        Args:
+            initial_limit: Starting concurrency limit.
+            min_limit: Lowest limit the algorithm may shed to.
+            max_limit: Highest limit the algorithm may grow to.
+            latency_tolerance: Smoothed latency, as a multiple of the
+                baseline, above which the limit is decreased.
+            backoff_ratio: Factor applied to the limit on a decrease.
+            smoothing: Weight of a new sample in the moving average.
+            baseline_window: Seconds after which the baseline is re-measured.
+            clock: Monotonic clock in seconds, replaceable in simulations.
+
+        Raises:
+            ValueError: If the limits are inconsistent or a parameter is out
+                of range.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if latency_tolerance <= 1.0:
+            raise ValueError("latency_tolerance must be > 1")
+        if not 0.0 < backoff_ratio < 1.0:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError("smoothing must be between 0 and 1")
+
+        self._initial_limit = initial_limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_tolerance = latency_tolerance
+        self._backoff_ratio = backoff_ratio
+        self._smoothing = smoothing
+        self._baseline_window = baseline_window
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._smoothed: float | None = None
+        # Lowest smoothed latency in the current and the previous window
+        self._window_min = math.inf
+        self._previous_window_min = math.inf
+        self._window_start = clock()
+        self._hold = 0
+        self._increases = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Get the current concurrency limit.
+
+        Returns:
+            Maximum concurrent operations currently allowed.
+        """
+        return int(self._limit)
+
+    @property
+    def baseline_latency(self) -> float | None:
+        """Get the no-load latency the smoothed latency is compared with.
+
+        Returns:
+            Baseline latency in seconds, or None before the first sample.
+        """
+        baseline = min(self._window_min, self._previous_window_min)
+        return None if baseline == math.inf else baseline
+
+    def on_success(self, latency: float, inflight: int) -> None:
+        """Record a completed operation and adjust the limit.
+
+        Args:
+            latency: Duration of the operation in seconds.
+            inflight: Operations running, including this one, when it started.
+        """
+        if self._smoothed is None:
+            self._smoothed = latency
+        else:
+            self._smoothed += self._smoothing * (latency - self._smoothed)
+
+        now = self._clock()
+        if now - self._window_start >= self._baseline_window:
+            self._previous_window_min = self._window_min
+            self._window_min = math.inf
+            self._window_start = now
+        self._window_min = min(self._window_min, self._smoothed)
+
+        if self._hold:
+            self._hold -= 1
+        elif self._smoothed > self._latency_tolerance * min(
+            self._window_min, self._previous_window_min
+        ):
+            self._decrease()
+        elif inflight * 2 >= self._limit:
+            # Only grow a limit that is being used
+            self._limit = min(self._max_limit, self._limit + 1.0 / self._limit)
+            self._increases += 1
+
+    def clone(self) -> "AIMDLimit":
+        """Create a limit with the same parameters, starting from scratch.
+
+        The clone starts at the initial limit, with no latency samples.
+
+        Returns:
+            AIMDLimit: Independent limit for another upstream.
+        """
+        return AIMDLimit(
+            self._initial_limit,
+            min_limit=self._min_limit,
+            max_limit=self._max_limit,
+            latency_tolerance=self._latency_tolerance,
+            backoff_ratio=self._backoff_ratio,
+            smoothing=self._smoothing,
+            baseline_window=self._baseline_window,
+            clock=self._clock,
+        )
+
+    def on_overload(self) -> None:
+        """Record an operation that failed because the upstream is overloaded."""
+        if self._hold:
+            self._hold -= 1
+        else:
+            self._decrease()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get algorithm statistics.
+
+        Returns:
+            Dictionary with the current limit, latencies and adjustment counts.
+        """
+        return {
+            "limit": self.limit,
+            "min_limit": self._min_limit,
+            "max_limit": self._max_limit,
+            "smoothed_latency_seconds": self._smoothed,
+            "baseline_latency_seconds": self.baseline_latency,
+            "increases": self._increases,
+            "decreases": self._decreases,
+        }
+
+    def _decrease(self) -> None:
+        """Shrink the limit and hold off further decreases."""
+        self._limit = max(float(self._min_limit), self._limit * self._backoff_ratio)
+        self._hold = math.ceil(1.0 / self._smoothing)
+        self._decreases += 1
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Rate limiter whose concurrency limit follows upstream latency.
+
+    Operations run through ``slot()`` or the context manager report their
+    latency, or an overload error, to an ``AIMDLimit``, and the limiter's
+    ``max_concurrent`` follows its limit. Operations using ``acquire()`` and
+    ``release()`` directly are not measured.
+
+    Example:
+        >>> limiter = AdaptiveRateLimiter(
+        ...     AIMDLimit(initial_limit=5, max_limit=20),
+        ...     name="llm",
+        ...     overload_errors=LLM_OVERLOAD_ERRORS,
+        ... )
+        >>> async with limiter.slot():
+        ...     response = await client.chat.completions.create(...)
+    """
+
+    def __init__(
+        self,
+        limit: AIMDLimit,
+        *,
+        name: str = "default",
+        queue_timeout: float | None = None,
+        client_weights: dict[str, float] | None = None,
+        metrics: "MetricsCollector | None" = None,
+        overload_errors: tuple[type[BaseException], ...] = (TimeoutError,),
+    ) -> None:
+        """Initialize adaptive rate limiter.
+
+        Args:
+            limit: Algorithm deciding the concurrency limit.
+            name: Name of the limiter, used in errors and metrics labels.
+            queue_timeout: Default seconds ``slot()`` waits for a slot.
+            client_weights: Relative share of slots per client id while
+                clients are queued.
+            metrics: Optional metrics collector receiving queue wait times
+                and the current limit.
+            overload_errors: Exception types raised inside a slot, or found in
+                the ``__cause__`` chain of the exception raised, that signal
+                an overloaded upstream. Other errors are not counted.
+        """
+        super().__init__(
+            limit.limit,
+            name=name,
+            queue_timeout=queue_timeout,
+            client_weights=client_weights,
+            metrics=metrics,
+        )
+        self._limit = limit
+        self._overload_errors = overload_errors
+        if metrics is not None:
+            metrics.set_concurrency_limit(name, limit.limit)
+
+    @property
+    def limit(self) -> AIMDLimit:
+        """Get the algorithm deciding the concurrency limit.
+
+        Returns:
+            AIMD limit.
+        """
+        return self._limit
+
+    @asynccontextmanager
+    async def __call__(
+        self,
+        *,
+        timeout: float | None = None,  # noqa: ASYNC109
+        client_id: str | None = None,
+    ) -> AsyncIterator[None]:
+        """Context manager for rate-limited, measured operations.
+
+        Args:
+            timeout: Optional timeout in seconds.
+            client_id: Client to queue under (defaults to the current context).
+
+        Yields:
+            None
+
+        Raises:
+            asyncio.TimeoutError: If timeout is exceeded.
+        """
+        async with super().__call__(timeout=timeout, client_id=client_id), self._measure():
+            yield
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a measured slot, failing with a structured error if none frees up.
+
+        Yields:
+            None
+
+        Raises:
+            RateLimitExceededError: If no slot became available in time.
+        """
+        async with super().slot(), self._measure():
+            yield
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rate limiter statistics.
+
+        Returns:
+            Dictionary containing current metrics and the AIMD statistics.
+        """
+        return {**super().get_stats(), "adaptive": self._limit.get_stats()}
+
+    @asynccontextmanager
+    async def _measure(self) -> AsyncIterator[None]:
+        """Report the latency or overload of the enclosed operation.
+
+        Yields:
+            None
+        """
+        inflight = self._active_count
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            if self._is_overload(e):
+                self._limit.on_overload()
+                self._apply_limit()
+            raise
+        self._limit.on_success(time.perf_counter() - start, inflight)
+        self._apply_limit()
+
+    def _is_overload(self, error: BaseException) -> bool:
+        """Check an error and its ``__cause__`` chain for an overload error."""
+        cause: BaseException | None = error
+        while cause is not None:
+            if isinstance(cause, self._overload_errors):
+                return True
+            cause = cause.__cause__
+        return False
+
+    def _apply_limit(self) -> None:
+        """Adopt the algorithm's current limit."""
+        limit = self._limit.limit
+        if limit == self._max_concurrent:
+            return
+        logger.debug(
+            "Concurrency limit changed",
+            extra={"limiter": self._name, "from": self._max_concurrent, "to": limit},
+        )
+        self._set_max_concurrent(limit)
+        if self._metrics is not None:
+            self._metrics.set_concurrency_limit(self._name, limit)
+
+
 class MultiRateLimiter:
     """Manages multiple rate limiters for different resource types.
 
     This class provides a convenient way to manage multiple rate limiters
     for different types of operations (e.g., queries, LLM calls).
 
+    Each database gets its own query limiter of ``query_limit`` slots, so
+    queries piling up on a slow database cannot take the slots of the
+    others. Queries run without naming a database share a default limiter.
+    When adaptive, every query limiter adapts to its own database's latency
+    with a clone of ``query_adaptive``.
+
     Example:
         >>> limiter = MultiRateLimiter(
         ...     query_limit=10,
         ...     llm_limit=5
         ... )
-        >>> async with limiter.for_queries():
+        >>> async with limiter.for_queries(database="sales"):
         ...     result = await execute_query()
         >>> async with limiter.for_llm():
         ...     sql = await generate_sql()
@@ -215,25 +767,98 @@ class MultiRateLimiter:
         self,
         query_limit: int = 10,
         llm_limit: int = 5,
+        *,
+        queue_timeout: float | None = None,
+        client_weights: dict[str, float] | None = None,
+        metrics: "MetricsCollector | None" = None,
+        query_adaptive: AIMDLimit | None = None,
+        llm_adaptive: AIMDLimit | None = None,
     ) -> None:
         """Initialize multi-rate limiter.
 
         Args:
-            query_limit: Maximum concurrent database queries.
+            query_limit: Maximum concurrent queries per database.
             llm_limit: Maximum concurrent LLM API calls.
+            queue_timeout: Default seconds ``slot()`` waits for a slot.
+            client_weights: Relative share of slots per client id while
+                clients are queued.
+            metrics: Optional metrics collector receiving queue wait times.
+            query_adaptive: Optional AIMD limit making the query limiters
+                adaptive; ``query_limit`` is then ignored. The default limiter
+                uses it, and each database limiter a clone of it.
+            llm_adaptive: Optional AIMD limit making the LLM limiter
+                adaptive; ``llm_limit`` is then ignored.
+        """
+        self._query_limit = query_limit
+        self._query_adaptive = query_adaptive
+        self._options: dict[str, Any] = {
+            "queue_timeout": queue_timeout,
+            "client_weights": client_weights,
+            "metrics": metrics,
+        }
+        self._query_limiter = self._build_limiter(
+            "queries", query_limit, query_adaptive, QUERY_OVERLOAD_ERRORS, **self._options
+        )
+        self._database_limiters: dict[str, RateLimiter] = {}
+        self._llm_limiter = self._build_limiter(
+            "llm", llm_limit, llm_adaptive, LLM_OVERLOAD_ERRORS, **self._options
+        )
+
+    @staticmethod
+    def _build_limiter(
+        name: str,
+        max_concurrent: int,
+        adaptive: AIMDLimit | None,
+        overload_errors: tuple[type[BaseException], ...],
+        **options: Any,
+    ) -> RateLimiter:
+        """Build a fixed or adaptive limiter.
+
+        Args:
+            name: Limiter name.
+            max_concurrent: Fixed limit, used if ``adaptive`` is None.
+            adaptive: Optional AIMD limit.
+            overload_errors: Errors signalling an overloaded upstream.
+            **options: Keyword arguments shared by both limiter types.
+
+        Returns:
+            RateLimiter: The limiter.
         """
-        self._query_limiter = RateLimiter(max_concurrent=query_limit)
-        self._llm_limiter = RateLimiter(max_concurrent=llm_limit)
+        if adaptive is None:
+            return RateLimiter(max_concurrent, name=name, **options)
+        return AdaptiveRateLimiter(adaptive, name=name, overload_errors=overload_errors, **options)
 
     @property
     def query_limiter(self) -> RateLimiter:
-        """Get the query rate limiter.
+        """Get the query rate limiter of queries not bound to a database.
 
         Returns:
-            Rate limiter for database queries.
+            Default rate limiter for database queries.
         """
         return self._query_limiter
 
+    def database_limiter(self, database: str) -> RateLimiter:
+        """Get the query rate limiter of a database, creating it on first use.
+
+        Args:
+            database: Database name.
+
+        Returns:
+            Rate limiter for the queries of that database, named
+            ``queries:<database>``.
+        """
+        limiter = self._database_limiters.get(database)
+        if limiter is None:
+            limiter = self._build_limiter(
+                f"queries:{database}",
+                self._query_limit,
+                self._query_adaptive.clone() if self._query_adaptive is not None else None,
+                QUERY_OVERLOAD_ERRORS,
+                **self._options,
+            )
+            self._database_limiters[database] = limiter
+        return limiter
+
     @property
     def llm_limiter(self) -> RateLimiter:
         """Get the LLM rate limiter.
@@ -248,11 +873,14 @@ class MultiRateLimiter:
         self,
         *,
         timeout: float | None = None,  # noqa: ASYNC109
+        database: str | None = None,
     ) -> AsyncIterator[None]:
         """Context manager for rate-limited query operations.
 
         Args:
             timeout: Optional timeout in seconds.
+            database: Database the query runs against. If None, the default
+                query limiter is used.
 
         Yields:
             None
@@ -261,7 +889,8 @@ class MultiRateLimiter:
             >>> async with multi_limiter.for_queries(timeout=30.0):
             ...     result = await execute_query()
         """
-        async with self._query_limiter(timeout=timeout):
+        limiter = self._query_limiter if database is None else self.database_limiter(database)
+        async with limiter(timeout=timeout):
             yield
 
     @asynccontextmanager
@@ -293,12 +922,15 @@ class MultiRateLimiter:
         """
         return {
             "queries": self._query_limiter.get_stats(),
+            **{limiter.name: limiter.get_stats() for limiter in self._database_limiters.values()},
             "llm": self._llm_limiter.get_stats(),
         }
 
     def reset_all_stats(self) -> None:
         """Reset statistics for all rate limiters."""
         self._query_limiter.reset_stats()
+        for limiter in self._database_limiters.values():
+            limiter.reset_stats()
         self._llm_limiter.reset_stats()
 
     def __repr__(self) -> str:
@@ -0,0 +1,322 @@
+"""Retry policy with exponential backoff, full jitter and a retry budget.
+
+This module retries transient upstream failures (timeouts, connection errors,
+HTTP 429 and 5xx responses) while leaving terminal ones (authentication,
+exhausted quota, malformed responses, local rate limiting) to fail at once.
+
+Two mechanisms keep retries from amplifying an overload:
+
+- Backoff with full jitter: the n-th retry sleeps a uniformly random time
+  between 0 and ``base_delay * backoff_factor ** n`` (capped at
+  ``max_delay``), so clients that failed together do not retry together. A
+  ``Retry-After`` header sent with the failure is honoured.
+- A retry budget: every call deposits ``ratio`` tokens and every retry
+  withdraws one, with deposits and withdrawals expiring after ``window``
+  seconds. Retries therefore stay a bounded fraction of recent traffic no
+  matter how many calls fail at once, while ``min_retries`` per window keeps
+  retries available when traffic is light.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import openai
+
+from pg_mcp.models.errors import LLMTimeoutError, RateLimitExceededError
+
+if TYPE_CHECKING:
+    from pg_mcp.observability.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying besides 5xx: request timeout, conflict, rate limit
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Check whether an error is transient and worth retrying.
+
+    The error and its ``__cause__`` chain are inspected, since services wrap
+    OpenAI client errors in ``LLMError`` subclasses.
+
+    Args:
+        error: Raised exception.
+
+    Returns:
+        bool: True for timeouts, connection errors and HTTP 408/409/429/5xx
+            responses; False for everything else, including exhausted
+            quota and local rate limiting.
+    """
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, RateLimitExceededError):
+            # Local queue timeout: retrying would only queue again
+            return False
+        if isinstance(cause, (LLMTimeoutError, TimeoutError, openai.APIConnectionError)):
+            return True
+        if isinstance(cause, openai.APIStatusError):
+            if cause.code == "insufficient_quota":
+                return False
+            return cause.status_code in RETRYABLE_STATUS_CODES or cause.status_code >= 500
+        cause = cause.__cause__
+    return False
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Get the delay an upstream asked for with a ``Retry-After`` header.
+
+    Args:
+        error: Raised exception, inspected along its ``__cause__`` chain.
+
+    Returns:
+        float | None: Requested delay in seconds, or None if there is none.
+    """
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, openai.APIStatusError):
+            value = cause.response.headers.get("retry-after")
+            try:
+                return max(0.0, float(value)) if value is not None else None
+            except ValueError:
+                return None  # HTTP-date form, not worth parsing
+        cause = cause.__cause__
+    return None
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of recent calls.
+
+    Example:
+        >>> budget = RetryBudget(ratio=0.2, min_retries=10, window=10.0)
+        >>> budget.record_call()
+        >>> if budget.try_withdraw():
+        ...     retry()
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries: int = 10,
+        window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per call.
+            min_retries: Retries allowed per window regardless of traffic.
+            window: Seconds after which calls and retries no longer count.
+            clock: Monotonic clock, replaceable in tests.
+
+        Raises:
+            ValueError: If ratio or min_retries is negative, or window is not
+                positive.
+        """
+        if ratio < 0 or min_retries < 0:
+            raise ValueError("ratio and min_retries must be >= 0")
+        if window <= 0:
+            raise ValueError("window must be > 0")
+
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._clock = clock
+        self._calls: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._exhausted = 0
+
+    @property
+    def available(self) -> float:
+        """Get the number of retries currently allowed."""
+        self._expire()
+        return self.min_retries + self.ratio * len(self._calls) - len(self._retries)
+
+    def record_call(self) -> None:
+        """Deposit the tokens of one call."""
+        self._calls.append(self._clock())
+
+    def try_withdraw(self) -> bool:
+        """Withdraw one retry if the budget allows it.
+
+        Returns:
+            bool: True if the retry may go ahead.
+        """
+        if self.available < 1:
+            self._exhausted += 1
+            return False
+        self._retries.append(self._clock())
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get retry budget statistics.
+
+        Returns:
+            Dictionary with calls and retries in the current window, the
+            retries still available and the number of refused retries.
+        """
+        available = self.available
+        return {
+            "calls": len(self._calls),
+            "retries": len(self._retries),
+            "available": max(0.0, available),
+            "exhausted": self._exhausted,
+        }
+
+    def _expire(self) -> None:
+        """Forget calls and retries older than the window."""
+        cutoff = self._clock() - self.window
+        for events in (self._calls, self._retries):
+            while events and events[0] <= cutoff:
+                events.popleft()
+
+
+class RetryPolicy:
+    """Retries transient failures with jittered backoff within a budget.
+
+    One policy (and so one budget) is shared by every operation calling the
+    same upstream, so SQL generation and result validation retries draw on
+    the same allowance.
+
+    Example:
+        >>> policy = RetryPolicy(max_retries=3, base_delay=1.0, budget=RetryBudget())
+        >>> sql = await policy.call(
+        ...     lambda: generator.generate(question, schema), operation="sql_generation"
+        ... )
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        backoff_factor: float = 2.0,
+        max_delay: float = 30.0,
+        budget: RetryBudget | None = None,
+        retryable: Callable[[BaseException], bool] = is_retryable,
+        metrics: "MetricsCollector | None" = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize retry policy.
+
+        Args:
+            max_retries: Maximum retries per call.
+            base_delay: Backoff cap of the first retry in seconds.
+            backoff_factor: Growth of the backoff cap per retry.
+            max_delay: Upper bound of any delay in seconds.
+            budget: Optional retry budget shared across calls. If None,
+                retries are only limited per call.
+            retryable: Predicate telling transient errors from terminal ones.
+            metrics: Optional metrics collector receiving retries and
+                refusals by the budget.
+            sleep: Async sleep function, replaceable in tests.
+            rng: Random generator for jitter, replaceable in tests.
+
+        Raises:
+            ValueError: If max_retries or a delay is negative.
+        """
+        if max_retries < 0 or base_delay < 0 or max_delay < 0:
+            raise ValueError("max_retries and delays must be >= 0")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retryable = retryable
+        self.metrics = metrics
+        self._sleep = sleep
+        self._random = rng or random.Random()  # noqa: S311 - jitter, not security
+        self._stats = {"calls": 0, "retries": 0, "budget_exhausted": 0, "gave_up": 0}
+
+    def backoff(self, retry: int) -> float:
+        """Get the jittered delay before a retry.
+
+        Args:
+            retry: Zero-based index of the retry.
+
+        Returns:
+            float: Seconds to wait, uniform between 0 and the backoff cap.
+        """
+        cap = min(self.max_delay, self.base_delay * self.backoff_factor**retry)
+        return self._random.uniform(0.0, cap)
+
+    async def call(self, operation: Callable[[], Awaitable[T]], *, name: str) -> T:
+        """Run an operation, retrying transient failures.
+
+        Args:
+            operation: Zero-argument callable returning a fresh awaitable per
+                attempt.
+            name: Operation name for logs and metrics labels.
+
+        Returns:
+            The operation's result.
+
+        Raises:
+            Exception: The operation's last error if it is terminal, retries
+                are used up or the budget refuses another retry.
+        """
+        self._stats["calls"] += 1
+        if self.budget is not None:
+            self.budget.record_call()
+
+        retry = 0
+        while True:
+            try:
+                return await operation()
+            except Exception as e:
+                if not self.retryable(e):
+                    raise
+                if retry >= self.max_retries:
+                    self._stats["gave_up"] += 1
+                    raise
+                if self.budget is not None and not self.budget.try_withdraw():
+                    self._stats["budget_exhausted"] += 1
+                    if self.metrics is not None:
+                        self.metrics.increment_retry_budget_exhausted(name)
+                    logger.warning(
+                        "Retry budget exhausted, not retrying",
+                        extra={"operation": name, "error": str(e)},
+                    )
+                    raise
+
+                delay = self.backoff(retry)
+                requested = retry_after(e)
+                if requested is not None:
+                    delay = min(self.max_delay, max(delay, requested))
+                retry += 1
+                self._stats["retries"] += 1
+                if self.metrics is not None:
+                    self.metrics.increment_retry(name)
+                logger.info(
+                    "Retrying after transient error",
+                    extra={
+                        "operation": name,
+                        "retry": retry,
+                        "delay_ms": round(delay * 1000, 1),
+                        "error": str(e),
+                    },
+                )
+                await self._sleep(delay)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get retry statistics.
+
+        Returns:
+            Dictionary with call, retry, budget refusal and give-up counters,
+            plus budget statistics if a budget is set.
+
+        Example:
+            >>> stats = policy.get_stats()
+            >>> print(stats["retries"] / max(1, stats["calls"]))
+        """
+        stats: dict[str, Any] = dict(self._stats)
+        if self.budget is not None:
+            stats["budget"] = self.budget.get_stats()
+        return stats
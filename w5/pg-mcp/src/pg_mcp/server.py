@@ -5,26 +5,38 @@ functionality as an MCP tool. It includes complete lifespan management for
 initializing and cleaning up all components.
 """
 
+import asyncio
+import json
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 
 from asyncpg import Pool
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
+from pg_mcp.cache.query_cache import QueryCache
+from pg_mcp.cache.result_cache import ResultCache
 from pg_mcp.cache.schema_cache import SchemaCache
-from pg_mcp.config.settings import Settings
-from pg_mcp.db.pool import close_pools, create_pool
-from pg_mcp.models.query import QueryRequest, QueryResponse, ReturnType
+from pg_mcp.config.settings import RateLimitConfig, ResilienceConfig, Settings
+from pg_mcp.db.pool import build_pool, close_pools
+from pg_mcp.models.query import QueryRequest, QueryResponse, ResultFormat, ReturnType
+from pg_mcp.observability.instrumentation import MetricsSampler
 from pg_mcp.observability.logging import configure_logging, get_logger
 from pg_mcp.observability.metrics import MetricsCollector
+from pg_mcp.observability.tracing import JsonLinesSpanExporter, request_context
 from pg_mcp.resilience.circuit_breaker import CircuitBreaker
-from pg_mcp.resilience.rate_limiter import MultiRateLimiter
+from pg_mcp.resilience.rate_limiter import AIMDLimit, MultiRateLimiter, client_scope
+from pg_mcp.resilience.retry import RetryBudget, RetryPolicy
+from pg_mcp.services.coalescer import RequestCoalescer
 from pg_mcp.services.orchestrator import QueryOrchestrator
+from pg_mcp.services.result_export import ResultExporter
 from pg_mcp.services.result_validator import ResultValidator
+from pg_mcp.services.schema_retriever import SchemaRetriever
 from pg_mcp.services.sql_executor import SQLExecutor
 from pg_mcp.services.sql_generator import SQLGenerator
+from pg_mcp.services.sql_hedger import SQLHedger
 from pg_mcp.services.sql_validator import SQLValidator
+from pg_mcp.services.warmup import DatabaseWarmup
 
 logger = get_logger(__name__)
 
@@ -36,10 +48,14 @@ _orchestrator: QueryOrchestrator | None = None
 _metrics: MetricsCollector | None = None
 _circuit_breaker: CircuitBreaker | None = None
 _rate_limiter: MultiRateLimiter | None = None
+_warmup: DatabaseWarmup | None = None
+_result_exporter: ResultExporter | None = None
+_metrics_sampler: MetricsSampler | None = None
+_span_exporter: JsonLinesSpanExporter | None = None
 
 
 @asynccontextmanager
-async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-arg]
+async def lifespan(_app: FastMCP) -> AsyncIterator[None]:
     """Lifespan context manager for server initialization and cleanup.
 
     This function manages the complete lifecycle of the MCP server:
@@ -47,16 +63,21 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
     Startup:
         1. Load configuration from Settings
         2. Configure logging
-        3. Create database connection pools
-        4. Load schema cache for all databases
+        3. Build database connection pools (connections are opened in step 4),
+           the rate limiter and one SQL executor per database
+        4. Start the background warm-up that connects every database and
+           loads its schema concurrently; requests wait only for the database
+           they query. With STARTUP_BACKGROUND_WARMUP=false startup blocks
+           until every database is ready.
         5. Initialize metrics collector
         6. Create service components (generators, validators, executors)
-        7. Initialize resilience components (circuit breaker, rate limiter)
+        7. Initialize resilience components (circuit breaker)
         8. Create query orchestrator
-        9. Start metrics HTTP server (optional)
+        9. Start metrics HTTP server and pool/cache-age sampling (optional)
 
     Shutdown:
-        1. Stop schema auto-refresh (if enabled)
+        1. Cancel unfinished warm-up, stop pool sampling and schema
+           auto-refresh (if enabled)
         2. Close all database connection pools
         3. Stop metrics HTTP server (if running)
 
@@ -69,7 +90,8 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         ...     pass
     """
     global _settings, _pools, _schema_cache, _orchestrator, _metrics
-    global _circuit_breaker, _rate_limiter
+    global _circuit_breaker, _rate_limiter, _warmup, _result_exporter, _metrics_sampler
+    global _span_exporter
 
     logger.info("Starting PostgreSQL MCP Server initialization...")
 
@@ -94,34 +116,91 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             },
         )
 
-        # 3. Create database connection pools
+        # 3. Build database connection pools (they connect during warm-up)
         logger.info("Creating database connection pools...")
+        db_configs = _settings.database_configs
         _pools = {}
-        # Note: For single database configuration, we use the main database config
-        pool = await create_pool(_settings.database)
-        _pools[_settings.database.name] = pool
-        logger.info(
-            f"Created connection pool for database '{_settings.database.name}'",
-            extra={
-                "min_size": _settings.database.min_pool_size,
-                "max_size": _settings.database.max_pool_size,
-            },
-        )
-
-        # 4. Load Schema cache
-        logger.info("Initializing schema cache...")
-        _schema_cache = SchemaCache(_settings.cache)
-
-        for db_name, pool in _pools.items():
-            logger.info(f"Loading schema for database '{db_name}'...")
-            schema = await _schema_cache.load(db_name, pool)
+        for db_config in db_configs:
+            _pools[db_config.name] = build_pool(db_config, _settings.security)
             logger.info(
-                f"Schema loaded for '{db_name}'",
+                f"Created connection pool for database '{db_config.name}'",
                 extra={
-                    "tables": len(schema.tables),
+                    "min_size": db_config.min_pool_size,
+                    "max_size": db_config.max_pool_size,
                 },
             )
 
+        # Rate Limiter (one query limiter per database, one shared by the LLM
+        # clients; queued requests are served fairly across clients)
+        _metrics = MetricsCollector()
+        rate_limit = _settings.rate_limit
+        _rate_limiter = (
+            MultiRateLimiter(
+                query_limit=rate_limit.max_concurrent_queries,
+                llm_limit=rate_limit.max_concurrent_llm_calls,
+                queue_timeout=rate_limit.queue_timeout,
+                client_weights=rate_limit.client_weights,
+                metrics=_metrics,
+                query_adaptive=(
+                    _aimd_limit(
+                        rate_limit,
+                        rate_limit.max_concurrent_queries,
+                        rate_limit.adaptive_max_queries,
+                    )
+                    if rate_limit.adaptive
+                    else None
+                ),
+                llm_adaptive=(
+                    _aimd_limit(
+                        rate_limit,
+                        rate_limit.max_concurrent_llm_calls,
+                        rate_limit.adaptive_max_llm_calls,
+                    )
+                    if rate_limit.adaptive
+                    else None
+                ),
+            )
+            if rate_limit.enabled
+            else None
+        )
+        llm_limiter = _rate_limiter.llm_limiter if _rate_limiter is not None else None
+
+        # SQL Executor (create one per database, bound to its own pool and limits)
+        sql_executors: dict[str, SQLExecutor] = {}
+        for db_config in db_configs:
+            executor = SQLExecutor(
+                pool=_pools[db_config.name],
+                security_config=_settings.security,
+                db_config=db_config,
+                rate_limiter=(
+                    _rate_limiter.database_limiter(db_config.name)
+                    if _rate_limiter is not None
+                    else None
+                ),
+                metrics=_metrics,
+            )
+            sql_executors[db_config.name] = executor
+            logger.info(f"Created SQL executor for database '{db_config.name}'")
+
+        # 4. Connect databases and load schemas
+        logger.info("Initializing schema cache...")
+        _schema_cache = SchemaCache(_settings.cache, metrics=_metrics)
+
+        _warmup = DatabaseWarmup(
+            db_configs,
+            _pools,
+            _schema_cache,
+            _settings.startup,
+            security_config=_settings.security,
+            sql_executors=sql_executors,
+        )
+        if _settings.startup.background_warmup:
+            logger.info("Warming up databases in the background...")
+            _warmup.start()
+        else:
+            logger.info("Warming up databases...")
+            await _warmup.wait_all()
+
         # Optional: Start schema auto-refresh
         # Disabled by default to avoid unnecessary background tasks
         # Uncomment to enable:
@@ -132,9 +211,8 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         #         pools=_pools,
         #     )
 
-        # 5. Initialize metrics collector
+        # 5. Initialize metrics collector (created with the rate limiter above)
         logger.info("Initializing metrics collector...")
-        _metrics = MetricsCollector()
 
         # Start metrics HTTP server if enabled
         if _settings.observability.metrics_enabled:
@@ -143,11 +221,20 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             start_http_server(_settings.observability.metrics_port)
             logger.info(f"Metrics server started on port {_settings.observability.metrics_port}")
 
+            # Sample pool sizes and schema cache ages for the gauges
+            _metrics_sampler = MetricsSampler(
+                _metrics,
+                _pools,
+                _schema_cache,
+                interval=_settings.observability.metrics_sample_interval,
+            )
+            _metrics_sampler.start()
+
         # 6. Create service components
         logger.info("Initializing service components...")
 
         # SQL Generator
-        sql_generator = SQLGenerator(_settings.openai)
+        sql_generator = SQLGenerator(_settings.openai, rate_limiter=llm_limiter, metrics=_metrics)
 
         # SQL Validator
         sql_validator = SQLValidator(
@@ -157,21 +244,12 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             allow_explain=False,
         )
 
-        # SQL Executor (create one per database)
-        sql_executors: dict[str, SQLExecutor] = {}
-        for db_name, pool in _pools.items():
-            executor = SQLExecutor(
-                pool=pool,
-                security_config=_settings.security,
-                db_config=_settings.database,
-            )
-            sql_executors[db_name] = executor
-            logger.info(f"Created SQL executor for database '{db_name}'")
-
         # Result Validator
         result_validator = ResultValidator(
             openai_config=_settings.openai,
             validation_config=_settings.validation,
+            rate_limiter=llm_limiter,
+            metrics=_metrics,
         )
 
         # 7. Initialize resilience components
@@ -183,23 +261,52 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             recovery_timeout=_settings.resilience.circuit_breaker_timeout,
         )
 
-        # Rate Limiter
-        _rate_limiter = MultiRateLimiter(
-            query_limit=10,  # Can be made configurable
-            llm_limit=5,  # Can be made configurable
-        )
+        # Exported results (arrow and csv formats) are served as resources
+        _result_exporter = ResultExporter(_settings.result_export)
+
+        # Request spans (exported only if configured; timings work regardless)
+        observability = _settings.observability
+        if observability.trace_exporter == "file":
+            _span_exporter = JsonLinesSpanExporter(path=observability.trace_file)
+        elif observability.trace_exporter == "console":
+            _span_exporter = JsonLinesSpanExporter()
 
         # 8. Create QueryOrchestrator
         logger.info("Creating query orchestrator...")
         _orchestrator = QueryOrchestrator(
             sql_generator=sql_generator,
             sql_validator=sql_validator,
-            sql_executor=sql_executors[_settings.database.name],  # Use primary executor
+            sql_executor=sql_executors[_settings.database.name],
             result_validator=result_validator,
             schema_cache=_schema_cache,
             pools=_pools,
             resilience_config=_settings.resilience,
             validation_config=_settings.validation,
+            schema_retriever=(
+                SchemaRetriever(_settings.retrieval) if _settings.retrieval.enabled else None
+            ),
+            query_cache=(
+                QueryCache(_settings.query_cache) if _settings.query_cache.enabled else None
+            ),
+            result_cache=(
+                ResultCache(_settings.result_cache) if _settings.result_cache.enabled else None
+            ),
+            sql_executors=sql_executors,
+            warmup=_warmup,
+            sql_hedger=(
+                SQLHedger(sql_generator, sql_validator, _settings.hedging, metrics=_metrics)
+                if _settings.hedging.enabled
+                else None
+            ),
+            retry_policy=_retry_policy(_settings.resilience, _metrics),
+            request_coalescer=(
+                RequestCoalescer(metrics=_metrics)
+                if _settings.coalescing.enabled and not _settings.security.allow_write_operations
+                else None
+            ),
+            result_exporter=_result_exporter,
+            metrics=_metrics,
+            span_exporter=_span_exporter,
         )
 
         logger.info("PostgreSQL MCP Server initialization complete!")
@@ -207,6 +314,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             "Server ready to accept requests",
             extra={
                 "databases": list(_pools.keys()),
+                "warmup": _warmup.get_status()["states"],
                 "cache_enabled": _settings.cache.enabled,
                 "metrics_enabled": _settings.observability.metrics_enabled,
             },
@@ -219,10 +327,20 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         # Shutdown sequence
         logger.info("Starting PostgreSQL MCP Server shutdown...")
 
+        # Cancel warm-up and background result validations still in progress
+        # before their pools and LLM clients go away
+        if _warmup is not None:
+            await _warmup.stop()
+        if _orchestrator is not None:
+            await _orchestrator.stop()
+
+        # Stop sampling pools before they are closed
+        if _metrics_sampler is not None:
+            await _metrics_sampler.stop()
+
         # Stop schema auto-refresh with timeout
         if _schema_cache is not None:
             try:
-                import asyncio
                 await asyncio.wait_for(
                     _schema_cache.stop_auto_refresh(),
                     timeout=3.0
@@ -242,6 +360,9 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             except Exception as e:
                 logger.error(f"Error closing connection pools: {e!s}")
 
+        if _span_exporter is not None:
+            _span_exporter.close()
+
         logger.info("PostgreSQL MCP Server shutdown complete")
 
 
@@ -249,11 +370,134 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
 mcp = FastMCP("pg-mcp", lifespan=lifespan)
 
 
+@mcp.resource(  # type: ignore[untyped-decorator]
+    "pg-mcp://status",
+    name="status",
+    description="Server readiness and per-database warm-up progress",
+    mime_type="application/json",
+)
+def status() -> str:
+    """Report server readiness and database warm-up progress.
+
+    Returns:
+        str: JSON document with:
+            - initialized (bool): Whether the server accepts queries
+            - ready (bool): Whether every database is connected and has its
+              schema loaded
+            - states (dict): Number of databases per warm-up state
+            - databases (dict): Per-database state (pending, connecting,
+              loading, ready or failed), attempts, schema source, table
+              count, duration and last error
+    """
+    if _warmup is None:
+        return json.dumps({"initialized": False, "ready": False, "states": {}, "databases": {}})
+    return json.dumps({"initialized": _orchestrator is not None, **_warmup.get_status()})
+
+
+@mcp.resource(  # type: ignore[untyped-decorator]
+    "pg-mcp://results/{export_id}",
+    name="result",
+    description="Query result exported by the query tool in the arrow or csv format",
+    mime_type="application/octet-stream",
+)
+def exported_result(export_id: str) -> bytes:
+    """Read a query result exported by the query tool.
+
+    The URI is returned in ``data.resource`` of a query response requested
+    with format "arrow" or "csv", together with the MIME type of the content
+    (``application/vnd.apache.arrow.stream`` or ``text/csv``).
+
+    Args:
+        export_id: Id of the exported result.
+
+    Returns:
+        bytes: Arrow IPC stream or UTF-8 CSV.
+
+    Raises:
+        ValueError: If the result is unknown or has expired.
+    """
+    export = _result_exporter.get(export_id) if _result_exporter is not None else None
+    if export is None:
+        raise ValueError(f"Exported result '{export_id}' not found or expired")
+    content, _ = export
+    return content
+
+
+def _client_id(ctx: Context | None) -> str | None:
+    """Identify the client of a tool call for fair rate limiting.
+
+    Uses the client id sent in the request metadata, falling back to the MCP
+    session, so every connected agent queues separately.
+
+    Args:
+        ctx: MCP request context, or None outside a request.
+
+    Returns:
+        str | None: Client identifier, or None if unknown.
+    """
+    if ctx is None:
+        return None
+    try:
+        return ctx.client_id or f"session-{id(ctx.session):x}"
+    except ValueError:
+        # Context not bound to a request
+        return None
+
+
+def _aimd_limit(config: RateLimitConfig, initial_limit: int, max_limit: int) -> AIMDLimit:
+    """Build the adaptive limit of one rate limiter from settings.
+
+    Args:
+        config: Rate limit configuration.
+        initial_limit: Starting concurrency limit.
+        max_limit: Highest limit the algorithm may grow to.
+
+    Returns:
+        AIMDLimit: Adaptive concurrency limit.
+    """
+    return AIMDLimit(
+        initial_limit,
+        min_limit=config.adaptive_min_limit,
+        max_limit=max_limit,
+        latency_tolerance=config.adaptive_latency_tolerance,
+        backoff_ratio=config.adaptive_backoff_ratio,
+        smoothing=config.adaptive_smoothing,
+        baseline_window=config.adaptive_baseline_window,
+    )
+
+
+def _retry_policy(config: ResilienceConfig, metrics: MetricsCollector | None) -> RetryPolicy:
+    """Build the retry policy shared by the LLM calls from settings.
+
+    Args:
+        config: Resilience configuration.
+        metrics: Optional metrics collector receiving retries.
+
+    Returns:
+        RetryPolicy: Retry policy with a retry budget.
+    """
+    return RetryPolicy(
+        max_retries=config.max_retries,
+        base_delay=config.retry_delay,
+        backoff_factor=config.backoff_factor,
+        max_delay=config.max_retry_delay,
+        budget=RetryBudget(
+            ratio=config.retry_budget_ratio,
+            min_retries=config.retry_budget_min_retries,
+            window=config.retry_budget_window,
+        ),
+        metrics=metrics,
+    )
+
+
 @mcp.tool()
 async def query(
     question: str,
     database: str | None = None,
     return_type: str = "result",
+    format: str = "rows",
+    timings: bool = False,
+    ctx: Context | None = None,
 ) -> dict[str, Any]:
     """Execute a natural language query against PostgreSQL database.
 
@@ -277,14 +521,42 @@ async def query(
                 - "sql": Return only the generated SQL query without executing it
                 - "result": Execute the query and return results (default)
 
+        format: Format of executed results.
+            Options:
+                - "rows": One object per row in data.rows (default)
+                - "columnar": Column names in data.columns and one value array
+                  per column in data.column_values, in the same order
+                - "arrow": Arrow IPC stream written to a temporary resource,
+                  referenced by data.resource (requires pyarrow)
+                - "csv": CSV written to a temporary resource, referenced by
+                  data.resource
+            Exported resources expire after RESULT_EXPORT_TTL seconds.
+
+        timings: Whether to add a latency breakdown to the response: the
+            total duration and the start and duration of each pipeline
+            stage (schema lookup, prompt build, LLM generation, validation,
+            execution, serialization, result validation).
+
+        ctx: MCP request context, injected by FastMCP. Identifies the client
+            so that, under load, queued requests are served fairly across
+            clients.
+
     Returns:
         dict: Query response containing:
             - success (bool): Whether the query succeeded
             - generated_sql (str): The generated SQL query
-            - data (dict): Query results if executed (columns, rows, row_count, etc.)
+            - executed_sql (str): The SQL actually executed, with a LIMIT of
+              SECURITY_MAX_ROWS + 1 pushed down when needed (if executed)
+            - data (dict): Query results if executed (columns, rows or
+              column_values or resource, row_count, etc.)
             - error (dict): Error information if query failed
             - confidence (int): Confidence score (0-100) for result quality
+            - result_validation (str): "validate" if the LLM validated the
+              results, otherwise why it did not (e.g. "sampled_out",
+              "deferred"); None if result validation is disabled
             - tokens_used (int): Number of LLM tokens consumed
+            - request_id (str): ID of the request, also found in logs and spans
+            - timings (dict): Latency breakdown, if requested
 
     Examples:
         >>> # Get query results
@@ -335,12 +607,26 @@ async def query(
             },
         }
 
+    # Validate format
+    formats = [f.value for f in ResultFormat]
+    if format not in formats:
+        return {
+            "success": False,
+            "error": {
+                "code": "INVALID_PARAMETER",
+                "message": f"Invalid format: '{format}'. Must be one of {', '.join(formats)}.",
+                "details": {"format": format},
+            },
+        }
+
     # Build request
     try:
         request = QueryRequest(
             question=question,
             database=database,
             return_type=ReturnType(return_type),
+            result_format=ResultFormat(format),
+            include_timings=timings,
         )
     except Exception as e:
         return {
@@ -354,7 +640,9 @@ async def query(
 
     # Execute query through orchestrator
     try:
-        response: QueryResponse = await _orchestrator.execute_query(request)
+        async with request_context():
+            with client_scope(_client_id(ctx)):
+                response: QueryResponse = await _orchestrator.execute_query(request)
         result = response.to_dict()
         # Ensure tokens_used is always present
         if "tokens_used" not in result:
@@ -4,18 +4,30 @@ This module provides high-level services that orchestrate various components
 including SQL generation, validation, execution, and result validation.
 """
 
+from pg_mcp.services.coalescer import RequestCoalescer
 from pg_mcp.services.orchestrator import QueryOrchestrator
 from pg_mcp.services.result_validator import ResultValidator
+from pg_mcp.services.schema_retriever import SchemaRetriever
 from pg_mcp.services.sql_executor import SQLExecutor
 from pg_mcp.services.sql_generator import SQLGenerator
+from pg_mcp.services.sql_hedger import HedgedGeneration, SQLHedger
+from pg_mcp.services.validation_policy import ValidationDecision, ValidationPolicy
+from pg_mcp.services.warmup import DatabaseWarmup
 
 # Note: SQLValidator import deferred to avoid import-time sqlglot issues
 # Use: from pg_mcp.services.sql_validator import SQLValidator
 
 __all__ = [
     "SQLGenerator",
+    "SQLHedger",
+    "HedgedGeneration",
     "SQLExecutor",
     "ResultValidator",
+    "ValidationPolicy",
+    "ValidationDecision",
     "QueryOrchestrator",
+    "RequestCoalescer",
+    "SchemaRetriever",
+    "DatabaseWarmup",
     # "SQLValidator",  # Import directly from sql_validator module
 ]
@@ -0,0 +1,160 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+When several clients ask the same question at the same moment (scheduled
+reports, dashboards refreshing together), each would otherwise run its own
+LLM generation, validation and execution. ``RequestCoalescer`` lets the first
+caller run the work in a task of its own while concurrent duplicates await
+the same task.
+
+The shared task outlives the caller that started it: each caller awaits it
+through ``asyncio.shield``, so cancelling one caller only stops that caller
+waiting. The task is cancelled only once every caller awaiting it has gone
+away. Because it outlives its first caller, the task records no spans in
+that caller's trace; it does keep the first caller's client, whose queue
+position it takes in the rate limiters, and each caller's ``coalesce`` span
+records which client that was.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from pg_mcp.cache.query_cache import normalize_question
+from pg_mcp.models.query import ReturnType
+from pg_mcp.observability.tracing import span, trace_scope
+from pg_mcp.resilience.rate_limiter import client_id_var
+
+if TYPE_CHECKING:
+    from pg_mcp.observability.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight(Generic[T]):
+    """A shared task, the client it runs as and the number of callers awaiting it."""
+
+    task: asyncio.Task[T]
+    client: str
+    waiters: int = 0
+
+
+class RequestCoalescer:
+    """Runs identical concurrent requests once and shares the outcome.
+
+    Example:
+        >>> coalescer = RequestCoalescer()
+        >>> key = RequestCoalescer.key("mydb", "How many users?", ReturnType.RESULT)
+        >>> response, shared = await coalescer.run(key, lambda: run_pipeline(request))
+    """
+
+    def __init__(self, metrics: "MetricsCollector | None" = None) -> None:
+        """Initialize request coalescer.
+
+        Args:
+            metrics: Optional metrics collector counting coalesced requests.
+        """
+        self.metrics = metrics
+        self._flights: dict[Hashable, _Flight[Any]] = {}
+        self._stats = {"flights": 0, "coalesced": 0, "abandoned": 0}
+
+    @staticmethod
+    def key(database: str, question: str, return_type: ReturnType) -> tuple[str, str, str]:
+        """Build the coalescing key of a query request.
+
+        Args:
+            database: Resolved database name.
+            question: Natural language question, normalised like the query
+                cache key so that case and punctuation do not matter.
+            return_type: Requested return type.
+
+        Returns:
+            tuple: Hashable key of the request.
+        """
+        return (database, normalize_question(question), return_type.value)
+
+    async def run(
+        self,
+        key: Hashable,
+        operation: Callable[[], Coroutine[Any, Any, T]],
+    ) -> tuple[T, bool]:
+        """Run an operation, or join the identical one already in flight.
+
+        Args:
+            key: Key identifying identical requests.
+            operation: Coroutine function performing the work. Only called
+                if no operation with the same key is in flight.
+
+        Returns:
+            tuple: The operation's result, and True if it was shared with
+                an earlier caller rather than started by this one.
+
+        Raises:
+            Exception: Whatever the shared operation raised.
+            asyncio.CancelledError: If this caller is cancelled, or every
+                caller went away and the operation was cancelled.
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = self._start_flight(key, operation())
+        else:
+            self._stats["coalesced"] += 1
+            if self.metrics is not None:
+                self.metrics.increment_coalesced_request()
+        flight.waiters += 1
+
+        try:
+            with span("coalesce", shared=shared, client=flight.client):
+                return await asyncio.shield(flight.task), shared
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Last caller went away: nobody needs the result any more
+                self._stats["abandoned"] += 1
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.task.cancel()
+                logger.debug("Cancelled abandoned request", extra={"key": str(key)})
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            Dictionary with requests in flight, operations started, requests
+            that joined one in flight and operations cancelled because every
+            caller went away.
+        """
+        return {"in_flight": len(self._flights), **self._stats}
+
+    def _start_flight(self, key: Hashable, coro: Coroutine[Any, Any, T]) -> _Flight[T]:
+        """Start an operation task and register it as in flight.
+
+        Args:
+            key: Key identifying identical requests.
+            coro: Operation coroutine to run.
+
+        Returns:
+            _Flight: The registered flight.
+        """
+        # The task may outlive this caller, whose trace could then already be
+        # exported; it still runs as this caller's client
+        with trace_scope(None):
+            task = asyncio.create_task(coro)
+        flight = _Flight(task, client=client_id_var.get())
+        self._flights[key] = flight
+        self._stats["flights"] += 1
+
+        def _on_done(done: asyncio.Task[T]) -> None:
+            if key in self._flights and self._flights[key].task is done:
+                del self._flights[key]
+            if not done.cancelled():
+                # Mark the exception retrieved even if every caller went away
+                done.exception()
+
+        flight.task.add_done_callback(_on_done)
+        return flight
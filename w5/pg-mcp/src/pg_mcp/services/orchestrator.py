@@ -5,36 +5,69 @@ of the query processing pipeline: SQL generation, validation, execution, and res
 validation. It implements retry logic, error handling, and request tracking.
 """
 
+import asyncio
 import logging
-import uuid
-from typing import Any
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from asyncpg import Pool
 
+from pg_mcp.cache.query_cache import QueryCache
+from pg_mcp.cache.result_cache import ResultCache
 from pg_mcp.cache.schema_cache import SchemaCache
-from pg_mcp.config.settings import ResilienceConfig, ValidationConfig
+from pg_mcp.config.settings import ResilienceConfig, ResultExportConfig, ValidationConfig
 from pg_mcp.models.errors import (
     DatabaseError,
     ErrorCode,
     LLMError,
     PgMcpError,
+    QueryCostExceededError,
+    RateLimitExceededError,
     SchemaLoadError,
     SecurityViolationError,
     SQLParseError,
 )
 from pg_mcp.models.query import (
     ErrorDetail,
+    ExecutionResult,
     QueryRequest,
     QueryResponse,
     QueryResult,
+    ResultFormat,
     ReturnType,
     ValidationResult,
 )
+from pg_mcp.observability.instrumentation import (
+    UNKNOWN_DATABASE,
+    Stage,
+    current_database,
+    database_scope,
+    stage_timer,
+)
+from pg_mcp.observability.tracing import (
+    RequestTrace,
+    SpanExporter,
+    get_request_id,
+    request_context,
+    span,
+    trace_scope,
+)
 from pg_mcp.resilience.circuit_breaker import CircuitBreaker
+from pg_mcp.resilience.retry import RetryBudget, RetryPolicy
+from pg_mcp.services.coalescer import RequestCoalescer
+from pg_mcp.services.result_export import ResultExporter
 from pg_mcp.services.result_validator import ResultValidator
+from pg_mcp.services.schema_retriever import SchemaRetriever, SchemaSelection
 from pg_mcp.services.sql_executor import SQLExecutor
 from pg_mcp.services.sql_generator import SQLGenerator
+from pg_mcp.services.sql_hedger import SQLHedger
 from pg_mcp.services.sql_validator import SQLValidator
+from pg_mcp.services.validation_policy import ValidationDecision, ValidationPolicy
+from pg_mcp.services.warmup import DatabaseWarmup
+
+if TYPE_CHECKING:
+    from pg_mcp.observability.metrics import MetricsCollector
 
 logger = logging.getLogger(__name__)
 
@@ -73,18 +106,64 @@ class QueryOrchestrator:
         pools: dict[str, Pool],
         resilience_config: ResilienceConfig,
         validation_config: ValidationConfig,
+        schema_retriever: SchemaRetriever | None = None,
+        query_cache: QueryCache | None = None,
+        result_cache: ResultCache | None = None,
+        sql_executors: dict[str, SQLExecutor] | None = None,
+        warmup: DatabaseWarmup | None = None,
+        sql_hedger: SQLHedger | None = None,
+        retry_policy: RetryPolicy | None = None,
+        request_coalescer: RequestCoalescer | None = None,
+        result_exporter: ResultExporter | None = None,
+        metrics: "MetricsCollector | None" = None,
+        span_exporter: SpanExporter | None = None,
     ) -> None:
         """Initialize query orchestrator.
 
         Args:
             sql_generator: SQL generation service.
             sql_validator: SQL validation service.
-            sql_executor: SQL execution service.
+            sql_executor: SQL execution service, used for every database unless
+                ``sql_executors`` is given.
             result_validator: Result validation service.
             schema_cache: Schema cache instance.
             pools: Dictionary mapping database names to connection pools.
             resilience_config: Resilience configuration for retries and circuit breaker.
-            validation_config: Validation configuration including thresholds.
+            validation_config: Validation configuration including thresholds
+                and the policy choosing which results the LLM validates and
+                whether it does so before or after responding.
+            schema_retriever: Optional schema retriever. When set, only the tables
+                relevant to each question are sent to the LLM.
+            query_cache: Optional answer cache. When set, repeated questions
+                against an unchanged schema reuse the validated SQL instead of
+                calling the LLM.
+            result_cache: Optional executed-result cache. When set, repeated SQL
+                is answered from cached rows until the tables it reads change.
+            sql_executors: Optional dictionary mapping database names to their
+                own SQL executors. When set, each request runs on the executor
+                (and so the pool and limits) of the database it resolved to.
+            warmup: Optional background warm-up. When set, each request waits
+                for the database it resolved to (not for every database) to
+                be connected and have its schema loaded.
+            sql_hedger: Optional hedged generator. When set, each generation
+                attempt runs concurrent candidates and keeps the first one
+                passing validation instead of making a single LLM call.
+            retry_policy: Optional policy for retrying transient LLM failures
+                of SQL generation and result validation. Defaults to one
+                built from ``resilience_config``.
+            request_coalescer: Optional request coalescer. When set,
+                identical questions asked while one is in flight share its
+                response instead of running the pipeline again.
+            result_exporter: Optional result exporter converting results to
+                the format each request asks for and holding exported ones
+                as resources. Defaults to one with the default settings.
+            metrics: Optional metrics collector receiving request counts and
+                durations, the durations of the schema lookup, validate and
+                result validation stages, per database, and result
+                validation decisions and confidence.
+            span_exporter: Optional span exporter. When set, every request is
+                traced and its spans exported; otherwise only requests asking
+                for timings are traced.
         """
         self.sql_generator = sql_generator
         self.sql_validator = sql_validator
@@ -94,6 +173,19 @@ class QueryOrchestrator:
         self.pools = pools
         self.resilience_config = resilience_config
         self.validation_config = validation_config
+        self.schema_retriever = schema_retriever
+        self.query_cache = query_cache
+        self.result_cache = result_cache
+        self.sql_executors = sql_executors
+        self.warmup = warmup
+        self.sql_hedger = sql_hedger
+        self.request_coalescer = request_coalescer
+        self.result_exporter = result_exporter or ResultExporter(ResultExportConfig())
+        self.metrics = metrics
+        self.span_exporter = span_exporter
+        self.validation_policy = ValidationPolicy(validation_config, sql_validator)
+        # Result validations running after their response was returned
+        self._deferred_validations: set[asyncio.Task[int]] = set()
 
         # Create circuit breaker for LLM calls
         self.circuit_breaker = CircuitBreaker(
@@ -101,17 +193,37 @@ class QueryOrchestrator:
             recovery_timeout=resilience_config.circuit_breaker_timeout,
         )
 
+        # Retry transient LLM failures with backoff, within a shared budget
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=resilience_config.max_retries,
+            base_delay=resilience_config.retry_delay,
+            backoff_factor=resilience_config.backoff_factor,
+            max_delay=resilience_config.max_retry_delay,
+            budget=RetryBudget(
+                ratio=resilience_config.retry_budget_ratio,
+                min_retries=resilience_config.retry_budget_min_retries,
+                window=resilience_config.retry_budget_window,
+            ),
+        )
+
     async def execute_query(self, request: QueryRequest) -> QueryResponse:
         """Execute complete query flow from question to results.
 
         This method orchestrates the entire pipeline:
-        1. Generate request_id for tracking
-        2. Resolve and validate database name
+        1. Take the request_id of the current request context (or generate
+           one) and start a trace if spans are exported or timings were
+           requested; with a request coalescer, join an identical request
+           already in flight instead of running steps 2-7
+        2. Resolve and validate database name, waiting for it to warm up
         3. Load schema from cache
         4. Generate and validate SQL with retry logic
-        5. Execute SQL (if return_type == RESULT)
-        6. Validate results (optional)
-        7. Return structured response
+        5. Push the row limit into the SQL and execute it (if return_type == RESULT);
+           SQL rejected by the plan cost gate is regenerated with the rejection
+           as feedback
+        6. Validate results (optional), unless the validation policy skips
+           them or defers validation until after the response
+        7. Return structured response, with results in the requested format
+           and, if requested, the latency breakdown of the trace
 
         Args:
             request: Query request containing question and parameters.
@@ -126,8 +238,160 @@ class QueryOrchestrator:
             >>> if response.success:
             ...     print(f"Found {response.data.row_count} rows")
         """
-        # Generate request_id for full-chain tracing
-        request_id = str(uuid.uuid4())
+        # Reuse the request_id of the caller's context for full-chain tracing
+        async with request_context(get_request_id()) as request_id:
+            start = time.perf_counter()
+            database_label = self._database_label(request.database)
+            trace = (
+                RequestTrace(request_id)
+                if self.span_exporter is not None or request.include_timings
+                else None
+            )
+
+            # Stages recorded by shared services are labelled with this database
+            with database_scope(database_label), trace_scope(trace):
+                response = await self._execute_coalesced(request, request_id)
+                # Coalesced requests share rows; each is formatted as it asked
+                response = self._format_response(response, request.result_format)
+
+            if self.metrics is not None:
+                status = "success" if response.success else "error"
+                if response.error is not None:
+                    status = response.error.code
+                self.metrics.increment_query_request(status=status, database=database_label)
+                self.metrics.observe_query_duration(database_label, time.perf_counter() - start)
+
+            if trace is not None:
+                response = self._finish_trace(trace, request, response, database_label)
+            return response
+
+    def _finish_trace(
+        self,
+        trace: RequestTrace,
+        request: QueryRequest,
+        response: QueryResponse,
+        database_label: str,
+    ) -> QueryResponse:
+        """Export a request trace and attach its timings if requested.
+
+        Args:
+            trace: Trace of the request.
+            request: Query request.
+            response: Response to the request.
+            database_label: Database the request was recorded under.
+
+        Returns:
+            QueryResponse: The response, with timings if requested.
+        """
+        trace.finish(
+            "query",
+            database=database_label,
+            return_type=request.return_type.value,
+            success=response.success,
+        )
+        if self.span_exporter is not None:
+            try:
+                self.span_exporter.export(trace)
+            except Exception as e:
+                logger.warning(
+                    "Failed to export request trace",
+                    extra={"request_id": trace.request_id, "error": str(e)},
+                )
+        if not request.include_timings:
+            return response
+        return response.model_copy(update={"timings": trace.timings()})
+
+    async def _execute_coalesced(self, request: QueryRequest, request_id: str) -> QueryResponse:
+        """Run the pipeline, or join an identical request already in flight.
+
+        Args:
+            request: Query request containing question and parameters.
+            request_id: Request ID for tracking.
+
+        Returns:
+            QueryResponse: Response with results as rows.
+        """
+        coalescer = self.request_coalescer
+        key = self._coalescing_key(request) if coalescer is not None else None
+        if coalescer is None or key is None:
+            return await self._execute_query(request, request_id)
+
+        response, shared = await coalescer.run(
+            key, partial(self._execute_query, request, request_id)
+        )
+        if not shared:
+            return response
+
+        logger.info(
+            "Shared response of identical request in flight",
+            extra={"request_id": request_id, "shared_request_id": response.request_id},
+        )
+        return response.model_copy(update={"request_id": request_id})
+
+    def _database_label(self, database: str | None) -> str:
+        """Get the database a request is recorded under in metrics.
+
+        Args:
+            database: Database name from request (optional).
+
+        Returns:
+            str: Resolved database name, or "unknown" if it cannot be resolved.
+        """
+        try:
+            return self._resolve_database(database)
+        except PgMcpError:
+            return UNKNOWN_DATABASE
+
+    def _format_response(
+        self, response: QueryResponse, result_format: ResultFormat
+    ) -> QueryResponse:
+        """Convert the results of a response to the requested format.
+
+        Args:
+            response: Response with results as rows.
+            result_format: Format requested by the client.
+
+        Returns:
+            QueryResponse: Response with results in the requested format, or
+                a failed response if they cannot be exported.
+        """
+        if response.data is None or result_format == ResultFormat.ROWS:
+            return response
+        try:
+            with span("format_result", format=result_format.value):
+                data = self.result_exporter.apply(response.data, result_format)
+        except PgMcpError as e:
+            logger.warning(
+                "Failed to export query result",
+                extra={
+                    "request_id": response.request_id,
+                    "format": result_format.value,
+                    "error_message": e.message,
+                },
+            )
+            return QueryResponse(
+                success=False,
+                generated_sql=response.generated_sql,
+                executed_sql=response.executed_sql,
+                validation=response.validation,
+                data=None,
+                error=ErrorDetail(code=e.code.value, message=e.message, details=e.details),
+                confidence=0,
+                tokens_used=response.tokens_used,
+                request_id=response.request_id,
+            )
+        return response.model_copy(update={"data": data})
+
+    async def _execute_query(self, request: QueryRequest, request_id: str) -> QueryResponse:
+        """Run steps 2-7 of the query pipeline for one request.
+
+        Args:
+            request: Query request containing question and parameters.
+            request_id: Request ID for tracking.
+
+        Returns:
+            QueryResponse: Complete response with SQL, results, or error information.
+        """
         logger.info(
             "Starting query execution",
             extra={"request_id": request_id, "question": request.question[:100]},
@@ -141,23 +405,9 @@ class QueryOrchestrator:
                 extra={"request_id": request_id, "database": database_name},
             )
 
-            # Step 2: Get schema from cache
-            schema = self.schema_cache.get(database_name)
-            if schema is None:
-                # Schema not in cache, load it
-                pool = self.pools.get(database_name)
-                if pool is None:
-                    raise DatabaseError(
-                        message=f"No connection pool available for database '{database_name}'",
-                        details={"database": database_name},
-                    )
-                try:
-                    schema = await self.schema_cache.load(database_name, pool)
-                except Exception as e:
-                    raise SchemaLoadError(
-                        message=f"Failed to load schema for database '{database_name}': {e!s}",
-                        details={"database": database_name, "error": str(e)},
-                    ) from e
+            # Step 2: Get schema from cache (after the database warmed up)
+            with stage_timer(self.metrics, Stage.SCHEMA_LOOKUP, database_name):
+                schema = await self._get_schema(database_name)
 
             logger.debug(
                 "Schema loaded",
@@ -168,12 +418,14 @@ class QueryOrchestrator:
                 },
             )
 
-            # Step 3: Generate and validate SQL with retry logic
-            generated_sql, validation_result, tokens_used = await self._generate_sql_with_retry(
-                question=request.question,
-                schema=schema,
-                request_id=request_id,
-            )
+            # Step 3: Generate and validate SQL with retry logic (or reuse a cached answer)
+            with span("generate_sql"):
+                generated_sql, validation_result, tokens_used = await self._generate_sql_cached(
+                    question=request.question,
+                    database_name=database_name,
+                    schema=schema,
+                    request_id=request_id,
+                )
 
             # Step 4: If return_type is SQL, return early
             if request.return_type == ReturnType.SQL:
@@ -189,13 +441,53 @@ class QueryOrchestrator:
                     error=None,
                     confidence=100,
                     tokens_used=tokens_used,
+                    request_id=request_id,
                 )
 
-            # Step 5: Execute SQL
-            logger.debug("Executing SQL", extra={"request_id": request_id})
-            start_time = self._get_current_time_ms()
+            # Step 5: Push the row limit into the SQL and execute it; a plan
+            # rejected as too expensive is fed back into generation
+            cost_retries = 0
+            while True:
+                executed_sql = self._apply_row_limit(generated_sql, request_id)
+                logger.debug("Executing SQL", extra={"request_id": request_id})
+                start_time = self._get_current_time_ms()
+                try:
+                    execution = await self._execute_sql(
+                        database_name, executed_sql, count_sql=generated_sql
+                    )
+                    break
+                except QueryCostExceededError as e:
+                    if cost_retries >= self.resilience_config.max_retries:
+                        raise
+                    cost_retries += 1
+                    logger.warning(
+                        "Query plan too expensive, regenerating with feedback",
+                        extra={
+                            "request_id": request_id,
+                            "attempt": cost_retries,
+                            "error": e.message,
+                        },
+                    )
+                    with span("generate_sql", cost_retry=cost_retries):
+                        (
+                            generated_sql,
+                            validation_result,
+                            more_tokens,
+                        ) = await self._generate_sql_cached(
+                            question=request.question,
+                            database_name=database_name,
+                            schema=schema,
+                            request_id=request_id,
+                            previous_attempt=generated_sql,
+                            error_feedback=e.message,
+                        )
+                    if more_tokens is not None:
+                        tokens_used = (tokens_used or 0) + more_tokens
 
-            results, total_count = await self.sql_executor.execute(generated_sql)
+            results = execution.rows
+            total_count = (
+                execution.total_row_count if execution.total_row_count is not None else len(results)
+            )
 
             execution_time_ms = self._get_current_time_ms() - start_time
             logger.info(
@@ -203,12 +495,13 @@ class QueryOrchestrator:
                 extra={
                     "request_id": request_id,
                     "row_count": total_count,
+                    "truncated": execution.truncated,
                     "execution_time_ms": execution_time_ms,
                 },
             )
 
             # Step 6: Validate results (non-blocking, failures don't fail the request)
-            result_confidence = await self._validate_results_safely(
+            result_confidence, result_validation = await self._validate_results_safely(
                 question=request.question,
                 sql=generated_sql,
                 results=results,
@@ -222,16 +515,22 @@ class QueryOrchestrator:
                 rows=results,
                 row_count=len(results),  # Limited row count (after max_rows applied)
                 execution_time_ms=execution_time_ms,
+                truncated=execution.truncated,
+                total_row_count=execution.total_row_count,
+                total_row_count_exact=execution.total_row_count_exact,
             )
 
             return QueryResponse(
                 success=True,
                 generated_sql=generated_sql,
+                executed_sql=executed_sql,
                 validation=validation_result,
                 data=query_result,
                 error=None,
                 confidence=result_confidence,
+                result_validation=result_validation,
                 tokens_used=tokens_used,
+                request_id=request_id,
             )
 
         except PgMcpError as e:
@@ -256,6 +555,7 @@ class QueryOrchestrator:
                 ),
                 confidence=0,
                 tokens_used=None,
+                request_id=request_id,
             )
         except Exception as e:
             # Handle unexpected errors
@@ -275,8 +575,61 @@ class QueryOrchestrator:
                 ),
                 confidence=0,
                 tokens_used=None,
+                request_id=request_id,
             )
 
+    async def _get_schema(self, database_name: str) -> Any:
+        """Get the schema of a database, loading it if not cached.
+
+        Args:
+            database_name: Resolved database name.
+
+        Returns:
+            DatabaseSchema: Schema of the database.
+
+        Raises:
+            DatabaseError: If the database has no connection pool.
+            SchemaLoadError: If the schema cannot be loaded.
+        """
+        if self.warmup is not None:
+            await self.warmup.wait_ready(database_name)
+
+        schema = self.schema_cache.get(database_name)
+        if schema is not None:
+            return schema
+
+        # Schema not in cache, load it
+        pool = self.pools.get(database_name)
+        if pool is None:
+            raise DatabaseError(
+                message=f"No connection pool available for database '{database_name}'",
+                details={"database": database_name},
+            )
+        try:
+            return await self.schema_cache.load(database_name, pool)
+        except Exception as e:
+            raise SchemaLoadError(
+                message=f"Failed to load schema for database '{database_name}': {e!s}",
+                details={"database": database_name, "error": str(e)},
+            ) from e
+
+    def _coalescing_key(self, request: QueryRequest) -> tuple[str, str, str] | None:
+        """Get the key identical concurrent requests are coalesced on.
+
+        Args:
+            request: Query request.
+
+        Returns:
+            tuple | None: Key of (database, normalised question, return type),
+                or None if the database cannot be resolved (the request then
+                fails on its own).
+        """
+        try:
+            database_name = self._resolve_database(request.database)
+        except PgMcpError:
+            return None
+        return RequestCoalescer.key(database_name, request.question, request.return_type)
+
     def _resolve_database(self, database: str | None) -> str:
         """Resolve database name from request or auto-select.
 
@@ -324,25 +677,90 @@ class QueryOrchestrator:
             details={"available_databases": available_dbs},
         )
 
+    async def _generate_sql_cached(
+        self,
+        question: str,
+        database_name: str,
+        schema: Any,
+        request_id: str,
+        previous_attempt: str | None = None,
+        error_feedback: str | None = None,
+    ) -> tuple[str, ValidationResult, int | None]:
+        """Return cached SQL for a repeated question, or generate and cache it.
+
+        Args:
+            question: User's natural language question.
+            database_name: Resolved database name.
+            schema: Database schema for context.
+            request_id: Request ID for tracking.
+            previous_attempt: SQL rejected after validation (e.g. by the plan
+                cost gate). When set, the cached answer is not used and the
+                regenerated SQL replaces it.
+            error_feedback: Why ``previous_attempt`` was rejected.
+
+        Returns:
+            tuple: (generated_sql, validation_result, tokens_used). tokens_used
+                is None for cached answers.
+
+        Raises:
+            LLMError: If circuit breaker is open or generation fails.
+            SecurityViolationError: If SQL fails validation after all retries.
+            SQLParseError: If SQL cannot be parsed.
+        """
+        if self.query_cache is None:
+            return await self._generate_sql_with_retry(
+                question=question,
+                schema=schema,
+                request_id=request_id,
+                previous_attempt=previous_attempt,
+                error_feedback=error_feedback,
+            )
+
+        cached = None
+        if previous_attempt is None:
+            cached = self.query_cache.get(database_name, schema, question)
+        if cached is not None:
+            logger.info(
+                "Answer cache hit, skipping SQL generation",
+                extra={"request_id": request_id, "database": database_name},
+            )
+            return cached.sql, cached.validation, None
+
+        generated_sql, validation_result, tokens_used = await self._generate_sql_with_retry(
+            question=question,
+            schema=schema,
+            request_id=request_id,
+            previous_attempt=previous_attempt,
+            error_feedback=error_feedback,
+        )
+        self.query_cache.put(database_name, schema, question, generated_sql, validation_result)
+        return generated_sql, validation_result, tokens_used
+
     async def _generate_sql_with_retry(
         self,
         question: str,
         schema: Any,
         request_id: str,
+        previous_attempt: str | None = None,
+        error_feedback: str | None = None,
     ) -> tuple[str, ValidationResult, int | None]:
         """Generate and validate SQL with retry logic on validation failures.
 
         This method implements a retry loop that:
         1. Checks circuit breaker state
-        2. Generates SQL using LLM
+        2. Generates SQL using LLM, retrying transient LLM failures with
+           jittered backoff within the retry budget
         3. Validates the generated SQL
-        4. On validation failure, retries with error feedback
+        4. On validation failure, retries at once with error feedback
         5. Records success/failure to circuit breaker
 
         Args:
             question: User's natural language question.
             schema: Database schema for context.
             request_id: Request ID for tracking.
+            previous_attempt: Optional SQL rejected after validation, sent with
+                the first generation as a failed attempt.
+            error_feedback: Why ``previous_attempt`` was rejected.
 
         Returns:
             tuple: (generated_sql, validation_result, tokens_used)
@@ -369,11 +787,26 @@ class QueryOrchestrator:
                 },
             )
 
-        previous_sql: str | None = None
-        error_feedback: str | None = None
+        previous_sql = previous_attempt
         max_retries = self.resilience_config.max_retries
         tokens_used: int | None = None
 
+        # Select the relevant part of the schema once; retries reuse it
+        selection = None
+        if self.schema_retriever is not None:
+            selection = self.schema_retriever.select(question, schema)
+            logger.info(
+                "Schema context selected",
+                extra={
+                    "request_id": request_id,
+                    "pruned": selection.pruned,
+                    "selected_tables": len(selection.tables),
+                    "total_tables": selection.total_tables,
+                    "prompt_chars": selection.prompt_chars,
+                    "full_prompt_chars": selection.full_prompt_chars,
+                },
+            )
+
         for attempt in range(max_retries + 1):
             try:
                 logger.debug(
@@ -386,15 +819,35 @@ class QueryOrchestrator:
                 )
 
                 # Generate SQL
-                generated_sql = await self.sql_generator.generate(
-                    question=question,
-                    schema=schema,
-                    previous_attempt=previous_sql,
-                    error_feedback=error_feedback,
-                )
-
-                # Note: tokens_used would come from OpenAI response metadata if available
-                # For now, we don't extract it, but it can be added later
+                if self.sql_hedger is not None:
+                    hedged = await self.retry_policy.call(
+                        partial(
+                            self.sql_hedger.generate,
+                            question=question,
+                            schema=schema,
+                            previous_attempt=previous_sql,
+                            error_feedback=error_feedback,
+                            schema_context=selection.prompt_context if selection else None,
+                        ),
+                        name="sql_generation",
+                    )
+                    generated_sql = hedged.sql
+                    validated = hedged.valid
+                    if hedged.tokens_used is not None:
+                        tokens_used = (tokens_used or 0) + hedged.tokens_used
+                else:
+                    generated_sql = await self.retry_policy.call(
+                        partial(
+                            self.sql_generator.generate,
+                            question=question,
+                            schema=schema,
+                            previous_attempt=previous_sql,
+                            error_feedback=error_feedback,
+                            schema_context=selection.prompt_context if selection else None,
+                        ),
+                        name="sql_generation",
+                    )
+                    validated = False
 
                 logger.debug(
                     "SQL generated",
@@ -404,9 +857,11 @@ class QueryOrchestrator:
                     },
                 )
 
-                # Validate SQL
+                # Validate SQL (an accepted hedged candidate already passed)
                 try:
-                    self.sql_validator.validate_or_raise(generated_sql)
+                    if not validated:
+                        with stage_timer(self.metrics, Stage.VALIDATE):
+                            self.sql_validator.validate_or_raise(generated_sql)
                 except (SecurityViolationError, SQLParseError) as validation_error:
                     if attempt < max_retries:
                         # Record as failure and retry with feedback
@@ -436,6 +891,8 @@ class QueryOrchestrator:
 
                 # Validation successful
                 self.circuit_breaker.record_success()
+                if selection is not None:
+                    self._record_schema_recall(schema, selection, generated_sql, request_id)
                 logger.info(
                     "SQL generated and validated successfully",
                     extra={
@@ -458,6 +915,9 @@ class QueryOrchestrator:
             except (LLMError, SecurityViolationError, SQLParseError):
                 # Re-raise known errors
                 raise
+            except RateLimitExceededError:
+                # Local saturation, not an LLM failure: leave the circuit closed
+                raise
             except Exception as e:
                 # Unexpected error during generation
                 self.circuit_breaker.record_failure()
@@ -477,6 +937,137 @@ class QueryOrchestrator:
             details={"max_retries": max_retries},
         )
 
+    def _record_schema_recall(
+        self,
+        schema: Any,
+        selection: SchemaSelection,
+        sql: str,
+        request_id: str,
+    ) -> None:
+        """Record how many of the tables used by the SQL were in the prompt.
+
+        Args:
+            schema: Full database schema.
+            selection: Schema selection the SQL was generated from.
+            sql: Validated SQL query.
+            request_id: Request ID for tracking.
+        """
+        if self.schema_retriever is None:
+            return
+
+        try:
+            used_tables = self.sql_validator.extract_tables(sql)
+        except SQLParseError:
+            return
+
+        recall = self.schema_retriever.record_recall(schema, selection, used_tables)
+        if recall is not None:
+            logger.debug(
+                "Schema selection recall",
+                extra={
+                    "request_id": request_id,
+                    "recall": recall,
+                    "used_tables": used_tables,
+                    "selected_tables": selection.tables,
+                },
+            )
+
+    def _apply_row_limit(self, sql: str, request_id: str) -> str:
+        """Rewrite validated SQL so the database stops after max_rows + 1 rows.
+
+        Args:
+            sql: Validated SQL query.
+            request_id: Request ID for tracking.
+
+        Returns:
+            str: SQL with the row limit pushed down, or ``sql`` unchanged if
+                it cannot be rewritten.
+        """
+        try:
+            limited_sql = self.sql_validator.apply_row_limit(sql)
+        except SQLParseError as e:
+            logger.warning(
+                "Failed to apply row limit, executing SQL as generated",
+                extra={"request_id": request_id, "error": str(e)},
+            )
+            return sql
+
+        if limited_sql != sql:
+            logger.debug(
+                "Applied row limit to SQL",
+                extra={"request_id": request_id, "sql": limited_sql[:200]},
+            )
+        return limited_sql
+
+    async def _execute_sql(
+        self,
+        database_name: str,
+        sql: str,
+        count_sql: str | None = None,
+    ) -> ExecutionResult:
+        """Execute SQL, serving repeated queries from the result cache.
+
+        Args:
+            database_name: Resolved database name.
+            sql: Validated SQL query.
+            count_sql: SQL counted for the total row count of a truncated
+                result: the generated SQL, without the pushed-down row limit.
+
+        Returns:
+            ExecutionResult: Rows and truncation information as returned by
+                the executor.
+
+        Raises:
+            ExecutionTimeoutError: If query execution exceeds timeout.
+            DatabaseError: If database operation fails.
+        """
+        executor = self._get_executor(database_name)
+        pool = self.pools.get(database_name)
+        if self.result_cache is None or pool is None:
+            return await executor.execute(sql, count_sql=count_sql)
+
+        try:
+            # Parse once (a cache hit after validation and the row limit rewrite)
+            parsed = self.sql_validator.parse(sql)
+            sql_key = self.sql_validator.normalize_sql(parsed)
+            tables = self.sql_validator.extract_tables(parsed)
+            volatile = self.sql_validator.extract_volatile_functions(parsed)
+        except SQLParseError:
+            return await executor.execute(sql, count_sql=count_sql)
+
+        return await self.result_cache.get_or_execute(
+            database_name,
+            pool,
+            sql_key,
+            tables,
+            lambda: executor.execute(sql, count_sql=count_sql),
+            cacheable=not volatile,
+        )
+
+    def _get_executor(self, database_name: str) -> SQLExecutor:
+        """Get the SQL executor of a database.
+
+        Args:
+            database_name: Resolved database name.
+
+        Returns:
+            SQLExecutor: Executor bound to the database's own connection pool.
+
+        Raises:
+            DatabaseError: If per-database executors are configured but the
+                database has none.
+        """
+        if self.sql_executors is None:
+            return self.sql_executor
+
+        executor = self.sql_executors.get(database_name)
+        if executor is None:
+            raise DatabaseError(
+                message=f"No SQL executor available for database '{database_name}'",
+                details={"database": database_name},
+            )
+        return executor
+
     async def _validate_results_safely(
         self,
         question: str,
@@ -484,11 +1075,15 @@ class QueryOrchestrator:
         results: list[dict[str, Any]],
         row_count: int,
         request_id: str,
-    ) -> int:
+    ) -> tuple[int, str | None]:
         """Validate query results with error handling (non-blocking).
 
-        This method attempts to validate results using LLM, but failures
-        don't cause the overall query to fail. Returns a confidence score.
+        The validation policy first decides whether the LLM validates the
+        results at all: results local heuristics vouch for and requests
+        outside the sample are not validated. In async mode, validation runs
+        in the background after the response is returned and its confidence
+        only reaches metrics and logs. Validation failures never fail the
+        overall query.
 
         Args:
             question: User's original question.
@@ -498,10 +1093,13 @@ class QueryOrchestrator:
             request_id: Request ID for tracking.
 
         Returns:
-            int: Confidence score (0-100). Returns 100 if validation disabled/fails.
+            tuple: (confidence, decision). confidence is the score (0-100)
+                given by the LLM, or 100 if validation is disabled, skipped,
+                deferred or fails. decision is the ``ValidationDecision``
+                value, or None if validation is disabled.
 
         Example:
-            >>> confidence = await orchestrator._validate_results_safely(
+            >>> confidence, decision = await orchestrator._validate_results_safely(
             ...     question="Count users",
             ...     sql="SELECT COUNT(*) FROM users",
             ...     results=[{"count": 42}],
@@ -510,20 +1108,60 @@ class QueryOrchestrator:
             ... )
         """
         if not self.validation_config.enabled:
-            return 100
+            return 100, None
+
+        decision = self.validation_policy.decide(question, sql, row_count, request_id)
+        if decision == ValidationDecision.VALIDATE and self.validation_config.mode == "async":
+            decision = self._defer_validation(question, sql, results, row_count, request_id)
+        if self.metrics is not None:
+            self.metrics.increment_result_validation(decision.value)
+
+        if decision != ValidationDecision.VALIDATE:
+            logger.debug(
+                "Result validation not awaited",
+                extra={"request_id": request_id, "decision": decision.value},
+            )
+            return 100, decision.value
+        confidence = await self._validate_results(question, sql, results, row_count, request_id)
+        return confidence, decision.value
+
+    async def _validate_results(
+        self,
+        question: str,
+        sql: str,
+        results: list[dict[str, Any]],
+        row_count: int,
+        request_id: str,
+    ) -> int:
+        """Validate query results with the LLM, logging and recording confidence.
+
+        Args:
+            question: User's original question.
+            sql: Generated SQL query.
+            results: Query results.
+            row_count: Total row count.
+            request_id: Request ID for tracking.
 
+        Returns:
+            int: Confidence score (0-100). Returns 100 if validation fails.
+        """
         try:
             logger.debug(
                 "Validating results",
                 extra={"request_id": request_id},
             )
 
-            validation_result = await self.result_validator.validate(
-                question=question,
-                sql=sql,
-                results=results,
-                row_count=row_count,
-            )
+            with stage_timer(self.metrics, Stage.RESULT_VALIDATION):
+                validation_result = await self.retry_policy.call(
+                    partial(
+                        self.result_validator.validate,
+                        question=question,
+                        sql=sql,
+                        results=results,
+                        row_count=row_count,
+                    ),
+                    name="result_validation",
+                )
 
             logger.info(
                 "Result validation completed",
@@ -533,6 +1171,10 @@ class QueryOrchestrator:
                     "is_acceptable": validation_result.is_acceptable,
                 },
             )
+            if self.metrics is not None:
+                self.metrics.observe_result_validation_confidence(
+                    current_database(), validation_result.confidence
+                )
 
             return validation_result.confidence
 
@@ -547,6 +1189,53 @@ class QueryOrchestrator:
             )
             return 100  # Default to high confidence if validation fails
 
+    def _defer_validation(
+        self,
+        question: str,
+        sql: str,
+        results: list[dict[str, Any]],
+        row_count: int,
+        request_id: str,
+    ) -> ValidationDecision:
+        """Start validating results in the background.
+
+        The task keeps the database scope of the request but not its trace,
+        which is exported when the response is returned.
+
+        Args:
+            question: User's original question.
+            sql: Generated SQL query.
+            results: Query results.
+            row_count: Total row count.
+            request_id: Request ID for tracking.
+
+        Returns:
+            ValidationDecision: ``DEFERRED``, or ``BACKLOG_FULL`` if
+                ``max_deferred`` validations are already in flight.
+        """
+        if len(self._deferred_validations) >= self.validation_config.max_deferred:
+            logger.warning(
+                "Too many deferred result validations, skipping",
+                extra={"request_id": request_id, "in_flight": len(self._deferred_validations)},
+            )
+            return ValidationDecision.BACKLOG_FULL
+
+        with trace_scope(None):
+            task = asyncio.create_task(
+                self._validate_results(question, sql, results, row_count, request_id),
+                name=f"pg-mcp-validate-{request_id}",
+            )
+        self._deferred_validations.add(task)
+        task.add_done_callback(self._deferred_validations.discard)
+        return ValidationDecision.DEFERRED
+
+    async def stop(self) -> None:
+        """Cancel result validations still running in the background."""
+        pending = list(self._deferred_validations)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
     @staticmethod
     def _get_current_time_ms() -> float:
         """Get current time in milliseconds.
@@ -554,6 +1243,4 @@ class QueryOrchestrator:
         Returns:
             float: Current time in milliseconds since epoch.
         """
-        import time
-
         return time.time() * 1000
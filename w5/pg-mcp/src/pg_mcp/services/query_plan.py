@@ -0,0 +1,163 @@
+"""Cost gate for generated SQL based on its EXPLAIN plan.
+
+This module reads a PostgreSQL ``EXPLAIN (FORMAT JSON)`` plan and rejects
+queries that are expected to be too expensive to finish, such as a cross
+join of two large tables or a sort over a full scan of a huge table.
+
+Two estimates are checked:
+
+- The total cost of the plan root. PostgreSQL already scales it down for a
+  ``LIMIT`` over a plan that can stop early.
+- The rows each plan node is expected to process. A node below a ``LIMIT``
+  only counts the fraction of its rows the limit lets through, unless a
+  node in between (a sort, hash or aggregate) has to read all its input
+  before returning anything.
+
+The rejection message names the most expensive node so that it can be fed
+back to the LLM when the query is regenerated.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from pg_mcp.models.errors import QueryCostExceededError
+
+# Nodes that read their whole input before returning their first row
+BLOCKING_NODE_TYPES = frozenset({"Sort", "Hash", "Materialize", "Aggregate", "SetOp"})
+
+
+class PlanEstimate(BaseModel):
+    """Planner estimates of one query."""
+
+    total_cost: float = Field(..., description="Estimated total cost of the plan root")
+    rows: float = Field(..., description="Estimated rows the query returns")
+    largest_node: str = Field(..., description="Plan node expected to process the most rows")
+    largest_node_rows: float = Field(
+        ..., description="Rows the largest node is expected to process"
+    )
+
+
+def estimate_plan(plan: dict[str, Any]) -> PlanEstimate:
+    """Summarize a plan's cost and its largest node.
+
+    Args:
+        plan: The ``"Plan"`` object of an ``EXPLAIN (FORMAT JSON)`` result.
+
+    Returns:
+        PlanEstimate: Root cost and rows, and the node expected to process
+            the most rows after allowing for ``LIMIT``.
+    """
+    largest: tuple[float, str] = (0.0, _describe(plan))
+    # (node, fraction of its estimated rows actually produced)
+    stack: list[tuple[dict[str, Any], float]] = [(plan, 1.0)]
+    while stack:
+        node, fraction = stack.pop()
+        rows = float(node.get("Plan Rows", 0)) * fraction
+        if rows > largest[0]:
+            largest = (rows, _describe(node))
+
+        for child in node.get("Plans", []):
+            stack.append((child, _child_fraction(node, child, fraction)))
+
+    return PlanEstimate(
+        total_cost=float(plan.get("Total Cost", 0.0)),
+        rows=float(plan.get("Plan Rows", 0)),
+        largest_node=largest[1],
+        largest_node_rows=largest[0],
+    )
+
+
+def check_plan_cost(
+    plan: dict[str, Any],
+    max_cost: float | None,
+    max_rows: int | None,
+) -> PlanEstimate:
+    """Reject a plan whose estimates exceed the limits.
+
+    Args:
+        plan: The ``"Plan"`` object of an ``EXPLAIN (FORMAT JSON)`` result.
+        max_cost: Maximum total cost, or None for no limit.
+        max_rows: Maximum rows any plan node may process, or None for no limit.
+
+    Returns:
+        PlanEstimate: The plan's estimates, if within the limits.
+
+    Raises:
+        QueryCostExceededError: If the total cost or a node's rows exceed
+            their limit.
+    """
+    estimate = estimate_plan(plan)
+    cost_exceeded = max_cost is not None and estimate.total_cost > max_cost
+    rows_exceeded = max_rows is not None and estimate.largest_node_rows > max_rows
+    if not cost_exceeded and not rows_exceeded:
+        return estimate
+
+    problems = []
+    if cost_exceeded:
+        problems.append(
+            f"estimated cost {estimate.total_cost:,.0f} exceeds the limit of {max_cost:,.0f}"
+        )
+    if rows_exceeded:
+        problems.append(
+            f"plan contains a {estimate.largest_node} over about "
+            f"{estimate.largest_node_rows:,.0f} rows (limit {max_rows:,})"
+        )
+    else:
+        # Name the heaviest step even when only the cost limit was hit
+        problems.append(
+            f"its largest step is a {estimate.largest_node} over about "
+            f"{estimate.largest_node_rows:,.0f} rows"
+        )
+    raise QueryCostExceededError(
+        message=(
+            f"Query is too expensive to run: {'; '.join(problems)}. Use selective filters, "
+            "join on keys, avoid cross joins and aggregate before joining large tables."
+        ),
+        details={
+            "total_cost": estimate.total_cost,
+            "largest_node": estimate.largest_node,
+            "largest_node_rows": estimate.largest_node_rows,
+            "max_plan_cost": max_cost,
+            "max_plan_rows": max_rows,
+        },
+    )
+
+
+def _child_fraction(node: dict[str, Any], child: dict[str, Any], fraction: float) -> float:
+    """Get the fraction of a child's estimated rows its parent consumes.
+
+    Args:
+        node: Parent plan node.
+        child: Child plan node.
+        fraction: Fraction of the parent's own rows that is produced.
+
+    Returns:
+        float: Fraction of the child's rows that is produced.
+    """
+    node_type = node.get("Node Type")
+    if node_type in BLOCKING_NODE_TYPES and node.get("Strategy") != "Sorted":
+        return 1.0
+    if node_type == "Limit":
+        child_rows = float(child.get("Plan Rows", 0))
+        if child_rows <= 0:
+            return fraction
+        return min(1.0, float(node.get("Plan Rows", 0)) * fraction / child_rows)
+    return fraction
+
+
+def _describe(node: dict[str, Any]) -> str:
+    """Describe a plan node for error messages.
+
+    Args:
+        node: Plan node.
+
+    Returns:
+        str: Node type, with the relation it reads if any
+            (e.g. ``"seq scan on orders"``).
+    """
+    node_type = str(node.get("Node Type", "plan node")).lower()
+    relation = node.get("Relation Name")
+    if relation:
+        return f"{node_type} on {relation}"
+    return node_type
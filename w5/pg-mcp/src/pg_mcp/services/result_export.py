@@ -0,0 +1,253 @@
+"""Result formats for executed queries.
+
+``QueryResult`` carries rows as a list of dicts, which repeats every column
+name in every row of the MCP payload. ``ResultExporter`` reshapes a result
+into the format the client asked for:
+
+- ``rows``: the result unchanged.
+- ``columnar``: column names plus one value array per column, so names are
+  sent once. Wide results shrink by roughly the share of the payload spent
+  on keys.
+- ``arrow`` / ``csv``: the result is encoded once and kept in memory as a
+  temporary MCP resource; the response only carries its URI. Arrow IPC can
+  be loaded by analysis tools without parsing and needs the optional
+  ``pyarrow`` dependency (``pip install pg-mcp[arrow]``).
+
+Exported results expire after ``ttl`` seconds and are bounded by a memory
+budget, evicting the oldest first.
+"""
+
+import csv
+import io
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any
+
+from pydantic_core import to_json
+
+from pg_mcp.config.settings import ResultExportConfig
+from pg_mcp.models.errors import ErrorCode, ResultExportError
+from pg_mcp.models.query import QueryResult, ResultFormat, ResultResource
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_URI_PREFIX = "pg-mcp://results/"
+
+ARROW_MIME_TYPE = "application/vnd.apache.arrow.stream"
+CSV_MIME_TYPE = "text/csv"
+
+
+def to_columnar(columns: list[str], rows: list[dict[str, Any]]) -> list[list[Any]]:
+    """Transpose result rows into one value array per column.
+
+    Args:
+        columns: Column names, in result order.
+        rows: Result rows as dicts.
+
+    Returns:
+        list[list[Any]]: Values of each column, in column order.
+    """
+    return [[row[column] for row in rows] for column in columns]
+
+
+def encode_csv(columns: list[str], rows: list[dict[str, Any]]) -> bytes:
+    """Encode result rows as CSV with a header line.
+
+    NULL is written as an empty field. Nested values (arrays, json objects)
+    are written as JSON.
+
+    Args:
+        columns: Column names, in result order.
+        rows: Result rows as dicts.
+
+    Returns:
+        bytes: UTF-8 encoded CSV.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(
+            [
+                to_json(value).decode() if isinstance(value, (list, dict)) else value
+                for value in (row[column] for column in columns)
+            ]
+        )
+    return buffer.getvalue().encode()
+
+
+def encode_arrow(columns: list[str], rows: list[dict[str, Any]]) -> bytes:
+    """Encode result rows as an Arrow IPC stream.
+
+    Column types are inferred by pyarrow from the serialized values; columns
+    pyarrow cannot type consistently (e.g. json values of mixed shapes) are
+    encoded as JSON strings.
+
+    Args:
+        columns: Column names, in result order.
+        rows: Result rows as dicts.
+
+    Returns:
+        bytes: Arrow IPC stream holding a single record batch.
+
+    Raises:
+        ResultExportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ResultExportError(
+            message="The arrow result format requires pyarrow (pip install pg-mcp[arrow])",
+            details={"format": ResultFormat.ARROW.value},
+            code=ErrorCode.INVALID_REQUEST,
+        ) from e
+
+    arrays = []
+    for values in to_columnar(columns, rows):
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays.append(
+                pa.array(
+                    [None if v is None else to_json(v).decode() for v in values],
+                    type=pa.string(),
+                )
+            )
+    table = pa.Table.from_arrays(arrays, names=columns)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return bytes(sink.getvalue().to_pybytes())
+
+
+class ResultExporter:
+    """Reshapes query results and holds exported ones as temporary resources.
+
+    Example:
+        >>> exporter = ResultExporter(ResultExportConfig())
+        >>> result = exporter.apply(query_result, ResultFormat.CSV)
+        >>> content, mime_type = exporter.get(result.resource.uri)
+    """
+
+    def __init__(self, config: ResultExportConfig):
+        """Initialize result exporter.
+
+        Args:
+            config: Result export configuration.
+        """
+        self.config = config
+        # export id -> (content, mime type, expiry on the monotonic clock)
+        self._exports: OrderedDict[str, tuple[bytes, str, float]] = OrderedDict()
+        self._bytes = 0
+
+    def apply(self, result: QueryResult, result_format: ResultFormat) -> QueryResult:
+        """Convert a result to the requested format.
+
+        Args:
+            result: Result with rows as dicts.
+            result_format: Format requested by the client.
+
+        Returns:
+            QueryResult: Result in the requested format. For ``columnar`` it
+                carries ``column_values``; for ``arrow`` and ``csv`` it
+                carries the ``resource`` to read the rows from. ``rows`` is
+                empty in both cases; the other fields are unchanged.
+
+        Raises:
+            ResultExportError: If the result cannot be exported.
+        """
+        if result_format == ResultFormat.ROWS:
+            return result
+
+        if result_format == ResultFormat.COLUMNAR:
+            update: dict[str, Any] = {
+                "column_values": to_columnar(result.columns, result.rows),
+            }
+        elif result_format == ResultFormat.ARROW:
+            update = {
+                "resource": self.put(encode_arrow(result.columns, result.rows), ARROW_MIME_TYPE)
+            }
+        else:
+            update = {"resource": self.put(encode_csv(result.columns, result.rows), CSV_MIME_TYPE)}
+        # model_copy skips validation, so row_count keeps the exported row count
+        return result.model_copy(update={**update, "rows": []})
+
+    def put(self, content: bytes, mime_type: str) -> ResultResource:
+        """Store exported content as a temporary resource.
+
+        Args:
+            content: Encoded result.
+            mime_type: MIME type of the content.
+
+        Returns:
+            ResultResource: Resource the content can be read from.
+
+        Raises:
+            ResultExportError: If the content exceeds the memory budget.
+        """
+        size = len(content)
+        if size > self.config.max_bytes:
+            raise ResultExportError(
+                message=(
+                    f"Exported result of {size} bytes exceeds the export budget "
+                    f"of {self.config.max_bytes} bytes"
+                ),
+                details={"size_bytes": size, "max_bytes": self.config.max_bytes},
+            )
+
+        self._expire()
+        while self._exports and self._bytes + size > self.config.max_bytes:
+            _, (evicted, _, _) = self._exports.popitem(last=False)
+            self._bytes -= len(evicted)
+
+        export_id = secrets.token_urlsafe(16)
+        self._exports[export_id] = (content, mime_type, time.monotonic() + self.config.ttl)
+        self._bytes += size
+        logger.debug(
+            "Exported query result",
+            extra={"export_id": export_id, "mime_type": mime_type, "size_bytes": size},
+        )
+        return ResultResource(
+            uri=f"{RESOURCE_URI_PREFIX}{export_id}",
+            mime_type=mime_type,
+            size_bytes=size,
+            expires_in=self.config.ttl,
+        )
+
+    def get(self, uri_or_id: str) -> tuple[bytes, str] | None:
+        """Read an exported result.
+
+        Args:
+            uri_or_id: Resource URI or export id.
+
+        Returns:
+            tuple | None: Content and MIME type, or None if unknown or expired.
+        """
+        self._expire()
+        entry = self._exports.get(uri_or_id.removeprefix(RESOURCE_URI_PREFIX))
+        if entry is None:
+            return None
+        content, mime_type, _ = entry
+        return content, mime_type
+
+    def get_stats(self) -> dict[str, int]:
+        """Get export statistics.
+
+        Returns:
+            dict: Number of live exports and their total size in bytes.
+        """
+        self._expire()
+        return {"exports": len(self._exports), "bytes": self._bytes}
+
+    def _expire(self) -> None:
+        """Drop exports whose TTL has passed (oldest first, as all share one TTL)."""
+        now = time.monotonic()
+        while self._exports:
+            export_id, (content, _, expires_at) = next(iter(self._exports.items()))
+            if expires_at > now:
+                break
+            del self._exports[export_id]
+            self._bytes -= len(content)
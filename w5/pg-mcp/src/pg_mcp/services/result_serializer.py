@@ -0,0 +1,198 @@
+"""Column-plan serialization of query results.
+
+asyncpg decodes PostgreSQL values into Python objects, some of which
+(datetimes, ``Decimal``, ``UUID``, ``bytes``) are not JSON-serializable.
+Checking the type of every value of every row is slow on large results, so
+``ColumnPlan`` decides once per statement, from the column type OIDs asyncpg
+reports, how each column is converted:
+
+- Columns decoded to JSON-native values (booleans, integers, floats, text,
+  json/jsonb, arrays of those) pass through untouched.
+- Datetime, interval, numeric, uuid and bytea columns get a single converter,
+  applied to the whole column.
+- Any other column (other arrays, enums, composites, domains, extension
+  types) falls back to the recursive ``serialize_value``.
+
+The converted values are JSON-native, so the MCP payload encoder (pydantic's
+Rust-based ``to_json``) never needs its ``str`` fallback.
+"""
+
+import datetime
+import decimal
+import uuid
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Protocol
+
+Converter = Callable[[Any], Any]
+
+
+def serialize_value(value: Any) -> Any:
+    """Recursively serialize a single value of unknown type.
+
+    Args:
+        value: Value to serialize.
+
+    Returns:
+        Serialized value that is JSON-compatible.
+    """
+    # Handle None
+    if value is None:
+        return None
+
+    # Handle datetime types
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+
+    # Handle timedelta
+    if isinstance(value, datetime.timedelta):
+        return str(value)
+
+    # Handle Decimal (convert to float)
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+
+    # Handle UUID
+    if isinstance(value, uuid.UUID):
+        return str(value)
+
+    # Handle bytes (convert to hex string)
+    if isinstance(value, bytes):
+        return value.hex()
+
+    # Handle lists and tuples (recursively serialize)
+    if isinstance(value, (list, tuple)):
+        return [serialize_value(v) for v in value]
+
+    # Handle dicts (recursively serialize values)
+    if isinstance(value, dict):
+        return {k: serialize_value(v) for k, v in value.items()}
+
+    # Return other types as-is (str, int, float, bool, etc.)
+    return value
+
+
+# Built-in types asyncpg decodes to JSON-native values (bool, int, float, str
+# or lists of them), by OID
+PASSTHROUGH_OIDS = frozenset(
+    {
+        16,  # bool
+        19,  # name
+        20,  # int8
+        21,  # int2
+        23,  # int4
+        25,  # text
+        26,  # oid
+        114,  # json
+        142,  # xml
+        700,  # float4
+        701,  # float8
+        790,  # money
+        1042,  # bpchar
+        1043,  # varchar
+        3802,  # jsonb
+        1000,  # bool[]
+        1005,  # int2[]
+        1007,  # int4[]
+        1009,  # text[]
+        1015,  # varchar[]
+        1016,  # int8[]
+        1021,  # float4[]
+        1022,  # float8[]
+    }
+)
+
+# Built-in types needing a conversion, by OID
+CONVERTERS: dict[int, Converter] = {
+    17: bytes.hex,  # bytea
+    18: bytes.hex,  # "char" (decoded to a single byte)
+    1082: datetime.date.isoformat,  # date
+    1083: datetime.time.isoformat,  # time
+    1114: datetime.datetime.isoformat,  # timestamp
+    1184: datetime.datetime.isoformat,  # timestamptz
+    1186: str,  # interval (timedelta)
+    1266: datetime.time.isoformat,  # timetz
+    1700: float,  # numeric
+    2950: str,  # uuid
+}
+
+
+class ColumnType(Protocol):
+    """Column type as reported by asyncpg (``asyncpg.types.Type``)."""
+
+    oid: int
+
+
+class Column(Protocol):
+    """Result column as reported by asyncpg (``asyncpg.types.Attribute``)."""
+
+    name: str
+    type: ColumnType
+
+
+class ColumnPlan:
+    """Per-column conversion plan of one statement's results.
+
+    Example:
+        >>> statement = await conn.prepare(sql)
+        >>> plan = ColumnPlan.from_columns(statement.get_attributes())
+        >>> rows = plan.apply(await statement.fetch())
+    """
+
+    def __init__(self, names: Sequence[str], converters: Sequence[Converter | None]) -> None:
+        """Initialize column plan.
+
+        Args:
+            names: Column names, in result order.
+            converters: Converter of each column, or None for columns that
+                pass through.
+        """
+        self.names = tuple(names)
+        # When names repeat, the row dict keeps the last column's value
+        last = {name: index for index, name in enumerate(self.names)}
+        self.converted = [
+            (index, converter)
+            for index, converter in enumerate(converters)
+            if converter is not None and last[self.names[index]] == index
+        ]
+
+    @classmethod
+    def from_columns(cls, columns: Iterable[Column]) -> "ColumnPlan":
+        """Build the plan from the statement's column metadata.
+
+        Args:
+            columns: Result columns with their type OIDs.
+
+        Returns:
+            ColumnPlan: Plan converting each column according to its type.
+        """
+        names = []
+        converters: list[Converter | None] = []
+        for column in columns:
+            names.append(column.name)
+            oid = column.type.oid
+            if oid in PASSTHROUGH_OIDS:
+                converters.append(None)
+            else:
+                converters.append(CONVERTERS.get(oid, serialize_value))
+        return cls(names, converters)
+
+    def apply(self, records: Sequence[Sequence[Any]]) -> list[dict[str, Any]]:
+        """Convert records into JSON-compatible row dictionaries.
+
+        Args:
+            records: Rows as sequences of values in column order
+                (``asyncpg.Record`` iterates over its values).
+
+        Returns:
+            list: One dictionary per row, mapping column names to values.
+        """
+        names = self.names
+        if not self.converted or not names:
+            return [dict(zip(names, record, strict=True)) for record in records]
+
+        columns: list[Sequence[Any]] = list(zip(*records, strict=True))
+        if not columns:
+            return []
+        for index, convert in self.converted:
+            columns[index] = [None if value is None else convert(value) for value in columns[index]]
+        return [dict(zip(names, row, strict=True)) for row in zip(*columns, strict=True)]
@@ -5,21 +5,32 @@ whether query results correctly match the user's original question.
 """
 
 import json
+import time
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import TYPE_CHECKING, Any
 
 from openai import AsyncOpenAI
 
 from pg_mcp.config.settings import OpenAIConfig, ValidationConfig
-from pg_mcp.models.errors import LLMError, LLMTimeoutError, LLMUnavailableError
+from pg_mcp.models.errors import (
+    LLMError,
+    LLMTimeoutError,
+    LLMUnavailableError,
+    RateLimitExceededError,
+)
 from pg_mcp.models.query import ResultValidationResult
+from pg_mcp.observability.instrumentation import record_llm_call
 from pg_mcp.prompts.result_validation import (
     RESULT_VALIDATION_SYSTEM_PROMPT,
     build_validation_prompt,
 )
+from pg_mcp.resilience.rate_limiter import RateLimiter
 
 if TYPE_CHECKING:
     from openai.types.chat import ChatCompletion
 
+    from pg_mcp.observability.metrics import MetricsCollector
+
 
 class ResultValidator:
     """Result validator using OpenAI for query result verification.
@@ -44,18 +55,27 @@ class ResultValidator:
         self,
         openai_config: OpenAIConfig,
         validation_config: ValidationConfig,
+        rate_limiter: RateLimiter | None = None,
+        metrics: "MetricsCollector | None" = None,
     ) -> None:
         """Initialize result validator with OpenAI and validation configuration.
 
         Args:
             openai_config: OpenAI configuration including API key and model settings.
             validation_config: Validation configuration including thresholds and timeouts.
+            rate_limiter: Optional limiter on concurrent LLM calls. Each API
+                request holds one of its slots.
+            metrics: Optional metrics collector receiving LLM call durations,
+                calls and tokens used.
         """
         self.openai_config = openai_config
         self.validation_config = validation_config
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
         self.client = AsyncOpenAI(
             api_key=openai_config.api_key.get_secret_value(),
             timeout=validation_config.timeout_seconds,
+            max_retries=0,  # Retried by the caller's RetryPolicy
         )
 
     async def validate(
@@ -85,6 +105,7 @@ class ResultValidator:
             LLMError: If validation fails or response is invalid.
             LLMTimeoutError: If the API request times out.
             LLMUnavailableError: If the API is unavailable or authentication fails.
+            RateLimitExceededError: If no LLM call slot became available in time.
 
         Example:
             >>> result = await validator.validate(
@@ -118,15 +139,20 @@ class ResultValidator:
 
         try:
             # Call OpenAI API with structured JSON output
-            response: ChatCompletion = await self.client.chat.completions.create(
-                model=self.openai_config.model,
-                messages=[
-                    {"role": "system", "content": RESULT_VALIDATION_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=500,
-                temperature=0.0,  # Use deterministic output for validation
-                response_format={"type": "json_object"},  # Ensure JSON response
+            async with self._llm_slot():
+                start = time.perf_counter()
+                response: ChatCompletion = await self.client.chat.completions.create(
+                    model=self.openai_config.model,
+                    messages=[
+                        {"role": "system", "content": RESULT_VALIDATION_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    max_tokens=500,
+                    temperature=0.0,  # Use deterministic output for validation
+                    response_format={"type": "json_object"},  # Ensure JSON response
+                )
+            record_llm_call(
+                self.metrics, "validate_result", time.perf_counter() - start, response.usage
             )
 
             # Extract and parse the response
@@ -192,8 +218,8 @@ class ResultValidator:
                 suggestion=None,
                 is_acceptable=False,
             )
-        except LLMError:
-            # Re-raise LLM errors as-is
+        except (LLMError, RateLimitExceededError):
+            # Re-raise LLM and rate limit errors as-is
             raise
         except Exception as e:
             # Handle various OpenAI errors
@@ -212,3 +238,9 @@ class ResultValidator:
                 message=f"Result validation failed: {error_msg}",
                 details={"error": error_msg},
             ) from e
+
+    def _llm_slot(self) -> AbstractAsyncContextManager[None]:
+        """Get a context holding an LLM call slot, if calls are rate limited."""
+        if self.rate_limiter is None:
+            return nullcontext()
+        return self.rate_limiter.slot()
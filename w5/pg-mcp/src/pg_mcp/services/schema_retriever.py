@@ -0,0 +1,391 @@
+"""Relevance-ranked schema selection for SQL generation prompts.
+
+This module narrows the schema sent to the LLM down to the tables that are
+relevant to a question. It builds a local BM25 index over table names, column
+names and comments (no network or embedding service involved), picks the
+top-k tables for each question and expands that set along foreign keys so
+join partners are not lost.
+
+The index is built once per cached ``DatabaseSchema`` object. Schema refreshes
+replace that object, which rebuilds the index on the next question.
+"""
+
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from pg_mcp.config.settings import RetrievalConfig
+from pg_mcp.models.schema import DatabaseSchema, EnumTypeInfo, TableInfo
+
+logger = logging.getLogger(__name__)
+
+# BM25 parameters (standard Okapi defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# How often table name tokens count relative to column and comment tokens
+TABLE_NAME_WEIGHT = 3
+
+# Frequent question words that carry no information about tables
+STOPWORDS = frozenset(
+    {
+        "a", "all", "an", "and", "are", "as", "at", "be", "by", "count", "did", "do",
+        "does", "each", "find", "for", "from", "get", "give", "has", "have", "how",
+        "in", "is", "it", "list", "many", "me", "most", "much", "number", "of", "on",
+        "or", "per", "show", "that", "the", "their", "there", "this", "to", "top",
+        "total", "was", "were", "what", "when", "where", "which", "who", "with",
+    }
+)  # fmt: skip
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_TOKEN = re.compile(r"[a-z0-9]+|[\u3400-\u9fff]+")
+
+
+def _stem(token: str) -> str:
+    """Reduce simple English plurals to their singular form."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 4 and token.endswith(("ses", "xes", "ches", "shes")):
+        return token[:-2]
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text and SQL identifiers into normalized search terms.
+
+    Identifiers are split on underscores, digits and camelCase boundaries,
+    lowercased, stripped of stopwords and reduced to singular form. Runs of
+    CJK characters are emitted as overlapping character bigrams.
+
+    Args:
+        text: Question, identifier or comment text.
+
+    Returns:
+        list[str]: Search terms, in order of appearance.
+
+    Example:
+        >>> tokenize("orderItems.created_at")
+        ['order', 'item', 'created']
+    """
+    terms = []
+    for token in _TOKEN.findall(_CAMEL_BOUNDARY.sub(" ", text).lower()):
+        if token[0] >= "\u3400":  # CJK
+            if len(token) == 1:
+                terms.append(token)
+            else:
+                terms.extend(token[i : i + 2] for i in range(len(token) - 1))
+        elif len(token) > 1 and not token.isdigit() and token not in STOPWORDS:
+            terms.append(_stem(token))
+    return terms
+
+
+class SchemaSelection(BaseModel):
+    """Tables selected for one question and the pruned prompt context."""
+
+    tables: list[str] = Field(
+        default_factory=list, description="Qualified names of all tables in the prompt"
+    )
+    matched_tables: list[str] = Field(
+        default_factory=list, description="Tables selected by relevance, best first"
+    )
+    expanded_tables: list[str] = Field(
+        default_factory=list, description="Tables added by foreign key expansion"
+    )
+    total_tables: int = Field(default=0, description="Number of tables in the full schema")
+    pruned: bool = Field(default=False, description="Whether the schema was pruned")
+    prompt_context: str = Field(..., description="Schema context to send to the LLM")
+    prompt_chars: int = Field(default=0, description="Length of the pruned schema context")
+    full_prompt_chars: int = Field(default=0, description="Length of the full schema context")
+
+
+class SchemaIndex:
+    """BM25 index over the tables of one database schema.
+
+    Attributes:
+        schema: The indexed schema.
+    """
+
+    def __init__(self, schema: DatabaseSchema):
+        """Build the index.
+
+        Args:
+            schema: Schema to index.
+        """
+        self.schema = schema
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        self._by_name: dict[str, list[int]] = defaultdict(list)
+        self._referenced_by: dict[str, set[int]] = defaultdict(set)
+        self._full_prompt_chars: int | None = None
+
+        documents = [self._document(table) for table in schema.tables]
+        doc_count = len(documents)
+        avg_length = sum(len(doc) for doc in documents) / doc_count if doc_count else 0.0
+
+        term_docs: dict[str, list[tuple[int, int, int]]] = defaultdict(list)
+        for idx, doc in enumerate(documents):
+            for term, tf in Counter(doc).items():
+                term_docs[term].append((idx, tf, len(doc)))
+
+        # Precompute each posting's BM25 contribution so a query only sums them
+        for term, entries in term_docs.items():
+            idf = math.log(1 + (doc_count - len(entries) + 0.5) / (len(entries) + 0.5))
+            self._postings[term] = [
+                (
+                    idx,
+                    idf
+                    * tf
+                    * (BM25_K1 + 1)
+                    / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / (avg_length or 1))),
+                )
+                for idx, tf, length in entries
+            ]
+
+        for idx, table in enumerate(schema.tables):
+            self._by_name[table.table_name.lower()].append(idx)
+            for fk in table.foreign_keys:
+                self._referenced_by[fk.referenced_table.lower()].add(idx)
+
+    @staticmethod
+    def _document(table: TableInfo) -> list[str]:
+        """Build the weighted term list describing a table."""
+        terms = tokenize(table.table_name) * TABLE_NAME_WEIGHT
+        if table.comment:
+            terms.extend(tokenize(table.comment))
+        for column in table.columns:
+            terms.extend(tokenize(column.name))
+            if column.comment:
+                terms.extend(tokenize(column.comment))
+        for fk in table.foreign_keys:
+            terms.extend(tokenize(fk.referenced_table))
+        return terms
+
+    @property
+    def full_prompt_chars(self) -> int:
+        """Length of the full schema context, computed once per index."""
+        if self._full_prompt_chars is None:
+            self._full_prompt_chars = len(self.schema.to_prompt_context())
+        return self._full_prompt_chars
+
+    @property
+    def table_names(self) -> set[str]:
+        """Lowercase names of all indexed tables."""
+        return set(self._by_name)
+
+    def search(self, question: str, limit: int) -> list[tuple[int, float]]:
+        """Rank tables by relevance to a question.
+
+        Args:
+            question: Natural language question.
+            limit: Maximum number of results.
+
+        Returns:
+            list[tuple[int, float]]: (table index, score) pairs with a positive
+                score, best first; ties are broken by schema order.
+        """
+        scores: dict[int, float] = defaultdict(float)
+        for term in set(tokenize(question)):
+            for idx, weight in self._postings.get(term, ()):
+                scores[idx] += weight
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+    def neighbours(self, idx: int) -> list[int]:
+        """Get tables joined to a table by foreign keys, in either direction.
+
+        Args:
+            idx: Table index.
+
+        Returns:
+            list[int]: Indexes of referenced and referencing tables.
+        """
+        table = self.schema.tables[idx]
+        related = set(self._referenced_by.get(table.table_name.lower(), ()))
+        for fk in table.foreign_keys:
+            related.update(self._by_name.get(fk.referenced_table.lower(), ()))
+        related.discard(idx)
+        return sorted(related)
+
+
+class SchemaRetriever:
+    """Selects the question-relevant part of a schema for SQL generation.
+
+    Example:
+        >>> retriever = SchemaRetriever(RetrievalConfig(enabled=True, top_k=5))
+        >>> selection = retriever.select("total revenue per customer", schema)
+        >>> sql = await generator.generate(
+        ...     question=question, schema=schema, schema_context=selection.prompt_context
+        ... )
+    """
+
+    def __init__(self, config: RetrievalConfig):
+        """Initialize schema retriever.
+
+        Args:
+            config: Retrieval configuration.
+        """
+        self.config = config
+        self._indexes: dict[str, SchemaIndex] = {}
+        self._index_builds = 0
+        self._selections = 0
+        self._pruned_selections = 0
+        self._selected_tables_total = 0
+        self._prompt_chars_total = 0
+        self._full_prompt_chars_total = 0
+        self._recall_samples = 0
+        self._recall_total = 0.0
+        self._last_recall: float | None = None
+
+    def _index_for(self, schema: DatabaseSchema) -> SchemaIndex:
+        """Get the index for a schema, building it if the schema changed."""
+        index = self._indexes.get(schema.database_name)
+        if index is None or index.schema is not schema:
+            index = SchemaIndex(schema)
+            self._indexes[schema.database_name] = index
+            self._index_builds += 1
+            logger.debug(
+                "Built schema retrieval index",
+                extra={"database": schema.database_name, "tables": len(schema.tables)},
+            )
+        return index
+
+    def select(self, question: str, schema: DatabaseSchema) -> SchemaSelection:
+        """Select the tables relevant to a question and render their context.
+
+        Small schemas (at most ``min_tables`` tables) and questions that match
+        no table at all are answered with the full schema.
+
+        Args:
+            question: Natural language question.
+            schema: Full database schema.
+
+        Returns:
+            SchemaSelection: Selected tables and the schema context to send.
+        """
+        total = len(schema.tables)
+        ranked: list[tuple[int, float]] = []
+        index: SchemaIndex | None = None
+        if total > self.config.min_tables:
+            index = self._index_for(schema)
+            ranked = index.search(question, self.config.top_k)
+
+        if index is None or not ranked:
+            context = schema.to_prompt_context()
+            selection = SchemaSelection(
+                tables=[table.full_name for table in schema.tables],
+                total_tables=total,
+                pruned=False,
+                prompt_context=context,
+                prompt_chars=len(context),
+                full_prompt_chars=len(context),
+            )
+            self._record_selection(selection)
+            return selection
+
+        matched = [idx for idx, _ in ranked]
+        selected = set(matched)
+        expanded: list[int] = []
+        if self.config.expand_foreign_keys:
+            for idx in matched:
+                for neighbour in index.neighbours(idx):
+                    if len(selected) >= self.config.max_tables:
+                        break
+                    if neighbour not in selected:
+                        selected.add(neighbour)
+                        expanded.append(neighbour)
+
+        # Render in schema order so the same selection always yields the same prompt
+        tables = [schema.tables[idx] for idx in sorted(selected)]
+        context = schema.model_copy(
+            update={"tables": tables, "enum_types": self._enums_used_by(tables, schema)}
+        ).to_prompt_context()
+
+        selection = SchemaSelection(
+            tables=[table.full_name for table in tables],
+            matched_tables=[schema.tables[idx].full_name for idx in matched],
+            expanded_tables=[schema.tables[idx].full_name for idx in expanded],
+            total_tables=total,
+            pruned=True,
+            prompt_context=context,
+            prompt_chars=len(context),
+            full_prompt_chars=index.full_prompt_chars,
+        )
+        self._record_selection(selection)
+        return selection
+
+    @staticmethod
+    def _enums_used_by(tables: list[TableInfo], schema: DatabaseSchema) -> list[EnumTypeInfo]:
+        """Keep only enum types used by a column of the selected tables."""
+        used = {
+            column.data_type.removesuffix("[]").split(".")[-1].strip('"')
+            for table in tables
+            for column in table.columns
+        }
+        return [enum for enum in schema.enum_types if enum.type_name in used]
+
+    def _record_selection(self, selection: SchemaSelection) -> None:
+        """Update running selection statistics."""
+        self._selections += 1
+        self._pruned_selections += int(selection.pruned)
+        self._selected_tables_total += len(selection.tables)
+        self._prompt_chars_total += selection.prompt_chars
+        self._full_prompt_chars_total += selection.full_prompt_chars
+
+    def record_recall(
+        self, schema: DatabaseSchema, selection: SchemaSelection, used_tables: list[str]
+    ) -> float | None:
+        """Measure which share of the tables a query used were in the prompt.
+
+        Args:
+            schema: Schema the selection was made from.
+            selection: Selection returned by ``select``.
+            used_tables: Table names referenced by the generated SQL.
+
+        Returns:
+            float | None: Recall between 0 and 1, or None if the selection was
+                not pruned or the SQL references no known table.
+        """
+        if not selection.pruned:
+            return None
+
+        known = self._index_for(schema).table_names
+        used = {name.lower() for name in used_tables} & known
+        if not used:
+            return None
+
+        selected = {name.rsplit(".", 1)[-1].lower() for name in selection.tables}
+        recall = len(used & selected) / len(used)
+
+        self._recall_samples += 1
+        self._recall_total += recall
+        self._last_recall = recall
+        return recall
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get schema retrieval statistics.
+
+        Returns:
+            Dictionary with selection counts, average selected tables, average
+            pruned and full prompt sizes (characters) and recall.
+        """
+        selections = self._selections or 1
+        return {
+            "top_k": self.config.top_k,
+            "index_builds": self._index_builds,
+            "selections": self._selections,
+            "pruned_selections": self._pruned_selections,
+            "avg_selected_tables": self._selected_tables_total / selections,
+            "avg_prompt_chars": self._prompt_chars_total / selections,
+            "avg_full_prompt_chars": self._full_prompt_chars_total / selections,
+            "recall_samples": self._recall_samples,
+            "avg_recall": (
+                self._recall_total / self._recall_samples if self._recall_samples else None
+            ),
+            "last_recall": self._last_recall,
+        }
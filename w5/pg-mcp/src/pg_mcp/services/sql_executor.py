@@ -5,31 +5,50 @@ result serialization, and row limiting to prevent memory overflow.
 """
 
 import asyncio
-import datetime
-import decimal
-import uuid
-from typing import Any
+import contextlib
+import json
+import logging
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
 import asyncpg
 from asyncpg import Connection, Pool
 
 from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
-from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError
+from pg_mcp.models.errors import (
+    DatabaseError,
+    ExecutionTimeoutError,
+    QueryCostExceededError,
+    RateLimitExceededError,
+)
+from pg_mcp.models.query import ExecutionResult
+from pg_mcp.observability.instrumentation import Stage, stage_timer
+from pg_mcp.resilience.rate_limiter import RateLimiter
+from pg_mcp.services.query_plan import check_plan_cost
+from pg_mcp.services.result_serializer import ColumnPlan, serialize_value
+
+if TYPE_CHECKING:
+    from pg_mcp.observability.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
 
 
 class SQLExecutor:
     """SQL executor using asyncpg with security measures.
 
     This executor ensures safe query execution by:
-    1. Setting session parameters (timeout, search_path, role)
+    1. Setting session parameters (timeout, search_path, role), either per
+       query or, with ``session_setup="per_connection"``, once per pooled
+       connection (see ``pg_mcp.db.pool.create_pool``)
     2. Running queries in read-only transactions
-    3. Limiting the number of returned rows
-    4. Serializing PostgreSQL-specific data types
+    3. Optionally rejecting queries whose EXPLAIN plan exceeds cost limits
+    4. Fetching at most max_rows rows through a server-side cursor
+    5. Serializing PostgreSQL-specific data types
 
     Example:
         >>> executor = SQLExecutor(pool, security_config, db_config)
-        >>> results, count = await executor.execute("SELECT * FROM users")
-        >>> print(f"Retrieved {count} rows")
+        >>> result = await executor.execute("SELECT * FROM users")
+        >>> print(f"Retrieved {len(result.rows)} rows")
     """
 
     def __init__(
@@ -37,6 +56,8 @@ class SQLExecutor:
         pool: Pool,
         security_config: SecurityConfig,
         db_config: DatabaseConfig,
+        rate_limiter: RateLimiter | None = None,
+        metrics: "MetricsCollector | None" = None,
     ) -> None:
         """Initialize SQL executor.
 
@@ -44,48 +65,73 @@ class SQLExecutor:
             pool: asyncpg connection pool for database connections.
             security_config: Security configuration including timeouts and limits.
             db_config: Database configuration including connection parameters.
+            rate_limiter: Optional limiter on concurrent queries, which may be
+                shared with the executors of other databases. Each execution
+                holds one of its slots.
+            metrics: Optional metrics collector receiving the durations of
+                the execute stage (from holding a connection to having the
+                rows and count) and the serialize stage.
         """
         self.pool = pool
         self.security_config = security_config
         self.db_config = db_config
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
 
     async def execute(
         self,
         sql: str,
         timeout: float | None = None,  # noqa: ASYNC109
         max_rows: int | None = None,
-    ) -> tuple[list[dict[str, Any]], int]:
+        count_sql: str | None = None,
+    ) -> ExecutionResult:
         """Execute SQL query with security measures.
 
         This method:
-        1. Acquires a connection from the pool
+        1. Waits for a query slot (if rate limited), then acquires a
+           connection from the pool
         2. Starts a read-only transaction
-        3. Sets session parameters (timeout, search_path, role)
-        4. Executes the query with timeout
-        5. Limits the number of returned rows
-        6. Serializes special PostgreSQL types
+        3. Sets session parameters (timeout, search_path, role); in
+           per-connection mode only the timeout, in the same call as BEGIN
+        4. If ``max_plan_cost`` or ``max_plan_rows`` is set, runs EXPLAIN in
+           the same transaction and rejects plans exceeding them
+        5. Opens a server-side cursor and fetches at most max_rows + 1 rows
+        6. Reports whether the result was truncated and, depending on
+           ``row_count_mode``, the total row count
+        7. Serializes special PostgreSQL types column by column, with a
+           conversion plan built once from the result's column types
+
+        Rows beyond max_rows + 1 are never transferred, so memory use is
+        bounded by max_rows rather than by the size of the result.
 
         Args:
             sql: SQL query to execute (should already be validated).
             timeout: Query timeout in seconds (uses config default if None).
             max_rows: Maximum rows to return (uses config default if None).
+            count_sql: SQL whose rows are counted when the result is truncated
+                (uses ``sql`` if None). Pass the query as generated when
+                ``sql`` has a row limit pushed into it, which would otherwise
+                cap the count at that limit.
 
         Returns:
-            tuple: (results, total_row_count) where:
-                - results: List of row dictionaries with serialized values
-                - total_row_count: Total number of rows (before limiting)
+            ExecutionResult: Serialized rows (at most max_rows), whether more
+                rows were available, and the total row count if known.
 
         Raises:
             ExecutionTimeoutError: If query execution exceeds timeout.
-            DatabaseError: If database operation fails.
+            DatabaseError: If database operation fails, or no pooled connection
+                becomes available within ``db_config.pool_timeout``.
+            RateLimitExceededError: If no query slot became available in time.
+            QueryCostExceededError: If the query plan exceeds the cost limits.
 
         Example:
-            >>> results, count = await executor.execute(
+            >>> result = await executor.execute(
             ...     "SELECT id, name FROM users WHERE active = true",
             ...     timeout=10.0,
             ...     max_rows=1000
             ... )
-            >>> print(f"Retrieved {len(results)} of {count} total rows")
+            >>> if result.truncated:
+            ...     print(f"Showing {len(result.rows)} of {result.total_row_count} rows")
         """
         # Use configured defaults if not specified
         timeout = timeout or self.security_config.max_execution_time
@@ -93,45 +139,70 @@ class SQLExecutor:
 
         try:
             async with (
-                self.pool.acquire() as connection,
-                connection.transaction(readonly=True),
+                self._query_slot(),
+                self.pool.acquire(timeout=self.db_config.pool_timeout) as connection,
+                self._read_only_transaction(connection, timeout),
             ):
-                # Set session parameters for security
-                await self._set_session_params(connection, timeout)
-
-                # Execute query with timeout
-                try:
-                    records = await asyncio.wait_for(
-                        connection.fetch(sql),
-                        timeout=timeout,
-                    )
-                except TimeoutError as e:
-                    raise ExecutionTimeoutError(
-                        message=f"Query execution exceeded timeout of {timeout} seconds",
-                        details={
-                            "timeout_seconds": timeout,
-                            "sql": sql[:200],  # Include truncated SQL for debugging
-                        },
-                    ) from e
-
-                # Track total count before limiting
-                total_count = len(records)
-
-                # Limit number of returned rows
-                if len(records) > max_rows:
-                    records = records[:max_rows]
-
-                # Convert asyncpg.Record to dict
-                results = [dict(record) for record in records]
-
-                # Serialize special PostgreSQL types
-                results = self._serialize_results(results)
-
-                return results, total_count
+                with stage_timer(self.metrics, Stage.EXECUTE, self.db_config.name):
+                    # Fetch one row past the limit through a server-side cursor to
+                    # detect truncation without materialising the full result
+                    try:
+                        if self._cost_gate_enabled():
+                            await asyncio.wait_for(
+                                self._check_plan_cost(connection, sql), timeout=timeout
+                            )
+                        records, plan = await asyncio.wait_for(
+                            self._fetch_limited(connection, sql, max_rows + 1),
+                            timeout=timeout,
+                        )
+                    except TimeoutError as e:
+                        raise ExecutionTimeoutError(
+                            message=f"Query execution exceeded timeout of {timeout} seconds",
+                            details={
+                                "timeout_seconds": timeout,
+                                "sql": sql[:200],  # Include truncated SQL for debugging
+                            },
+                        ) from e
+
+                    truncated = len(records) > max_rows
+                    if truncated:
+                        records = records[:max_rows]
+                        total_count, exact = await self._count_rows(
+                            connection, count_sql or sql, timeout
+                        )
+                    else:
+                        total_count, exact = len(records), True
+
+                # Convert records to dicts, serializing special PostgreSQL
+                # types column by column
+                with stage_timer(self.metrics, Stage.SERIALIZE, self.db_config.name):
+                    results = plan.apply(records)
+
+                # The rows were serialized above; skip re-validating them
+                return ExecutionResult.model_construct(
+                    rows=results,
+                    truncated=truncated,
+                    total_row_count=total_count,
+                    total_row_count_exact=exact,
+                )
 
-        except ExecutionTimeoutError:
-            # Re-raise timeout errors as-is
+        except (ExecutionTimeoutError, RateLimitExceededError, QueryCostExceededError):
+            # Re-raise timeout, rate limit and cost errors as-is
             raise
+        except TimeoutError as e:
+            # Query timeouts are converted above, so the pool was exhausted;
+            # fail instead of queueing behind a slow database indefinitely
+            raise DatabaseError(
+                message=(
+                    f"Timed out after {self.db_config.pool_timeout} seconds waiting for a "
+                    f"connection to database '{self.db_config.name}'"
+                ),
+                details={
+                    "database": self.db_config.name,
+                    "pool_timeout_seconds": self.db_config.pool_timeout,
+                    "max_pool_size": self.db_config.max_pool_size,
+                },
+            ) from e
         except asyncpg.PostgresError as e:
             # Wrap PostgreSQL errors
             raise DatabaseError(
@@ -152,6 +223,195 @@ class SQLExecutor:
                 },
             ) from e
 
+    def _query_slot(self) -> contextlib.AbstractAsyncContextManager[None]:
+        """Get a context holding a query slot, if queries are rate limited."""
+        if self.rate_limiter is None:
+            return contextlib.nullcontext()
+        return self.rate_limiter.slot()
+
+    def _cost_gate_enabled(self) -> bool:
+        """Check whether plans are checked against cost limits before executing."""
+        return (
+            self.security_config.max_plan_cost is not None
+            or self.security_config.max_plan_rows is not None
+        )
+
+    async def _check_plan_cost(self, conn: Connection, sql: str) -> None:
+        """Reject a query whose EXPLAIN plan exceeds the cost limits.
+
+        Must be called inside the transaction the query will run in, so the
+        plan is made with the same session settings.
+
+        Args:
+            conn: Database connection with an open transaction.
+            sql: SQL query to check.
+
+        Raises:
+            QueryCostExceededError: If the plan exceeds ``max_plan_cost`` or
+                ``max_plan_rows``.
+        """
+        plan = await conn.fetchval(f"EXPLAIN (FORMAT JSON) {sql.strip().rstrip(';')}")
+        estimate = check_plan_cost(
+            json.loads(plan)[0]["Plan"],
+            max_cost=self.security_config.max_plan_cost,
+            max_rows=self.security_config.max_plan_rows,
+        )
+        logger.debug(
+            "Query plan within cost limits",
+            extra={
+                "total_cost": estimate.total_cost,
+                "largest_node": estimate.largest_node,
+                "largest_node_rows": estimate.largest_node_rows,
+            },
+        )
+
+    async def _fetch_limited(
+        self, conn: Connection, sql: str, limit: int
+    ) -> tuple[list[asyncpg.Record], ColumnPlan]:
+        """Fetch at most ``limit`` rows of a query through a server-side cursor.
+
+        The query is prepared first, which costs no extra round trip over
+        opening the cursor directly and reports the result column types
+        that the serialization plan is built from.
+
+        Must be called inside a transaction.
+
+        Args:
+            conn: Database connection with an open transaction.
+            sql: SQL query to execute.
+            limit: Maximum number of rows to fetch.
+
+        Returns:
+            tuple: Fetched records and the column plan serializing them.
+        """
+        statement = await conn.prepare(sql)
+        cursor = await statement.cursor()
+        records = await cursor.fetch(limit)
+        return records, ColumnPlan.from_columns(statement.get_attributes())
+
+    async def _count_rows(
+        self,
+        conn: Connection,
+        sql: str,
+        timeout: float,  # noqa: ASYNC109
+    ) -> tuple[int | None, bool]:
+        """Determine the total row count of a truncated query.
+
+        Depending on ``security_config.row_count_mode`` the count is skipped,
+        computed with ``count(*)`` over at most ``row_count_cap`` + 1 rows, or
+        taken from the planner estimate. Counting runs in a savepoint so a
+        failure leaves the transaction usable; failures are logged and
+        reported as an unknown count rather than failing the query.
+
+        Args:
+            conn: Database connection with an open transaction.
+            sql: SQL query whose rows to count.
+            timeout: Timeout in seconds for the count query.
+
+        Returns:
+            tuple: (total_row_count, exact). total_row_count is None if the
+                count is disabled or failed; exact is False for planner
+                estimates and for counts that reached the cap.
+        """
+        mode = self.security_config.row_count_mode
+        if mode == "none":
+            return None, False
+
+        # The newline keeps a trailing line comment from swallowing the wrapper
+        query = sql.strip().rstrip(";")
+        try:
+            async with self._savepoint(conn, "pg_mcp_row_count"):
+                if mode == "capped":
+                    cap = self.security_config.row_count_cap
+                    count = await asyncio.wait_for(
+                        conn.fetchval(
+                            "SELECT count(*) FROM "  # noqa: S608 - validated query
+                            f"(SELECT 1 FROM ({query}\n) AS q LIMIT {cap + 1}) AS c"
+                        ),
+                        timeout=timeout,
+                    )
+                    if count > cap:
+                        return cap, False
+                    return count, True
+
+                plan = await asyncio.wait_for(
+                    conn.fetchval(f"EXPLAIN (FORMAT JSON) {query}"),
+                    timeout=timeout,
+                )
+                return int(json.loads(plan)[0]["Plan"]["Plan Rows"]), False
+        except (TimeoutError, asyncpg.PostgresError, KeyError, ValueError) as e:
+            logger.warning(
+                "Failed to count rows of truncated result",
+                extra={"row_count_mode": mode, "error": str(e)},
+            )
+            return None, False
+
+    @contextlib.asynccontextmanager
+    async def _read_only_transaction(
+        self,
+        conn: Connection,
+        timeout: float,  # noqa: ASYNC109
+    ) -> AsyncIterator[None]:
+        """Run a block in a read-only transaction with safe session settings.
+
+        In ``per_query`` session setup mode the transaction is started with
+        ``connection.transaction(readonly=True)`` followed by
+        ``_set_session_params``. In ``per_connection`` mode search_path and
+        role were applied when the connection was opened, so BEGIN and a
+        transaction-scoped ``SET LOCAL statement_timeout`` are sent together
+        in a single round trip.
+
+        Args:
+            conn: Database connection.
+            timeout: Query timeout in seconds.
+
+        Yields:
+            None: Control inside the transaction. It is committed if the
+                block succeeds and rolled back otherwise.
+
+        Raises:
+            DatabaseError: If setting session parameters fails.
+        """
+        if self.security_config.session_setup != "per_connection":
+            async with conn.transaction(readonly=True):
+                await self._set_session_params(conn, timeout)
+                yield
+            return
+
+        timeout_ms = int(timeout * 1000)
+        await conn.execute(f"BEGIN READ ONLY; SET LOCAL statement_timeout = {timeout_ms}")
+        try:
+            yield
+        except BaseException:
+            # The pool rolls back on release if this fails as well
+            with contextlib.suppress(asyncpg.PostgresError, asyncpg.InterfaceError, OSError):
+                await conn.execute("ROLLBACK")
+            raise
+        await conn.execute("COMMIT")
+
+    @contextlib.asynccontextmanager
+    async def _savepoint(self, conn: Connection, name: str) -> AsyncIterator[None]:
+        """Run a block in a savepoint of the current transaction.
+
+        Savepoints are issued directly, since ``connection.transaction()``
+        cannot be nested in a transaction started with a plain BEGIN.
+
+        Args:
+            conn: Database connection with an open transaction.
+            name: Savepoint name.
+
+        Yields:
+            None: Control inside the savepoint. It is released if the block
+                succeeds and rolled back to otherwise.
+        """
+        await conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except BaseException:
+            await conn.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            raise
+        await conn.execute(f"RELEASE SAVEPOINT {name}")
+
     async def _set_session_params(
         self,
         conn: Connection,
@@ -216,8 +476,9 @@ class SQLExecutor:
     def _serialize_results(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Serialize PostgreSQL-specific types to JSON-compatible types.
 
-        This method handles serialization of types that are not natively
-        JSON-serializable, including:
+        Query results are converted column-wise by a ``ColumnPlan``; this
+        checks every value instead, for rows without column type metadata.
+        It handles types that are not natively JSON-serializable, including:
         - datetime types: converted to ISO format strings
         - decimal.Decimal: converted to float
         - uuid.UUID: converted to string
@@ -240,49 +501,5 @@ class SQLExecutor:
             >>> serialized[1]["price"]  # 99.99
         """
 
-        def serialize_value(value: Any) -> Any:
-            """Recursively serialize a single value.
-
-            Args:
-                value: Value to serialize.
-
-            Returns:
-                Serialized value that is JSON-compatible.
-            """
-            # Handle None
-            if value is None:
-                return None
-
-            # Handle datetime types
-            if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
-                return value.isoformat()
-
-            # Handle timedelta
-            if isinstance(value, datetime.timedelta):
-                return str(value)
-
-            # Handle Decimal (convert to float)
-            if isinstance(value, decimal.Decimal):
-                return float(value)
-
-            # Handle UUID
-            if isinstance(value, uuid.UUID):
-                return str(value)
-
-            # Handle bytes (convert to hex string)
-            if isinstance(value, bytes):
-                return value.hex()
-
-            # Handle lists and tuples (recursively serialize)
-            if isinstance(value, (list, tuple)):
-                return [serialize_value(v) for v in value]
-
-            # Handle dicts (recursively serialize values)
-            if isinstance(value, dict):
-                return {k: serialize_value(v) for k, v in value.items()}
-
-            # Return other types as-is (str, int, float, bool, etc.)
-            return value
-
         # Serialize all values in all rows
         return [{key: serialize_value(value) for key, value in row.items()} for row in results]
@@ -5,18 +5,23 @@ natural language questions into valid PostgreSQL SQL queries.
 """
 
 import re
+import time
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import TYPE_CHECKING
 
 from openai import AsyncOpenAI
 
 from pg_mcp.config.settings import OpenAIConfig
 from pg_mcp.models.errors import LLMError, LLMTimeoutError, LLMUnavailableError
+from pg_mcp.observability.instrumentation import Stage, record_llm_call, stage_timer
 from pg_mcp.prompts.sql_generation import SQL_GENERATION_SYSTEM_PROMPT, build_user_prompt
+from pg_mcp.resilience.rate_limiter import RateLimiter
 
 if TYPE_CHECKING:
     from openai.types.chat import ChatCompletion
 
     from pg_mcp.models.schema import DatabaseSchema
+    from pg_mcp.observability.metrics import MetricsCollector
 
 
 class SQLGenerator:
@@ -35,14 +40,28 @@ class SQLGenerator:
         ... )
     """
 
-    def __init__(self, config: OpenAIConfig) -> None:
+    def __init__(
+        self,
+        config: OpenAIConfig,
+        rate_limiter: RateLimiter | None = None,
+        metrics: "MetricsCollector | None" = None,
+    ) -> None:
         """Initialize SQL generator with OpenAI configuration.
 
         Args:
             config: OpenAI configuration including API key and model settings.
+            rate_limiter: Optional limiter on concurrent LLM calls. Each API
+                request holds one of its slots.
+            metrics: Optional metrics collector receiving prompt build and
+                LLM call durations, calls and tokens used.
         """
         self.config = config
-        self.client = AsyncOpenAI(api_key=config.api_key.get_secret_value(), timeout=config.timeout)
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        # Retries are left to the caller's RetryPolicy so they are budgeted once
+        self.client = AsyncOpenAI(
+            api_key=config.api_key.get_secret_value(), timeout=config.timeout, max_retries=0
+        )
 
     async def generate(
         self,
@@ -51,6 +70,7 @@ class SQLGenerator:
         context: str | None = None,
         previous_attempt: str | None = None,
         error_feedback: str | None = None,
+        schema_context: str | None = None,
     ) -> str:
         """Generate SQL statement from natural language question.
 
@@ -64,6 +84,8 @@ class SQLGenerator:
             context: Optional additional context to guide generation.
             previous_attempt: Previously generated SQL that failed (for retry).
             error_feedback: Error message from previous attempt (for retry).
+            schema_context: Optional pre-rendered schema context (e.g. only the
+                tables relevant to the question) used instead of the full schema.
 
         Returns:
             str: Generated SQL query (without trailing semicolon).
@@ -72,6 +94,7 @@ class SQLGenerator:
             LLMError: If generation fails or response is invalid.
             LLMTimeoutError: If the API request times out.
             LLMUnavailableError: If the API is unavailable or authentication fails.
+            RateLimitExceededError: If no LLM call slot became available in time.
 
         Example:
             >>> # Initial generation
@@ -87,46 +110,92 @@ class SQLGenerator:
             ...     error_feedback='relation "user" does not exist'
             ... )
         """
-        user_prompt = build_user_prompt(
+        sql, _ = await self.generate_with_usage(
             question=question,
             schema=schema,
             context=context,
             previous_attempt=previous_attempt,
             error_feedback=error_feedback,
+            schema_context=schema_context,
         )
+        return sql
+
+    async def generate_with_usage(
+        self,
+        question: str,
+        schema: "DatabaseSchema",
+        context: str | None = None,
+        previous_attempt: str | None = None,
+        error_feedback: str | None = None,
+        schema_context: str | None = None,
+        temperature: float | None = None,
+    ) -> tuple[str, int | None]:
+        """Generate SQL and report the tokens the API call used.
+
+        Takes the same arguments as ``generate``, plus an optional sampling
+        temperature overriding ``OpenAIConfig.temperature`` (used to make
+        hedged candidates differ).
+
+        Returns:
+            tuple: (generated SQL, total tokens used or None if the API did
+                not report usage)
 
-        try:
-            response: ChatCompletion = await self.client.chat.completions.create(
-                model=self.config.model,
-                messages=[
-                    {"role": "system", "content": SQL_GENERATION_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
+        Raises:
+            LLMError: If generation fails or response is invalid.
+            LLMTimeoutError: If the API request times out.
+            LLMUnavailableError: If the API is unavailable or authentication fails.
+            RateLimitExceededError: If no LLM call slot became available in time.
+        """
+        with stage_timer(self.metrics, Stage.PROMPT_BUILD):
+            user_prompt = build_user_prompt(
+                question=question,
+                schema=schema,
+                context=context,
+                previous_attempt=previous_attempt,
+                error_feedback=error_feedback,
+                schema_context=schema_context,
             )
-        except TimeoutError as e:
-            raise LLMTimeoutError(
-                message=f"OpenAI API request timed out after {self.config.timeout}s",
-                details={"timeout": self.config.timeout},
-            ) from e
-        except Exception as e:
-            # Handle various OpenAI errors
-            error_msg = str(e)
-            if "authentication" in error_msg.lower() or "api_key" in error_msg.lower():
-                raise LLMUnavailableError(
-                    message="OpenAI API authentication failed - check API key",
-                    details={"error": error_msg},
+
+        async with self._llm_slot():
+            try:
+                # Time the API call only, not the wait for an LLM slot
+                start = time.perf_counter()
+                with stage_timer(self.metrics, Stage.LLM_GENERATE):
+                    response: ChatCompletion = await self.client.chat.completions.create(
+                        model=self.config.model,
+                        messages=[
+                            {"role": "system", "content": SQL_GENERATION_SYSTEM_PROMPT},
+                            {"role": "user", "content": user_prompt},
+                        ],
+                        temperature=(
+                            self.config.temperature if temperature is None else temperature
+                        ),
+                        max_tokens=self.config.max_tokens,
+                    )
+            except TimeoutError as e:
+                raise LLMTimeoutError(
+                    message=f"OpenAI API request timed out after {self.config.timeout}s",
+                    details={"timeout": self.config.timeout},
                 ) from e
-            if "rate_limit" in error_msg.lower():
-                raise LLMUnavailableError(
-                    message="OpenAI API rate limit exceeded",
+            except Exception as e:
+                # Handle various OpenAI errors
+                error_msg = str(e)
+                if "authentication" in error_msg.lower() or "api_key" in error_msg.lower():
+                    raise LLMUnavailableError(
+                        message="OpenAI API authentication failed - check API key",
+                        details={"error": error_msg},
+                    ) from e
+                if "rate_limit" in error_msg.lower():
+                    raise LLMUnavailableError(
+                        message="OpenAI API rate limit exceeded",
+                        details={"error": error_msg},
+                    ) from e
+                raise LLMError(
+                    message=f"OpenAI API request failed: {error_msg}",
                     details={"error": error_msg},
                 ) from e
-            raise LLMError(
-                message=f"OpenAI API request failed: {error_msg}",
-                details={"error": error_msg},
-            ) from e
+
+        record_llm_call(self.metrics, "generate_sql", time.perf_counter() - start, response.usage)
 
         # Extract SQL from response
         if not response.choices:
@@ -149,7 +218,14 @@ class SQLGenerator:
                 details={"content": content},
             )
 
-        return sql
+        usage = response.usage
+        return sql, usage.total_tokens if usage is not None else None
+
+    def _llm_slot(self) -> AbstractAsyncContextManager[None]:
+        """Get a context holding an LLM call slot, if calls are rate limited."""
+        if self.rate_limiter is None:
+            return nullcontext()
+        return self.rate_limiter.slot()
 
     def _extract_sql(self, content: str) -> str | None:
         """Extract SQL query from LLM response content.
@@ -0,0 +1,349 @@
+"""Hedged SQL generation.
+
+This module cuts the tail latency of SQL generation by running several LLM
+generations for the same prompt concurrently and keeping the first candidate
+that passes ``SQLValidator``; the others are cancelled. In ``delayed`` mode a
+further candidate is only launched once the running ones have taken longer
+than a high percentile of recent generation latencies, so most requests cost
+a single LLM call. In ``parallel`` mode every candidate is launched at once,
+trading tokens for latency, and per-candidate temperatures can make the
+candidates differ so that one invalid answer is less likely to be repeated.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, Field
+
+from pg_mcp.config.settings import HedgingConfig
+from pg_mcp.models.errors import (
+    LLMError,
+    RateLimitExceededError,
+    SecurityViolationError,
+    SQLParseError,
+)
+from pg_mcp.observability.instrumentation import Stage, stage_timer
+from pg_mcp.services.sql_generator import SQLGenerator
+from pg_mcp.services.sql_validator import SQLValidator
+
+if TYPE_CHECKING:
+    from pg_mcp.models.schema import DatabaseSchema
+    from pg_mcp.observability.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+# Generation latencies kept for the hedge delay percentile
+LATENCY_WINDOW = 200
+# Latencies needed before the percentile replaces the initial delay
+MIN_LATENCY_SAMPLES = 20
+
+Candidate = tuple[str, int | None]
+
+
+class HedgedGeneration(BaseModel):
+    """Outcome of one hedged generation attempt."""
+
+    sql: str = Field(..., description="Accepted SQL, or the last invalid candidate if none passed")
+    valid: bool = Field(..., description="Whether the SQL passed validation")
+    tokens_used: int | None = Field(
+        default=None, description="Tokens used by every completed candidate"
+    )
+    candidates: int = Field(..., description="Number of candidates launched")
+    winner: int | None = Field(default=None, description="Launch index of the accepted candidate")
+
+
+class SQLHedger:
+    """Runs concurrent SQL generations and keeps the first valid candidate.
+
+    Example:
+        >>> hedger = SQLHedger(generator, validator, HedgingConfig(enabled=True))
+        >>> result = await hedger.generate(question="Count users", schema=db_schema)
+        >>> if result.valid:
+        ...     print(result.sql, result.winner)
+    """
+
+    def __init__(
+        self,
+        sql_generator: SQLGenerator,
+        sql_validator: SQLValidator,
+        config: HedgingConfig,
+        metrics: "MetricsCollector | None" = None,
+    ) -> None:
+        """Initialize SQL hedger.
+
+        Args:
+            sql_generator: SQL generation service.
+            sql_validator: Validator a candidate must pass to be accepted.
+            config: Hedging configuration.
+            metrics: Optional metrics collector receiving candidate outcomes,
+                token use and time to valid SQL.
+        """
+        self.sql_generator = sql_generator
+        self.sql_validator = sql_validator
+        self.config = config
+        self.metrics = metrics
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._stats = {
+            "attempts": 0,
+            "hedged_attempts": 0,
+            "candidates": 0,
+            "hedge_wins": 0,
+            "cancelled": 0,
+            "accepted_tokens": 0,
+            "discarded_tokens": 0,
+        }
+
+    async def generate(
+        self,
+        question: str,
+        schema: "DatabaseSchema",
+        previous_attempt: str | None = None,
+        error_feedback: str | None = None,
+        schema_context: str | None = None,
+    ) -> HedgedGeneration:
+        """Generate SQL with hedged candidates.
+
+        Candidates are launched up to ``max_candidates``: all at once in
+        ``parallel`` mode, otherwise one more each time the hedge delay passes
+        without a valid candidate, or straight away when every running
+        candidate has failed. The first candidate passing validation wins.
+
+        Args:
+            question: User's natural language question.
+            schema: Database schema for context.
+            previous_attempt: Previously generated SQL that failed (for retry).
+            error_feedback: Error message from previous attempt (for retry).
+            schema_context: Optional pre-rendered schema context.
+
+        Returns:
+            HedgedGeneration: The accepted SQL, or the last invalid candidate
+                if no candidate passed validation.
+
+        Raises:
+            LLMError: If every candidate failed to generate (the first error).
+            RateLimitExceededError: If every candidate failed and the first
+                failure was waiting for an LLM call slot.
+        """
+        start = time.perf_counter()
+        pending: dict[asyncio.Task[Candidate], int] = {}
+        launched = 0
+        last_launch = start
+        invalid_sql: str | None = None
+        failures: list[Exception] = []
+        tokens: int | None = None
+
+        def launch() -> None:
+            nonlocal launched, last_launch
+            temperatures = self.config.temperatures
+            task = asyncio.create_task(
+                self._timed_candidate(
+                    question=question,
+                    schema=schema,
+                    previous_attempt=previous_attempt,
+                    error_feedback=error_feedback,
+                    schema_context=schema_context,
+                    temperature=temperatures[launched] if launched < len(temperatures) else None,
+                )
+            )
+            pending[task] = launched
+            launched += 1
+            last_launch = time.perf_counter()
+
+        self._stats["attempts"] += 1
+        try:
+            launch()
+            if self.config.mode == "parallel":
+                while launched < self.config.max_candidates:
+                    launch()
+
+            while pending:
+                timeout = None
+                if launched < self.config.max_candidates:
+                    timeout = max(0.0, last_launch + self._hedge_delay() - time.perf_counter())
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    launch()
+                    continue
+
+                for task in done:
+                    index = pending.pop(task)
+                    try:
+                        sql, used = task.result()
+                    except (LLMError, RateLimitExceededError) as e:
+                        failures.append(e)
+                        self._record_candidate("failed")
+                        continue
+
+                    if used is not None:
+                        tokens = (tokens or 0) + used
+
+                    if self._is_valid(sql):
+                        self._record_candidate("accepted", used)
+                        return self._accept(sql, index, launched, tokens, start)
+
+                    invalid_sql = sql
+                    self._record_candidate("invalid", used)
+
+                if not pending and launched < self.config.max_candidates:
+                    # No candidate left running; don't wait out the delay
+                    launch()
+        finally:
+            for task in pending:
+                if task.done():
+                    # Finished alongside the accepted candidate
+                    self._record_unused(task)
+                else:
+                    task.cancel()
+                    self._record_candidate("cancelled")
+            await asyncio.gather(*pending, return_exceptions=True)
+            self._stats["candidates"] += launched
+            if launched > 1:
+                self._stats["hedged_attempts"] += 1
+
+        if invalid_sql is not None:
+            return HedgedGeneration(
+                sql=invalid_sql, valid=False, tokens_used=tokens, candidates=launched
+            )
+        raise failures[0]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hedging statistics.
+
+        Returns:
+            Dictionary with attempt, candidate, hedge win, cancellation and
+            token counters and the current hedge delay.
+
+        Example:
+            >>> stats = hedger.get_stats()
+            >>> print(stats["discarded_tokens"] / max(1, stats["accepted_tokens"]))
+        """
+        return {
+            **self._stats,
+            "hedge_delay_seconds": self._hedge_delay(),
+            "latency_samples": len(self._latencies),
+        }
+
+    async def _timed_candidate(self, temperature: float | None, **kwargs: Any) -> Candidate:
+        """Generate one candidate and record its latency.
+
+        A candidate cancelled because another one won records its elapsed
+        time as a lower bound on its latency.
+
+        Args:
+            temperature: Sampling temperature, or None for the configured one.
+            **kwargs: Arguments for ``SQLGenerator.generate_with_usage``.
+
+        Returns:
+            Candidate: (generated SQL, tokens used)
+        """
+        start = time.perf_counter()
+        try:
+            candidate = await self.sql_generator.generate_with_usage(
+                temperature=temperature, **kwargs
+            )
+        except asyncio.CancelledError:
+            # Leaving out cancelled slow candidates would pull the percentile
+            # down and make hedging ever more eager
+            self._latencies.append(time.perf_counter() - start)
+            raise
+        self._latencies.append(time.perf_counter() - start)
+        return candidate
+
+    def _hedge_delay(self) -> float:
+        """Get the time after which another candidate is launched.
+
+        Returns:
+            float: ``delay_percentile`` of recent generation latencies, or
+                ``initial_delay`` until enough latencies are known.
+        """
+        if len(self._latencies) < MIN_LATENCY_SAMPLES:
+            return self.config.initial_delay
+        ordered = sorted(self._latencies)
+        rank = math.ceil(self.config.delay_percentile / 100 * len(ordered)) - 1
+        return ordered[max(0, rank)]
+
+    def _is_valid(self, sql: str) -> bool:
+        """Check whether a candidate passes validation.
+
+        Args:
+            sql: Candidate SQL.
+
+        Returns:
+            bool: True if the SQL is valid.
+        """
+        try:
+            with stage_timer(self.metrics, Stage.VALIDATE):
+                self.sql_validator.validate_or_raise(sql)
+        except (SecurityViolationError, SQLParseError):
+            return False
+        return True
+
+    def _accept(
+        self,
+        sql: str,
+        index: int,
+        launched: int,
+        tokens: int | None,
+        start: float,
+    ) -> HedgedGeneration:
+        """Build the outcome for an accepted candidate and record it.
+
+        Args:
+            sql: Accepted SQL.
+            index: Launch index of the accepted candidate.
+            launched: Number of candidates launched.
+            tokens: Tokens used by every completed candidate.
+            start: perf_counter value when the attempt started.
+
+        Returns:
+            HedgedGeneration: The accepted outcome.
+        """
+        duration = time.perf_counter() - start
+        if index > 0:
+            self._stats["hedge_wins"] += 1
+        if self.metrics is not None:
+            self.metrics.observe_sql_generation(hedged=launched > 1, duration=duration)
+        logger.debug(
+            "Hedged SQL generation accepted a candidate",
+            extra={"winner": index, "candidates": launched, "duration_ms": duration * 1000},
+        )
+        return HedgedGeneration(
+            sql=sql, valid=True, tokens_used=tokens, candidates=launched, winner=index
+        )
+
+    def _record_unused(self, task: "asyncio.Task[Candidate]") -> None:
+        """Record a candidate that finished but was not looked at.
+
+        Args:
+            task: Finished candidate task.
+        """
+        if task.cancelled() or task.exception() is not None:
+            self._record_candidate("failed")
+        else:
+            self._record_candidate("unused", task.result()[1])
+
+    def _record_candidate(self, outcome: str, tokens: int | None = None) -> None:
+        """Record the outcome of one candidate.
+
+        Args:
+            outcome: accepted, invalid, failed, unused or cancelled.
+            tokens: Tokens the candidate used, if reported.
+        """
+        if outcome == "cancelled":
+            self._stats["cancelled"] += 1
+        if tokens is not None:
+            key = "accepted_tokens" if outcome == "accepted" else "discarded_tokens"
+            self._stats[key] += tokens
+        if self.metrics is not None:
+            self.metrics.increment_sql_hedge_candidate(outcome)
+            if tokens is not None:
+                self.metrics.increment_sql_hedge_tokens(
+                    "accepted" if outcome == "accepted" else "discarded", tokens
+                )
@@ -3,9 +3,17 @@
 This module provides SQL validation and security checking using SQLGlot parser.
 It ensures that only safe, read-only queries are executed and blocks potentially
 dangerous operations.
+
+Parsing is the most expensive step, so each SQL string is parsed once into a
+``ParsedStatement`` that validation, normalisation, table extraction and the
+row limit rewrite all share. Parsed statements are kept in a bounded LRU cache
+keyed by SQL text, so SQL seen before (cached answers, hedged candidates,
+repeated dashboard queries) is not parsed again.
 """
 
-from typing import ClassVar
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, ClassVar
 
 import sqlglot
 from sqlglot import exp
@@ -13,6 +21,153 @@ from sqlglot import exp
 from pg_mcp.config.settings import SecurityConfig
 from pg_mcp.models.errors import SecurityViolationError, SQLParseError
 
+# Parsed statements kept by default in a validator's LRU cache
+PARSE_CACHE_SIZE = 1024
+
+# Functions whose result changes between calls with the same arguments (the
+# clock, randomness, sequences), so the same SQL can return different rows
+# without any table changing. Expressions sqlglot parses into dedicated
+# nodes are matched by type (the ones this sqlglot version defines); the
+# others are matched by name.
+_VOLATILE_EXPRESSIONS = tuple(
+    getattr(exp, name)
+    for name in (
+        "CurrentDate",
+        "CurrentTime",
+        "CurrentTimestamp",
+        "CurrentDatetime",
+        "Localtime",
+        "Localtimestamp",
+        "Rand",
+        "Uuid",
+    )
+    if hasattr(exp, name)
+)
+_VOLATILE_FUNCTIONS = frozenset(
+    {
+        "now",
+        "clock_timestamp",
+        "statement_timestamp",
+        "transaction_timestamp",
+        "timeofday",
+        "random",
+        "random_normal",
+        "gen_random_uuid",
+        "uuid_generate_v1",
+        "uuid_generate_v4",
+        "nextval",
+        "currval",
+        "lastval",
+        "setval",
+        "txid_current",
+        "pg_current_xact_id",
+    }
+)
+# Date/time input strings evaluated against the clock ('now'::timestamp)
+_VOLATILE_LITERALS = frozenset({"now", "today", "tomorrow", "yesterday"})
+
+
+class ParsedStatement:
+    """SQL text parsed once by SQLGlot.
+
+    The syntax trees may be shared through the parse cache and must be treated
+    as read-only; rewrites work on a copy.
+
+    Example:
+        >>> parsed = validator.parse("SELECT id FROM users")
+        >>> validator.validate_or_raise(parsed)
+        >>> parsed.tables
+        ['users']
+    """
+
+    def __init__(self, sql: str, expressions: list[exp.Expression | None]) -> None:
+        """Initialize parsed statement.
+
+        Args:
+            sql: SQL text that was parsed.
+            expressions: Statements parsed from the text, as returned by
+                ``sqlglot.parse`` (None for empty statements).
+        """
+        self.sql = sql
+        self.expressions = expressions
+        # Row limit rewrites already computed, by limit
+        self._limited: dict[int, str] = {}
+
+    @property
+    def statement(self) -> exp.Expression:
+        """Get the first statement.
+
+        Raises:
+            SQLParseError: If no statement was parsed.
+        """
+        if not self.expressions or self.expressions[0] is None:
+            raise SQLParseError("No valid SQL statement found")
+        return self.expressions[0]
+
+    @cached_property
+    def normalized(self) -> str:
+        """Get the SQL in canonical form (computed once).
+
+        Raises:
+            SQLParseError: If no statement was parsed.
+        """
+        return "; ".join(
+            expression.sql(dialect="postgres", pretty=False) for expression in self._statements()
+        )
+
+    @cached_property
+    def tables(self) -> list[str]:
+        """Get the sorted, lowercase names of all referenced tables (computed once).
+
+        Raises:
+            SQLParseError: If no statement was parsed.
+        """
+        return sorted(
+            {
+                table.name.lower()
+                for expression in self._statements()
+                for table in expression.find_all(exp.Table)
+                if table.name
+            }
+        )
+
+    @cached_property
+    def volatile_functions(self) -> list[str]:
+        """Get the sorted names of clock, random and sequence functions used (computed once).
+
+        ``age`` with a single argument counts, as it is measured from
+        ``current_date``; so do date/time literals such as ``'now'``.
+
+        Raises:
+            SQLParseError: If no statement was parsed.
+        """
+        names = set()
+        for expression in self._statements():
+            for node in expression.find_all(exp.Func):
+                name = node.name.lower() if isinstance(node, exp.Anonymous) else ""
+                if isinstance(node, _VOLATILE_EXPRESSIONS):
+                    # The PostgreSQL spelling: RANDOM() rather than sqlglot's RAND
+                    names.add(node.sql(dialect="postgres").split("(")[0].lower())
+                elif name in _VOLATILE_FUNCTIONS or (name == "age" and len(node.expressions) == 1):
+                    names.add(name)
+                elif (
+                    isinstance(node, exp.Cast)
+                    and isinstance(node.this, exp.Literal)
+                    and node.this.is_string
+                    and node.this.name.strip().lower() in _VOLATILE_LITERALS
+                ):
+                    names.add(node.this.name.strip().lower())
+        return sorted(names)
+
+    def _statements(self) -> list[exp.Expression]:
+        """Get the non-empty statements.
+
+        Raises:
+            SQLParseError: If the first statement is empty.
+        """
+        rest = self.expressions[1:]
+        return [self.statement, *(expression for expression in rest if expression is not None)]
+
 
 class SQLValidator:
     """SQL security validator using SQLGlot for parsing and validation.
@@ -26,13 +181,16 @@ class SQLValidator:
     """
 
     # Allowed statement types at the top level (including set operations)
-    ALLOWED_STATEMENT_TYPES: ClassVar = {
-        exp.Select, exp.Union, exp.Intersect, exp.Except
-    }
+    ALLOWED_STATEMENT_TYPES: ClassVar = {exp.Select, exp.Union, exp.Intersect, exp.Except}
 
     # Allowed top-level expressions (including CTEs)
     ALLOWED_TOP_LEVEL: ClassVar = {
-        exp.Select, exp.Union, exp.Intersect, exp.Except, exp.With, exp.Subquery
+        exp.Select,
+        exp.Union,
+        exp.Intersect,
+        exp.Except,
+        exp.With,
+        exp.Subquery,
     }
 
     # Forbidden statement types
@@ -70,6 +228,7 @@ class SQLValidator:
         "dblink_open",
         "pg_write_file",
         "pg_execute_sql",
+        "set_config",  # would let a query change the session's role or search_path
         "copy_from",
         "copy_to",
     }
@@ -80,6 +239,7 @@ class SQLValidator:
         blocked_tables: list[str] | None = None,
         blocked_columns: list[str] | None = None,
         allow_explain: bool = False,
+        parse_cache_size: int = PARSE_CACHE_SIZE,
     ) -> None:
         """Initialize SQL validator.
 
@@ -88,22 +248,86 @@ class SQLValidator:
             blocked_tables: Optional list of table names to block access to.
             blocked_columns: Optional list of column names to block access to.
             allow_explain: Whether to allow EXPLAIN statements.
+            parse_cache_size: Maximum parsed statements kept in the LRU parse
+                cache (0 disables caching).
         """
         self.config = config
         self.blocked_tables = {t.lower() for t in (blocked_tables or [])}
         self.blocked_columns = {c.lower() for c in (blocked_columns or [])}
         self.allow_explain = allow_explain
+        self.parse_cache_size = parse_cache_size
+        self._parse_cache: OrderedDict[str, ParsedStatement] = OrderedDict()
+        self._parse_stats = {"hits": 0, "misses": 0}
 
         # Combine built-in dangerous functions with custom blocked functions
         self.blocked_functions = self.BUILTIN_DANGEROUS_FUNCTIONS | {
             f.lower() for f in config.blocked_functions
         }
 
-    def validate(self, sql: str) -> tuple[bool, str | None]:
+    def parse(self, sql: str | ParsedStatement) -> ParsedStatement:
+        """Parse SQL, reusing the cached statement for SQL seen before.
+
+        Args:
+            sql: SQL query string, or an already parsed statement (returned
+                as is).
+
+        Returns:
+            ParsedStatement: Parsed statement shared with other callers.
+
+        Raises:
+            SQLParseError: If SQL cannot be parsed.
+        """
+        if isinstance(sql, ParsedStatement):
+            return sql
+
+        parsed = self._parse_cache.get(sql)
+        if parsed is not None:
+            self._parse_cache.move_to_end(sql)
+            self._parse_stats["hits"] += 1
+            return parsed
+
+        self._parse_stats["misses"] += 1
+        try:
+            # Newer sqlglot releases annotate parse() with the Expr base class
+            expressions: list[Any] = sqlglot.parse(sql, read="postgres")
+        except Exception as e:
+            raise SQLParseError(f"Failed to parse SQL: {e}") from e
+        return self._remember(ParsedStatement(sql, expressions))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get parse cache statistics.
+
+        Returns:
+            Dictionary with cached statements, the cache capacity, and cache
+            hits and misses.
+        """
+        return {
+            "size": len(self._parse_cache),
+            "max_size": self.parse_cache_size,
+            **self._parse_stats,
+        }
+
+    def _remember(self, parsed: ParsedStatement) -> ParsedStatement:
+        """Store a parsed statement in the LRU cache.
+
+        Args:
+            parsed: Parsed statement.
+
+        Returns:
+            ParsedStatement: The same statement.
+        """
+        if self.parse_cache_size > 0:
+            self._parse_cache[parsed.sql] = parsed
+            self._parse_cache.move_to_end(parsed.sql)
+            while len(self._parse_cache) > self.parse_cache_size:
+                self._parse_cache.popitem(last=False)
+        return parsed
+
+    def validate(self, sql: str | ParsedStatement) -> tuple[bool, str | None]:
         """Validate SQL query for security compliance.
 
         Args:
-            sql: SQL query string to validate.
+            sql: SQL query string or parsed statement to validate.
 
         Returns:
             Tuple of (is_valid, error_message). If valid, error_message is None.
@@ -114,25 +338,27 @@ class SQLValidator:
         except (SecurityViolationError, SQLParseError) as e:
             return (False, str(e))
 
-    def validate_or_raise(self, sql: str) -> None:
+    def validate_or_raise(self, sql: str | ParsedStatement) -> ParsedStatement:
         """Validate SQL query and raise exception on violation.
 
         Args:
-            sql: SQL query string to validate.
+            sql: SQL query string or parsed statement to validate.
+
+        Returns:
+            ParsedStatement: The parsed statement, for reuse by later steps.
 
         Raises:
             SQLParseError: If SQL cannot be parsed.
             SecurityViolationError: If SQL violates security constraints.
         """
         # Check for empty or whitespace-only SQL
-        if not sql or not sql.strip():
+        text = sql.sql if isinstance(sql, ParsedStatement) else sql
+        if not text or not text.strip():
             raise SQLParseError("SQL query cannot be empty")
 
-        # Parse SQL using SQLGlot
-        try:
-            parsed = sqlglot.parse(sql, read="postgres")
-        except Exception as e:
-            raise SQLParseError(f"Failed to parse SQL: {e}") from e
+        # Parse SQL using SQLGlot (or reuse the cached parse)
+        parsed_statement = self.parse(sql)
+        parsed = parsed_statement.expressions
 
         # Check for multiple statements
         if len(parsed) > 1:
@@ -160,7 +386,7 @@ class SQLValidator:
                 # sqlglot 28.5.0 cannot parse EXPLAIN syntax reliably (falls back to Command),
                 # so we don't attempt to validate the inner query string to avoid false positives.
                 # Even "EXPLAIN DELETE" is safe as it won't actually delete data.
-                return None
+                return parsed_statement
             else:
                 # Other commands are not allowed
                 raise SecurityViolationError(
@@ -193,6 +419,8 @@ class SQLValidator:
         if error := self._check_subquery_safety(statement):
             raise SecurityViolationError(error)
 
+        return parsed_statement
+
     def _check_statement_type(self, statement: exp.Expression) -> str | None:
         """Check if statement type is allowed.
 
@@ -308,14 +536,137 @@ class SQLValidator:
 
         return None
 
-    def normalize_sql(self, sql: str) -> str:
+    def apply_row_limit(self, sql: str | ParsedStatement, max_rows: int | None = None) -> str:
+        """Push the row limit down into the outermost query.
+
+        Injects ``LIMIT max_rows + 1`` into a validated query, or tightens an
+        existing literal LIMIT / FETCH FIRST that is larger, so PostgreSQL can
+        choose fast-start plans and stop producing rows that would be thrown
+        away. The extra row lets the executor detect truncation.
+
+        Queries that already return at most that many rows are left as they
+        are, as are aggregate-only queries (which return a single row) and
+        limits the rewrite cannot reason about (parameters, expressions,
+        ``WITH TIES`` and ``PERCENT``).
+
+        The rewrite works on a copy of the cached syntax tree, and the
+        rewritten statement is cached under its own text so that later steps
+        on the executed SQL do not parse it again.
+
+        Args:
+            sql: SQL query (or its parsed statement) that passed
+                ``validate_or_raise``.
+            max_rows: Maximum rows to return (uses config default if None).
+
+        Returns:
+            str: The rewritten SQL, or the SQL text unchanged if no limit is
+                needed.
+
+        Raises:
+            SQLParseError: If SQL cannot be parsed.
+
+        Example:
+            >>> validator.apply_row_limit("SELECT * FROM orders", max_rows=100)
+            'SELECT * FROM orders LIMIT 101'
+        """
+        limit = (max_rows or self.config.max_rows) + 1
+
+        parsed = self.parse(sql)
+        limited_sql = parsed._limited.get(limit)
+        if limited_sql is None:
+            limited_sql = self._limit_statement(parsed, limit)
+            parsed._limited[limit] = limited_sql
+        return limited_sql
+
+    def _limit_statement(self, parsed: ParsedStatement, limit: int) -> str:
+        """Rewrite a parsed statement so it returns at most ``limit`` rows.
+
+        Args:
+            parsed: Parsed statement that passed ``validate_or_raise``.
+            limit: Row limit to push down.
+
+        Returns:
+            str: The rewritten SQL, or the SQL text unchanged if no limit is
+                needed.
+        """
+        sql = parsed.sql
+        if len(parsed.expressions) != 1:
+            return sql
+        statement = parsed.statement
+
+        if not isinstance(statement, (exp.Select, exp.SetOperation)):
+            return sql
+
+        if self.is_single_row_aggregate(parsed):
+            return sql
+
+        current = statement.args.get("limit")
+        if current is not None:
+            if isinstance(current, exp.Fetch):
+                options = current.args.get("limit_options")
+                if options is not None and (
+                    options.args.get("percent") or options.args.get("with_ties")
+                ):
+                    return sql
+                count = current.args.get("count")
+            else:
+                count = current.expression
+
+            if isinstance(count, exp.Var) and count.name.upper() == "ALL":
+                pass  # LIMIT ALL is no limit at all
+            elif isinstance(count, exp.Literal) and count.is_int:
+                if int(count.name) <= limit:
+                    return sql
+            else:
+                return sql
+
+        # Copy: the cached tree is shared and must not change
+        limited = statement.limit(limit)
+        limited_sql = limited.sql(dialect="postgres")
+        if limited_sql not in self._parse_cache:
+            self._remember(ParsedStatement(limited_sql, [limited]))
+        return limited_sql
+
+    def is_single_row_aggregate(self, sql: str | ParsedStatement) -> bool:
+        """Check whether a query aggregates everything into a single row.
+
+        Args:
+            sql: SQL query string or parsed statement.
+
+        Returns:
+            bool: True for a single SELECT without GROUP BY whose projection
+                contains a plain (non-window) aggregate and no set-returning
+                function.
+
+        Raises:
+            SQLParseError: If SQL cannot be parsed.
+        """
+        parsed = self.parse(sql)
+        if len(parsed.expressions) != 1:
+            return False
+        statement = parsed.statement
+        if not isinstance(statement, exp.Select) or statement.args.get("group"):
+            return False
+
+        has_aggregate = False
+        for projection in statement.expressions:
+            if projection.find(exp.UDTF, exp.GenerateSeries):
+                return False
+            for aggregate in projection.find_all(exp.AggFunc):
+                if isinstance(aggregate.parent, exp.Window):
+                    continue
+                if aggregate.find_ancestor(exp.Select) is statement:
+                    has_aggregate = True
+        return has_aggregate
+
+    def normalize_sql(self, sql: str | ParsedStatement) -> str:
         """Normalize SQL query to a canonical form.
 
         This removes extra whitespace, standardizes formatting, and makes
         queries easier to compare or cache.
 
         Args:
-            sql: SQL query string to normalize.
+            sql: SQL query string or parsed statement to normalize.
 
         Returns:
             Normalized SQL string.
@@ -323,18 +674,13 @@ class SQLValidator:
         Raises:
             SQLParseError: If SQL cannot be parsed.
         """
-        try:
-            parsed = sqlglot.parse_one(sql, read="postgres")
-            # Generate normalized SQL
-            return parsed.sql(dialect="postgres", pretty=False)
-        except Exception as e:
-            raise SQLParseError(f"Failed to normalize SQL: {e}") from e
+        return self.parse(sql).normalized
 
-    def extract_tables(self, sql: str) -> list[str]:
+    def extract_tables(self, sql: str | ParsedStatement) -> list[str]:
         """Extract all table names referenced in the SQL query.
 
         Args:
-            sql: SQL query string.
+            sql: SQL query string or parsed statement.
 
         Returns:
             List of table names (in lowercase).
@@ -342,14 +688,23 @@ class SQLValidator:
         Raises:
             SQLParseError: If SQL cannot be parsed.
         """
-        try:
-            parsed = sqlglot.parse_one(sql, read="postgres")
-            tables = []
+        return list(self.parse(sql).tables)
 
-            for table in parsed.find_all(exp.Table):
-                if table.name:
-                    tables.append(table.name.lower())
+    def extract_volatile_functions(self, sql: str | ParsedStatement) -> list[str]:
+        """Extract the functions that make a query's result change over time.
 
-            return sorted(set(tables))
-        except Exception as e:
-            raise SQLParseError(f"Failed to extract tables: {e}") from e
+        These are the clock (``now()``, ``current_date``, ...), randomness
+        and sequence functions: the same SQL over unchanged tables can return
+        different rows when it uses them.
+
+        Args:
+            sql: SQL query string or parsed statement.
+
+        Returns:
+            List of function names (in lowercase), empty if the result only
+            depends on the data read.
+
+        Raises:
+            SQLParseError: If SQL cannot be parsed.
+        """
+        return list(self.parse(sql).volatile_functions)
@@ -0,0 +1,135 @@
+"""Policy deciding which results are validated by the LLM.
+
+Result validation makes a second LLM call after every successful execution.
+Many results need no second opinion, and ``ValidationPolicy`` answers those
+locally before any call is made:
+
+- empty results: there are no rows for the LLM to judge.
+- single-row aggregates (``SELECT count(*) FROM ...`` without ``GROUP BY``,
+  as recognised by ``SQLValidator.is_single_row_aggregate``): a single number
+  whose shape the SQL already fixes.
+- results whose row count is the N of a "top N" / "first N" / "前 N"
+  question.
+
+Of the remaining requests, only ``sample_rate`` of them are validated. The
+sample is taken by hashing the request ID, so a request is either always
+or never sampled, however often its decision is taken.
+"""
+
+import hashlib
+import re
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from pg_mcp.config.settings import ValidationConfig
+from pg_mcp.models.errors import SQLParseError
+
+if TYPE_CHECKING:
+    from pg_mcp.services.sql_validator import SQLValidator
+
+# "top 10", "first 5", "last 3", "10 largest", "前10", "前 10 名"
+_TOP_N_PATTERN = re.compile(
+    r"\b(?:top|first|last)\s+(\d+)\b"
+    r"|\b(\d+)\s+(?:most|least|highest|lowest|largest|smallest|biggest|best|worst"
+    r"|latest|newest|oldest)\b"
+    r"|前\s*(\d+)",
+    re.IGNORECASE,
+)
+
+
+class ValidationDecision(StrEnum):
+    """How the results of a request are validated."""
+
+    VALIDATE = "validate"  # LLM validation before responding
+    DEFERRED = "deferred"  # LLM validation in the background after responding
+    BACKLOG_FULL = "backlog_full"  # Too many deferred validations in flight
+    EMPTY_RESULT = "empty_result"  # Skipped: no rows to judge
+    SINGLE_ROW_AGGREGATE = "single_row_aggregate"  # Skipped: single aggregate row
+    TOP_N = "top_n"  # Skipped: row count is the N the question asked for
+    SAMPLED_OUT = "sampled_out"  # Skipped: not in the validation sample
+
+
+def top_n(question: str) -> set[int]:
+    """Extract the row counts a question asks for.
+
+    Args:
+        question: Natural language question.
+
+    Returns:
+        set[int]: Every N of "top N"-like phrases in the question.
+    """
+    return {
+        int(next(group for group in match.groups() if group is not None))
+        for match in _TOP_N_PATTERN.finditer(question)
+    }
+
+
+class ValidationPolicy:
+    """Decides whether the results of a request are validated by the LLM.
+
+    Example:
+        >>> policy = ValidationPolicy(ValidationConfig(sample_rate=0.2), sql_validator)
+        >>> policy.decide("Top 5 customers", sql, row_count=5, request_id=request_id)
+        <ValidationDecision.TOP_N: 'top_n'>
+    """
+
+    def __init__(
+        self, config: ValidationConfig, sql_validator: "SQLValidator | None" = None
+    ) -> None:
+        """Initialize validation policy.
+
+        Args:
+            config: Validation configuration with the heuristics switch and
+                sample rate.
+            sql_validator: Optional SQL validator whose parse cache is used to
+                recognise single-row aggregates. Without it that heuristic
+                is not applied.
+        """
+        self.config = config
+        self.sql_validator = sql_validator
+
+    def decide(
+        self, question: str, sql: str, row_count: int, request_id: str
+    ) -> ValidationDecision:
+        """Decide whether to validate the results of a request.
+
+        Args:
+            question: User's original question.
+            sql: Executed SQL query.
+            row_count: Total row count of the results.
+            request_id: Request ID, used to sample requests.
+
+        Returns:
+            ValidationDecision: ``VALIDATE``, or the reason validation is
+                skipped.
+        """
+        if self.config.heuristics:
+            if row_count == 0:
+                return ValidationDecision.EMPTY_RESULT
+            if row_count == 1 and self._is_single_row_aggregate(sql):
+                return ValidationDecision.SINGLE_ROW_AGGREGATE
+            if row_count in top_n(question):
+                return ValidationDecision.TOP_N
+
+        if not self._sampled(request_id):
+            return ValidationDecision.SAMPLED_OUT
+        return ValidationDecision.VALIDATE
+
+    def _is_single_row_aggregate(self, sql: str) -> bool:
+        """Check the statement of already validated SQL for a single aggregate row."""
+        if self.sql_validator is None:
+            return False
+        try:
+            return self.sql_validator.is_single_row_aggregate(sql)
+        except SQLParseError:
+            return False
+
+    def _sampled(self, request_id: str) -> bool:
+        """Check whether a request is in the validation sample."""
+        rate = self.config.sample_rate
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        digest = hashlib.blake2b(request_id.encode(), digest_size=8).digest()
+        return int.from_bytes(digest) / 2**64 < rate
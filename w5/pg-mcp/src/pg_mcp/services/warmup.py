@@ -0,0 +1,332 @@
+"""Background database warm-up.
+
+This module brings databases online without holding up server startup. Each
+database gets a background task that opens its connection pool and loads its
+schema, from the on-disk snapshot when there is one and by introspection
+otherwise, so the server can accept requests straight away. A request waits,
+up to a timeout, only for the database it queries; a database whose warm-up
+failed is retried on demand.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any, Literal
+
+from asyncpg import Pool
+from pydantic import BaseModel, Field
+
+from pg_mcp.cache.schema_cache import SchemaCache
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig, StartupConfig
+from pg_mcp.db.pool import build_pool
+from pg_mcp.models.errors import DatabaseConnectionError, PgMcpError, SchemaLoadError
+from pg_mcp.services.sql_executor import SQLExecutor
+
+logger = logging.getLogger(__name__)
+
+WarmupState = Literal["pending", "connecting", "loading", "ready", "failed"]
+
+
+class DatabaseWarmupStatus(BaseModel):
+    """Warm-up progress of one database."""
+
+    state: WarmupState = Field(default="pending", description="Current warm-up phase")
+    attempts: int = Field(default=0, description="Number of warm-up attempts started")
+    schema_source: Literal["snapshot", "introspection"] | None = Field(
+        default=None, description="Where the schema was loaded from"
+    )
+    tables: int | None = Field(default=None, description="Number of tables in the loaded schema")
+    duration_ms: float | None = Field(
+        default=None, description="Duration of the last finished attempt in milliseconds"
+    )
+    failed_phase: Literal["connecting", "loading"] | None = Field(
+        default=None, description="Phase the last failed attempt failed in"
+    )
+    error: str | None = Field(default=None, description="Error of the last failed attempt")
+
+
+class DatabaseWarmup:
+    """Opens connection pools and loads schemas in background tasks.
+
+    The pools are built up front without connecting (see ``build_pool``), so
+    executors and the orchestrator can be wired to them before any
+    connection exists. ``wait_ready`` is the per-database readiness gate.
+
+    Example:
+        >>> pools = {config.name: build_pool(config) for config in configs}
+        >>> warmup = DatabaseWarmup(configs, pools, schema_cache, StartupConfig())
+        >>> warmup.start()
+        >>> await warmup.wait_ready("mydb")  # Raises if not ready in time
+        >>> print(warmup.get_status()["databases"]["mydb"]["state"])
+        ready
+    """
+
+    def __init__(
+        self,
+        configs: Iterable[DatabaseConfig],
+        pools: dict[str, Pool],
+        schema_cache: SchemaCache,
+        startup_config: StartupConfig,
+        security_config: SecurityConfig | None = None,
+        sql_executors: dict[str, SQLExecutor] | None = None,
+    ) -> None:
+        """Initialize database warm-up.
+
+        Args:
+            configs: Configurations of the databases to warm up.
+            pools: Dictionary mapping database names to their (possibly not
+                yet initialized) pools. A pool whose initialization fails is
+                replaced in place so the next attempt can connect again.
+            schema_cache: Schema cache to populate.
+            startup_config: Startup configuration with wait timeout and retry
+                delay.
+            security_config: Optional security configuration used to build
+                replacement pools.
+            sql_executors: Optional dictionary mapping database names to their
+                executors, which are pointed at replacement pools.
+        """
+        self.configs = {config.name: config for config in configs}
+        self.pools = pools
+        self.schema_cache = schema_cache
+        self.startup_config = startup_config
+        self.security_config = security_config
+        self.sql_executors = sql_executors
+        self._status = {name: DatabaseWarmupStatus() for name in self.configs}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._pool_ready: set[str] = set()
+        self._failed_at: dict[str, float] = {}
+
+    def start(self) -> None:
+        """Start warming up every database that has not been started yet.
+
+        Returns immediately; the work runs in background tasks.
+        """
+        for name in self.configs:
+            if name not in self._tasks:
+                self._start_attempt(name)
+
+    async def wait_ready(
+        self,
+        database_name: str,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> None:
+        """Wait until a database is connected and its schema is loaded.
+
+        A database whose last attempt failed at least ``retry_delay`` seconds
+        ago is warmed up again before waiting. Databases not managed by this
+        warm-up are considered ready.
+
+        Args:
+            database_name: Name of the database.
+            timeout: Maximum seconds to wait. Defaults to
+                ``StartupConfig.ready_timeout``.
+
+        Raises:
+            DatabaseConnectionError: If the database could not be connected.
+            SchemaLoadError: If the schema could not be loaded, or the database
+                did not finish warming up within the timeout.
+        """
+        status = self._status.get(database_name)
+        if status is None or status.state == "ready":
+            return
+
+        if database_name not in self._tasks or (
+            status.state == "failed"
+            and time.monotonic() - self._failed_at[database_name] >= self.startup_config.retry_delay
+        ):
+            self._start_attempt(database_name)
+
+        task = self._tasks[database_name]
+        if not task.done():
+            if timeout is None:
+                timeout = self.startup_config.ready_timeout
+            # asyncio.wait neither raises on timeout nor cancels the task,
+            # which other requests may be waiting on as well
+            await asyncio.wait((task,), timeout=timeout)
+
+        status = self._status[database_name]
+        if status.state == "ready":
+            return
+        if status.state == "failed":
+            raise self._failure_error(database_name)
+
+        raise SchemaLoadError(
+            message=(
+                f"Database '{database_name}' is still warming up ({status.state}), "
+                "please retry shortly"
+            ),
+            details={
+                "database": database_name,
+                "state": status.state,
+                "waited_seconds": timeout,
+            },
+        )
+
+    async def wait_all(self) -> None:
+        """Start every database and wait until all of them finished warming up.
+
+        Used for blocking startup (``STARTUP_BACKGROUND_WARMUP=false``).
+
+        Raises:
+            DatabaseConnectionError: If a database could not be connected.
+            SchemaLoadError: If a schema could not be loaded.
+        """
+        self.start()
+        await asyncio.gather(*self._tasks.values())
+        for name, status in self._status.items():
+            if status.state == "failed":
+                raise self._failure_error(name)
+
+    async def stop(self) -> None:
+        """Cancel warm-up tasks that are still running."""
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def is_ready(self) -> bool:
+        """Check whether every database finished warming up successfully."""
+        return all(status.state == "ready" for status in self._status.values())
+
+    def get_status(self) -> dict[str, Any]:
+        """Get warm-up progress.
+
+        Returns:
+            Dictionary with overall readiness, the number of databases per
+            state and the progress of each database.
+
+        Example:
+            >>> warmup.get_status()["states"]
+            {'ready': 1, 'loading': 1}
+        """
+        states: dict[str, int] = {}
+        for status in self._status.values():
+            states[status.state] = states.get(status.state, 0) + 1
+        return {
+            "ready": self.is_ready(),
+            "states": states,
+            "databases": {name: status.model_dump() for name, status in self._status.items()},
+        }
+
+    def _start_attempt(self, database_name: str) -> None:
+        """Start a warm-up attempt for one database.
+
+        Args:
+            database_name: Name of the database.
+        """
+        self._status[database_name].attempts += 1
+        self._tasks[database_name] = asyncio.create_task(
+            self._warm(database_name), name=f"pg-mcp-warmup-{database_name}"
+        )
+
+    async def _warm(self, database_name: str) -> None:
+        """Connect a database and load its schema, recording the outcome.
+
+        Args:
+            database_name: Name of the database.
+        """
+        status = self._status[database_name]
+        start = time.perf_counter()
+        try:
+            if database_name not in self._pool_ready:
+                status.state = "connecting"
+                await self._open_pool(database_name)
+            status.state = "loading"
+            await self._load_schema(database_name)
+        except Exception as e:
+            status.failed_phase = "connecting" if status.state == "connecting" else "loading"
+            status.state = "failed"
+            status.error = str(e)
+            self._failed_at[database_name] = time.monotonic()
+            logger.warning(
+                "Database warm-up failed",
+                extra={
+                    "database": database_name,
+                    "phase": status.failed_phase,
+                    "attempt": status.attempts,
+                    "error": str(e),
+                },
+            )
+        else:
+            status.state = "ready"
+            status.failed_phase = None
+            status.error = None
+            logger.info(
+                f"Database '{database_name}' is ready",
+                extra={"tables": status.tables, "schema_source": status.schema_source},
+            )
+        finally:
+            status.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    async def _open_pool(self, database_name: str) -> None:
+        """Initialize a database's pool, replacing it if that fails.
+
+        Args:
+            database_name: Name of the database.
+
+        Raises:
+            Exception: Whatever connecting raises.
+        """
+        try:
+            await self.pools[database_name]
+        except Exception:
+            # asyncpg closes a pool whose initialization failed for good;
+            # swap in a fresh one for the next attempt
+            pool = build_pool(self.configs[database_name], self.security_config)
+            self.pools[database_name] = pool
+            if self.sql_executors is not None and database_name in self.sql_executors:
+                self.sql_executors[database_name].pool = pool
+            raise
+        self._pool_ready.add(database_name)
+
+    async def _load_schema(self, database_name: str) -> None:
+        """Load the schema of one database into the cache.
+
+        Serves from the on-disk snapshot if there is one; it is validated
+        against the catalog in the background. Otherwise the database is
+        introspected.
+
+        Args:
+            database_name: Name of the database.
+        """
+        status = self._status[database_name]
+        pool = self.pools[database_name]
+
+        schema = await self.schema_cache.restore_snapshot(database_name, pool)
+        if schema is not None:
+            status.schema_source = "snapshot"
+        else:
+            schema = await self.schema_cache.load(database_name, pool)
+            status.schema_source = "introspection"
+        status.tables = len(schema.tables)
+
+    def _failure_error(self, database_name: str) -> PgMcpError:
+        """Build the error reported for a database whose warm-up failed.
+
+        Args:
+            database_name: Name of the database.
+
+        Returns:
+            PgMcpError: Connection or schema load error.
+        """
+        status = self._status[database_name]
+        retry_in = max(
+            0.0,
+            self.startup_config.retry_delay - (time.monotonic() - self._failed_at[database_name]),
+        )
+        details = {
+            "database": database_name,
+            "error": status.error,
+            "attempts": status.attempts,
+            "retry_in_seconds": round(retry_in, 1),
+        }
+        if status.failed_phase == "connecting":
+            return DatabaseConnectionError(
+                message=f"Failed to connect to database '{database_name}': {status.error}",
+                details=details,
+            )
+        return SchemaLoadError(
+            message=f"Failed to load schema for database '{database_name}': {status.error}",
+            details=details,
+        )
@@ -0,0 +1,27 @@
+"""Shared fixtures for performance benchmarks.
+
+Benchmarks run against the database configured through the usual
+``DATABASE_*`` environment variables and are skipped when it is unreachable.
+"""
+
+from collections.abc import AsyncIterator
+
+import asyncpg
+import pytest
+
+from pg_mcp.config.settings import DatabaseConfig
+
+
+@pytest.fixture
+async def pg_pool() -> AsyncIterator[asyncpg.Pool]:
+    """Create a small connection pool, skipping if no database is available."""
+    config = DatabaseConfig()
+    try:
+        pool = await asyncpg.create_pool(dsn=config.dsn, min_size=1, max_size=4, timeout=5.0)
+    except (OSError, TimeoutError, asyncpg.PostgresError) as e:
+        pytest.skip(f"PostgreSQL not available at {config.safe_dsn}: {e}")
+
+    try:
+        yield pool
+    finally:
+        await pool.close()
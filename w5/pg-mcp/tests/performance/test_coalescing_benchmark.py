@@ -0,0 +1,101 @@
+"""Benchmark for coalescing identical concurrent questions.
+
+Simulates a burst of scheduled reports: several agents ask the same few
+questions at the same moment. A stand-in LLM and database add fixed
+latencies. Compares the LLM calls, queries and wall time of the burst with
+and without request coalescing. Needs no database or API key.
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pg_mcp.config.settings import ResilienceConfig, ValidationConfig
+from pg_mcp.models.query import ExecutionResult, QueryRequest
+from pg_mcp.models.schema import DatabaseSchema
+from pg_mcp.services.coalescer import RequestCoalescer
+from pg_mcp.services.orchestrator import QueryOrchestrator
+
+AGENTS = 50
+QUESTIONS = ["Daily signups", "Revenue by region", "Open tickets", "Churned accounts"]
+LLM_SECONDS = 0.2
+QUERY_SECONDS = 0.05
+
+
+class FakeLLM:
+    """SQL generator with a fixed latency."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, **_: object) -> str:
+        self.calls += 1
+        await asyncio.sleep(LLM_SECONDS)
+        return "SELECT 1"
+
+
+class FakeExecutor:
+    """SQL executor with a fixed latency."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def execute(self, sql: str, count_sql: str | None = None) -> ExecutionResult:
+        self.calls += 1
+        await asyncio.sleep(QUERY_SECONDS)
+        return ExecutionResult(rows=[{"value": 1}], total_row_count=1)
+
+
+async def _burst(coalesce: bool) -> tuple[float, int, int]:
+    """Serve one burst; return wall time in ms, LLM calls and queries."""
+    generator = FakeLLM()
+    executor = FakeExecutor()
+    validator = MagicMock()
+    validator.apply_row_limit.side_effect = lambda sql: sql
+    schema_cache = MagicMock()
+    schema_cache.get.return_value = DatabaseSchema(database_name="bench")
+
+    orchestrator = QueryOrchestrator(
+        sql_generator=generator,  # type: ignore[arg-type]
+        sql_validator=validator,
+        sql_executor=executor,  # type: ignore[arg-type]
+        result_validator=MagicMock(),
+        schema_cache=schema_cache,
+        pools={"bench": MagicMock()},
+        resilience_config=ResilienceConfig(),
+        validation_config=ValidationConfig(enabled=False),
+        request_coalescer=RequestCoalescer() if coalesce else None,
+    )
+
+    start = time.perf_counter()
+    responses = await asyncio.gather(
+        *(
+            orchestrator.execute_query(
+                QueryRequest(question=QUESTIONS[agent % len(QUESTIONS)], database="bench")
+            )
+            for agent in range(AGENTS)
+        )
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    assert all(response.success for response in responses)
+    return elapsed, generator.calls, executor.calls
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_coalescing_burst() -> None:
+    """Report the cost of a burst of identical questions with and without coalescing."""
+    plain_ms, plain_llm, plain_queries = await _burst(coalesce=False)
+    coalesced_ms, coalesced_llm, coalesced_queries = await _burst(coalesce=True)
+
+    print(
+        f"\n{AGENTS} agents asking {len(QUESTIONS)} questions at once: "
+        f"without coalescing {plain_llm} LLM calls, {plain_queries} queries, "
+        f"{plain_ms:.0f} ms; coalesced {coalesced_llm} LLM calls, "
+        f"{coalesced_queries} queries, {coalesced_ms:.0f} ms"
+    )
+
+    assert coalesced_llm == len(QUESTIONS)
+    assert coalesced_llm < plain_llm
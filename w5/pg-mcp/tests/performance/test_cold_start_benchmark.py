@@ -0,0 +1,88 @@
+"""Benchmark for server cold start.
+
+Creates a scratch schema with many tables and runs the server lifespan with
+blocking startup (every pool created and every schema introspected before
+the server accepts requests) and with background warm-up, reporting the
+time until the server accepts requests and until the database is ready.
+The table count can be tuned with ``PG_MCP_BENCH_TABLES`` (default 2000).
+"""
+
+import os
+import time
+from collections.abc import AsyncIterator
+
+import asyncpg
+import pytest
+
+from pg_mcp import server
+
+BENCH_SCHEMA = "mcp_bench_cold_start"
+TABLE_COUNT = int(os.environ.get("PG_MCP_BENCH_TABLES", "2000"))
+DDL_BATCH_SIZE = 100
+
+
+async def _drop_bench_schema(conn: asyncpg.Connection) -> None:
+    """Drop the scratch schema, table by table, if it exists."""
+    tables = await conn.fetch("SELECT tablename FROM pg_tables WHERE schemaname = $1", BENCH_SCHEMA)
+    for start in range(0, len(tables), DDL_BATCH_SIZE):
+        await conn.execute(
+            ";\n".join(
+                f"DROP TABLE IF EXISTS {BENCH_SCHEMA}.{r['tablename']}"
+                for r in tables[start : start + DDL_BATCH_SIZE]
+            )
+        )
+    await conn.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA}")
+
+
+@pytest.fixture
+async def bench_schema(pg_pool: asyncpg.Pool) -> AsyncIterator[str]:
+    """Create ``TABLE_COUNT`` tables in a scratch schema."""
+    statements = [
+        f"CREATE TABLE {BENCH_SCHEMA}.t{i} (id integer PRIMARY KEY, name text)"
+        for i in range(TABLE_COUNT)
+    ]
+    async with pg_pool.acquire() as conn:
+        await _drop_bench_schema(conn)
+        await conn.execute(f"CREATE SCHEMA {BENCH_SCHEMA}")
+        for start in range(0, len(statements), DDL_BATCH_SIZE):
+            await conn.execute(";\n".join(statements[start : start + DDL_BATCH_SIZE]))
+    try:
+        yield BENCH_SCHEMA
+    finally:
+        async with pg_pool.acquire() as conn:
+            await _drop_bench_schema(conn)
+
+
+async def _cold_start(background: bool) -> tuple[float, float]:
+    """Run the lifespan once; return ms until it yields and until ready."""
+    os.environ["STARTUP_BACKGROUND_WARMUP"] = str(background).lower()
+    start = time.perf_counter()
+    async with server.lifespan(server.mcp):
+        accepting_ms = (time.perf_counter() - start) * 1000
+        assert server._warmup is not None
+        await server._warmup.wait_all()
+        ready_ms = (time.perf_counter() - start) * 1000
+    return accepting_ms, ready_ms
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_cold_start_time_to_accept(
+    bench_schema: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Report time to accept requests with blocking and background warm-up."""
+    monkeypatch.setenv("OPENAI_API_KEY", os.environ.get("OPENAI_API_KEY", "sk-bench-dummy-key"))
+    monkeypatch.setenv("OBSERVABILITY_METRICS_ENABLED", "false")
+    monkeypatch.setenv("STARTUP_BACKGROUND_WARMUP", "false")
+
+    blocking_accept, blocking_ready = await _cold_start(background=False)
+    background_accept, background_ready = await _cold_start(background=True)
+
+    print(
+        f"\ncold start ({TABLE_COUNT} tables): blocking accepts after "
+        f"{blocking_accept:.1f} ms (ready {blocking_ready:.1f} ms), "
+        f"background warm-up accepts after {background_accept:.1f} ms "
+        f"(ready {background_ready:.1f} ms)"
+    )
+
+    assert background_accept < blocking_accept
@@ -0,0 +1,76 @@
+"""Benchmark for the peak memory of SQL execution.
+
+Runs a query producing far more rows than ``max_rows`` and compares the
+Python heap high-water mark of fetching the whole result and slicing it (the
+behaviour before cursor-based execution) with ``SQLExecutor.execute``, which
+streams at most ``max_rows`` + 1 rows through a server-side cursor. The
+result size can be tuned with ``PG_MCP_BENCH_RESULT_ROWS`` (default 2000000).
+"""
+
+import os
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import asyncpg
+import pytest
+
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
+from pg_mcp.services.sql_executor import SQLExecutor
+
+RESULT_ROWS = int(os.environ.get("PG_MCP_BENCH_RESULT_ROWS", "2000000"))
+MAX_ROWS = 1000
+QUERY = f"SELECT n, md5(n::text) AS digest FROM generate_series(1, {RESULT_ROWS}) AS n"  # noqa: S608
+
+
+async def _measure(run: Callable[[], Awaitable[Any]]) -> tuple[Any, float, float]:
+    """Run a coroutine function, returning its result, peak heap MiB and ms."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = await run()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak / 2**20, elapsed_ms
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_cursor_execution_bounds_memory(pg_pool: asyncpg.Pool) -> None:
+    """Report peak memory of fetch-then-slice versus cursor execution."""
+    executor = SQLExecutor(pg_pool, SecurityConfig(max_rows=MAX_ROWS), DatabaseConfig())
+
+    async def fetch_all() -> list[dict[str, Any]]:
+        async with pg_pool.acquire() as conn, conn.transaction(readonly=True):
+            records = await conn.fetch(QUERY)
+            return [dict(record) for record in records[:MAX_ROWS]]
+
+    old_rows, old_mib, old_ms = await _measure(fetch_all)
+    result, new_mib, new_ms = await _measure(lambda: executor.execute(QUERY))
+
+    capped = SQLExecutor(
+        pg_pool, SecurityConfig(max_rows=MAX_ROWS, row_count_mode="capped"), DatabaseConfig()
+    )
+    counted, _, capped_ms = await _measure(lambda: capped.execute(QUERY))
+    estimate = SQLExecutor(
+        pg_pool, SecurityConfig(max_rows=MAX_ROWS, row_count_mode="estimate"), DatabaseConfig()
+    )
+    estimated, _, estimate_ms = await _measure(lambda: estimate.execute(QUERY))
+
+    print(
+        f"\nexecution of {RESULT_ROWS} rows limited to {MAX_ROWS}: "
+        f"fetch all {old_mib:.1f} MiB peak / {old_ms:.0f} ms, "
+        f"cursor {new_mib:.2f} MiB peak / {new_ms:.0f} ms; "
+        f"capped count {counted.total_row_count} in {capped_ms:.0f} ms, "
+        f"planner estimate {estimated.total_row_count} in {estimate_ms:.0f} ms"
+    )
+
+    assert result.rows == old_rows
+    assert result.truncated is True
+    assert counted.total_row_count == 100_000
+    assert counted.total_row_count_exact is False
+    assert estimated.total_row_count is not None
+    assert new_mib * 10 < old_mib
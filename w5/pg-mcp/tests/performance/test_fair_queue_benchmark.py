@@ -0,0 +1,64 @@
+"""Benchmark for fair queuing in the rate limiter.
+
+A chatty client keeps a limiter's queue full with many concurrent workers
+while a quiet client sends one request at a time. With a plain FIFO queue
+every quiet request waits behind the whole backlog; with fair queuing it
+waits for roughly one slot.
+Reports the quiet client's mean queue wait with both clients attributed to
+the same id (FIFO) and to separate ids (fair). Needs no database.
+"""
+
+import asyncio
+import statistics
+import time
+
+import pytest
+
+from pg_mcp.resilience.rate_limiter import RateLimiter
+
+SLOTS = 4
+CHATTY_WORKERS = 50
+QUIET_REQUESTS = 10
+HOLD_SECONDS = 0.005
+
+
+async def _quiet_wait_ms(fair: bool) -> float:
+    """Run the workload once; return the quiet client's mean wait in ms."""
+    limiter = RateLimiter(max_concurrent=SLOTS)
+    quiet_id = "quiet" if fair else "chatty"
+
+    async def operation(client_id: str) -> float:
+        start = time.perf_counter()
+        async with limiter(client_id=client_id):
+            waited = time.perf_counter() - start
+            await asyncio.sleep(HOLD_SECONDS)
+        return waited
+
+    done = asyncio.Event()
+
+    async def chatty_worker() -> None:
+        while not done.is_set():
+            await operation("chatty")
+
+    chatty = [asyncio.create_task(chatty_worker()) for _ in range(CHATTY_WORKERS)]
+    await asyncio.sleep(0)  # Let the chatty workers queue up first
+
+    waits = [await operation(quiet_id) for _ in range(QUIET_REQUESTS)]
+    done.set()
+    await asyncio.gather(*chatty)
+    return statistics.mean(waits) * 1000
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_quiet_client_wait_under_flood() -> None:
+    """Report the quiet client's queue wait with FIFO and fair queuing."""
+    fifo_ms = await _quiet_wait_ms(fair=False)
+    fair_ms = await _quiet_wait_ms(fair=True)
+
+    print(
+        f"\nquiet client mean wait beside {CHATTY_WORKERS} chatty workers "
+        f"({SLOTS} slots): FIFO {fifo_ms:.1f} ms, fair queuing {fair_ms:.1f} ms"
+    )
+
+    assert fair_ms < fifo_ms
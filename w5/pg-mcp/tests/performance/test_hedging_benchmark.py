@@ -0,0 +1,96 @@
+"""Benchmark for hedged SQL generation.
+
+A stand-in generator answers most calls quickly but a few percent of them
+very slowly, like an LLM endpoint with a heavy latency tail. Runs the same
+requests with a single candidate and with a delayed hedge at the p95 of
+recent latencies, reporting p50/p95/p99 time to valid SQL and the number of
+LLM calls each needed. Needs no database or API key.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from typing import Any
+
+import pytest
+
+from pg_mcp.config.settings import HedgingConfig, SecurityConfig
+from pg_mcp.models.schema import DatabaseSchema
+from pg_mcp.services.sql_hedger import SQLHedger
+from pg_mcp.services.sql_validator import SQLValidator
+
+REQUESTS = 300
+CONCURRENCY = 20
+FAST_SECONDS = (0.01, 0.03)
+SLOW_SECONDS = (0.3, 0.5)
+SLOW_RATIO = 0.08
+
+
+class TailLatencyGenerator:
+    """Generator with a bimodal latency: mostly fast, sometimes very slow."""
+
+    def __init__(self, seed: int) -> None:
+        self.random = random.Random(seed)  # noqa: S311 - reproducible workload
+        self.calls = 0
+
+    async def generate_with_usage(self, **_: Any) -> tuple[str, int | None]:
+        self.calls += 1
+        slow = self.random.random() < SLOW_RATIO
+        await asyncio.sleep(self.random.uniform(*(SLOW_SECONDS if slow else FAST_SECONDS)))
+        return "SELECT id FROM users", 100
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    return ordered[max(0, round(percentile / 100 * len(ordered)) - 1)]
+
+
+async def _run(hedged: bool) -> tuple[list[float], int]:
+    """Serve the workload once; return latencies in ms and LLM calls made."""
+    generator = TailLatencyGenerator(seed=7)
+    validator = SQLValidator(SecurityConfig())
+    schema = DatabaseSchema(database_name="bench")
+    hedger = SQLHedger(
+        generator,  # type: ignore[arg-type]
+        validator,
+        HedgingConfig(enabled=True, initial_delay=FAST_SECONDS[1] * 2),
+    )
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def request() -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            if hedged:
+                result = await hedger.generate(question="q", schema=schema)
+                assert result.valid
+            else:
+                sql, _ = await generator.generate_with_usage()
+                validator.validate_or_raise(sql)
+            return (time.perf_counter() - start) * 1000
+
+    latencies = await asyncio.gather(*(request() for _ in range(REQUESTS)))
+    return list(latencies), generator.calls
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_hedging_tail_latency() -> None:
+    """Report time to valid SQL with and without a delayed hedge."""
+    single, single_calls = await _run(hedged=False)
+    hedged, hedged_calls = await _run(hedged=True)
+
+    def summary(samples: list[float]) -> str:
+        return (
+            f"p50 {statistics.median(samples):.0f} ms, p95 {_percentile(samples, 95):.0f} ms, "
+            f"p99 {_percentile(samples, 99):.0f} ms"
+        )
+
+    print(
+        f"\n{REQUESTS} generations, {SLOW_RATIO:.0%} slow: single candidate {summary(single)} "
+        f"({single_calls} calls); hedged {summary(hedged)} ({hedged_calls} calls, "
+        f"+{(hedged_calls - single_calls) / single_calls:.0%})"
+    )
+
+    assert _percentile(hedged, 99) < _percentile(single, 99)
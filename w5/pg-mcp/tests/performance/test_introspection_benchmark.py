@@ -0,0 +1,194 @@
+"""Benchmarks for schema introspection, incremental refresh and snapshots.
+
+Creates a scratch schema with many tables and reports the number of catalog
+round trips and the wall time taken by ``SchemaIntrospector.introspect()``
+by a fingerprint-driven ``SchemaCache.refresh()`` after a small DDL change,
+and by a startup that restores an on-disk schema snapshot.
+The table count can be tuned with ``PG_MCP_BENCH_TABLES`` (default 2000).
+"""
+
+import os
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import asyncpg
+import pytest
+
+from pg_mcp.cache.schema_cache import SchemaCache
+from pg_mcp.config.settings import CacheConfig
+from pg_mcp.db.introspection import SchemaIntrospector
+
+BENCH_SCHEMA = "mcp_bench_introspection"
+TABLE_COUNT = int(os.environ.get("PG_MCP_BENCH_TABLES", "2000"))
+EXTRA_COLUMNS = 3
+DDL_BATCH_SIZE = 100
+
+
+class CountingConnection:
+    """Connection proxy that counts statements sent to the server."""
+
+    def __init__(self, conn: asyncpg.Connection):
+        self._conn = conn
+        self.round_trips = 0
+
+    async def fetch(self, query: str, *args: Any) -> list[asyncpg.Record]:
+        self.round_trips += 1
+        return await self._conn.fetch(query, *args)
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        self.round_trips += 1
+        return await self._conn.fetchval(query, *args)
+
+
+class CountingPool:
+    """Pool proxy whose acquire() yields a CountingConnection."""
+
+    def __init__(self, pool: asyncpg.Pool):
+        self._pool = pool
+        self.connection: CountingConnection | None = None
+
+    def acquire(self) -> "CountingPool":
+        return self
+
+    async def __aenter__(self) -> CountingConnection:
+        self._raw = await self._pool.acquire()
+        self.connection = CountingConnection(self._raw)
+        return self.connection
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self._pool.release(self._raw)
+
+
+async def _execute_in_batches(conn: asyncpg.Connection, statements: list[str]) -> None:
+    """Run DDL in small transactions to stay below max_locks_per_transaction."""
+    for start in range(0, len(statements), DDL_BATCH_SIZE):
+        await conn.execute(";\n".join(statements[start : start + DDL_BATCH_SIZE]))
+
+
+async def _drop_bench_schema(conn: asyncpg.Connection) -> None:
+    """Drop the scratch schema, table by table, if it exists."""
+    tables = await conn.fetch("SELECT tablename FROM pg_tables WHERE schemaname = $1", BENCH_SCHEMA)
+    await _execute_in_batches(
+        conn,
+        [f"DROP TABLE IF EXISTS {BENCH_SCHEMA}.{r['tablename']} CASCADE" for r in tables],
+    )
+    await conn.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+
+
+@pytest.fixture
+async def bench_schema(pg_pool: asyncpg.Pool) -> AsyncIterator[str]:
+    """Create ``TABLE_COUNT`` related tables in a scratch schema."""
+    statements = []
+    for i in range(TABLE_COUNT):
+        parent = f", parent_id integer REFERENCES {BENCH_SCHEMA}.t{i - 1}(id)" if i else ""
+        extra = ", ".join(f"c{j} text" for j in range(EXTRA_COLUMNS))
+        statements.append(
+            f"CREATE TABLE {BENCH_SCHEMA}.t{i} (id integer PRIMARY KEY, {extra}{parent})"
+        )
+        statements.append(f"CREATE INDEX ON {BENCH_SCHEMA}.t{i} (c0)")
+
+    async with pg_pool.acquire() as conn:
+        await _drop_bench_schema(conn)
+        await conn.execute(f"CREATE SCHEMA {BENCH_SCHEMA}")
+        await _execute_in_batches(conn, statements)
+    try:
+        yield BENCH_SCHEMA
+    finally:
+        async with pg_pool.acquire() as conn:
+            await _drop_bench_schema(conn)
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_introspection_round_trips_and_latency(
+    pg_pool: asyncpg.Pool, bench_schema: str
+) -> None:
+    """Introspect thousands of tables and report round trips and wall time."""
+    pool = CountingPool(pg_pool)
+    introspector = SchemaIntrospector(pool, "bench")  # type: ignore[arg-type]
+
+    start = time.perf_counter()
+    schema = await introspector.introspect()
+    elapsed = time.perf_counter() - start
+
+    bench_tables = [t for t in schema.tables if t.schema_name == bench_schema]
+    round_trips = pool.connection.round_trips if pool.connection else 0
+    # The previous per-table implementation issued 5 queries per relation
+    # (columns, primary keys, foreign keys, indexes, row estimate), one
+    # uniqueness check per column, and 4 fixed queries.
+    legacy_round_trips = 4 + sum(5 + len(t.columns) for t in schema.tables)
+
+    print(
+        f"\nintrospected {len(schema.tables)} relations "
+        f"({len(bench_tables)} benchmark tables) in {elapsed * 1000:.1f} ms, "
+        f"{round_trips} round trips (per-table approach: {legacy_round_trips})"
+    )
+
+    assert len(bench_tables) == TABLE_COUNT
+    assert round_trips == 6
+    assert all(t.columns[0].is_primary_key for t in bench_tables)
+    # t0 has no parent_id column; every other table references its predecessor
+    assert sum(len(t.foreign_keys) for t in bench_tables) == TABLE_COUNT - 1
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_incremental_refresh_after_small_ddl_change(
+    pg_pool: asyncpg.Pool, bench_schema: str
+) -> None:
+    """Refresh after altering one table and compare against a full load."""
+    cache = SchemaCache(CacheConfig(enabled=True))
+
+    start = time.perf_counter()
+    await cache.load("bench", pg_pool)
+    full_elapsed = time.perf_counter() - start
+
+    async with pg_pool.acquire() as conn:
+        await conn.execute(f"ALTER TABLE {bench_schema}.t1 ADD COLUMN added integer")
+
+    start = time.perf_counter()
+    await cache.refresh("bench", pg_pool)
+    refresh_elapsed = time.perf_counter() - start
+
+    print(
+        f"\nfull load {full_elapsed * 1000:.1f} ms, "
+        f"incremental refresh after 1 ALTER {refresh_elapsed * 1000:.1f} ms"
+    )
+
+    schema = cache.get("bench")
+    assert schema is not None
+    table = schema.get_table("t1", bench_schema)
+    assert table is not None
+    assert "added" in [c.name for c in table.columns]
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_startup_from_snapshot(
+    pg_pool: asyncpg.Pool, bench_schema: str, tmp_path: Path
+) -> None:
+    """Compare restoring a snapshot with a cold full introspection."""
+    cold_cache = SchemaCache(CacheConfig(enabled=True, snapshot_dir=tmp_path))
+    start = time.perf_counter()
+    await cold_cache.load("bench", pg_pool)
+    cold_elapsed = time.perf_counter() - start
+
+    warm_cache = SchemaCache(CacheConfig(enabled=True, snapshot_dir=tmp_path))
+    start = time.perf_counter()
+    schema = await warm_cache.restore_snapshot("bench", pg_pool)
+    restore_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await warm_cache.load("bench", pg_pool)  # joins the background validation
+    validate_elapsed = time.perf_counter() - start
+
+    print(
+        f"\ncold load {cold_elapsed * 1000:.1f} ms, "
+        f"snapshot restore {restore_elapsed * 1000:.1f} ms, "
+        f"background validation {validate_elapsed * 1000:.1f} ms"
+    )
+
+    assert schema is not None
+    assert warm_cache.get_stats()["bench"]["loads"] == 0
@@ -0,0 +1,65 @@
+"""Benchmark for pushing the row limit into generated SQL.
+
+Executes a sorted query producing far more rows than ``max_rows`` through
+``SQLExecutor`` as generated and after ``SQLValidator.apply_row_limit``, and
+reports the latency and the executed plan of both. With the LIMIT the planner
+can use a bounded top-N sort instead of sorting the whole input. The input size
+can be tuned with ``PG_MCP_BENCH_RESULT_ROWS`` (default 2000000).
+"""
+
+import json
+import os
+import time
+
+import asyncpg
+import pytest
+
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
+from pg_mcp.services.sql_executor import SQLExecutor
+from pg_mcp.services.sql_validator import SQLValidator
+
+RESULT_ROWS = int(os.environ.get("PG_MCP_BENCH_RESULT_ROWS", "2000000"))
+MAX_ROWS = 1000
+RUNS = 3
+QUERY = (
+    "SELECT n, md5(n::text) AS digest "  # noqa: S608 - constant benchmark query
+    f"FROM generate_series(1, {RESULT_ROWS}) AS n ORDER BY digest"
+)
+
+
+async def _sort_method(pool: asyncpg.Pool, sql: str) -> str:
+    """Return the sort method PostgreSQL used for a query."""
+    async with pool.acquire() as conn:
+        plan = json.loads(await conn.fetchval(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"))
+    node = plan[0]["Plan"]
+    while node.get("Node Type") != "Sort" and node.get("Plans"):
+        node = node["Plans"][0]
+    return str(node.get("Sort Method", "unknown"))
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_limit_pushdown_latency(pg_pool: asyncpg.Pool) -> None:
+    """Report latency of generated SQL with and without the pushed-down LIMIT."""
+    security = SecurityConfig(max_rows=MAX_ROWS)
+    executor = SQLExecutor(pg_pool, security, DatabaseConfig())
+    limited = SQLValidator(security).apply_row_limit(QUERY)
+
+    timings: dict[str, float] = {}
+    results = {}
+    for label, sql in (("as generated", QUERY), ("limit pushed down", limited)):
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            results[label] = await executor.execute(sql)
+        timings[label] = (time.perf_counter() - start) * 1000 / RUNS
+
+    print(
+        f"\nsorted query over {RESULT_ROWS} rows limited to {MAX_ROWS}: "
+        + ", ".join(f"{label} {ms:.0f} ms" for label, ms in timings.items())
+        + f"; sort {await _sort_method(pg_pool, QUERY)} vs {await _sort_method(pg_pool, limited)}"
+    )
+
+    assert limited.endswith(f"LIMIT {MAX_ROWS + 1}")
+    assert results["as generated"].rows == results["limit pushed down"].rows
+    assert results["limit pushed down"].truncated is True
+    assert timings["limit pushed down"] < timings["as generated"]
@@ -0,0 +1,130 @@
+"""Microbenchmark for schema prompt rendering.
+
+Builds a synthetic schema with many tables and reports the CPU time spent
+assembling SQL generation prompts for one request (first attempt plus
+retries), with the prompt memo cold (the behaviour before memoisation) and
+warm, and for the first request after a refresh that replaced a few tables.
+The table count can be tuned with ``PG_MCP_BENCH_TABLES`` (default 2000).
+No database is required.
+"""
+
+import os
+import time
+
+import pytest
+
+from pg_mcp.models.schema import (
+    ColumnInfo,
+    DatabaseSchema,
+    EnumTypeInfo,
+    ForeignKeyInfo,
+    IndexInfo,
+    TableInfo,
+)
+from pg_mcp.prompts.sql_generation import build_user_prompt
+
+TABLE_COUNT = int(os.environ.get("PG_MCP_BENCH_TABLES", "2000"))
+PROMPTS_PER_REQUEST = 3  # first attempt plus two retries
+REQUESTS = 20
+REFRESHED_TABLES = 10
+
+
+def _make_table(i: int) -> TableInfo:
+    """Create a table shaped like the introspection benchmark tables."""
+    columns = [
+        ColumnInfo(name="id", data_type="integer", is_nullable=False, is_primary_key=True),
+        ColumnInfo(name="name", data_type="text", is_nullable=True, comment=f"name of t{i}"),
+        ColumnInfo(
+            name="created_at",
+            data_type="timestamp with time zone",
+            is_nullable=False,
+            default_value="now()",
+        ),
+        *(ColumnInfo(name=f"c{j}", data_type="numeric(12,2)", is_nullable=True) for j in range(3)),
+    ]
+    foreign_keys = []
+    if i:
+        columns.append(ColumnInfo(name="parent_id", data_type="integer", is_nullable=True))
+        foreign_keys.append(
+            ForeignKeyInfo(
+                constraint_name=f"t{i}_parent_id_fkey",
+                column_name="parent_id",
+                referenced_table=f"t{i - 1}",
+                referenced_column="id",
+            )
+        )
+    return TableInfo(
+        table_name=f"t{i}",
+        columns=columns,
+        foreign_keys=foreign_keys,
+        indexes=[IndexInfo(name=f"t{i}_pkey", columns=["id"], is_unique=True)],
+        comment=f"benchmark table {i}",
+        row_count_estimate=i * 10,
+    )
+
+
+def _request_cpu_ms(schema: DatabaseSchema) -> float:
+    """Measure the CPU time of building every prompt for one request."""
+    start = time.process_time()
+    for attempt in range(PROMPTS_PER_REQUEST):
+        build_user_prompt(
+            question="How many rows does t42 have?",
+            schema=schema,
+            previous_attempt="SELECT count(*) FROM t42x;" if attempt else None,
+            error_feedback='relation "t42x" does not exist' if attempt else None,
+        )
+    return (time.process_time() - start) * 1000
+
+
+def _invalidate(schema: DatabaseSchema) -> None:
+    """Drop every memoised fragment, reproducing the un-memoised behaviour."""
+    schema.invalidate_prompt_cache()
+    for table in schema.tables:
+        table.invalidate_prompt_cache()
+
+
+@pytest.mark.performance
+def test_prompt_rendering_cpu_time() -> None:
+    """Report per-request prompt CPU time with a cold and a warm memo."""
+    schema = DatabaseSchema(
+        database_name="bench",
+        version="PostgreSQL 16.2",
+        tables=[_make_table(i) for i in range(TABLE_COUNT)],
+        enum_types=[EnumTypeInfo(type_name="status", values=["new", "done"])],
+    )
+
+    cold = []
+    for _ in range(REQUESTS):
+        # Without memoisation every attempt re-rendered the whole schema
+        start = time.process_time()
+        for _attempt in range(PROMPTS_PER_REQUEST):
+            _invalidate(schema)
+            build_user_prompt(question="How many rows does t42 have?", schema=schema)
+        cold.append((time.process_time() - start) * 1000)
+
+    expected = schema.to_prompt_context()
+    warm = [_request_cpu_ms(schema) for _ in range(REQUESTS)]
+
+    refreshed = schema.model_copy(
+        update={
+            "tables": [
+                t.model_copy(update={"row_count_estimate": 1}) if i < REFRESHED_TABLES else t
+                for i, t in enumerate(schema.tables)
+            ]
+        }
+    )
+    after_refresh = _request_cpu_ms(refreshed)
+
+    cold_ms = sorted(cold)[len(cold) // 2]
+    warm_ms = sorted(warm)[len(warm) // 2]
+    print(
+        f"\nprompt CPU time per request ({TABLE_COUNT} tables, "
+        f"{PROMPTS_PER_REQUEST} prompts, {len(expected) / 1024:.0f} KiB schema): "
+        f"unmemoised {cold_ms:.2f} ms, memoised {warm_ms:.2f} ms "
+        f"({cold_ms / max(warm_ms, 1e-6):.0f}x), "
+        f"first request after refreshing {REFRESHED_TABLES} tables {after_refresh:.2f} ms"
+    )
+
+    assert schema.to_prompt_context() == expected
+    assert "Approximate rows: 1\n" in refreshed.to_prompt_context()
+    assert warm_ms < cold_ms
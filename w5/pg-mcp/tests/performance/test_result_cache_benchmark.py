@@ -0,0 +1,100 @@
+"""Benchmark for the executed-result cache.
+
+Runs a dashboard-style aggregate through ``ResultCache`` and ``SQLExecutor``
+against a scratch table and reports miss and hit latency, then checks that
+INSERT and TRUNCATE on the table are picked up by the next poll. Requires
+PostgreSQL 15 or later.
+"""
+
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import asyncpg
+import pytest
+
+from pg_mcp.cache.result_cache import ResultCache
+from pg_mcp.config.settings import DatabaseConfig, ResultCacheConfig, SecurityConfig
+from pg_mcp.services.sql_executor import SQLExecutor
+from pg_mcp.services.sql_validator import SQLValidator
+
+BENCH_TABLE = "mcp_bench_result_cache"
+ROWS = 200_000
+HITS = 200
+QUERY = (
+    f"SELECT n % 10 AS bucket, count(*) AS total FROM {BENCH_TABLE} "  # noqa: S608 - constant table name
+    "GROUP BY 1 ORDER BY 1"
+)
+
+
+async def _write(statement: str) -> None:
+    """Run a write and make its table statistics visible to other sessions.
+
+    Backends publish statistics when they go idle, at most once per second;
+    ``pg_stat_force_next_flush()`` lifts that limit so the counters are
+    flushed before the following statement completes.
+    """
+    conn = await asyncpg.connect(dsn=DatabaseConfig().dsn)
+    try:
+        await conn.execute(statement)
+        await conn.execute("SELECT pg_stat_force_next_flush()")
+        await conn.execute("SELECT 1")
+    finally:
+        await conn.close()
+
+
+@pytest.fixture
+async def bench_table(pg_pool: asyncpg.Pool) -> AsyncIterator[str]:
+    """Create and populate the scratch table, dropping it afterwards."""
+    await _write(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+    await _write(f"CREATE TABLE {BENCH_TABLE} (n integer NOT NULL)")
+    await _write(f"INSERT INTO {BENCH_TABLE} SELECT generate_series(1, {ROWS})")
+    try:
+        yield BENCH_TABLE
+    finally:
+        await _write(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_result_cache_hits_and_invalidation(pg_pool: asyncpg.Pool, bench_table: str) -> None:
+    """Report miss and hit latency and verify write-driven invalidation."""
+    cache = ResultCache(ResultCacheConfig(enabled=True, max_staleness=0.0))
+    executor = SQLExecutor(pg_pool, SecurityConfig(), DatabaseConfig())
+    validator = SQLValidator(SecurityConfig())
+    sql_key = validator.normalize_sql(QUERY)
+    tables = validator.extract_tables(QUERY)
+
+    async def run() -> list[dict[str, Any]]:
+        result = await cache.get_or_execute(
+            "bench", pg_pool, sql_key, tables, lambda: executor.execute(QUERY)
+        )
+        return result.rows
+
+    start = time.perf_counter()
+    baseline = await run()
+    miss_ms = (time.perf_counter() - start) * 1000
+
+    # max_staleness=0 re-checks the table version on every hit (worst case)
+    start = time.perf_counter()
+    for _ in range(HITS):
+        assert await run() == baseline
+    hit_ms = (time.perf_counter() - start) * 1000 / HITS
+
+    await _write(f"INSERT INTO {bench_table} VALUES (0)")  # noqa: S608
+    after_insert = await run()
+
+    await _write(f"TRUNCATE {bench_table}")
+    after_truncate = await run()
+
+    stats = cache.get_stats()
+    print(
+        f"\nresult cache ({ROWS} rows aggregated): miss {miss_ms:.1f} ms, "
+        f"hit {hit_ms:.2f} ms with a version check per hit, "
+        f"{stats['polls']} polls, {stats['invalidations']} invalidations"
+    )
+
+    assert stats["hits"] == HITS
+    assert after_insert[0]["total"] == baseline[0]["total"] + 1
+    assert after_truncate == []
+    assert stats["invalidations"] == 2
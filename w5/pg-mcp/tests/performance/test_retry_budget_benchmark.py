@@ -0,0 +1,67 @@
+"""Benchmark for the retry budget during an upstream outage.
+
+Sends calls through a retry policy while the upstream times out on every
+call, then after it recovers, and reports how many upstream attempts each
+call caused: the load multiplier an overloaded upstream sees from retries.
+Compares per-call retries only with a shared retry budget. Needs no database
+or API key; backoff sleeps are skipped.
+"""
+
+import contextlib
+
+import pytest
+
+from pg_mcp.models.errors import LLMTimeoutError
+from pg_mcp.resilience.retry import RetryBudget, RetryPolicy
+
+CALLS = 500
+OUTAGE_CALLS = 300
+MAX_RETRIES = 3
+
+
+async def _no_sleep(_: float) -> None:
+    """Skip backoff delays."""
+
+
+async def _amplification(budget: RetryBudget | None) -> tuple[float, float]:
+    """Run the workload once; return attempts per call during and after the outage."""
+    policy = RetryPolicy(max_retries=MAX_RETRIES, budget=budget, sleep=_no_sleep)
+    attempts = 0
+    healthy = False
+
+    async def upstream() -> str:
+        nonlocal attempts
+        attempts += 1
+        if not healthy:
+            raise LLMTimeoutError(message="timed out")
+        return "ok"
+
+    for _ in range(OUTAGE_CALLS):
+        with contextlib.suppress(LLMTimeoutError):
+            await policy.call(upstream, name="sql_generation")
+    during = attempts / OUTAGE_CALLS
+
+    healthy = True
+    attempts = 0
+    for _ in range(CALLS - OUTAGE_CALLS):
+        await policy.call(upstream, name="sql_generation")
+    after = attempts / (CALLS - OUTAGE_CALLS)
+    return during, after
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_retry_amplification_during_outage() -> None:
+    """Report upstream attempts per call with and without a retry budget."""
+    unbudgeted, _ = await _amplification(None)
+    budgeted, recovered = await _amplification(
+        RetryBudget(ratio=0.2, min_retries=10, window=3600.0)
+    )
+
+    print(
+        f"\nupstream attempts per call during an outage ({MAX_RETRIES} retries per call): "
+        f"unbudgeted {unbudgeted:.2f}x, retry budget {budgeted:.2f}x "
+        f"(after recovery {recovered:.2f}x)"
+    )
+
+    assert budgeted < unbudgeted
@@ -0,0 +1,61 @@
+"""Benchmark for per-query session setup overhead.
+
+Runs a trivial query through ``SQLExecutor`` with ``session_setup`` set to
+``per_query`` (BEGIN plus three SET statements before every query) and to
+``per_connection`` (search_path and role as connection startup parameters,
+BEGIN and ``SET LOCAL statement_timeout`` in one call), and reports the mean
+latency of each. The connecting user doubles as the read-only role so that
+``SET ROLE`` is exercised without creating roles. Over a real network each
+saved round trip is worth one RTT; against a local server the gap is mostly
+per-statement server and driver overhead.
+"""
+
+import time
+
+import asyncpg
+import pytest
+
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
+from pg_mcp.db.pool import create_pool
+from pg_mcp.services.sql_executor import SQLExecutor
+
+QUERIES = 2000
+
+
+async def _mean_latency_ms(mode: str) -> tuple[float, str]:
+    """Measure mean latency of a trivial query and report the effective role."""
+    db_config = DatabaseConfig(min_pool_size=1, max_pool_size=1)
+    security = SecurityConfig(session_setup=mode, readonly_role=db_config.user)
+    pool = await create_pool(db_config, security)
+    try:
+        executor = SQLExecutor(pool, security, db_config)
+        await executor.execute("SELECT 1")  # warm up the connection
+
+        start = time.perf_counter()
+        for _ in range(QUERIES):
+            await executor.execute("SELECT 1")
+        elapsed_ms = (time.perf_counter() - start) * 1000 / QUERIES
+
+        result = await executor.execute(
+            "SELECT current_user AS role, current_setting('search_path') AS search_path"
+        )
+        return elapsed_ms, f"{result.rows[0]['role']}/{result.rows[0]['search_path']}"
+    finally:
+        await pool.close()
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_session_setup_overhead(pg_pool: asyncpg.Pool) -> None:
+    """Report per-query latency with per-query and per-connection session setup."""
+    per_query_ms, per_query_session = await _mean_latency_ms("per_query")
+    per_connection_ms, per_connection_session = await _mean_latency_ms("per_connection")
+
+    print(
+        f"\nsession setup overhead ({QUERIES} x SELECT 1): "
+        f"per query {per_query_ms:.3f} ms, per connection {per_connection_ms:.3f} ms "
+        f"({per_query_ms / per_connection_ms:.1f}x)"
+    )
+
+    assert per_query_session == per_connection_session
+    assert per_connection_ms < per_query_ms
@@ -0,0 +1,81 @@
+"""Benchmark for parse-once SQL validation.
+
+Runs the SQL steps of a request (validation, table extraction for schema
+recall, the row limit rewrite, then normalisation and table extraction of the
+executed SQL for the result cache key) over 10,000 varied queries. Compares a
+validator without a parse cache, which parses the SQL at every step, with the
+LRU parse cache, on all-distinct queries and on a workload where queries
+repeat. Needs no database or API key.
+"""
+
+import random
+import time
+
+import pytest
+
+from pg_mcp.config.settings import SecurityConfig
+from pg_mcp.services.sql_validator import SQLValidator
+
+QUERIES = 10_000
+REPEATED_DISTINCT = 500
+
+TEMPLATES = [
+    "SELECT id, name, email FROM users WHERE created_at > '2024-01-{day:02d}' ORDER BY id",
+    "SELECT u.name, count(o.id) AS orders FROM users u JOIN orders o ON o.user_id = u.id "
+    "WHERE o.total > {n} GROUP BY u.name ORDER BY orders DESC",
+    "WITH recent AS (SELECT * FROM orders WHERE created_at > now() - interval '{n} days') "
+    "SELECT status, sum(total) FROM recent GROUP BY status",
+    "SELECT p.name, p.price FROM products p WHERE p.category_id IN "
+    "(SELECT id FROM categories WHERE name LIKE '%{n}%') LIMIT {limit}",
+    "SELECT count(*) FROM events WHERE kind = 'click' AND user_id = {n}",
+    "SELECT id FROM users WHERE id = {n} UNION SELECT user_id FROM orders WHERE total > {n}",
+]
+
+
+def _queries(distinct: int, seed: int) -> list[str]:
+    """Build QUERIES queries drawn from ``distinct`` different ones."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible workload
+    pool = [
+        TEMPLATES[index % len(TEMPLATES)].format(
+            day=index % 28 + 1, n=index, limit=rng.choice([10, 100, 50_000])
+        )
+        for index in range(distinct)
+    ]
+    return [pool[rng.randrange(distinct)] for _ in range(QUERIES)] if distinct < QUERIES else pool
+
+
+def _run(validator: SQLValidator, queries: list[str]) -> float:
+    """Run the request steps over every query; return elapsed ms."""
+    start = time.perf_counter()
+    for sql in queries:
+        validator.validate_or_raise(sql)
+        validator.extract_tables(sql)
+        executed = validator.apply_row_limit(sql)
+        validator.normalize_sql(executed)
+        validator.extract_tables(executed)
+    return (time.perf_counter() - start) * 1000
+
+
+@pytest.mark.performance
+def test_parse_once_validation() -> None:
+    """Report the time to validate 10k varied queries with and without the parse cache."""
+    distinct = _queries(QUERIES, seed=1)
+    repeated = _queries(REPEATED_DISTINCT, seed=2)
+
+    uncached_ms = _run(SQLValidator(SecurityConfig(), parse_cache_size=0), distinct)
+    cached_validator = SQLValidator(SecurityConfig())
+    cached_ms = _run(cached_validator, distinct)
+    repeated_validator = SQLValidator(SecurityConfig())
+    repeated_ms = _run(repeated_validator, repeated)
+    hits = repeated_validator.get_stats()["hits"]
+    lookups = hits + repeated_validator.get_stats()["misses"]
+
+    print(
+        f"\n{QUERIES} queries through validation, recall, row limit and result cache key: "
+        f"parse every step {uncached_ms:.0f} ms; parse once {cached_ms:.0f} ms "
+        f"({uncached_ms / cached_ms:.1f}x); {REPEATED_DISTINCT} distinct queries repeated "
+        f"{repeated_ms:.0f} ms ({uncached_ms / repeated_ms:.1f}x, {hits / lookups:.0%} hits)"
+    )
+
+    assert cached_ms < uncached_ms
+    assert repeated_ms < cached_ms
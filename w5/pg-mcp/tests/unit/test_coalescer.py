@@ -0,0 +1,179 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from pg_mcp.models.query import ReturnType
+from pg_mcp.observability.tracing import RequestTrace, span, trace_scope
+from pg_mcp.resilience.rate_limiter import client_id_var, client_scope
+from pg_mcp.services.coalescer import RequestCoalescer
+
+
+class SlowOperation:
+    """Operation that blocks until released and counts its runs."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.runs = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> str:
+        self.runs += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"result-{self.runs}"
+
+
+class TestRequestCoalescer:
+    """Test suite for RequestCoalescer."""
+
+    def test_key_normalises_question(self) -> None:
+        """Test that case and punctuation do not change the key."""
+        assert RequestCoalescer.key(
+            "db", "How many users?", ReturnType.RESULT
+        ) == RequestCoalescer.key("db", "how  many USERS", ReturnType.RESULT)
+        assert RequestCoalescer.key(
+            "db", "How many users?", ReturnType.RESULT
+        ) != RequestCoalescer.key("db", "How many users?", ReturnType.SQL)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_run(self) -> None:
+        """Test that identical concurrent calls run the operation once."""
+        metrics = MagicMock()
+        coalescer = RequestCoalescer(metrics=metrics)
+        operation = SlowOperation()
+
+        tasks = [asyncio.create_task(coalescer.run("key", operation)) for _ in range(5)]
+        await asyncio.sleep(0)
+        operation.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert operation.runs == 1
+        assert [result for result, _ in results] == ["result-1"] * 5
+        assert [shared for _, shared in results] == [False, True, True, True, True]
+        assert metrics.increment_coalesced_request.call_count == 4
+        assert coalescer.get_stats() == {
+            "in_flight": 0,
+            "flights": 1,
+            "coalesced": 4,
+            "abandoned": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self) -> None:
+        """Test that different keys do not share an operation."""
+        coalescer = RequestCoalescer()
+        operation = SlowOperation()
+        operation.release.set()
+
+        results = await asyncio.gather(coalescer.run("a", operation), coalescer.run("b", operation))
+
+        assert operation.runs == 2
+        assert results == [("result-1", False), ("result-2", False)]
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self) -> None:
+        """Test that a finished operation is not reused."""
+        coalescer = RequestCoalescer()
+        operation = SlowOperation()
+        operation.release.set()
+
+        await coalescer.run("key", operation)
+        _, shared = await coalescer.run("key", operation)
+
+        assert operation.runs == 2
+        assert shared is False
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_shared_work(self) -> None:
+        """Test that cancelling the first caller keeps the work for the others."""
+        coalescer = RequestCoalescer()
+        operation = SlowOperation()
+
+        leader = asyncio.create_task(coalescer.run("key", operation))
+        follower = asyncio.create_task(coalescer.run("key", operation))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        operation.release.set()
+
+        assert await follower == ("result-1", True)
+        assert leader.cancelled()
+        assert operation.cancelled == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_work_is_outside_callers_traces(self) -> None:
+        """Test that the work records no spans in its first caller's trace."""
+        coalescer = RequestCoalescer()
+        release = asyncio.Event()
+        clients: list[str] = []
+
+        async def operation() -> str:
+            with span("work"):
+                await release.wait()
+            clients.append(client_id_var.get())
+            return "result"
+
+        async def call(client: str, trace: RequestTrace) -> tuple[str, bool]:
+            with client_scope(client), trace_scope(trace):
+                return await coalescer.run("key", operation)
+
+        leader_trace, follower_trace = RequestTrace("leader"), RequestTrace("follower")
+        leader = asyncio.create_task(call("agent-1", leader_trace))
+        follower = asyncio.create_task(call("agent-2", follower_trace))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == ("result", True)
+        # The work ran as the first caller's client, and both callers say so
+        assert clients == ["agent-1"]
+        assert [s.name for s in leader_trace.spans] == ["coalesce"]
+        assert leader_trace.spans[0].attributes == {"shared": False, "client": "agent-1"}
+        assert [s.name for s in follower_trace.spans] == ["coalesce"]
+        assert follower_trace.spans[0].attributes == {"shared": True, "client": "agent-1"}
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_leaving_cancels_work(self) -> None:
+        """Test that the work is cancelled once every caller went away."""
+        coalescer = RequestCoalescer()
+        operation = SlowOperation()
+
+        tasks = [asyncio.create_task(coalescer.run("key", operation)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert operation.cancelled == 1
+        assert coalescer.get_stats()["abandoned"] == 1
+        assert coalescer.get_stats()["in_flight"] == 0
+
+        # A new caller starts fresh work instead of joining the cancelled one
+        operation.release.set()
+        assert await coalescer.run("key", operation) == ("result-2", False)
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared(self) -> None:
+        """Test that every caller sees the operation's error."""
+        coalescer = RequestCoalescer()
+        release = asyncio.Event()
+
+        async def failing() -> str:
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(coalescer.run("key", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert coalescer.get_stats()["in_flight"] == 0
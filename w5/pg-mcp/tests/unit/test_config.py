@@ -11,12 +11,20 @@ from pydantic import ValidationError
 
 from pg_mcp.config.settings import (
     CacheConfig,
+    CoalescingConfig,
     DatabaseConfig,
+    HedgingConfig,
     ObservabilityConfig,
     OpenAIConfig,
+    QueryCacheConfig,
+    RateLimitConfig,
     ResilienceConfig,
+    ResultCacheConfig,
+    ResultExportConfig,
+    RetrievalConfig,
     SecurityConfig,
     Settings,
+    StartupConfig,
     ValidationConfig,
     get_settings,
     reset_settings,
@@ -162,6 +170,16 @@ class TestSecurityConfig:
         assert config.max_execution_time == 30.0
         assert "pg_sleep" in config.blocked_functions
         assert "pg_read_file" in config.blocked_functions
+        assert config.max_plan_cost is None
+        assert config.max_plan_rows is None
+
+    def test_plan_limits_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test plan cost limits are read from the environment."""
+        monkeypatch.setenv("SECURITY_MAX_PLAN_COST", "1e6")
+        monkeypatch.setenv("SECURITY_MAX_PLAN_ROWS", "10000000")
+        config = SecurityConfig()
+        assert config.max_plan_cost == 1_000_000.0
+        assert config.max_plan_rows == 10_000_000
 
     def test_custom_blocked_functions(self) -> None:
         """Test custom blocked functions."""
@@ -192,6 +210,30 @@ class TestSecurityConfig:
         with pytest.raises(ValidationError):
             SecurityConfig(max_rows=100001)
 
+    def test_row_count_mode(self) -> None:
+        """Test truncated-result row count settings."""
+        config = SecurityConfig()
+        assert config.row_count_mode == "none"
+        assert config.row_count_cap == 100000
+
+        config = SecurityConfig(row_count_mode="capped", row_count_cap=500)
+        assert config.row_count_mode == "capped"
+        assert config.row_count_cap == 500
+
+        with pytest.raises(ValidationError):
+            SecurityConfig(row_count_mode="exact")  # type: ignore[arg-type]
+
+        with pytest.raises(ValidationError):
+            SecurityConfig(row_count_cap=0)
+
+    def test_session_setup(self) -> None:
+        """Test session setup mode setting."""
+        assert SecurityConfig().session_setup == "per_query"
+        assert SecurityConfig(session_setup="per_connection").session_setup == "per_connection"
+
+        with pytest.raises(ValidationError):
+            SecurityConfig(session_setup="per_request")  # type: ignore[arg-type]
+
 
 class TestValidationConfig:
     """Tests for ValidationConfig."""
@@ -219,6 +261,22 @@ class TestValidationConfig:
         with pytest.raises(ValidationError):
             ValidationConfig(min_confidence_score=101)
 
+    def test_validation_policy_defaults(self) -> None:
+        """Test that results are validated synchronously by default."""
+        config = ValidationConfig()
+        assert config.heuristics is True
+        assert config.sample_rate == 1.0
+        assert config.mode == "sync"
+        assert config.max_deferred == 100
+
+    def test_invalid_validation_policy(self) -> None:
+        """Test invalid sample rate and mode are rejected."""
+        with pytest.raises(ValidationError):
+            ValidationConfig(sample_rate=1.5)
+
+        with pytest.raises(ValidationError):
+            ValidationConfig(mode="later")
+
 
 class TestCacheConfig:
     """Tests for CacheConfig."""
@@ -229,6 +287,8 @@ class TestCacheConfig:
         assert config.schema_ttl == 3600
         assert config.max_size == 100
         assert config.enabled is True
+        assert config.stale_while_revalidate is False
+        assert config.max_stale_age == 3600
 
     def test_custom_values(self) -> None:
         """Test custom configuration values."""
@@ -250,6 +310,165 @@ class TestCacheConfig:
             CacheConfig(schema_ttl=90000)
 
 
+class TestQueryCacheConfig:
+    """Tests for QueryCacheConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = QueryCacheConfig()
+        assert config.enabled is True
+        assert config.ttl == 3600
+        assert config.max_size == 1000
+
+    def test_invalid_max_size(self) -> None:
+        """Test invalid max_size is rejected."""
+        with pytest.raises(ValidationError):
+            QueryCacheConfig(max_size=0)
+
+
+class TestResultCacheConfig:
+    """Tests for ResultCacheConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = ResultCacheConfig()
+        assert config.enabled is False
+        assert config.max_bytes == 64 * 1024 * 1024
+        assert config.max_staleness == 5.0
+
+    def test_invalid_max_staleness(self) -> None:
+        """Test negative staleness is rejected."""
+        with pytest.raises(ValidationError):
+            ResultCacheConfig(max_staleness=-1)
+
+
+class TestResultExportConfig:
+    """Tests for ResultExportConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = ResultExportConfig()
+        assert config.ttl == 600.0
+        assert config.max_bytes == 256 * 1024 * 1024
+
+    def test_invalid_ttl(self) -> None:
+        """Test a TTL below one second is rejected."""
+        with pytest.raises(ValidationError):
+            ResultExportConfig(ttl=0)
+
+
+class TestCoalescingConfig:
+    """Tests for CoalescingConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        assert CoalescingConfig().enabled is True
+
+    def test_disabled_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test coalescing can be disabled through the environment."""
+        monkeypatch.setenv("COALESCING_ENABLED", "false")
+        assert CoalescingConfig().enabled is False
+
+
+class TestStartupConfig:
+    """Tests for StartupConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = StartupConfig()
+        assert config.background_warmup is True
+        assert config.ready_timeout == 30.0
+        assert config.retry_delay == 5.0
+
+    def test_invalid_ready_timeout(self) -> None:
+        """Test negative wait timeout is rejected."""
+        with pytest.raises(ValidationError):
+            StartupConfig(ready_timeout=-1)
+
+
+class TestHedgingConfig:
+    """Tests for HedgingConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = HedgingConfig()
+        assert config.enabled is False
+        assert config.max_candidates == 2
+        assert config.mode == "delayed"
+        assert config.delay_percentile == 95.0
+        assert config.temperatures == []
+
+    def test_temperatures_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test per-candidate temperatures are parsed from JSON."""
+        monkeypatch.setenv("HEDGING_TEMPERATURES", "[0.0, 0.7]")
+        assert HedgingConfig().temperatures == [0.0, 0.7]
+
+    def test_invalid_temperature(self) -> None:
+        """Test out-of-range temperatures are rejected."""
+        with pytest.raises(ValidationError, match="Temperatures must be between 0 and 2"):
+            HedgingConfig(temperatures=[0.0, 2.5])
+
+    def test_invalid_max_candidates(self) -> None:
+        """Test a single candidate is rejected."""
+        with pytest.raises(ValidationError):
+            HedgingConfig(max_candidates=1)
+
+
+class TestRateLimitConfig:
+    """Tests for RateLimitConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = RateLimitConfig()
+        assert config.enabled is True
+        assert config.max_concurrent_queries == 10
+        assert config.max_concurrent_llm_calls == 5
+        assert config.queue_timeout == 30.0
+        assert config.client_weights == {}
+
+    def test_client_weights_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test client weights are parsed from JSON."""
+        monkeypatch.setenv("RATE_LIMIT_CLIENT_WEIGHTS", '{"dashboard": 0.5, "analyst": 2}')
+        config = RateLimitConfig()
+        assert config.client_weights == {"dashboard": 0.5, "analyst": 2.0}
+
+    def test_invalid_client_weight(self) -> None:
+        """Test non-positive client weights are rejected."""
+        with pytest.raises(ValidationError, match="Client weights must be > 0"):
+            RateLimitConfig(client_weights={"agent": 0})
+
+    def test_adaptive_defaults(self) -> None:
+        """Test adaptive limits are off by default with sane bounds."""
+        config = RateLimitConfig()
+        assert config.adaptive is False
+        assert config.adaptive_min_limit == 1
+        assert config.adaptive_max_queries == 50
+        assert config.adaptive_max_llm_calls == 20
+
+    def test_adaptive_start_outside_bounds(self) -> None:
+        """Test a starting limit above the adaptive maximum is rejected."""
+        with pytest.raises(ValidationError, match="max_concurrent_llm_calls must lie between"):
+            RateLimitConfig(adaptive=True, max_concurrent_llm_calls=30, adaptive_max_llm_calls=20)
+
+
+class TestRetrievalConfig:
+    """Tests for RetrievalConfig."""
+
+    def test_default_values(self) -> None:
+        """Test default configuration values."""
+        config = RetrievalConfig()
+        assert config.enabled is False
+        assert config.top_k == 8
+        assert config.max_tables == 20
+        assert config.min_tables == 30
+        assert config.expand_foreign_keys is True
+
+    def test_invalid_top_k(self) -> None:
+        """Test invalid top_k is rejected."""
+        with pytest.raises(ValidationError):
+            RetrievalConfig(top_k=0)
+
+
 class TestResilienceConfig:
     """Tests for ResilienceConfig."""
 
@@ -261,6 +480,10 @@ class TestResilienceConfig:
         assert config.backoff_factor == 2.0
         assert config.circuit_breaker_threshold == 5
         assert config.circuit_breaker_timeout == 60.0
+        assert config.max_retry_delay == 30.0
+        assert config.retry_budget_ratio == 0.2
+        assert config.retry_budget_min_retries == 10
+        assert config.retry_budget_window == 10.0
 
     def test_custom_values(self) -> None:
         """Test custom configuration values."""
@@ -281,6 +504,9 @@ class TestResilienceConfig:
         with pytest.raises(ValidationError):
             ResilienceConfig(backoff_factor=0.5)
 
+        with pytest.raises(ValidationError):
+            ResilienceConfig(retry_budget_ratio=1.5)
+
 
 class TestObservabilityConfig:
     """Tests for ObservabilityConfig."""
@@ -317,6 +543,11 @@ class TestObservabilityConfig:
         with pytest.raises(ValidationError):
             ObservabilityConfig(log_format="xml")  # type: ignore
 
+    def test_invalid_metrics_sample_interval(self) -> None:
+        """Test a sample interval below one second is rejected."""
+        with pytest.raises(ValidationError):
+            ObservabilityConfig(metrics_sample_interval=0.1)
+
 
 class TestSettings:
     """Tests for main Settings class."""
@@ -367,6 +598,25 @@ class TestSettings:
         assert settings.database.port == 5433
         assert settings.security.allow_write_operations is True
 
+    def test_additional_databases(self) -> None:
+        """Test that additional databases follow the primary database."""
+        settings = Settings(
+            openai=OpenAIConfig(api_key="sk-test"),
+            database=DatabaseConfig(name="main"),
+            databases=[DatabaseConfig(name="sales"), DatabaseConfig(name="hr", port=5433)],
+        )
+        assert [config.name for config in settings.database_configs] == ["main", "sales", "hr"]
+        assert settings.database_configs[2].port == 5433
+
+    def test_duplicate_database_names_rejected(self) -> None:
+        """Test that two databases with the same name are rejected."""
+        with pytest.raises(ValidationError, match="Duplicate database names: main"):
+            Settings(
+                openai=OpenAIConfig(api_key="sk-test"),
+                database=DatabaseConfig(name="main"),
+                databases=[DatabaseConfig(name="main", host="replica")],
+            )
+
 
 class TestSettingsGlobalInstance:
     """Tests for global settings instance management."""
@@ -379,6 +629,22 @@ class TestSettingsGlobalInstance:
             if key.startswith(("DATABASE_", "OPENAI_", "SECURITY_")):
                 del os.environ[key]
 
+    def test_databases_from_environment(self) -> None:
+        """Test parsing additional databases from a JSON list."""
+        os.environ["OPENAI_API_KEY"] = "sk-test123"
+        os.environ["DATABASE_HOST"] = "db.internal"
+        os.environ["DATABASES"] = '[{"name": "sales"}, {"name": "hr", "host": "hr.internal"}]'
+        try:
+            settings = get_settings()
+        finally:
+            del os.environ["DATABASES"]
+
+        sales, hr = settings.databases
+        assert sales.name == "sales"
+        # Fields left out fall back to the DATABASE_* values
+        assert sales.host == "db.internal"
+        assert hr.host == "hr.internal"
+
     def test_get_settings_creates_instance(self) -> None:
         """Test get_settings creates instance."""
         # Set required env var
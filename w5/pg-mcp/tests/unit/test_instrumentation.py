@@ -0,0 +1,144 @@
+"""Unit tests for query pipeline instrumentation."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from pg_mcp.observability.instrumentation import (
+    UNKNOWN_DATABASE,
+    MetricsSampler,
+    Stage,
+    current_database,
+    database_scope,
+    record_llm_call,
+    stage_timer,
+)
+
+
+def make_pool(size: int, idle: int, max_size: int = 10) -> MagicMock:
+    """Create a pool reporting its connection counts."""
+    pool = MagicMock()
+    pool.get_size.return_value = size
+    pool.get_idle_size.return_value = idle
+    pool.get_max_size.return_value = max_size
+    return pool
+
+
+class TestStageTimer:
+    """Test suite for stage_timer and database_scope."""
+
+    def test_records_stage_of_current_database(self) -> None:
+        """Test that stages are labelled with the database scope."""
+        metrics = MagicMock()
+
+        with database_scope("sales"), stage_timer(metrics, Stage.PROMPT_BUILD):
+            assert current_database() == "sales"
+
+        stage, database, duration = metrics.observe_stage.call_args.args
+        assert (stage, database) == ("prompt_build", "sales")
+        assert duration >= 0
+        assert current_database() == UNKNOWN_DATABASE
+
+    def test_explicit_database(self) -> None:
+        """Test that an explicit database overrides the scope."""
+        metrics = MagicMock()
+
+        with database_scope("sales"), stage_timer(metrics, Stage.EXECUTE, "analytics"):
+            pass
+
+        assert metrics.observe_stage.call_args.args[:2] == ("execute", "analytics")
+
+    def test_records_failed_stage(self) -> None:
+        """Test that a stage is recorded when it raises."""
+        metrics = MagicMock()
+
+        with pytest.raises(ValueError), stage_timer(metrics, Stage.VALIDATE):
+            raise ValueError("invalid")
+
+        metrics.observe_stage.assert_called_once()
+
+    def test_without_metrics(self) -> None:
+        """Test that nothing is recorded without a collector."""
+        with stage_timer(None, Stage.EXECUTE):
+            pass
+
+    @pytest.mark.asyncio
+    async def test_scope_is_per_task(self) -> None:
+        """Test that concurrent requests keep their own database."""
+
+        async def run(database: str) -> str:
+            with database_scope(database):
+                await asyncio.sleep(0)
+                return current_database()
+
+        assert await asyncio.gather(run("a"), run("b")) == ["a", "b"]
+
+
+class TestRecordLLMCall:
+    """Test suite for record_llm_call."""
+
+    def test_records_call_latency_and_tokens(self) -> None:
+        """Test that calls, latency and reported tokens are recorded."""
+        metrics = MagicMock()
+
+        record_llm_call(metrics, "generate_sql", 1.5, SimpleNamespace(total_tokens=120))
+
+        metrics.increment_llm_call.assert_called_once_with("generate_sql")
+        metrics.observe_llm_latency.assert_called_once_with("generate_sql", 1.5)
+        metrics.increment_llm_tokens.assert_called_once_with("generate_sql", 120)
+
+    def test_missing_usage(self) -> None:
+        """Test that no tokens are recorded when usage is not reported."""
+        metrics = MagicMock()
+
+        record_llm_call(metrics, "validate_result", 0.5, None)
+
+        metrics.increment_llm_call.assert_called_once_with("validate_result")
+        metrics.increment_llm_tokens.assert_not_called()
+
+
+class TestMetricsSampler:
+    """Test suite for MetricsSampler."""
+
+    def test_sample(self) -> None:
+        """Test that pool sizes and cache ages are sampled per database."""
+        metrics = MagicMock()
+        schema_cache = MagicMock()
+        schema_cache.get_cache_age.side_effect = {"a": 12.5, "b": None}.get
+        sampler = MetricsSampler(
+            metrics, {"a": make_pool(5, 2), "b": make_pool(0, 0, 4)}, schema_cache
+        )
+
+        sampler.sample()
+
+        metrics.set_db_pool_connections.assert_any_call("a", size=5, idle=2, max_size=10)
+        metrics.set_db_pool_connections.assert_any_call("b", size=0, idle=0, max_size=4)
+        metrics.set_schema_cache_age.assert_called_once_with("a", 12.5)
+
+    def test_sample_survives_pool_errors(self) -> None:
+        """Test that a pool failing to report does not stop sampling."""
+        metrics = MagicMock()
+        broken = MagicMock()
+        broken.get_size.side_effect = RuntimeError("closed")
+        sampler = MetricsSampler(metrics, {"a": broken, "b": make_pool(3, 3)})
+
+        sampler.sample()
+
+        metrics.set_db_pool_connections.assert_called_once_with("b", size=3, idle=3, max_size=10)
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self) -> None:
+        """Test that the background task samples until stopped."""
+        metrics = MagicMock()
+        sampler = MetricsSampler(metrics, {"a": make_pool(1, 1)}, interval=0.01)
+
+        sampler.start()
+        await asyncio.sleep(0.05)
+        await sampler.stop()
+        samples = metrics.set_db_pool_connections.call_count
+        await asyncio.sleep(0.03)
+
+        assert samples >= 2
+        assert metrics.set_db_pool_connections.call_count == samples
@@ -0,0 +1,305 @@
+"""Unit tests for set-based schema introspection.
+
+This module tests that SchemaIntrospector loads catalog metadata with a
+constant number of round trips and assembles TableInfo objects correctly.
+"""
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pg_mcp.db.introspection import SchemaIntrospector
+
+
+class FakeConnection:
+    """Connection double that serves catalog rows and counts round trips."""
+
+    def __init__(self, catalog: dict[str, list[dict[str, Any]]]):
+        self.catalog = catalog
+        self.round_trips = 0
+        self.oid_filters: list[Any] = []
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        self.round_trips += 1
+        return "PostgreSQL 16.2, compiled by gcc"
+
+    async def fetch(self, query: str, *args: Any) -> list[dict[str, Any]]:
+        self.round_trips += 1
+        if args:
+            self.oid_filters.append(args[0])
+        return decode_char_columns(query, self._rows(query))
+
+    def _rows(self, query: str) -> list[dict[str, Any]]:
+        # Dispatch on the column aliases each catalog query selects
+        if "AS constraint_name" in query:
+            return self.catalog["constraints"]
+        if "AS index_name" in query:
+            return self.catalog["indexes"]
+        if "AS type_name" in query:
+            return self.catalog["enums"]
+        if "AS column_name" in query:
+            return self.catalog["columns"]
+        if "AS relkind" in query:
+            return self.catalog["relations"]
+        return [
+            {
+                "oid": row["oid"],
+                "fingerprint": row["fingerprint"],
+                "row_count_estimate": row["row_count_estimate"],
+            }
+            for row in self.catalog["relations"]
+        ]
+
+
+# "char" catalog columns and the expression selecting them as text
+CHAR_COLUMNS = {"relkind": "c.relkind::text", "constraint_type": "con.contype::text"}
+
+
+def decode_char_columns(query: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return "char" columns as bytes, as asyncpg does, unless cast to text."""
+    for column, text_expression in CHAR_COLUMNS.items():
+        if f"AS {column}" in query and text_expression not in query:
+            rows = [{**row, column: row[column].encode()} for row in rows]
+    return rows
+
+
+class _Acquire:
+    def __init__(self, conn: FakeConnection):
+        self.conn = conn
+
+    async def __aenter__(self) -> FakeConnection:
+        return self.conn
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+def make_pool(conn: FakeConnection) -> MagicMock:
+    """Create a pool double whose acquire() yields the given connection."""
+    pool = MagicMock()
+    pool.acquire.return_value = _Acquire(conn)
+    return pool
+
+
+def make_catalog(table_count: int) -> dict[str, list[dict[str, Any]]]:
+    """Build catalog rows for ``table_count`` tables plus one view.
+
+    Every table has an ``id`` primary key and a ``parent_a``/``parent_b``
+    composite foreign key to ``parents``; the view has a single column.
+    """
+    relations: list[dict[str, Any]] = [
+        {
+            "oid": 1000 + i,
+            "relkind": "r",
+            "schema_name": "public",
+            "table_name": f"t{i}",
+            "comment": None,
+            "row_count_estimate": i,
+            "fingerprint": f"fp-t{i}",
+        }
+        for i in range(table_count)
+    ]
+    relations.append(
+        {
+            "oid": 9000,
+            "relkind": "v",
+            "schema_name": "public",
+            "table_name": "v_all",
+            "comment": "A view",
+            "row_count_estimate": None,
+            "fingerprint": "fp-v_all",
+        }
+    )
+
+    columns: list[dict[str, Any]] = []
+    constraints: list[dict[str, Any]] = []
+    indexes: list[dict[str, Any]] = []
+    for i in range(table_count):
+        relid = 1000 + i
+        for name, data_type, nullable in (
+            ("id", "integer", False),
+            ("email", "text", True),
+            ("parent_a", "integer", True),
+            ("parent_b", "integer", True),
+        ):
+            columns.append(
+                {
+                    "relid": relid,
+                    "column_name": name,
+                    "data_type": data_type,
+                    "is_nullable": nullable,
+                    "default_value": None,
+                    "comment": None,
+                }
+            )
+        constraints.extend(
+            [
+                {
+                    "relid": relid,
+                    "constraint_name": f"t{i}_pkey",
+                    "constraint_type": "p",
+                    "column_name": "id",
+                    "referenced_table": None,
+                    "referenced_column": None,
+                },
+                {
+                    "relid": relid,
+                    "constraint_name": f"t{i}_email_key",
+                    "constraint_type": "u",
+                    "column_name": "email",
+                    "referenced_table": None,
+                    "referenced_column": None,
+                },
+                {
+                    "relid": relid,
+                    "constraint_name": f"t{i}_parent_fkey",
+                    "constraint_type": "f",
+                    "column_name": "parent_a",
+                    "referenced_table": "parents",
+                    "referenced_column": "a",
+                },
+                {
+                    "relid": relid,
+                    "constraint_name": f"t{i}_parent_fkey",
+                    "constraint_type": "f",
+                    "column_name": "parent_b",
+                    "referenced_table": "parents",
+                    "referenced_column": "b",
+                },
+            ]
+        )
+        indexes.append(
+            {
+                "relid": relid,
+                "index_name": f"t{i}_parent_idx",
+                "is_unique": False,
+                "index_type": "btree",
+                "columns": ["parent_a", "parent_b"],
+            }
+        )
+    columns.append(
+        {
+            "relid": 9000,
+            "column_name": "id",
+            "data_type": "integer",
+            "is_nullable": True,
+            "default_value": None,
+            "comment": None,
+        }
+    )
+
+    enums = [{"schema_name": "public", "type_name": "mood", "values": ["happy", "sad"]}]
+
+    return {
+        "relations": relations,
+        "columns": columns,
+        "constraints": constraints,
+        "indexes": indexes,
+        "enums": enums,
+    }
+
+
+class TestSchemaIntrospector:
+    """Test suite for SchemaIntrospector."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("table_count", [1, 10, 500])
+    async def test_round_trips_independent_of_table_count(self, table_count: int) -> None:
+        """Test that introspection uses a fixed number of queries."""
+        conn = FakeConnection(make_catalog(table_count))
+        introspector = SchemaIntrospector(make_pool(conn), "testdb")
+
+        schema = await introspector.introspect()
+
+        assert len(schema.tables) == table_count + 1
+        # version + relations + columns + constraints + indexes + enums
+        assert conn.round_trips == 6
+
+    @pytest.mark.asyncio
+    async def test_assembles_table_details(self) -> None:
+        """Test that bulk rows are assembled into complete TableInfo objects."""
+        conn = FakeConnection(make_catalog(2))
+        introspector = SchemaIntrospector(make_pool(conn), "testdb")
+
+        schema = await introspector.introspect()
+
+        assert schema.database_name == "testdb"
+        assert schema.version == "PostgreSQL 16.2"
+        assert [t.table_name for t in schema.tables] == ["t0", "t1", "v_all"]
+
+        table = schema.get_table("t1")
+        assert table is not None
+        assert [c.name for c in table.columns] == ["id", "email", "parent_a", "parent_b"]
+        columns = {c.name: c for c in table.columns}
+        assert [c.name for c in table.columns if c.is_primary_key] == ["id"]
+        assert columns["email"].is_unique
+        assert not columns["id"].is_nullable
+        assert table.row_count_estimate == 1
+        assert len(table.indexes) == 1
+        assert table.indexes[0].columns == ["parent_a", "parent_b"]
+        assert table.oid == 1001
+        assert table.fingerprint == "fp-t1"
+
+        assert schema.enum_types[0].values == ["happy", "sad"]
+
+    @pytest.mark.asyncio
+    async def test_composite_foreign_key_pairs_columns(self) -> None:
+        """Test that multi-column foreign keys map columns pairwise."""
+        conn = FakeConnection(make_catalog(1))
+        introspector = SchemaIntrospector(make_pool(conn), "testdb")
+
+        schema = await introspector.introspect()
+        table = schema.get_table("t0")
+
+        pairs = [(fk.column_name, fk.referenced_column) for fk in table.foreign_keys]
+        assert pairs == [("parent_a", "a"), ("parent_b", "b")]
+
+    @pytest.mark.asyncio
+    async def test_view_without_estimate(self) -> None:
+        """Test that views follow tables and default to a zero row estimate."""
+        conn = FakeConnection(make_catalog(1))
+        introspector = SchemaIntrospector(make_pool(conn), "testdb")
+
+        schema = await introspector.introspect()
+
+        view = schema.get_table("v_all")
+        assert view is not None
+        assert view.row_count_estimate == 0
+        assert view.comment == "A view"
+
+    @pytest.mark.asyncio
+    async def test_get_relations_passes_oid_filter(self) -> None:
+        """Test that relation OIDs are forwarded to every catalog query."""
+        conn = FakeConnection(make_catalog(1))
+        introspector = SchemaIntrospector(make_pool(conn), "testdb")
+
+        await introspector._get_relations(conn, [1000])
+
+        assert conn.oid_filters == [[1000]] * 4
+
+    @pytest.mark.asyncio
+    async def test_fetch_fingerprints(self) -> None:
+        """Test that fingerprints are fetched in one query in table order."""
+        conn = FakeConnection(make_catalog(2))
+        introspector = SchemaIntrospector(make_pool(conn), "testdb")
+
+        fingerprints = await introspector.fetch_fingerprints()
+
+        assert conn.round_trips == 1
+        assert [(f.oid, f.fingerprint) for f in fingerprints] == [
+            (1000, "fp-t0"),
+            (1001, "fp-t1"),
+            (9000, "fp-v_all"),
+        ]
+        assert fingerprints[1].row_count_estimate == 1
+        assert fingerprints[2].row_count_estimate == 0
+
+    @pytest.mark.asyncio
+    async def test_introspect_relations_skips_empty_oid_list(self) -> None:
+        """Test that introspecting no relations does not touch the database."""
+        conn = FakeConnection(make_catalog(1))
+        introspector = SchemaIntrospector(make_pool(conn), "testdb")
+
+        assert await introspector.introspect_relations([]) == []
+        assert conn.round_trips == 0
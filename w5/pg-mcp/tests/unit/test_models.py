@@ -181,6 +181,36 @@ class TestTableInfo:
         assert "Description: User accounts" in section
         assert "Columns:" in section
 
+    def test_prompt_section_is_memoised(self) -> None:
+        """Test that the section is rendered once and reset on modification."""
+        table = TableInfo(table_name="users", columns=[], row_count_estimate=10)
+        first = table.to_prompt_section()
+        assert table.to_prompt_section() is first
+
+        table.comment = "User accounts"
+        assert "Description: User accounts" in table.to_prompt_section()
+
+        updated = table.model_copy(update={"row_count_estimate": 20})
+        assert "Approximate rows: 20" in updated.to_prompt_section()
+        assert "Approximate rows: 10" in table.to_prompt_section()
+
+    def test_invalidate_prompt_cache_after_nested_edit(self) -> None:
+        """Test explicit invalidation after mutating a nested list."""
+        table = TableInfo(table_name="users", columns=[])
+        table.to_prompt_section()
+
+        table.columns.append(ColumnInfo(name="email", data_type="text", is_nullable=True))
+        table.invalidate_prompt_cache()
+
+        assert "email: text" in table.to_prompt_section()
+
+    def test_rendering_does_not_affect_equality(self) -> None:
+        """Test that a rendered and an unrendered table compare equal."""
+        rendered = TableInfo(table_name="users", columns=[])
+        rendered.to_prompt_section()
+
+        assert rendered == TableInfo(table_name="users", columns=[])
+
 
 class TestEnumTypeInfo:
     """Tests for EnumTypeInfo model."""
@@ -264,6 +294,38 @@ class TestDatabaseSchema:
         assert "Custom Types" in context
         assert "Tables" in context
 
+    def test_prompt_context_reuses_table_sections(self) -> None:
+        """Test that a new schema version re-renders only replaced tables."""
+        users = TableInfo(table_name="users", columns=[])
+        orders = TableInfo(table_name="orders", columns=[])
+        schema = DatabaseSchema(database_name="testdb", tables=[users, orders])
+        context = schema.to_prompt_context()
+        assert schema.to_prompt_context() is context
+        users_section = users.to_prompt_section()
+
+        refreshed_orders = orders.model_copy(update={"comment": "Customer orders"})
+        refreshed = schema.model_copy(update={"tables": [users, refreshed_orders]})
+
+        assert "Description: Customer orders" in refreshed.to_prompt_context()
+        assert "Customer orders" not in schema.to_prompt_context()
+        assert users.to_prompt_section() is users_section
+
+    def test_definition_fingerprint(self) -> None:
+        """Test that the fingerprint tracks definitions but not row estimates."""
+        table = TableInfo(table_name="users", columns=[], row_count_estimate=1)
+        schema = DatabaseSchema(database_name="testdb", tables=[table])
+        fingerprint = schema.definition_fingerprint()
+
+        same = schema.model_copy(
+            update={"tables": [table.model_copy(update={"row_count_estimate": 2})]}
+        )
+        changed = schema.model_copy(
+            update={"tables": [table.model_copy(update={"comment": "Accounts"})]}
+        )
+
+        assert same.definition_fingerprint() == fingerprint
+        assert changed.definition_fingerprint() != fingerprint
+
 
 class TestQueryRequest:
     """Tests for QueryRequest model."""
@@ -369,6 +431,7 @@ class TestQueryResponse:
         assert response.success
         assert response.generated_sql is not None
         assert response.data is None
+        assert response.executed_sql is None
 
 
 class TestErrorModels:
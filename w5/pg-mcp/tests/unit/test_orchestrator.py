@@ -4,25 +4,43 @@ This module tests the orchestrator's coordination of the query pipeline,
 including retry logic, error handling, and integration with all components.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from pg_mcp.config.settings import ResilienceConfig, ValidationConfig
+from pg_mcp.cache.query_cache import QueryCache
+from pg_mcp.config.settings import (
+    QueryCacheConfig,
+    ResilienceConfig,
+    RetrievalConfig,
+    ValidationConfig,
+)
 from pg_mcp.models.errors import (
     DatabaseError,
     LLMError,
+    LLMTimeoutError,
+    QueryCostExceededError,
+    RateLimitExceededError,
+    SchemaLoadError,
     SecurityViolationError,
     SQLParseError,
 )
 from pg_mcp.models.query import (
+    ExecutionResult,
     QueryRequest,
+    ResultFormat,
     ResultValidationResult,
     ReturnType,
 )
 from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, TableInfo
+from pg_mcp.observability.tracing import request_context
 from pg_mcp.resilience.circuit_breaker import CircuitState
+from pg_mcp.resilience.retry import RetryPolicy
+from pg_mcp.services.coalescer import RequestCoalescer
 from pg_mcp.services.orchestrator import QueryOrchestrator
+from pg_mcp.services.schema_retriever import SchemaRetriever
+from pg_mcp.services.sql_hedger import HedgedGeneration
 
 
 class TestDatabaseResolution:
@@ -109,6 +127,77 @@ class TestDatabaseResolution:
         assert "no databases configured" in str(exc_info.value).lower()
 
 
+class TestPerDatabaseExecutors:
+    """Test routing execution to the resolved database's executor."""
+
+    @pytest.fixture
+    def mock_schema(self) -> DatabaseSchema:
+        """Create mock database schema."""
+        return DatabaseSchema(
+            database_name="db2",
+            tables=[
+                TableInfo(
+                    table_name="items",
+                    columns=[ColumnInfo(name="id", data_type="integer", is_nullable=False)],
+                )
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_runs_on_its_database_executor(self, mock_schema: DatabaseSchema) -> None:
+        """Test that each database's queries run on that database's executor."""
+        executors = {"db1": AsyncMock(), "db2": AsyncMock()}
+        for executor in executors.values():
+            executor.execute.return_value = ExecutionResult(rows=[{"n": 1}], total_row_count=1)
+
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT 1 AS n"
+        mock_validator = MagicMock()
+        mock_validator.apply_row_limit.side_effect = lambda sql: sql
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=executors["db1"],
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"db1": MagicMock(), "db2": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            sql_executors=executors,
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="How many?", database="db2")
+        )
+
+        assert response.success is True
+        executors["db2"].execute.assert_awaited_once_with(
+            "SELECT 1 AS n", count_sql="SELECT 1 AS n"
+        )
+        executors["db1"].execute.assert_not_called()
+        mock_cache.get.assert_called_once_with("db2")
+
+    def test_missing_executor_raises(self) -> None:
+        """Test that a database without an executor is not run on another's."""
+        orchestrator = QueryOrchestrator(
+            sql_generator=MagicMock(),
+            sql_validator=MagicMock(),
+            sql_executor=MagicMock(),
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"db1": MagicMock(), "db2": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(),
+            sql_executors={"db1": MagicMock()},
+        )
+
+        with pytest.raises(DatabaseError, match="No SQL executor available for database 'db2'"):
+            orchestrator._get_executor("db2")
+
+
 class TestSQLGenerationWithRetry:
     """Test SQL generation with retry logic."""
 
@@ -174,6 +263,41 @@ class TestSQLGenerationWithRetry:
         mock_generator.generate.assert_called_once()
         mock_validator.validate_or_raise.assert_called_once_with("SELECT * FROM users;")
 
+    @pytest.mark.asyncio
+    async def test_generate_sql_with_schema_retriever(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a retriever's pruned context is passed to the generator."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT * FROM users;"
+
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.return_value = None
+        mock_validator.extract_tables.return_value = ["users"]
+
+        retriever = SchemaRetriever(RetrievalConfig(enabled=True, min_tables=0))
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=MagicMock(),
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=3),
+            validation_config=ValidationConfig(),
+            schema_retriever=retriever,
+        )
+
+        await orchestrator._generate_sql_with_retry(
+            question="Get all users",
+            schema=mock_schema,
+            request_id="test-123",
+        )
+
+        schema_context = mock_generator.generate.call_args.kwargs["schema_context"]
+        assert "Table: public.users" in schema_context
+        mock_validator.extract_tables.assert_called_once_with("SELECT * FROM users;")
+        assert retriever.get_stats()["last_recall"] == 1.0
+
     @pytest.mark.asyncio
     async def test_generate_sql_retry_on_validation_failure(
         self, mock_schema: DatabaseSchema
@@ -314,6 +438,100 @@ class TestSQLGenerationWithRetry:
         assert "unexpectedly" in str(exc_info.value).lower()
         assert orchestrator.circuit_breaker.failure_count == 1
 
+    @pytest.mark.asyncio
+    async def test_generate_sql_rate_limited(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a rate limit rejection propagates without tripping the circuit."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = RateLimitExceededError(message="Too many requests")
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executor=MagicMock(),
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=1),
+            validation_config=ValidationConfig(),
+        )
+
+        with pytest.raises(RateLimitExceededError):
+            await orchestrator._generate_sql_with_retry(
+                question="Get all users",
+                schema=mock_schema,
+                request_id="test-123",
+            )
+
+        assert orchestrator.circuit_breaker.failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_generate_sql_retries_transient_error(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a transient LLM error is retried with backoff."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = [
+            LLMTimeoutError(message="timed out"),
+            "SELECT * FROM users",
+        ]
+        sleep = AsyncMock()
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executor=MagicMock(),
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=1),
+            validation_config=ValidationConfig(),
+            retry_policy=RetryPolicy(max_retries=2, sleep=sleep),
+        )
+
+        sql, _, _ = await orchestrator._generate_sql_with_retry(
+            question="Get all users",
+            schema=mock_schema,
+            request_id="test-123",
+        )
+
+        assert sql == "SELECT * FROM users"
+        assert mock_generator.generate.call_count == 2
+        sleep.assert_awaited_once()
+        # The retried call repeats the same prompt, without validation feedback
+        assert mock_generator.generate.call_args.kwargs["error_feedback"] is None
+
+    @pytest.mark.asyncio
+    async def test_generate_sql_hedged(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a hedged candidate is used without validating it again."""
+        mock_generator = AsyncMock()
+        mock_validator = MagicMock()
+        mock_hedger = AsyncMock()
+        mock_hedger.generate.return_value = HedgedGeneration(
+            sql="SELECT * FROM users", valid=True, tokens_used=420, candidates=2, winner=1
+        )
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=MagicMock(),
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=1),
+            validation_config=ValidationConfig(),
+            sql_hedger=mock_hedger,
+        )
+
+        sql, validation, tokens = await orchestrator._generate_sql_with_retry(
+            question="Get all users",
+            schema=mock_schema,
+            request_id="test-123",
+        )
+
+        assert sql == "SELECT * FROM users"
+        assert validation.is_valid is True
+        assert tokens == 420
+        mock_generator.generate.assert_not_called()
+        mock_validator.validate_or_raise.assert_not_called()
+
 
 class TestResultValidation:
     """Test result validation logic."""
@@ -329,9 +547,13 @@ class TestResultValidation:
             is_acceptable=True,
         )
 
+        # Send the aggregate to the LLM rather than skip it as a single row
+        mock_sql_validator = MagicMock()
+        mock_sql_validator.is_single_row_aggregate.return_value = False
+
         orchestrator = QueryOrchestrator(
             sql_generator=MagicMock(),
-            sql_validator=MagicMock(),
+            sql_validator=mock_sql_validator,
             sql_executor=MagicMock(),
             result_validator=mock_validator,
             schema_cache=MagicMock(),
@@ -340,7 +562,7 @@ class TestResultValidation:
             validation_config=ValidationConfig(enabled=True),
         )
 
-        confidence = await orchestrator._validate_results_safely(
+        confidence, decision = await orchestrator._validate_results_safely(
             question="Count users",
             sql="SELECT COUNT(*) FROM users",
             results=[{"count": 42}],
@@ -349,6 +571,7 @@ class TestResultValidation:
         )
 
         assert confidence == 85
+        assert decision == "validate"
         mock_validator.validate.assert_called_once()
 
     @pytest.mark.asyncio
@@ -367,7 +590,7 @@ class TestResultValidation:
             validation_config=ValidationConfig(enabled=False),
         )
 
-        confidence = await orchestrator._validate_results_safely(
+        confidence, decision = await orchestrator._validate_results_safely(
             question="Count users",
             sql="SELECT COUNT(*) FROM users",
             results=[{"count": 42}],
@@ -376,6 +599,7 @@ class TestResultValidation:
         )
 
         assert confidence == 100
+        assert decision is None
         mock_validator.validate.assert_not_called()
 
     @pytest.mark.asyncio
@@ -384,9 +608,13 @@ class TestResultValidation:
         mock_validator = AsyncMock()
         mock_validator.validate.side_effect = Exception("Validation failed")
 
+        # Send the aggregate to the LLM rather than skip it as a single row
+        mock_sql_validator = MagicMock()
+        mock_sql_validator.is_single_row_aggregate.return_value = False
+
         orchestrator = QueryOrchestrator(
             sql_generator=MagicMock(),
-            sql_validator=MagicMock(),
+            sql_validator=mock_sql_validator,
             sql_executor=MagicMock(),
             result_validator=mock_validator,
             schema_cache=MagicMock(),
@@ -396,7 +624,7 @@ class TestResultValidation:
         )
 
         # Should not raise, returns default confidence
-        confidence = await orchestrator._validate_results_safely(
+        confidence, decision = await orchestrator._validate_results_safely(
             question="Count users",
             sql="SELECT COUNT(*) FROM users",
             results=[{"count": 42}],
@@ -405,6 +633,112 @@ class TestResultValidation:
         )
 
         assert confidence == 100
+        assert decision == "validate"
+        mock_validator.validate.assert_called_once()
+
+    @staticmethod
+    def _orchestrator(
+        result_validator: AsyncMock, metrics: MagicMock, **config: object
+    ) -> QueryOrchestrator:
+        """Create an orchestrator around a result validator."""
+        return QueryOrchestrator(
+            sql_generator=MagicMock(),
+            sql_validator=MagicMock(),
+            sql_executor=MagicMock(),
+            result_validator=result_validator,
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(**config),  # type: ignore[arg-type]
+            metrics=metrics,
+        )
+
+    @pytest.mark.asyncio
+    async def test_validate_results_skipped_by_policy(self) -> None:
+        """Test that results vouched for by heuristics are not sent to the LLM."""
+        mock_validator = AsyncMock()
+        metrics = MagicMock()
+        orchestrator = self._orchestrator(mock_validator, metrics)
+
+        confidence, decision = await orchestrator._validate_results_safely(
+            question="List admins",
+            sql="SELECT * FROM users WHERE is_admin",
+            results=[],
+            row_count=0,
+            request_id="test-123",
+        )
+
+        assert confidence == 100
+        assert decision == "empty_result"
+        mock_validator.validate.assert_not_called()
+        metrics.increment_result_validation.assert_called_once_with("empty_result")
+
+    @pytest.mark.asyncio
+    async def test_validate_results_async(self) -> None:
+        """Test that async mode responds first and records confidence later."""
+        release = asyncio.Event()
+
+        async def validate(**_: object) -> ResultValidationResult:
+            await release.wait()
+            return ResultValidationResult(
+                confidence=40, explanation="Wrong table", suggestion=None, is_acceptable=False
+            )
+
+        mock_validator = AsyncMock()
+        mock_validator.validate.side_effect = validate
+        metrics = MagicMock()
+        orchestrator = self._orchestrator(mock_validator, metrics, mode="async")
+
+        confidence, decision = await orchestrator._validate_results_safely(
+            question="List users",
+            sql="SELECT id FROM users",
+            results=[{"id": 1}, {"id": 2}],
+            row_count=2,
+            request_id="test-123",
+        )
+
+        assert confidence == 100
+        assert decision == "deferred"
+        metrics.increment_result_validation.assert_called_once_with("deferred")
+        metrics.observe_result_validation_confidence.assert_not_called()
+
+        (task,) = orchestrator._deferred_validations
+        release.set()
+        await task
+
+        metrics.observe_result_validation_confidence.assert_called_once_with("unknown", 40)
+        assert not orchestrator._deferred_validations
+
+    @pytest.mark.asyncio
+    async def test_deferred_validation_backlog(self) -> None:
+        """Test that deferred validations are bounded and cancelled on stop."""
+
+        async def validate(**_: object) -> ResultValidationResult:
+            await asyncio.Event().wait()  # Never completes
+            raise AssertionError("unreachable")
+
+        mock_validator = AsyncMock()
+        mock_validator.validate.side_effect = validate
+        metrics = MagicMock()
+        orchestrator = self._orchestrator(mock_validator, metrics, mode="async", max_deferred=1)
+
+        for request_id in ("a", "b"):
+            await orchestrator._validate_results_safely(
+                question="List users",
+                sql="SELECT id FROM users",
+                results=[{"id": 1}, {"id": 2}],
+                row_count=2,
+                request_id=request_id,
+            )
+
+        await asyncio.sleep(0)
+        assert [c.args for c in metrics.increment_result_validation.call_args_list] == [
+            ("deferred",),
+            ("backlog_full",),
+        ]
+        assert len(orchestrator._deferred_validations) == 1
+        await orchestrator.stop()
+        assert not orchestrator._deferred_validations
 
 
 class TestExecuteQueryFlow:
@@ -477,6 +811,192 @@ class TestExecuteQueryFlow:
         assert response.data is None  # No execution for SQL-only
         assert response.error is None
 
+    @pytest.mark.asyncio
+    async def test_execute_query_answer_cache_skips_llm(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a repeated question is answered from the answer cache."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT * FROM users;"
+
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.return_value = None
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        query_cache = QueryCache(QueryCacheConfig())
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=MagicMock(),
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(),
+            query_cache=query_cache,
+        )
+
+        first = await orchestrator.execute_query(
+            QueryRequest(question="Get all users", database="test_db", return_type=ReturnType.SQL)
+        )
+        second = await orchestrator.execute_query(
+            QueryRequest(question="get all users!", database="test_db", return_type=ReturnType.SQL)
+        )
+
+        assert first.success is True
+        assert second.success is True
+        assert second.generated_sql == "SELECT * FROM users;"
+        assert second.validation is not None
+        assert second.validation.is_valid is True
+        mock_generator.generate.assert_called_once()
+        mock_validator.validate_or_raise.assert_called_once()
+        assert query_cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_questions_coalesced(
+        self, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that duplicates in flight share one pipeline run but keep their own IDs."""
+        release = asyncio.Event()
+
+        async def generate(**_: object) -> str:
+            await release.wait()
+            return "SELECT id FROM users"
+
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = generate
+
+        mock_validator = MagicMock()
+        mock_validator.apply_row_limit.side_effect = lambda sql: sql
+
+        mock_executor = AsyncMock()
+        mock_executor.execute.return_value = ExecutionResult(rows=[{"id": 1}], total_row_count=1)
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=mock_executor,
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            request_coalescer=RequestCoalescer(),
+        )
+
+        questions = ["Get all users", "get all users?", "Get all users"]
+        tasks = [
+            asyncio.create_task(
+                orchestrator.execute_query(QueryRequest(question=question, database="test_db"))
+            )
+            for question in questions
+        ]
+        sql_only = asyncio.create_task(
+            orchestrator.execute_query(
+                QueryRequest(question="Get all users", database="test_db", return_type="sql")
+            )
+        )
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*tasks)
+
+        assert all(response.success for response in responses)
+        assert (await sql_only).success is True
+        # One run for the three result requests, one for the SQL-only request
+        assert mock_generator.generate.call_count == 2
+        assert mock_executor.execute.call_count == 1
+        request_ids = {response.request_id for response in responses}
+        assert len(request_ids) == 3
+        assert None not in request_ids
+
+    @pytest.mark.asyncio
+    async def test_expensive_plan_regenerated_with_feedback(
+        self, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that SQL rejected by the cost gate is regenerated with the reason."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = [
+            "SELECT * FROM users, users AS u2",
+            "SELECT * FROM users",
+        ]
+
+        mock_validator = MagicMock()
+        mock_validator.apply_row_limit.side_effect = lambda sql: sql
+
+        mock_executor = AsyncMock()
+        mock_executor.execute.side_effect = [
+            QueryCostExceededError(message="plan contains a nested loop over about 1e12 rows"),
+            ExecutionResult(rows=[{"id": 1, "name": "Alice"}], total_row_count=1),
+        ]
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+        query_cache = QueryCache(QueryCacheConfig())
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=mock_executor,
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=1),
+            validation_config=ValidationConfig(enabled=False),
+            query_cache=query_cache,
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="Get all users", database="test_db")
+        )
+
+        assert response.success is True
+        assert response.generated_sql == "SELECT * FROM users"
+        retry_kwargs = mock_generator.generate.call_args.kwargs
+        assert retry_kwargs["previous_attempt"] == "SELECT * FROM users, users AS u2"
+        assert "nested loop" in retry_kwargs["error_feedback"]
+        cached = query_cache.get("test_db", mock_schema, "Get all users")
+        assert cached is not None
+        assert cached.sql == "SELECT * FROM users"
+
+    @pytest.mark.asyncio
+    async def test_expensive_plan_retries_exhausted(self, mock_schema: DatabaseSchema) -> None:
+        """Test that the cost rejection is returned once retries are used up."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT * FROM users, users AS u2"
+
+        mock_validator = MagicMock()
+        mock_validator.apply_row_limit.side_effect = lambda sql: sql
+
+        mock_executor = AsyncMock()
+        mock_executor.execute.side_effect = QueryCostExceededError(message="too expensive")
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=mock_executor,
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=2),
+            validation_config=ValidationConfig(),
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="Get all users", database="test_db")
+        )
+
+        assert response.success is False
+        assert response.error is not None
+        assert response.error.code == "query_too_expensive"
+        assert mock_executor.execute.call_count == 3
+
     @pytest.mark.asyncio
     async def test_execute_query_with_results(self, mock_schema: DatabaseSchema) -> None:
         """Test executing query with return_type=RESULT."""
@@ -486,14 +1006,15 @@ class TestExecuteQueryFlow:
 
         mock_validator = MagicMock()
         mock_validator.validate_or_raise.return_value = None
+        mock_validator.apply_row_limit.return_value = "SELECT id, name FROM users LIMIT 10001"
 
         mock_executor = AsyncMock()
-        mock_executor.execute.return_value = (
-            [
+        mock_executor.execute.return_value = ExecutionResult(
+            rows=[
                 {"id": 1, "name": "Alice"},
                 {"id": 2, "name": "Bob"},
             ],
-            2,  # total count
+            total_row_count=2,
         )
 
         mock_result_validator = AsyncMock()
@@ -529,13 +1050,225 @@ class TestExecuteQueryFlow:
         # Verify
         assert response.success is True
         assert response.generated_sql == "SELECT id, name FROM users;"
+        assert response.executed_sql == "SELECT id, name FROM users LIMIT 10001"
+        # The total row count is taken without the pushed-down limit
+        mock_executor.execute.assert_awaited_once_with(
+            "SELECT id, name FROM users LIMIT 10001", count_sql="SELECT id, name FROM users;"
+        )
         assert response.data is not None
         assert response.data.row_count == 2
         assert len(response.data.rows) == 2
         assert response.data.columns == ["id", "name"]
+        assert response.data.truncated is False
+        assert response.data.total_row_count == 2
         assert response.confidence == 90
+        assert response.result_validation == "validate"
         assert response.error is None
 
+    @pytest.mark.asyncio
+    async def test_execute_query_uses_result_cache(self, mock_schema: DatabaseSchema) -> None:
+        """Test that execution goes through the result cache when configured."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "select id from users"
+
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.return_value = None
+        mock_validator.apply_row_limit.side_effect = lambda sql: sql
+        mock_validator.normalize_sql.return_value = "SELECT id FROM users"
+        mock_validator.extract_tables.return_value = ["users"]
+        mock_validator.extract_volatile_functions.return_value = []
+
+        mock_executor = AsyncMock()
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        mock_result_cache = MagicMock()
+        mock_result_cache.get_or_execute = AsyncMock(
+            return_value=ExecutionResult(
+                rows=[{"id": 1}],
+                truncated=True,
+                total_row_count=500,
+                total_row_count_exact=False,
+            )
+        )
+
+        mock_pool = MagicMock()
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=mock_executor,
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": mock_pool},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            result_cache=mock_result_cache,
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="Get user ids", database="test_db")
+        )
+
+        assert response.success is True
+        assert response.data is not None
+        assert response.data.rows == [{"id": 1}]
+        assert response.data.row_count == 1
+        assert response.data.truncated is True
+        assert response.data.total_row_count == 500
+        assert response.data.total_row_count_exact is False
+        args = mock_result_cache.get_or_execute.call_args.args
+        assert args[:4] == ("test_db", mock_pool, "SELECT id FROM users", ["users"])
+        assert mock_result_cache.get_or_execute.call_args.kwargs["cacheable"] is True
+        mock_executor.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_query_columnar_format(self, mock_schema: DatabaseSchema) -> None:
+        """Test that results are returned in the requested format."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "select id, name from users"
+
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.return_value = None
+        mock_validator.apply_row_limit.side_effect = lambda sql: sql
+
+        mock_executor = AsyncMock()
+        mock_executor.execute.return_value = ExecutionResult(
+            rows=[{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+        )
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=mock_executor,
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(
+                question="Get users",
+                database="test_db",
+                result_format=ResultFormat.COLUMNAR,
+            )
+        )
+
+        assert response.success is True
+        assert response.data is not None
+        assert response.data.columns == ["id", "name"]
+        assert response.data.rows == []
+        assert response.data.column_values == [[1, 2], ["Alice", "Bob"]]
+        assert response.data.row_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_query_records_metrics(self, mock_schema: DatabaseSchema) -> None:
+        """Test that the request and its stages are recorded per database."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "select id from users"
+
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.return_value = None
+        mock_validator.apply_row_limit.side_effect = lambda sql: sql
+
+        mock_executor = AsyncMock()
+        mock_executor.execute.return_value = ExecutionResult(rows=[{"id": 1}])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        metrics = MagicMock()
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=mock_executor,
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            metrics=metrics,
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="Get user ids", database="test_db")
+        )
+
+        assert response.success is True
+        metrics.increment_query_request.assert_called_once_with(
+            status="success", database="test_db"
+        )
+        assert metrics.observe_query_duration.call_args.args[0] == "test_db"
+        stages = [call.args[:2] for call in metrics.observe_stage.call_args_list]
+        assert stages == [("schema_lookup", "test_db"), ("validate", "test_db")]
+
+        await orchestrator.execute_query(QueryRequest(question="Get user ids", database="other"))
+        metrics.increment_query_request.assert_called_with(
+            status="database_error", database="unknown"
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_query_reports_timings(self, mock_schema: DatabaseSchema) -> None:
+        """Test the latency breakdown and span export of a traced request."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "select id from users"
+
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.return_value = None
+        mock_validator.apply_row_limit.side_effect = lambda sql: sql
+
+        mock_executor = AsyncMock()
+        mock_executor.execute.return_value = ExecutionResult(rows=[{"id": 1}])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        exporter = MagicMock()
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=mock_executor,
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            span_exporter=exporter,
+        )
+
+        async with request_context("caller-request-id"):
+            response = await orchestrator.execute_query(
+                QueryRequest(question="Get user ids", database="test_db", include_timings=True)
+            )
+
+        assert response.request_id == "caller-request-id"
+        assert response.timings is not None
+        spans = [(s.name, s.parent) for s in response.timings.spans]
+        assert spans == [
+            ("schema_lookup", None),
+            ("generate_sql", None),
+            ("validate", "generate_sql"),
+        ]
+        assert response.timings.total_ms >= sum(
+            s.duration_ms for s in response.timings.spans if s.parent is None
+        )
+        trace = exporter.export.call_args.args[0]
+        assert trace.request_id == "caller-request-id"
+        assert trace.spans[-1].name == "query"
+
+        # Exported but not reported unless requested
+        response = await orchestrator.execute_query(
+            QueryRequest(question="Get user ids", database="test_db")
+        )
+        assert response.timings is None
+        assert exporter.export.call_count == 2
+
     @pytest.mark.asyncio
     async def test_execute_query_schema_not_cached(self) -> None:
         """Test loading schema when not in cache."""
@@ -614,6 +1347,69 @@ class TestExecuteQueryFlow:
         assert "schema" in response.error.message.lower()
         assert response.generated_sql is None
 
+    @pytest.mark.asyncio
+    async def test_execute_query_waits_for_database_warmup(
+        self, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that a request waits for its own database to warm up first."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT * FROM users;"
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        mock_warmup = MagicMock()
+        mock_warmup.wait_ready = AsyncMock()
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executor=MagicMock(),
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock(), "other_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(),
+            warmup=mock_warmup,
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="Get all users", database="test_db", return_type=ReturnType.SQL)
+        )
+
+        assert response.success is True
+        mock_warmup.wait_ready.assert_awaited_once_with("test_db")
+
+    @pytest.mark.asyncio
+    async def test_execute_query_database_still_warming(self) -> None:
+        """Test that a warm-up timeout is reported without calling the LLM."""
+        mock_generator = AsyncMock()
+        mock_warmup = MagicMock()
+        mock_warmup.wait_ready = AsyncMock(
+            side_effect=SchemaLoadError("Database 'test_db' is still warming up (loading)")
+        )
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executor=MagicMock(),
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(),
+            warmup=mock_warmup,
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="Test query", database="test_db", return_type=ReturnType.SQL)
+        )
+
+        assert response.success is False
+        assert response.error is not None
+        assert response.error.code == "schema_load_error"
+        mock_generator.generate.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_query_validation_error(self) -> None:
         """Test handling of SQL validation errors."""
@@ -0,0 +1,128 @@
+"""Unit tests for connection pool creation."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
+from pg_mcp.db.pool import (
+    build_pool,
+    close_pools,
+    create_pool,
+    create_pools,
+    session_settings,
+)
+
+
+class TestSessionSettings:
+    """Test suite for per-connection session settings."""
+
+    def test_per_query_mode_has_no_settings(self) -> None:
+        """Test that the default mode leaves connections untouched."""
+        assert session_settings(SecurityConfig(readonly_role="reader")) == {}
+
+    def test_per_connection_mode(self) -> None:
+        """Test that search_path and role become startup parameters."""
+        config = SecurityConfig(
+            session_setup="per_connection",
+            safe_search_path="analytics, public",
+            readonly_role="reader",
+        )
+        assert session_settings(config) == {
+            "search_path": "analytics, public",
+            "role": "reader",
+        }
+
+    def test_per_connection_mode_without_role(self) -> None:
+        """Test that no role is set when none is configured."""
+        config = SecurityConfig(session_setup="per_connection")
+        assert session_settings(config) == {"search_path": "public"}
+
+
+class TestCreatePool:
+    """Test suite for create_pool."""
+
+    @pytest.mark.asyncio
+    async def test_passes_server_settings(self) -> None:
+        """Test that per-connection settings reach asyncpg.create_pool."""
+        with patch("pg_mcp.db.pool.asyncpg.create_pool", new=AsyncMock()) as create:
+            await create_pool(
+                DatabaseConfig(name="db"),
+                SecurityConfig(session_setup="per_connection", readonly_role="reader"),
+            )
+
+        assert create.call_args.kwargs["server_settings"] == {
+            "search_path": "public",
+            "role": "reader",
+        }
+
+    @pytest.mark.asyncio
+    async def test_no_server_settings_by_default(self) -> None:
+        """Test that pools are created as before without a security config."""
+        with patch("pg_mcp.db.pool.asyncpg.create_pool", new=AsyncMock()) as create:
+            await create_pool(DatabaseConfig(name="db"))
+
+        assert create.call_args.kwargs["server_settings"] is None
+
+
+class TestBuildPool:
+    """Test suite for build_pool and closing pools that never connected."""
+
+    def test_does_not_connect(self) -> None:
+        """Test that the pool is returned without being awaited."""
+        with patch("pg_mcp.db.pool.asyncpg.create_pool") as create:
+            pool = build_pool(DatabaseConfig(name="db"))
+
+        assert pool is create.return_value
+        assert create.call_args.kwargs["database"] == "db"
+
+    @pytest.mark.asyncio
+    async def test_close_unopened_pool(self) -> None:
+        """Test that closing a pool shut down during warm-up does not fail."""
+        pool = build_pool(DatabaseConfig(name="db", host="127.0.0.1", port=1))
+
+        await close_pools({"db": pool}, timeout=1.0)
+
+
+class TestCreatePools:
+    """Test suite for create_pools."""
+
+    @pytest.mark.asyncio
+    async def test_pools_created_concurrently(self) -> None:
+        """Test that every pool is being created before any finishes."""
+        started: list[str] = []
+        all_started = asyncio.Event()
+
+        async def fake_create_pool(config: DatabaseConfig, _security: object) -> MagicMock:
+            started.append(config.name)
+            if len(started) == 3:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=1.0)
+            return MagicMock(name=config.name)
+
+        configs = [DatabaseConfig(name=name) for name in ("a", "b", "c")]
+        with patch("pg_mcp.db.pool.create_pool", new=fake_create_pool):
+            pools = await create_pools(configs)
+
+        assert list(pools) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_failure_closes_created_pools(self) -> None:
+        """Test that pools created before a failure are closed."""
+        created = MagicMock()
+        created.close = AsyncMock()
+
+        async def fake_create_pool(config: DatabaseConfig, _security: object) -> MagicMock:
+            if config.name == "broken":
+                raise OSError("connection refused")
+            return created
+
+        configs = [DatabaseConfig(name="ok"), DatabaseConfig(name="broken")]
+        with (
+            patch("pg_mcp.db.pool.create_pool", new=fake_create_pool),
+            pytest.raises(OSError, match="connection refused"),
+        ):
+            await create_pools(configs)
+
+        created.close.assert_awaited_once()
@@ -0,0 +1,144 @@
+"""Unit tests for the question-to-SQL answer cache.
+
+This module tests question normalisation, LRU eviction, TTL expiry and
+invalidation on schema changes of QueryCache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from pg_mcp.cache.query_cache import QueryCache, normalize_question
+from pg_mcp.config.settings import QueryCacheConfig
+from pg_mcp.models.query import ValidationResult
+from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, TableInfo
+
+
+@pytest.fixture
+def schema() -> DatabaseSchema:
+    """Create a small schema."""
+    return DatabaseSchema(
+        database_name="test_db",
+        tables=[
+            TableInfo(
+                table_name="users",
+                columns=[ColumnInfo(name="id", data_type="integer", is_nullable=False)],
+                row_count_estimate=10,
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def validation() -> ValidationResult:
+    """Create a passing validation result."""
+    return ValidationResult(is_valid=True, is_select=True)
+
+
+@pytest.fixture
+def cache() -> QueryCache:
+    """Create an answer cache."""
+    return QueryCache(QueryCacheConfig(ttl=60, max_size=3))
+
+
+class TestNormalizeQuestion:
+    """Test suite for question normalisation."""
+
+    def test_folds_case_whitespace_and_punctuation(self) -> None:
+        """Test that cosmetic differences are folded away."""
+        assert normalize_question("  How many USERS?  ") == "how many users"
+        assert normalize_question("How\tmany users, today!") == "how many users today"
+        assert normalize_question("用户有多少\uff1f") == "用户有多少"
+
+    def test_keeps_meaningful_symbols(self) -> None:
+        """Test that comparison operators are not treated as punctuation."""
+        assert normalize_question("orders > 100") != normalize_question("orders < 100")
+
+
+class TestQueryCache:
+    """Test suite for QueryCache."""
+
+    def test_hit_after_put(
+        self, cache: QueryCache, schema: DatabaseSchema, validation: ValidationResult
+    ) -> None:
+        """Test that an equivalent question hits the stored answer."""
+        assert cache.get("test_db", schema, "How many users?") is None
+
+        cache.put("test_db", schema, "How many users?", "SELECT count(*) FROM users", validation)
+        answer = cache.get("test_db", schema, "how many users")
+
+        assert answer is not None
+        assert answer.sql == "SELECT count(*) FROM users"
+        assert answer.validation == validation
+        assert cache.get("other_db", schema, "how many users") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+    def test_lru_eviction(
+        self, cache: QueryCache, schema: DatabaseSchema, validation: ValidationResult
+    ) -> None:
+        """Test that the least recently used answer is evicted."""
+        for i in range(3):
+            cache.put("test_db", schema, f"question {i}", f"SELECT {i}", validation)
+        cache.get("test_db", schema, "question 0")
+
+        cache.put("test_db", schema, "question 3", "SELECT 3", validation)
+
+        assert cache.get("test_db", schema, "question 0") is not None
+        assert cache.get("test_db", schema, "question 1") is None
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["size"] == 3
+
+    def test_ttl_expiry(
+        self, cache: QueryCache, schema: DatabaseSchema, validation: ValidationResult
+    ) -> None:
+        """Test that answers expire after the TTL."""
+        with patch("pg_mcp.cache.query_cache.time.monotonic", return_value=1000.0):
+            cache.put("test_db", schema, "q", "SELECT 1", validation)
+        with patch("pg_mcp.cache.query_cache.time.monotonic", return_value=1059.0):
+            assert cache.get("test_db", schema, "q") is not None
+        with patch("pg_mcp.cache.query_cache.time.monotonic", return_value=1060.0):
+            assert cache.get("test_db", schema, "q") is None
+
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_schema_change_invalidates(
+        self, cache: QueryCache, schema: DatabaseSchema, validation: ValidationResult
+    ) -> None:
+        """Test that a new schema version drops answers for the old one."""
+        cache.put("test_db", schema, "q", "SELECT 1", validation)
+
+        changed = schema.model_copy(
+            update={"tables": [*schema.tables, TableInfo(table_name="orders", columns=[])]}
+        )
+
+        assert cache.get("test_db", changed, "q") is None
+        assert cache.get_stats()["invalidations"] == 1
+        assert cache.get_stats()["size"] == 0
+
+    def test_row_estimate_change_keeps_answers(
+        self, cache: QueryCache, schema: DatabaseSchema, validation: ValidationResult
+    ) -> None:
+        """Test that a refresh that only changed statistics keeps answers."""
+        cache.put("test_db", schema, "q", "SELECT 1", validation)
+
+        refreshed = schema.model_copy(
+            update={"tables": [schema.tables[0].model_copy(update={"row_count_estimate": 99})]}
+        )
+
+        assert cache.get("test_db", refreshed, "q") is not None
+
+    def test_invalidate(
+        self, cache: QueryCache, schema: DatabaseSchema, validation: ValidationResult
+    ) -> None:
+        """Test explicit invalidation per database and globally."""
+        cache.put("db1", schema, "q", "SELECT 1", validation)
+        cache.put("db2", schema, "q", "SELECT 1", validation)
+
+        assert cache.invalidate("db1") == 1
+        assert cache.get("db1", schema, "q") is None
+        assert cache.invalidate() == 1
+        assert cache.get_stats()["size"] == 0
@@ -0,0 +1,124 @@
+"""Unit tests for the EXPLAIN plan cost gate."""
+
+from typing import Any
+
+import pytest
+
+from pg_mcp.models.errors import QueryCostExceededError
+from pg_mcp.services.query_plan import check_plan_cost, estimate_plan
+
+
+def node(node_type: str, rows: float, cost: float = 0.0, **extra: Any) -> dict[str, Any]:
+    """Build an EXPLAIN (FORMAT JSON) plan node."""
+    plan: dict[str, Any] = {"Node Type": node_type, "Plan Rows": rows, "Total Cost": cost}
+    plan.update(extra)
+    return plan
+
+
+def seq_scan(relation: str, rows: float, cost: float = 0.0) -> dict[str, Any]:
+    """Build a sequential scan node."""
+    return node("Seq Scan", rows, cost, **{"Relation Name": relation})
+
+
+class TestEstimatePlan:
+    """Test suite for estimate_plan."""
+
+    def test_largest_node(self) -> None:
+        """Test that the node processing the most rows is found."""
+        plan = node(
+            "Hash Join",
+            1_000,
+            5_000.0,
+            Plans=[
+                seq_scan("orders", 2_000_000),
+                node("Hash", 50, Plans=[seq_scan("users", 50)]),
+            ],
+        )
+
+        estimate = estimate_plan(plan)
+
+        assert estimate.total_cost == 5_000.0
+        assert estimate.rows == 1_000
+        assert estimate.largest_node == "seq scan on orders"
+        assert estimate.largest_node_rows == 2_000_000
+
+    def test_limit_scales_streaming_children(self) -> None:
+        """Test that a LIMIT over a scan only counts the rows it lets through."""
+        plan = node("Limit", 1_001, Plans=[seq_scan("events", 50_000_000)])
+
+        estimate = estimate_plan(plan)
+
+        assert estimate.largest_node_rows == pytest.approx(1_001)
+
+    def test_blocking_node_reads_all_input(self) -> None:
+        """Test that a sort below a LIMIT still reads its whole input."""
+        plan = node(
+            "Limit",
+            1_001,
+            Plans=[node("Sort", 50_000_000, Plans=[seq_scan("events", 50_000_000)])],
+        )
+
+        estimate = estimate_plan(plan)
+
+        assert estimate.largest_node == "seq scan on events"
+        assert estimate.largest_node_rows == 50_000_000
+
+    def test_sorted_aggregate_streams(self) -> None:
+        """Test that a sorted (streaming) aggregate passes the LIMIT fraction on."""
+        plan = node(
+            "Limit",
+            10,
+            Plans=[
+                node(
+                    "Aggregate",
+                    1_000,
+                    Strategy="Sorted",
+                    Plans=[node("Index Scan", 1_000_000, **{"Relation Name": "events"})],
+                )
+            ],
+        )
+
+        assert estimate_plan(plan).largest_node_rows == pytest.approx(10_000)
+
+
+class TestCheckPlanCost:
+    """Test suite for check_plan_cost."""
+
+    def test_within_limits(self) -> None:
+        """Test that a cheap plan passes."""
+        estimate = check_plan_cost(seq_scan("users", 100, 10.0), max_cost=1e6, max_rows=1e6)
+
+        assert estimate.total_cost == 10.0
+
+    def test_no_limits(self) -> None:
+        """Test that no limits accept any plan."""
+        check_plan_cost(seq_scan("events", 1e9, 1e9), max_cost=None, max_rows=None)
+
+    def test_rows_exceeded(self) -> None:
+        """Test that an oversized scan is rejected with a descriptive message."""
+        plan = node("Aggregate", 1, 900_000.0, Plans=[seq_scan("events", 52_000_000)])
+
+        with pytest.raises(QueryCostExceededError) as exc_info:
+            check_plan_cost(plan, max_cost=None, max_rows=10_000_000)
+
+        assert "plan contains a seq scan on events over about 52,000,000 rows" in str(
+            exc_info.value
+        )
+        assert exc_info.value.code == "query_too_expensive"
+        assert exc_info.value.details["largest_node_rows"] == 52_000_000
+
+    def test_cost_exceeded_names_largest_step(self) -> None:
+        """Test that a cost rejection still names the heaviest step."""
+        plan = node(
+            "Nested Loop",
+            4e10,
+            5e8,
+            Plans=[seq_scan("orders", 200_000), node("Materialize", 200_000)],
+        )
+
+        with pytest.raises(QueryCostExceededError) as exc_info:
+            check_plan_cost(plan, max_cost=1e6, max_rows=None)
+
+        message = str(exc_info.value)
+        assert "estimated cost 500,000,000 exceeds the limit of 1,000,000" in message
+        assert "its largest step is a nested loop" in message
@@ -6,16 +6,53 @@ Tests cover:
 - Circuit breaker recovery timeout
 - Rate limiter concurrent control
 - Rate limiter timeout behavior
+- Rate limiter weighted fair queuing
+- Adaptive concurrency limits (simulated upstream latency)
 - Multi-rate limiter coordination
+- Retry policy backoff, error classification and retry budget
 """
 
 import asyncio
+import random
+import statistics
 import time
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
+import openai
 import pytest
-
+from pydantic import SecretStr
+
+from pg_mcp.config.settings import OpenAIConfig, ValidationConfig
+from pg_mcp.models.errors import (
+    ExecutionTimeoutError,
+    LLMError,
+    LLMTimeoutError,
+    LLMUnavailableError,
+    RateLimitExceededError,
+)
+from pg_mcp.models.schema import DatabaseSchema
 from pg_mcp.resilience.circuit_breaker import CircuitBreaker, CircuitState
-from pg_mcp.resilience.rate_limiter import MultiRateLimiter, RateLimiter
+from pg_mcp.resilience.rate_limiter import (
+    DEFAULT_CLIENT_ID,
+    LLM_OVERLOAD_ERRORS,
+    AdaptiveRateLimiter,
+    AIMDLimit,
+    MultiRateLimiter,
+    RateLimiter,
+    client_id_var,
+    client_scope,
+)
+from pg_mcp.resilience.retry import RetryBudget, RetryPolicy, is_retryable, retry_after
+from pg_mcp.services.result_validator import ResultValidator
+from pg_mcp.services.sql_generator import SQLGenerator
+
+OPENAI_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def http_response(status: int) -> httpx.Response:
+    """Build an OpenAI API response with a status code."""
+    return httpx.Response(status, request=OPENAI_REQUEST)
 
 
 class TestCircuitBreaker:
@@ -358,6 +395,458 @@ class TestRateLimiter:
         assert sorted(completed) == list(range(operation_count))
 
 
+class TestFairQueuing:
+    """Test cases for weighted fair queuing across clients."""
+
+    @staticmethod
+    async def _run_order(limiter: RateLimiter, clients: list[str]) -> list[str]:
+        """Queue one operation per client id behind a held slot; return grant order."""
+        order: list[str] = []
+
+        async def operation(client_id: str) -> None:
+            async with limiter(client_id=client_id):
+                order.append(client_id)
+
+        await limiter.acquire()
+        tasks = []
+        for client_id in clients:
+            tasks.append(asyncio.create_task(operation(client_id)))
+            await asyncio.sleep(0)  # Queue in this order
+        limiter.release()
+        await asyncio.gather(*tasks)
+        return order
+
+    @pytest.mark.asyncio
+    async def test_single_client_is_fifo(self) -> None:
+        """Waiters of one client should be served in arrival order."""
+        limiter = RateLimiter(max_concurrent=1)
+        order: list[int] = []
+
+        async def operation(op_id: int) -> None:
+            async with limiter():
+                order.append(op_id)
+
+        await limiter.acquire()
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.create_task(operation(i)))
+            await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_chatty_client_does_not_monopolise(self) -> None:
+        """A client queued behind another's burst should be served next."""
+        limiter = RateLimiter(max_concurrent=1)
+
+        order = await self._run_order(limiter, ["chatty"] * 4 + ["quiet"])
+
+        assert order.index("quiet") <= 1
+
+    @pytest.mark.asyncio
+    async def test_clients_interleave(self) -> None:
+        """Equally weighted clients should take turns."""
+        limiter = RateLimiter(max_concurrent=1)
+
+        order = await self._run_order(limiter, ["a", "a", "a", "b", "b", "b"])
+
+        assert order == ["a", "b", "a", "b", "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_weights_are_honoured(self) -> None:
+        """A client with weight 2 should get two slots per slot of weight 1."""
+        limiter = RateLimiter(max_concurrent=1, client_weights={"heavy": 2.0})
+
+        order = await self._run_order(limiter, ["light"] * 3 + ["heavy"] * 6)
+
+        assert order[:6].count("heavy") == 4
+
+    def test_invalid_weight(self) -> None:
+        """Should reject non-positive weights."""
+        with pytest.raises(ValueError, match="weights must be > 0"):
+            RateLimiter(max_concurrent=1, client_weights={"a": 0.0})
+
+    @pytest.mark.asyncio
+    async def test_client_scope_sets_client(self) -> None:
+        """Operations should be attributed to the client of the context."""
+        limiter = RateLimiter(max_concurrent=1)
+        order: list[str] = []
+
+        async def operation(client_id: str) -> None:
+            with client_scope(client_id):
+                async with limiter():
+                    order.append(client_id_var.get())
+
+        await limiter.acquire()
+        tasks = []
+        for client_id in ["a", "a", "b"]:
+            tasks.append(asyncio.create_task(operation(client_id)))
+            await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["a", "b", "a"]
+        assert client_id_var.get() == DEFAULT_CLIENT_ID
+
+    @pytest.mark.asyncio
+    async def test_timed_out_waiter_does_not_leak_slot(self) -> None:
+        """A waiter that gave up should not receive or hold a slot."""
+        limiter = RateLimiter(max_concurrent=1)
+        await limiter.acquire()
+
+        assert await limiter.acquire(timeout=0.01) is False
+        assert limiter.waiting == 0
+
+        limiter.release()
+        assert limiter.active_count == 0
+        assert await limiter.acquire(timeout=0.01) is True
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """A cancelled waiter should leave the queue."""
+        limiter = RateLimiter(max_concurrent=1)
+        await limiter.acquire()
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert limiter.waiting == 0
+        limiter.release()
+        assert limiter.active_count == 0
+
+    @pytest.mark.asyncio
+    async def test_slot_raises_rate_limit_error(self) -> None:
+        """slot() should raise a structured error after queue_timeout."""
+        limiter = RateLimiter(max_concurrent=1, name="llm", queue_timeout=0.01)
+        await limiter.acquire()
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            async with limiter.slot():
+                pass
+
+        assert exc_info.value.details == {
+            "limiter": "llm",
+            "max_concurrent": 1,
+            "queue_timeout_seconds": 0.01,
+        }
+        assert limiter.get_stats()["total_rejections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_time_is_recorded(self) -> None:
+        """Queue wait should be reported to metrics and statistics."""
+        metrics = MagicMock()
+        limiter = RateLimiter(max_concurrent=1, name="queries", metrics=metrics)
+        await limiter.acquire()
+
+        async def release_later() -> None:
+            await asyncio.sleep(0.02)
+            limiter.release()
+
+        releaser = asyncio.create_task(release_later())
+        async with limiter.slot():
+            pass
+        await releaser
+
+        waits = [call.args for call in metrics.observe_rate_limit_wait.call_args_list]
+        assert waits[0] == ("queries", 0.0)
+        assert waits[1][0] == "queries"
+        assert waits[1][1] >= 0.015
+        assert limiter.get_stats()["max_wait_seconds"] >= 0.015
+
+
+class LatencyModel:
+    """Synthetic upstream: latency grows once concurrency exceeds capacity."""
+
+    def __init__(self, capacity: int, base_latency: float, seed: int = 0) -> None:
+        self.capacity = capacity
+        self.base_latency = base_latency
+        self.error_rate = 0.0
+        self.now = 0.0
+        self._random = random.Random(seed)  # noqa: S311 - reproducible simulation
+
+    def latency(self, inflight: int) -> float:
+        """Noise-free latency at a given concurrency."""
+        return self.base_latency * max(1.0, inflight / self.capacity)
+
+    def run(self, limit: AIMDLimit, samples: int) -> tuple[float, float]:
+        """Drive a saturated client through the limit.
+
+        Returns:
+            Mean latency relative to the base latency and mean throughput
+            (operations per second) over the last half of the run.
+        """
+        latencies: list[float] = []
+        throughputs: list[float] = []
+        for _ in range(samples):
+            inflight = limit.limit
+            latency = self.latency(inflight)
+            self.now += latency / inflight
+            if self._random.random() < self.error_rate:
+                limit.on_overload()
+            else:
+                limit.on_success(latency * self._random.lognormvariate(0, 0.3), inflight)
+            latencies.append(latency / self.base_latency)
+            throughputs.append(inflight / latency)
+        tail = samples // 2
+        return statistics.mean(latencies[tail:]), statistics.mean(throughputs[tail:])
+
+
+def make_limit(model: LatencyModel, initial_limit: int = 5) -> AIMDLimit:
+    """Create an AIMD limit on the model's clock."""
+    return AIMDLimit(
+        initial_limit,
+        max_limit=100,
+        latency_tolerance=1.5,
+        smoothing=0.1,
+        baseline_window=30.0,
+        clock=lambda: model.now,
+    )
+
+
+class TestAIMDLimit:
+    """Simulation tests for AIMDLimit against a synthetic latency model."""
+
+    def test_invalid_parameters(self) -> None:
+        """Should reject inconsistent limits and out-of-range parameters."""
+        with pytest.raises(ValueError, match="min_limit"):
+            AIMDLimit(10, max_limit=5)
+        with pytest.raises(ValueError, match="latency_tolerance"):
+            AIMDLimit(5, latency_tolerance=1.0)
+        with pytest.raises(ValueError, match="backoff_ratio"):
+            AIMDLimit(5, backoff_ratio=1.0)
+
+    def test_grows_to_capacity_when_healthy(self) -> None:
+        """A healthy upstream should be driven near its capacity."""
+        model = LatencyModel(capacity=20, base_latency=0.1)
+        limit = make_limit(model)
+
+        latency, throughput = model.run(limit, 4000)
+
+        assert limit.limit > 5
+        assert latency < 1.5
+        # A fixed limit of 5 would serve 50 operations per second, the
+        # upstream's capacity is 200
+        assert throughput > 140
+
+    def test_sheds_when_capacity_drops(self) -> None:
+        """A degraded upstream should get fewer concurrent operations."""
+        model = LatencyModel(capacity=20, base_latency=0.1)
+        limit = make_limit(model)
+        model.run(limit, 4000)
+
+        model.capacity = 5
+        latency, throughput = model.run(limit, 4000)
+
+        assert limit.limit <= 12
+        # A fixed limit of 20 would keep latency at 4x the base latency
+        assert latency < 1.5
+        assert throughput > 45
+
+    def test_recovers_after_degradation(self) -> None:
+        """The limit should grow back once the upstream recovers."""
+        model = LatencyModel(capacity=5, base_latency=0.1)
+        limit = make_limit(model, initial_limit=20)
+        model.run(limit, 4000)
+
+        model.capacity = 20
+        _, throughput = model.run(limit, 4000)
+
+        # The degraded upstream served at most 50 operations per second
+        assert throughput > 120
+
+    def test_adopts_new_normal_latency(self) -> None:
+        """A lasting latency shift not caused by load should not starve clients."""
+        model = LatencyModel(capacity=20, base_latency=0.1)
+        limit = make_limit(model)
+        model.run(limit, 4000)
+
+        model.base_latency = 0.4
+        latency, throughput = model.run(limit, 4000)
+
+        # Capacity is unchanged, so 50 operations per second remain possible
+        assert latency < 1.5
+        assert throughput > 40
+
+    def test_sheds_on_overload_errors(self) -> None:
+        """Rising overload errors should shrink the limit."""
+        model = LatencyModel(capacity=20, base_latency=0.1)
+        limit = make_limit(model)
+        model.run(limit, 4000)
+
+        model.error_rate = 0.2
+        model.run(limit, 1000)
+
+        assert limit.limit <= 8
+        assert limit.get_stats()["decreases"] > 0
+
+    def test_idle_limit_does_not_grow(self) -> None:
+        """Samples from an underused limit should not raise it."""
+        limit = AIMDLimit(10)
+
+        for _ in range(1000):
+            limit.on_success(0.1, inflight=2)
+
+        assert limit.limit == 10
+        assert limit.baseline_latency == pytest.approx(0.1)
+
+
+class TestAdaptiveRateLimiter:
+    """Test cases for AdaptiveRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_overload_error_shrinks_limit(self) -> None:
+        """Overload errors raised in a slot should lower max_concurrent."""
+        metrics = MagicMock()
+        limiter = AdaptiveRateLimiter(
+            AIMDLimit(10),
+            name="queries",
+            metrics=metrics,
+            overload_errors=(TimeoutError,),
+        )
+
+        with pytest.raises(TimeoutError):
+            async with limiter.slot():
+                raise TimeoutError
+
+        assert limiter.max_concurrent == 7
+        assert limiter.active_count == 0
+        metrics.set_concurrency_limit.assert_called_with("queries", 7)
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_counted(self) -> None:
+        """Errors that do not signal overload should leave the limit alone."""
+        limiter = AdaptiveRateLimiter(AIMDLimit(10), overload_errors=(TimeoutError,))
+
+        with pytest.raises(ValueError):
+            async with limiter():
+                raise ValueError("bad request")
+
+        assert limiter.max_concurrent == 10
+        assert limiter.get_stats()["adaptive"]["decreases"] == 0
+
+    @pytest.mark.asyncio
+    async def test_success_records_latency(self) -> None:
+        """Completed operations should report their latency."""
+        limiter = AdaptiveRateLimiter(AIMDLimit(10))
+
+        async with limiter.slot():
+            await asyncio.sleep(0.01)
+
+        assert limiter.limit.baseline_latency is not None
+        assert limiter.limit.baseline_latency >= 0.009
+
+    @pytest.mark.asyncio
+    async def test_raised_limit_wakes_waiters(self) -> None:
+        """Raising the limit should grant slots to queued callers."""
+        limiter = RateLimiter(max_concurrent=1)
+        await limiter.acquire()
+        waiters = [asyncio.create_task(limiter.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        limiter._set_max_concurrent(3)
+        await asyncio.gather(*waiters)
+
+        assert limiter.active_count == 3
+        assert limiter.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_lowered_limit_drains_before_granting(self) -> None:
+        """Lowering the limit should not grant slots until enough finished."""
+        limiter = RateLimiter(max_concurrent=3)
+        for _ in range(3):
+            await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        limiter._set_max_concurrent(1)
+        limiter.release()
+        limiter.release()
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.release()
+        assert await waiter is True
+        assert limiter.active_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("service", ["generator", "validator"])
+    @pytest.mark.parametrize(
+        ("error", "expected_limit"),
+        [
+            (openai.APITimeoutError(request=OPENAI_REQUEST), 7),
+            (openai.InternalServerError("unavailable", response=http_response(503), body=None), 7),
+            (openai.RateLimitError("slow down", response=http_response(429), body=None), 7),
+            (openai.BadRequestError("bad prompt", response=http_response(400), body=None), 10),
+        ],
+        ids=["timeout", "503", "429", "400"],
+    )
+    async def test_openai_overload_in_services_shrinks_limit(
+        self, service: str, error: openai.OpenAIError, expected_limit: int
+    ) -> None:
+        """OpenAI overload errors should shrink the LLM limit, however services wrap them."""
+        limiter = AdaptiveRateLimiter(
+            AIMDLimit(10, max_limit=20), name="llm", overload_errors=LLM_OVERLOAD_ERRORS
+        )
+        config = OpenAIConfig(api_key=SecretStr("sk-test-key-12345"))
+        create = AsyncMock(side_effect=error)
+
+        with pytest.raises(LLMError):
+            if service == "generator":
+                generator = SQLGenerator(config, rate_limiter=limiter)
+                generator.client.chat.completions.create = create  # type: ignore[method-assign]
+                await generator.generate("List users", DatabaseSchema(database_name="db"))
+            else:
+                validator = ResultValidator(config, ValidationConfig(), rate_limiter=limiter)
+                validator.client.chat.completions.create = create  # type: ignore[method-assign]
+                await validator.validate(
+                    question="List users", sql="SELECT 1", results=[{"n": 1}], row_count=1
+                )
+
+        create.assert_awaited_once()
+        assert limiter.max_concurrent == expected_limit
+
+    def test_multi_rate_limiter_adaptive(self) -> None:
+        """MultiRateLimiter should build adaptive limiters when given limits."""
+        multi = MultiRateLimiter(llm_adaptive=AIMDLimit(3, max_limit=10))
+
+        assert isinstance(multi.llm_limiter, AdaptiveRateLimiter)
+        assert multi.llm_limiter.max_concurrent == 3
+        assert not isinstance(multi.query_limiter, AdaptiveRateLimiter)
+
+    @pytest.mark.asyncio
+    async def test_databases_have_separate_adaptive_limits(self) -> None:
+        """Overload on one database should only shrink that database's limit."""
+        multi = MultiRateLimiter(query_adaptive=AIMDLimit(10, max_limit=50))
+        slow = multi.database_limiter("slow")
+        fast = multi.database_limiter("fast")
+        assert isinstance(slow, AdaptiveRateLimiter)
+        assert isinstance(fast, AdaptiveRateLimiter)
+
+        with pytest.raises(ExecutionTimeoutError):
+            async with slow.slot():
+                raise ExecutionTimeoutError(message="statement timeout")
+
+        assert slow.max_concurrent == 7
+        assert fast.max_concurrent == 10
+        assert slow.limit is not fast.limit
+
+    def test_aimd_clone(self) -> None:
+        """A clone should share the parameters but not the state."""
+        limit = AIMDLimit(10, min_limit=2, max_limit=50)
+        limit.on_overload()
+
+        clone = limit.clone()
+
+        assert clone.limit == 10
+        assert clone.get_stats() == {**limit.get_stats(), "limit": 10, "decreases": 0}
+
+
 class TestMultiRateLimiter:
     """Test cases for MultiRateLimiter implementation."""
 
@@ -435,6 +924,28 @@ class TestMultiRateLimiter:
         assert stats["queries"]["total_requests"] == 0
         assert stats["llm"]["total_requests"] == 0
 
+    @pytest.mark.asyncio
+    async def test_databases_have_separate_query_limiters(self) -> None:
+        """A database using all its query slots should not block another."""
+        limiter = MultiRateLimiter(query_limit=2, llm_limit=1, queue_timeout=0.01)
+        slow = limiter.database_limiter("slow")
+
+        await slow.acquire()
+        await slow.acquire()
+        async with limiter.for_queries(database="fast"):
+            assert limiter.database_limiter("fast").active_count == 1
+
+        assert limiter.database_limiter("slow") is slow
+        assert slow.name == "queries:slow"
+        assert slow.max_concurrent == 2
+        with pytest.raises(RateLimitExceededError):
+            async with slow.slot():
+                pass
+        stats = limiter.get_all_stats()
+        assert stats["queries:slow"]["active_count"] == 2
+        assert stats["queries:fast"]["total_requests"] == 1
+        assert stats["queries"]["total_requests"] == 0
+
     def test_repr(self) -> None:
         """String representation should be informative."""
         limiter = MultiRateLimiter(query_limit=10, llm_limit=5)
@@ -472,6 +983,203 @@ class TestMultiRateLimiter:
         assert len(llm_results) == 5
 
 
+def api_error(status: int, code: str | None = None, retry_after: str | None = None) -> LLMError:
+    """Build an LLMError wrapping an OpenAI HTTP error, as the services raise it."""
+    response = httpx.Response(
+        status,
+        headers={"retry-after": retry_after} if retry_after else {},
+        request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"),
+    )
+    cause = openai.APIStatusError("upstream error", response=response, body={"code": code})
+    error = LLMUnavailableError(message="OpenAI API request failed")
+    error.__cause__ = cause
+    return error
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetryBudget:
+    """Test cases for RetryBudget."""
+
+    def test_min_retries_without_traffic(self) -> None:
+        """The minimum allowance is available before any call."""
+        budget = RetryBudget(ratio=0.5, min_retries=2, window=10.0, clock=FakeClock())
+
+        assert budget.try_withdraw() is True
+        assert budget.try_withdraw() is True
+        assert budget.try_withdraw() is False
+        assert budget.get_stats()["exhausted"] == 1
+
+    def test_retries_scale_with_calls(self) -> None:
+        """Each call deposits ``ratio`` retries."""
+        budget = RetryBudget(ratio=0.2, min_retries=0, window=10.0, clock=FakeClock())
+        for _ in range(10):
+            budget.record_call()
+
+        allowed = sum(budget.try_withdraw() for _ in range(10))
+
+        assert allowed == 2
+
+    def test_window_expiry(self) -> None:
+        """Calls and retries older than the window no longer count."""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=1.0, min_retries=0, window=10.0, clock=clock)
+        budget.record_call()
+        assert budget.try_withdraw() is True
+        assert budget.try_withdraw() is False
+
+        clock.now = 11.0
+        budget.record_call()
+
+        assert budget.try_withdraw() is True
+
+    def test_invalid_arguments(self) -> None:
+        """Negative ratios and empty windows are rejected."""
+        with pytest.raises(ValueError, match="ratio and min_retries must be >= 0"):
+            RetryBudget(ratio=-0.1)
+        with pytest.raises(ValueError, match="window must be > 0"):
+            RetryBudget(window=0)
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy."""
+
+    @staticmethod
+    def make_policy(**kwargs: object) -> tuple[RetryPolicy, list[float]]:
+        """Create a policy recording its sleeps instead of sleeping."""
+        sleeps: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        policy = RetryPolicy(sleep=sleep, rng=random.Random(1), **kwargs)  # type: ignore[arg-type]  # noqa: S311
+        return policy, sleeps
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (LLMTimeoutError(message="timed out"), True),
+            (TimeoutError(), True),
+            (api_error(429, "rate_limit_exceeded"), True),
+            (api_error(503), True),
+            (api_error(429, "insufficient_quota"), False),
+            (api_error(401), False),
+            (api_error(400), False),
+            (LLMError(message="empty response"), False),
+            (RateLimitExceededError(message="queue timeout"), False),
+        ],
+    )
+    def test_is_retryable(self, error: Exception, expected: bool) -> None:
+        """Transient errors are told apart from terminal ones."""
+        assert is_retryable(error) is expected
+
+    def test_retry_after(self) -> None:
+        """The Retry-After header of a wrapped HTTP error is read."""
+        assert retry_after(api_error(429, retry_after="2.5")) == 2.5
+        assert retry_after(api_error(429)) is None
+        assert retry_after(LLMTimeoutError(message="timed out")) is None
+
+    def test_full_jitter_bounds(self) -> None:
+        """Delays are uniform between 0 and the capped exponential backoff."""
+        policy, _ = self.make_policy(base_delay=1.0, backoff_factor=2.0, max_delay=5.0)
+
+        for retry, cap in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 5.0)]:
+            delays = [policy.backoff(retry) for _ in range(200)]
+            assert min(delays) >= 0.0
+            assert max(delays) <= cap
+            assert max(delays) > cap * 0.8
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self) -> None:
+        """Transient failures are retried with backoff until success."""
+        metrics = MagicMock()
+        policy, sleeps = self.make_policy(max_retries=3, metrics=metrics)
+        operation = AsyncMock(side_effect=[LLMTimeoutError(message="t"), api_error(502), "ok"])
+
+        assert await policy.call(operation, name="sql_generation") == "ok"
+
+        assert operation.call_count == 3
+        assert len(sleeps) == 2
+        assert policy.get_stats()["retries"] == 2
+        metrics.increment_retry.assert_called_with("sql_generation")
+
+    @pytest.mark.asyncio
+    async def test_terminal_error_not_retried(self) -> None:
+        """Terminal failures are raised without retrying."""
+        policy, sleeps = self.make_policy(max_retries=3)
+        operation = AsyncMock(side_effect=api_error(401))
+
+        with pytest.raises(LLMUnavailableError):
+            await policy.call(operation, name="sql_generation")
+
+        assert operation.call_count == 1
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self) -> None:
+        """The last error is raised once retries are used up."""
+        policy, _ = self.make_policy(max_retries=2)
+        operation = AsyncMock(side_effect=LLMTimeoutError(message="t"))
+
+        with pytest.raises(LLMTimeoutError):
+            await policy.call(operation, name="sql_generation")
+
+        assert operation.call_count == 3
+        assert policy.get_stats()["gave_up"] == 1
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after(self) -> None:
+        """A Retry-After header raises the delay, up to max_delay."""
+        policy, sleeps = self.make_policy(base_delay=0.1, max_delay=3.0)
+
+        await policy.call(AsyncMock(side_effect=[api_error(429, retry_after="2"), "ok"]), name="x")
+        await policy.call(AsyncMock(side_effect=[api_error(429, retry_after="60"), "ok"]), name="x")
+
+        assert sleeps == [2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_budget_exhausted(self) -> None:
+        """Retries stop once the shared budget is spent."""
+        metrics = MagicMock()
+        budget = RetryBudget(ratio=0.0, min_retries=1, window=10.0, clock=FakeClock())
+        policy, _ = self.make_policy(max_retries=3, budget=budget, metrics=metrics)
+        operation = AsyncMock(side_effect=LLMTimeoutError(message="t"))
+
+        with pytest.raises(LLMTimeoutError):
+            await policy.call(operation, name="result_validation")
+
+        assert operation.call_count == 2
+        assert policy.get_stats()["budget_exhausted"] == 1
+        metrics.increment_retry_budget_exhausted.assert_called_once_with("result_validation")
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_retry_storm(self) -> None:
+        """During an outage retries stay a fraction of calls."""
+        budget = RetryBudget(ratio=0.2, min_retries=0, window=10.0, clock=FakeClock())
+        policy, _ = self.make_policy(max_retries=3, budget=budget)
+        attempts = 0
+
+        async def outage() -> str:
+            nonlocal attempts
+            attempts += 1
+            raise LLMTimeoutError(message="t")
+
+        for _ in range(100):
+            with pytest.raises(LLMTimeoutError):
+                await policy.call(outage, name="sql_generation")
+
+        # Without the budget: 100 calls * 4 attempts
+        assert attempts <= 100 * 1.2 + 1
+
+
 class TestIntegration:
     """Integration tests combining circuit breaker and rate limiter."""
 
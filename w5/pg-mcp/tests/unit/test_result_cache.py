@@ -0,0 +1,229 @@
+"""Unit tests for the executed-result cache.
+
+This module tests cache hits, table-aware invalidation, staleness polling,
+uncacheable queries and the memory budget of ResultCache.
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import asyncpg
+import pytest
+
+from pg_mcp.cache.result_cache import ResultCache
+from pg_mcp.config.settings import ResultCacheConfig
+from pg_mcp.models.query import ExecutionResult
+
+
+class FakeConnection:
+    """Connection answering the table version query from a dict."""
+
+    def __init__(self, tables: dict[str, tuple[bool, str]]):
+        self.tables = tables
+        self.queries = 0
+        self.error: Exception | None = None
+
+    async def fetch(self, _query: str, names: list[str]) -> list[dict[str, Any]]:
+        self.queries += 1
+        if self.error is not None:
+            raise self.error
+        return [
+            {"table_name": name, "trackable": self.tables[name][0], "version": self.tables[name][1]}
+            for name in names
+            if name in self.tables
+        ]
+
+
+class FakePool:
+    """Pool whose acquire() yields a single FakeConnection."""
+
+    def __init__(self, conn: FakeConnection):
+        self.conn = conn
+
+    def acquire(self) -> "FakePool":
+        return self
+
+    async def __aenter__(self) -> FakeConnection:
+        return self.conn
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+@pytest.fixture
+def conn() -> FakeConnection:
+    """Create a connection knowing two tables and a view."""
+    return FakeConnection(
+        {
+            "users": (True, "100:5"),
+            "orders": (True, "200:9"),
+            "active_users": (False, ":"),
+        }
+    )
+
+
+@pytest.fixture
+def pool(conn: FakeConnection) -> FakePool:
+    """Create a pool around the fake connection."""
+    return FakePool(conn)
+
+
+@pytest.fixture
+def cache() -> ResultCache:
+    """Create a result cache with a long staleness window."""
+    return ResultCache(ResultCacheConfig(enabled=True, max_staleness=60.0))
+
+
+def make_execute(rows: list[dict[str, Any]]) -> AsyncMock:
+    """Create an execute callback returning rows."""
+    return AsyncMock(return_value=ExecutionResult(rows=rows, total_row_count=len(rows)))
+
+
+class TestResultCache:
+    """Test suite for ResultCache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_bypasses_execute(self, cache: ResultCache, pool: FakePool) -> None:
+        """Test that a repeated query is served without executing it."""
+        execute = make_execute([{"id": 1}])
+
+        first = await cache.get_or_execute("db", pool, "SELECT id FROM users", ["users"], execute)
+        second = await cache.get_or_execute("db", pool, "SELECT id FROM users", ["users"], execute)
+
+        assert first is second
+        assert first.rows == [{"id": 1}]
+        execute.assert_awaited_once()
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["bytes"] == len('[{"id":1}]')
+
+    @pytest.mark.asyncio
+    async def test_changed_table_invalidates_after_staleness(
+        self, cache: ResultCache, pool: FakePool, conn: FakeConnection
+    ) -> None:
+        """Test that entries reading a changed table are dropped on the next poll."""
+        await cache.get_or_execute("db", pool, "q_users", ["users"], make_execute([{"n": 1}]))
+        await cache.get_or_execute("db", pool, "q_orders", ["orders"], make_execute([{"n": 2}]))
+        conn.tables["users"] = (True, "100:6")
+
+        # Within the staleness window the old rows are still served
+        execute = make_execute([{"n": 3}])
+        result = await cache.get_or_execute("db", pool, "q_users", ["users"], execute)
+        assert result.rows == [{"n": 1}]
+
+        with patch("pg_mcp.cache.result_cache.time.monotonic", return_value=1e12):
+            rows = (await cache.get_or_execute("db", pool, "q_users", ["users"], execute)).rows
+            orders = (
+                await cache.get_or_execute("db", pool, "q_orders", ["orders"], make_execute([]))
+            ).rows
+
+        assert rows == [{"n": 3}]
+        assert orders == [{"n": 2}]
+        stats = cache.get_stats()
+        assert stats["invalidations"] == 1
+        assert stats["polls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dropped_table_invalidates(self, pool: FakePool, conn: FakeConnection) -> None:
+        """Test that a table disappearing from the catalog drops its entries."""
+        cache = ResultCache(ResultCacheConfig(enabled=True, max_staleness=0.0))
+        await cache.get_or_execute("db", pool, "q", ["users"], make_execute([{"n": 1}]))
+        del conn.tables["users"]
+
+        execute = make_execute([])
+        await cache.get_or_execute("db", pool, "q", ["users"], execute)
+
+        execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_queries(self, cache: ResultCache, pool: FakePool) -> None:
+        """Test that views and table-less queries are never cached."""
+        for tables in (["active_users"], ["users", "active_users"], [], ["generate_series"]):
+            execute = make_execute([{"n": 1}])
+            await cache.get_or_execute("db", pool, f"q{tables}", tables, execute)
+            await cache.get_or_execute("db", pool, f"q{tables}", tables, execute)
+            assert execute.await_count == 2
+
+        assert cache.get_stats()["entries"] == 0
+        assert cache.get_stats()["uncacheable"] == 8
+
+    @pytest.mark.asyncio
+    async def test_volatile_queries_not_cached(self, cache: ResultCache, pool: FakePool) -> None:
+        """Test that queries marked not cacheable always execute."""
+        execute = make_execute([{"now": 1}])
+
+        for _ in range(2):
+            await cache.get_or_execute("db", pool, "q", ["users"], execute, cacheable=False)
+
+        assert execute.await_count == 2
+        assert pool.conn.queries == 0
+        stats = cache.get_stats()
+        assert stats["entries"] == 0
+        assert stats["uncacheable"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cte_aliases_are_ignored(self, cache: ResultCache, pool: FakePool) -> None:
+        """Test that names that are not relations do not prevent caching."""
+        execute = make_execute([{"n": 1}])
+
+        await cache.get_or_execute("db", pool, "q", ["recent", "users"], execute)
+        await cache.get_or_execute("db", pool, "q", ["recent", "users"], execute)
+
+        execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_memory_budget_evicts_lru(self, pool: FakePool) -> None:
+        """Test that least recently used entries are evicted over budget."""
+        cache = ResultCache(ResultCacheConfig(enabled=True, max_bytes=1024, max_staleness=60.0))
+        rows = [{"v": "x" * 400}]
+
+        await cache.get_or_execute("db", pool, "a", ["users"], make_execute(rows))
+        await cache.get_or_execute("db", pool, "b", ["users"], make_execute(rows))
+        await cache.get_or_execute("db", pool, "a", ["users"], make_execute(rows))
+        await cache.get_or_execute("db", pool, "c", ["users"], make_execute(rows))
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["bytes"] <= 1024
+
+        execute = make_execute(rows)
+        await cache.get_or_execute("db", pool, "a", ["users"], execute)
+        execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_oversized_result_not_cached(self, pool: FakePool) -> None:
+        """Test that a result larger than the budget is not cached."""
+        cache = ResultCache(ResultCacheConfig(enabled=True, max_bytes=1024))
+
+        await cache.get_or_execute("db", pool, "q", ["users"], make_execute([{"v": "x" * 2000}]))
+
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_poll_failure_drops_database_entries(
+        self, pool: FakePool, conn: FakeConnection
+    ) -> None:
+        """Test that entries are dropped when their tables cannot be checked."""
+        cache = ResultCache(ResultCacheConfig(enabled=True, max_staleness=0.0))
+        await cache.get_or_execute("db", pool, "q", ["users"], make_execute([{"n": 1}]))
+        conn.error = asyncpg.PostgresConnectionError("connection lost")
+
+        execute = make_execute([{"n": 2}])
+        rows = (await cache.get_or_execute("db", pool, "q", ["users"], execute)).rows
+
+        assert rows == [{"n": 2}]
+        assert cache.get_stats()["poll_failures"] == 2
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, cache: ResultCache, pool: FakePool) -> None:
+        """Test explicit invalidation per database and globally."""
+        await cache.get_or_execute("db1", pool, "q", ["users"], make_execute([]))
+        await cache.get_or_execute("db2", pool, "q", ["users"], make_execute([]))
+
+        assert cache.invalidate("db1") == 1
+        assert cache.invalidate() == 1
+        assert cache.get_stats()["bytes"] == 0
@@ -0,0 +1,150 @@
+"""Unit tests for result formats and exported results."""
+
+import csv
+import io
+from unittest.mock import patch
+
+import pytest
+
+from pg_mcp.config.settings import ResultExportConfig
+from pg_mcp.models.errors import ResultExportError
+from pg_mcp.models.query import QueryResult, ResultFormat
+from pg_mcp.services.result_export import (
+    CSV_MIME_TYPE,
+    RESOURCE_URI_PREFIX,
+    ResultExporter,
+    encode_arrow,
+    encode_csv,
+    to_columnar,
+)
+
+COLUMNS = ["id", "name", "tags"]
+ROWS = [
+    {"id": 1, "name": "Alice", "tags": ["a", "b"]},
+    {"id": 2, "name": None, "tags": []},
+]
+
+
+@pytest.fixture
+def result() -> QueryResult:
+    """Create a query result with rows as dicts."""
+    return QueryResult(
+        columns=COLUMNS,
+        rows=ROWS,
+        row_count=2,
+        execution_time_ms=3.5,
+        truncated=True,
+        total_row_count=10,
+    )
+
+
+class TestEncoders:
+    """Test suite for the result encoders."""
+
+    def test_to_columnar(self) -> None:
+        """Test that rows are transposed in column order."""
+        assert to_columnar(COLUMNS, ROWS) == [[1, 2], ["Alice", None], [["a", "b"], []]]
+
+    def test_encode_csv(self) -> None:
+        """Test CSV with a header, empty NULLs and JSON nested values."""
+        content = encode_csv(COLUMNS, ROWS).decode()
+
+        assert list(csv.reader(io.StringIO(content))) == [
+            ["id", "name", "tags"],
+            ["1", "Alice", '["a","b"]'],
+            ["2", "", "[]"],
+        ]
+
+    def test_encode_arrow_round_trip(self) -> None:
+        """Test that the Arrow IPC stream holds the rows."""
+        pa = pytest.importorskip("pyarrow")
+
+        table = pa.ipc.open_stream(encode_arrow(COLUMNS, ROWS)).read_all()
+
+        assert table.column_names == COLUMNS
+        assert table.to_pylist() == ROWS
+
+    def test_encode_arrow_without_pyarrow(self) -> None:
+        """Test that a missing pyarrow is reported as an export error."""
+        with (
+            patch.dict("sys.modules", {"pyarrow": None}),
+            pytest.raises(ResultExportError, match="pyarrow"),
+        ):
+            encode_arrow(COLUMNS, ROWS)
+
+
+class TestResultExporter:
+    """Test suite for ResultExporter."""
+
+    def test_rows_unchanged(self, result: QueryResult) -> None:
+        """Test that the rows format returns the result as is."""
+        exporter = ResultExporter(ResultExportConfig())
+
+        assert exporter.apply(result, ResultFormat.ROWS) is result
+
+    def test_columnar(self, result: QueryResult) -> None:
+        """Test that the columnar format keeps the metadata and drops the rows."""
+        exporter = ResultExporter(ResultExportConfig())
+
+        columnar = exporter.apply(result, ResultFormat.COLUMNAR)
+
+        assert columnar.rows == []
+        assert columnar.column_values == to_columnar(COLUMNS, ROWS)
+        assert columnar.row_count == 2
+        assert columnar.truncated is True
+        assert columnar.total_row_count == 10
+        assert QueryResult.model_validate(columnar.model_dump()).row_count == 2
+
+    def test_csv_exported_as_resource(self, result: QueryResult) -> None:
+        """Test that CSV is readable from the returned resource URI."""
+        exporter = ResultExporter(ResultExportConfig(ttl=60.0))
+
+        exported = exporter.apply(result, ResultFormat.CSV)
+
+        assert exported.rows == []
+        assert exported.row_count == 2
+        assert exported.resource is not None
+        assert exported.resource.uri.startswith(RESOURCE_URI_PREFIX)
+        assert exported.resource.mime_type == CSV_MIME_TYPE
+        assert exported.resource.expires_in == 60.0
+        assert exporter.get(exported.resource.uri) == (encode_csv(COLUMNS, ROWS), CSV_MIME_TYPE)
+        assert QueryResult.model_validate(exported.model_dump()).row_count == 2
+
+    def test_get_by_id(self) -> None:
+        """Test that exports can be read by id as well as by URI."""
+        exporter = ResultExporter(ResultExportConfig())
+        resource = exporter.put(b"a\n1\n", CSV_MIME_TYPE)
+
+        export_id = resource.uri.removeprefix(RESOURCE_URI_PREFIX)
+        assert exporter.get(export_id) == (b"a\n1\n", CSV_MIME_TYPE)
+        assert exporter.get("unknown") is None
+
+    def test_expired_exports_dropped(self) -> None:
+        """Test that exports are unreadable after the TTL."""
+        exporter = ResultExporter(ResultExportConfig(ttl=60.0))
+        resource = exporter.put(b"x" * 100, CSV_MIME_TYPE)
+
+        with patch("pg_mcp.services.result_export.time.monotonic", return_value=1e12):
+            assert exporter.get(resource.uri) is None
+            assert exporter.get_stats() == {"exports": 0, "bytes": 0}
+
+    def test_oldest_evicted_over_budget(self) -> None:
+        """Test that the oldest exports are evicted to fit the memory budget."""
+        exporter = ResultExporter(ResultExportConfig(max_bytes=2048))
+        first = exporter.put(b"x" * 1000, CSV_MIME_TYPE)
+        second = exporter.put(b"y" * 1000, CSV_MIME_TYPE)
+        third = exporter.put(b"z" * 1000, CSV_MIME_TYPE)
+
+        assert exporter.get(first.uri) is None
+        assert exporter.get(second.uri) is not None
+        assert exporter.get(third.uri) is not None
+        assert exporter.get_stats() == {"exports": 2, "bytes": 2000}
+
+    def test_export_over_budget_rejected(self) -> None:
+        """Test that a single export larger than the budget is rejected."""
+        exporter = ResultExporter(ResultExportConfig(max_bytes=1024))
+
+        with pytest.raises(ResultExportError) as exc_info:
+            exporter.put(b"x" * 2000, CSV_MIME_TYPE)
+
+        assert exc_info.value.details == {"size_bytes": 2000, "max_bytes": 1024}
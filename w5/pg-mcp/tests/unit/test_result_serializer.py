@@ -0,0 +1,139 @@
+"""Unit tests for column-plan result serialization."""
+
+import datetime
+import decimal
+import uuid
+from typing import Any
+
+from asyncpg.types import Attribute, Type
+
+from pg_mcp.services.result_serializer import ColumnPlan, serialize_value
+
+
+def column(name: str, oid: int) -> Attribute:
+    """Create result column metadata as reported by asyncpg."""
+    return Attribute(name, Type(oid, "t", "scalar", "pg_catalog"))
+
+
+def serialize_generically(columns: list[Attribute], records: list[tuple[Any, ...]]) -> list[dict]:
+    """Serialize records by checking the type of every value."""
+    names = [col.name for col in columns]
+    return [
+        {name: serialize_value(value) for name, value in zip(names, record, strict=True)}
+        for record in records
+    ]
+
+
+class TestColumnPlan:
+    """Test suite for ColumnPlan."""
+
+    def test_native_columns_pass_through(self) -> None:
+        """Test that JSON-native columns need no converter."""
+        columns = [column("id", 23), column("name", 25), column("data", 3802)]
+        plan = ColumnPlan.from_columns(columns)
+
+        assert plan.converted == []
+        assert plan.apply([(1, "Alice", '{"a": 1}')]) == [
+            {"id": 1, "name": "Alice", "data": '{"a": 1}'}
+        ]
+
+    def test_special_types_converted(self) -> None:
+        """Test conversion of datetime, numeric, uuid, bytea and interval columns."""
+        columns = [
+            column("created", 1184),
+            column("day", 1082),
+            column("at", 1083),
+            column("price", 1700),
+            column("user_id", 2950),
+            column("raw", 17),
+            column("elapsed", 1186),
+        ]
+        record = (
+            datetime.datetime(2024, 1, 15, 12, 30, tzinfo=datetime.UTC),
+            datetime.date(2024, 1, 15),
+            datetime.time(12, 30, 45),
+            decimal.Decimal("99.99"),
+            uuid.UUID("550e8400-e29b-41d4-a716-446655440000"),
+            b"\x01\x02\x03",
+            datetime.timedelta(days=1, hours=2),
+        )
+
+        rows = ColumnPlan.from_columns(columns).apply([record])
+
+        assert rows == [
+            {
+                "created": "2024-01-15T12:30:00+00:00",
+                "day": "2024-01-15",
+                "at": "12:30:45",
+                "price": 99.99,
+                "user_id": "550e8400-e29b-41d4-a716-446655440000",
+                "raw": "010203",
+                "elapsed": "1 day, 2:00:00",
+            }
+        ]
+
+    def test_unknown_types_use_generic_serializer(self) -> None:
+        """Test that arrays of special types and unknown OIDs are serialized recursively."""
+        columns = [column("dates", 1182), column("custom", 99999)]
+        record = (
+            [datetime.date(2024, 1, 1), None],
+            {"price": decimal.Decimal("1.50")},
+        )
+
+        rows = ColumnPlan.from_columns(columns).apply([record])
+
+        assert rows == [{"dates": ["2024-01-01", None], "custom": {"price": 1.5}}]
+
+    def test_null_values_preserved(self) -> None:
+        """Test that NULLs are not passed to converters."""
+        columns = [column("created", 1114), column("price", 1700), column("id", 23)]
+        records = [(None, None, None), (datetime.datetime(2024, 1, 1), decimal.Decimal("1"), 1)]
+
+        rows = ColumnPlan.from_columns(columns).apply(records)
+
+        assert rows == [
+            {"created": None, "price": None, "id": None},
+            {"created": "2024-01-01T00:00:00", "price": 1.0, "id": 1},
+        ]
+
+    def test_duplicate_names_keep_last_column(self) -> None:
+        """Test that a repeated column name maps to the last column, like dict(record)."""
+        columns = [column("value", 1700), column("value", 25)]
+        plan = ColumnPlan.from_columns(columns)
+
+        assert plan.converted == []
+        assert plan.apply([(decimal.Decimal("1"), "text")]) == [{"value": "text"}]
+
+    def test_no_rows(self) -> None:
+        """Test that an empty result gives no rows."""
+        plan = ColumnPlan.from_columns([column("created", 1114)])
+
+        assert plan.apply([]) == []
+
+    def test_matches_generic_serializer(self) -> None:
+        """Test that the plan gives the same rows as serializing every value."""
+        columns = [
+            column("id", 20),
+            column("active", 16),
+            column("score", 701),
+            column("tags", 1009),
+            column("created", 1114),
+            column("price", 1700),
+            column("user_id", 2950),
+        ]
+        records = [
+            (
+                index,
+                index % 2 == 0,
+                index / 3,
+                [f"tag{index}"],
+                datetime.datetime(2024, 1, 1) + datetime.timedelta(minutes=index),
+                decimal.Decimal(index) / 4,
+                uuid.UUID(int=index),
+            )
+            for index in range(50)
+        ]
+
+        plan = ColumnPlan.from_columns(columns)
+
+        assert plan.apply(records) == serialize_generically(columns, records)
@@ -12,7 +12,12 @@ import pytest
 
 from pg_mcp.cache.schema_cache import SchemaCache
 from pg_mcp.config.settings import CacheConfig
-from pg_mcp.models.schema import DatabaseSchema, TableInfo
+from pg_mcp.models.schema import (
+    DatabaseSchema,
+    EnumTypeInfo,
+    RelationFingerprint,
+    TableInfo,
+)
 
 
 class TestSchemaCache:
@@ -356,3 +361,306 @@ class TestSchemaCache:
             await cache.stop_auto_refresh()
 
             assert cache._stop_refresh is True
+
+
+class TestIncrementalRefresh:
+    """Test suite for fingerprint-driven incremental refresh."""
+
+    @pytest.fixture
+    def cache(self) -> SchemaCache:
+        """Create schema cache instance."""
+        return SchemaCache(CacheConfig(schema_ttl=3600, enabled=True))
+
+    @pytest.fixture
+    def fingerprinted_schema(self) -> DatabaseSchema:
+        """Create a cached schema whose relations carry fingerprints."""
+        return DatabaseSchema(
+            database_name="test_db",
+            tables=[
+                TableInfo(table_name="users", oid=1, fingerprint="a", row_count_estimate=10),
+                TableInfo(table_name="orders", oid=2, fingerprint="b", row_count_estimate=20),
+                TableInfo(table_name="legacy", oid=3, fingerprint="c", row_count_estimate=30),
+            ],
+            version="PostgreSQL 16.0",
+        )
+
+    @pytest.mark.asyncio
+    async def test_refresh_reintrospects_only_changed_relations(
+        self, cache: SchemaCache, fingerprinted_schema: DatabaseSchema
+    ):
+        """Test that only added and altered relations are re-introspected."""
+        cache._cache["test_db"] = fingerprinted_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC) - timedelta(minutes=30)
+        users = fingerprinted_schema.tables[0]
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            # users unchanged, orders altered, legacy dropped, items added
+            mock_introspector.fetch_fingerprints.return_value = [
+                RelationFingerprint(oid=4, fingerprint="d", row_count_estimate=5),
+                RelationFingerprint(oid=2, fingerprint="b2", row_count_estimate=20),
+                RelationFingerprint(oid=1, fingerprint="a", row_count_estimate=10),
+            ]
+            mock_introspector.introspect_relations.return_value = [
+                TableInfo(table_name="items", oid=4, fingerprint="d"),
+                TableInfo(table_name="orders", oid=2, fingerprint="b2"),
+            ]
+            mock_introspector.introspect_enum_types.return_value = [
+                EnumTypeInfo(type_name="mood", values=["happy"])
+            ]
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.refresh("test_db", MagicMock())
+
+            mock_introspector.introspect.assert_not_called()
+            mock_introspector.introspect_relations.assert_awaited_once_with([4, 2])
+
+        schema = cache.get("test_db")
+        assert schema is not None
+        assert [t.table_name for t in schema.tables] == ["items", "orders", "users"]
+        assert schema.tables[2] is users  # unchanged relations are reused as-is
+        assert schema.enum_types[0].type_name == "mood"
+        assert schema.version == "PostgreSQL 16.0"
+        assert cache.get_cache_age("test_db") < 60
+
+    @pytest.mark.asyncio
+    async def test_refresh_without_changes_updates_row_estimates(
+        self, cache: SchemaCache, fingerprinted_schema: DatabaseSchema
+    ):
+        """Test that unchanged relations only pick up new row estimates."""
+        cache._cache["test_db"] = fingerprinted_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC)
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.fetch_fingerprints.return_value = [
+                RelationFingerprint(oid=t.oid, fingerprint=t.fingerprint, row_count_estimate=99)
+                for t in fingerprinted_schema.tables
+            ]
+            mock_introspector.introspect_relations.return_value = []
+            mock_introspector.introspect_enum_types.return_value = []
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.refresh("test_db", MagicMock())
+
+            mock_introspector.introspect_relations.assert_awaited_once_with([])
+
+        schema = cache.get("test_db")
+        assert [t.row_count_estimate for t in schema.tables] == [99, 99, 99]
+        # The previously cached schema object is not mutated
+        assert fingerprinted_schema.tables[0].row_count_estimate == 10
+
+    @pytest.mark.asyncio
+    async def test_refresh_falls_back_to_full_load_without_fingerprints(
+        self, cache: SchemaCache, fingerprinted_schema: DatabaseSchema
+    ):
+        """Test that schemas without fingerprints are fully reloaded."""
+        legacy_schema = DatabaseSchema(
+            database_name="test_db", tables=[TableInfo(table_name="users")]
+        )
+        cache._cache["test_db"] = legacy_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC)
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect.return_value = fingerprinted_schema
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.refresh("test_db", MagicMock())
+
+            mock_introspector.introspect.assert_awaited_once()
+            mock_introspector.fetch_fingerprints.assert_not_called()
+
+        assert cache.get("test_db") is fingerprinted_schema
+
+
+class TestSingleFlightAndStaleWhileRevalidate:
+    """Test suite for single-flight loading and stale-while-revalidate."""
+
+    @pytest.fixture
+    def swr_config(self) -> CacheConfig:
+        """Create cache configuration with stale-while-revalidate enabled."""
+        return CacheConfig(schema_ttl=60, stale_while_revalidate=True, max_stale_age=600)
+
+    @pytest.fixture
+    def sample_schema(self) -> DatabaseSchema:
+        """Create sample database schema for testing."""
+        return DatabaseSchema(database_name="test_db", tables=[TableInfo(table_name="users")])
+
+    @staticmethod
+    def slow_introspector(schema: DatabaseSchema, delay: float = 0.05) -> AsyncMock:
+        """Create an introspector mock whose introspect() takes some time."""
+
+        async def introspect() -> DatabaseSchema:
+            await asyncio.sleep(delay)
+            return schema
+
+        mock_introspector = AsyncMock()
+        mock_introspector.introspect.side_effect = introspect
+        return mock_introspector
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_introspection(self, sample_schema: DatabaseSchema):
+        """Test that concurrent misses coalesce onto a single load."""
+        cache = SchemaCache(CacheConfig())
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = self.slow_introspector(sample_schema)
+            mock_introspector_class.return_value = mock_introspector
+
+            results = await asyncio.gather(*(cache.load("test_db", MagicMock()) for _ in range(5)))
+
+            assert mock_introspector.introspect.await_count == 1
+
+        assert all(result is sample_schema for result in results)
+        stats = cache.get_stats()["test_db"]
+        assert stats["loads"] == 1
+        assert stats["coalesced_loads"] == 4
+        assert stats["loading"] is False
+
+    @pytest.mark.asyncio
+    async def test_events_recorded_as_metrics(self, sample_schema: DatabaseSchema):
+        """Test that cache counters are also sent to the metrics collector."""
+        metrics = MagicMock()
+        cache = SchemaCache(CacheConfig(), metrics=metrics)
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector_class.return_value = self.slow_introspector(sample_schema)
+            cache.get("test_db")
+            await asyncio.gather(
+                cache.load("test_db", MagicMock()), cache.load("test_db", MagicMock())
+            )
+            cache.get("test_db")
+
+        events = [c.args for c in metrics.increment_schema_cache_event.call_args_list]
+        assert sorted(events) == [
+            ("test_db", "coalesced_loads"),
+            ("test_db", "hits"),
+            ("test_db", "loads"),
+            ("test_db", "misses"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_load(
+        self, sample_schema: DatabaseSchema
+    ):
+        """Test that cancelling one waiter leaves the shared load running."""
+        cache = SchemaCache(CacheConfig())
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector_class.return_value = self.slow_introspector(sample_schema)
+
+            first = asyncio.create_task(cache.load("test_db", MagicMock()))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(cache.load("test_db", MagicMock()))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            assert await second is sample_schema
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_failed_load_propagates_to_all_waiters(self):
+        """Test that a failed shared load raises for every caller and is not cached."""
+        cache = SchemaCache(CacheConfig())
+
+        async def failing_introspect() -> DatabaseSchema:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("connection lost")
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect.side_effect = failing_introspect
+            mock_introspector_class.return_value = mock_introspector
+
+            results = await asyncio.gather(
+                cache.load("test_db", MagicMock()),
+                cache.load("test_db", MagicMock()),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert cache.get("test_db") is None
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_stale_schema_served_while_one_reload_runs(
+        self, swr_config: CacheConfig, sample_schema: DatabaseSchema
+    ):
+        """Test that expired entries are served while a single reload runs."""
+        cache = SchemaCache(swr_config)
+        fresh_schema = DatabaseSchema(database_name="test_db", tables=[])
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector_class.return_value = self.slow_introspector(sample_schema, 0)
+            await cache.load("test_db", MagicMock())
+            cache._cache_timestamps["test_db"] = datetime.now(UTC) - timedelta(seconds=120)
+
+            mock_introspector = self.slow_introspector(fresh_schema)
+            mock_introspector_class.return_value = mock_introspector
+
+            served = [cache.get("test_db") for _ in range(10)]
+            assert all(schema is sample_schema for schema in served)
+
+            await cache._inflight["test_db"]
+            assert mock_introspector.introspect.await_count == 1
+
+        assert cache.get("test_db") is fresh_schema
+        stats = cache.get_stats()["test_db"]
+        assert stats["stale_hits"] == 10
+        assert stats["revalidations"] == 1
+        assert stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_too_stale_schema_is_not_served(
+        self, swr_config: CacheConfig, sample_schema: DatabaseSchema
+    ):
+        """Test that schemas past max_stale_age are treated as misses."""
+        cache = SchemaCache(swr_config)
+        cache._pools["test_db"] = MagicMock()
+        cache._cache["test_db"] = sample_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC) - timedelta(seconds=60 + 601)
+
+        assert cache.get("test_db") is None
+        assert cache._inflight == {}
+        assert cache.get_stats()["test_db"]["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_keeps_serving_stale_and_backs_off(
+        self, swr_config: CacheConfig, sample_schema: DatabaseSchema
+    ):
+        """Test that a failed background reload is not retried immediately."""
+        cache = SchemaCache(swr_config)
+        cache._pools["test_db"] = MagicMock()
+        cache._cache["test_db"] = sample_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC) - timedelta(seconds=120)
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect.side_effect = RuntimeError("connection lost")
+            mock_introspector_class.return_value = mock_introspector
+
+            assert cache.get("test_db") is sample_schema
+            with pytest.raises(RuntimeError):
+                await cache._inflight["test_db"]
+
+            assert cache.get("test_db") is sample_schema
+            assert "test_db" not in cache._inflight
+
+        stats = cache.get_stats()["test_db"]
+        assert stats["revalidations"] == 1
+        assert stats["revalidation_failures"] == 1
+        assert stats["stale_hits"] == 2
+
+    def test_stale_schema_not_served_without_running_loop(
+        self, swr_config: CacheConfig, sample_schema: DatabaseSchema
+    ):
+        """Test that get() outside an event loop falls back to expiring the entry."""
+        cache = SchemaCache(swr_config)
+        cache._pools["test_db"] = MagicMock()
+        cache._cache["test_db"] = sample_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC) - timedelta(seconds=120)
+
+        assert cache.get("test_db") is None
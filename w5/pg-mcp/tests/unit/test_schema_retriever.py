@@ -0,0 +1,199 @@
+"""Unit tests for relevance-ranked schema selection.
+
+This module tests the tokenizer, the BM25 table ranking, foreign key
+expansion, prompt rendering and the recall statistics of SchemaRetriever.
+"""
+
+import pytest
+
+from pg_mcp.config.settings import RetrievalConfig
+from pg_mcp.models.schema import (
+    ColumnInfo,
+    DatabaseSchema,
+    EnumTypeInfo,
+    ForeignKeyInfo,
+    TableInfo,
+)
+from pg_mcp.services.schema_retriever import SchemaRetriever, tokenize
+
+
+def make_table(
+    name: str,
+    columns: list[str],
+    references: list[str] | None = None,
+    comment: str | None = None,
+    column_type: str = "text",
+) -> TableInfo:
+    """Create a table whose ``<ref>_id`` columns reference other tables."""
+    references = references or []
+    return TableInfo(
+        table_name=name,
+        comment=comment,
+        columns=[ColumnInfo(name="id", data_type="integer", is_nullable=False)]
+        + [ColumnInfo(name=c, data_type=column_type, is_nullable=True) for c in columns]
+        + [ColumnInfo(name=f"{r}_id", data_type="integer", is_nullable=True) for r in references],
+        foreign_keys=[
+            ForeignKeyInfo(
+                constraint_name=f"{name}_{r}_fkey",
+                column_name=f"{r}_id",
+                referenced_table=r,
+                referenced_column="id",
+            )
+            for r in references
+        ],
+    )
+
+
+@pytest.fixture
+def shop_schema() -> DatabaseSchema:
+    """Create a shop schema padded with many unrelated tables."""
+    tables = [
+        make_table("customers", ["email", "full_name"], comment="People who buy things"),
+        make_table("orders", ["status", "placed_at"], references=["customers"]),
+        make_table("order_items", ["quantity", "unit_price"], references=["orders", "products"]),
+        make_table("products", ["title", "sku"], references=["categories"]),
+        make_table("categories", ["label"]),
+        make_table("support_tickets", ["subject"], references=["customers"]),
+        make_table("warehouses", ["city"], column_type="public.region"),
+    ]
+    tables += [make_table(f"audit_log_{i}", ["payload", "recorded_at"]) for i in range(40)]
+    return DatabaseSchema(
+        database_name="shop",
+        tables=tables,
+        enum_types=[
+            EnumTypeInfo(type_name="region", values=["eu", "us"]),
+            EnumTypeInfo(type_name="unused", values=["x"]),
+        ],
+        version="PostgreSQL 16.2",
+    )
+
+
+@pytest.fixture
+def retriever() -> SchemaRetriever:
+    """Create a retriever with a small top-k and no expansion."""
+    return SchemaRetriever(RetrievalConfig(enabled=True, top_k=2, expand_foreign_keys=False))
+
+
+class TestTokenize:
+    """Test suite for the tokenizer."""
+
+    def test_splits_identifiers_and_singularizes(self) -> None:
+        """Test snake_case, camelCase and plural handling."""
+        assert tokenize("order_items") == ["order", "item"]
+        assert tokenize("customerAddresses") == ["customer", "address"]
+        assert tokenize("categories") == ["category"]
+
+    def test_drops_stopwords_and_numbers(self) -> None:
+        """Test that question filler words are ignored."""
+        assert tokenize("How many orders in 2024 for each customer?") == ["order", "customer"]
+
+    def test_cjk_bigrams(self) -> None:
+        """Test that CJK text is split into character bigrams."""
+        assert tokenize("订单数量") == ["订单", "单数", "数量"]
+
+
+class TestSchemaRetriever:
+    """Test suite for SchemaRetriever."""
+
+    def test_selects_relevant_tables(
+        self, retriever: SchemaRetriever, shop_schema: DatabaseSchema
+    ) -> None:
+        """Test that the best-matching tables are selected and rendered."""
+        selection = retriever.select("customer email for each order status", shop_schema)
+
+        assert selection.pruned is True
+        assert set(selection.matched_tables) == {"public.orders", "public.customers"}
+        assert selection.total_tables == 47
+        assert "Table: public.orders" in selection.prompt_context
+        assert "audit_log" not in selection.prompt_context
+        assert selection.prompt_chars < selection.full_prompt_chars
+        assert selection.full_prompt_chars == len(shop_schema.to_prompt_context())
+
+    def test_matches_comments(
+        self, retriever: SchemaRetriever, shop_schema: DatabaseSchema
+    ) -> None:
+        """Test that table comments contribute to the ranking."""
+        selection = retriever.select("which people buy the most", shop_schema)
+
+        assert selection.matched_tables[0] == "public.customers"
+
+    def test_expands_along_foreign_keys(self, shop_schema: DatabaseSchema) -> None:
+        """Test that referenced and referencing tables are added."""
+        retriever = SchemaRetriever(RetrievalConfig(enabled=True, top_k=1, max_tables=10))
+
+        selection = retriever.select("quantity sold per order item", shop_schema)
+
+        assert selection.matched_tables == ["public.order_items"]
+        assert set(selection.expanded_tables) == {"public.orders", "public.products"}
+        # Rendered in schema order
+        assert selection.tables == ["public.orders", "public.order_items", "public.products"]
+
+    def test_expansion_respects_max_tables(self, shop_schema: DatabaseSchema) -> None:
+        """Test that foreign key expansion stops at max_tables."""
+        retriever = SchemaRetriever(RetrievalConfig(enabled=True, top_k=1, max_tables=2))
+
+        selection = retriever.select("customers", shop_schema)
+
+        assert len(selection.tables) == 2
+
+    def test_only_used_enums_are_rendered(
+        self, retriever: SchemaRetriever, shop_schema: DatabaseSchema
+    ) -> None:
+        """Test that enum types are pruned to those used by selected columns."""
+        selection = retriever.select("warehouses by city", shop_schema)
+
+        assert "region" in selection.prompt_context
+        assert "unused" not in selection.prompt_context
+
+    def test_small_schema_is_sent_in_full(self, shop_schema: DatabaseSchema) -> None:
+        """Test that schemas below min_tables are not pruned."""
+        retriever = SchemaRetriever(RetrievalConfig(enabled=True, min_tables=100))
+
+        selection = retriever.select("customer email for each order status", shop_schema)
+
+        assert selection.pruned is False
+        assert selection.prompt_context == shop_schema.to_prompt_context()
+
+    def test_unmatched_question_falls_back_to_full_schema(
+        self, retriever: SchemaRetriever, shop_schema: DatabaseSchema
+    ) -> None:
+        """Test that a question matching nothing gets the full schema."""
+        selection = retriever.select("zzz qqq", shop_schema)
+
+        assert selection.pruned is False
+        assert len(selection.tables) == 47
+
+    def test_index_built_once_per_schema_object(
+        self, retriever: SchemaRetriever, shop_schema: DatabaseSchema
+    ) -> None:
+        """Test that the index is reused until the schema object changes."""
+        retriever.select("orders", shop_schema)
+        retriever.select("customers", shop_schema)
+        assert retriever.get_stats()["index_builds"] == 1
+
+        refreshed = shop_schema.model_copy(
+            update={"tables": [*shop_schema.tables, make_table("refunds", ["reason"])]}
+        )
+        selection = retriever.select("refunds", refreshed)
+
+        assert retriever.get_stats()["index_builds"] == 2
+        assert selection.matched_tables[0] == "public.refunds"
+
+    def test_recall_statistics(
+        self, retriever: SchemaRetriever, shop_schema: DatabaseSchema
+    ) -> None:
+        """Test recall against the tables used by generated SQL."""
+        selection = retriever.select("customer email for each order status", shop_schema)
+
+        assert retriever.record_recall(shop_schema, selection, ["orders", "customers"]) == 1.0
+        # CTE names and unknown relations are ignored; products was not selected
+        recall = retriever.record_recall(shop_schema, selection, ["orders", "products", "cte"])
+        assert recall == 0.5
+
+        stats = retriever.get_stats()
+        assert stats["selections"] == 1
+        assert stats["pruned_selections"] == 1
+        assert stats["recall_samples"] == 2
+        assert stats["avg_recall"] == 0.75
+        assert stats["last_recall"] == 0.5
+        assert stats["avg_prompt_chars"] == selection.prompt_chars
@@ -0,0 +1,273 @@
+"""Unit tests for persistent schema snapshots.
+
+This module tests the SchemaSnapshotStore and how SchemaCache writes and
+restores snapshots.
+"""
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pg_mcp.cache.schema_cache import SchemaCache
+from pg_mcp.cache.snapshot import SNAPSHOT_FORMAT_VERSION, SchemaSnapshotStore
+from pg_mcp.config.settings import CacheConfig
+from pg_mcp.models.schema import (
+    ColumnInfo,
+    DatabaseSchema,
+    EnumTypeInfo,
+    ForeignKeyInfo,
+    IndexInfo,
+    RelationFingerprint,
+    TableInfo,
+)
+
+
+@pytest.fixture
+def sample_schema() -> DatabaseSchema:
+    """Create a fingerprinted sample schema."""
+    return DatabaseSchema(
+        database_name="test_db",
+        tables=[
+            TableInfo(
+                table_name="orders",
+                columns=[
+                    ColumnInfo(
+                        name="id", data_type="integer", is_nullable=False, is_primary_key=True
+                    ),
+                    ColumnInfo(name="user_id", data_type="integer", is_nullable=True),
+                ],
+                foreign_keys=[
+                    ForeignKeyInfo(
+                        constraint_name="orders_user_id_fkey",
+                        column_name="user_id",
+                        referenced_table="users",
+                        referenced_column="id",
+                    )
+                ],
+                indexes=[IndexInfo(name="orders_user_idx", columns=["user_id"])],
+                comment="Customer orders",
+                row_count_estimate=42,
+                oid=16384,
+                fingerprint="abc",
+            )
+        ],
+        enum_types=[EnumTypeInfo(type_name="status", values=["open", "closed"])],
+        version="PostgreSQL 16.2",
+    )
+
+
+class TestSchemaSnapshotStore:
+    """Test suite for SchemaSnapshotStore."""
+
+    def test_save_and_load_round_trip(self, tmp_path: Path, sample_schema: DatabaseSchema):
+        """Test that a saved snapshot loads back identically."""
+        store = SchemaSnapshotStore(tmp_path / "snapshots")
+
+        path = store.save(sample_schema)
+
+        assert path.exists()
+        assert store.load("test_db") == sample_schema
+        # No temporary files are left behind
+        assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+    def test_load_snapshot_save_time(self, tmp_path: Path, sample_schema: DatabaseSchema):
+        """Test that a snapshot is loaded with the time it was saved."""
+        store = SchemaSnapshotStore(tmp_path)
+        before = datetime.now(UTC)
+        store.save(sample_schema)
+
+        snapshot = store.load_snapshot("test_db")
+
+        assert snapshot is not None
+        assert snapshot.schema == sample_schema
+        assert before <= snapshot.saved_at <= datetime.now(UTC)
+
+    def test_load_missing_snapshot_returns_none(self, tmp_path: Path):
+        """Test that a missing snapshot is not an error."""
+        assert SchemaSnapshotStore(tmp_path).load("test_db") is None
+
+    def test_load_ignores_other_format_version(self, tmp_path: Path, sample_schema: DatabaseSchema):
+        """Test that snapshots from another format version are ignored."""
+        store = SchemaSnapshotStore(tmp_path)
+        path = store.save(sample_schema)
+        payload = json.loads(path.read_text())
+        payload["format_version"] = SNAPSHOT_FORMAT_VERSION + 1
+        path.write_text(json.dumps(payload))
+
+        assert store.load("test_db") is None
+
+    @pytest.mark.parametrize("content", ["{not json", '{"format_version": 1, "schema": {}}', "[]"])
+    def test_load_ignores_corrupt_snapshot(self, tmp_path: Path, content: str):
+        """Test that corrupt or invalid snapshots are ignored."""
+        store = SchemaSnapshotStore(tmp_path)
+        store.path_for("test_db").write_text(content)
+
+        assert store.load("test_db") is None
+
+    def test_path_for_sanitizes_database_name(self, tmp_path: Path):
+        """Test that database names cannot escape the snapshot directory."""
+        path = SchemaSnapshotStore(tmp_path).path_for("../etc/passwd")
+
+        assert path.parent == tmp_path
+        assert "/" not in path.name
+
+    def test_delete_removes_snapshot(self, tmp_path: Path, sample_schema: DatabaseSchema):
+        """Test that delete removes the snapshot and tolerates missing files."""
+        store = SchemaSnapshotStore(tmp_path)
+        store.save(sample_schema)
+
+        store.delete("test_db")
+        store.delete("test_db")
+
+        assert store.load("test_db") is None
+
+
+class TestSchemaCacheSnapshots:
+    """Test suite for snapshot integration in SchemaCache."""
+
+    @pytest.mark.asyncio
+    async def test_load_writes_snapshot(self, tmp_path: Path, sample_schema: DatabaseSchema):
+        """Test that a loaded schema is persisted."""
+        cache = SchemaCache(CacheConfig(snapshot_dir=tmp_path))
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect.return_value = sample_schema
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.load("test_db", MagicMock())
+
+        assert SchemaSnapshotStore(tmp_path).load("test_db") == sample_schema
+
+    @pytest.mark.asyncio
+    async def test_snapshot_write_failure_does_not_fail_load(
+        self, tmp_path: Path, sample_schema: DatabaseSchema
+    ):
+        """Test that an unwritable snapshot directory only logs a warning."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = SchemaCache(CacheConfig(snapshot_dir=blocker / "snapshots"))
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect.return_value = sample_schema
+            mock_introspector_class.return_value = mock_introspector
+
+            assert await cache.load("test_db", MagicMock()) is sample_schema
+
+        assert cache.get("test_db") is sample_schema
+
+    @pytest.mark.asyncio
+    async def test_restore_serves_snapshot_and_validates_in_background(
+        self, tmp_path: Path, sample_schema: DatabaseSchema
+    ):
+        """Test that a restored snapshot is served and checked against fingerprints."""
+        SchemaSnapshotStore(tmp_path).save(sample_schema)
+        cache = SchemaCache(CacheConfig(snapshot_dir=tmp_path))
+        validated = asyncio.Event()
+
+        async def fetch_fingerprints() -> list[RelationFingerprint]:
+            await validated.wait()
+            return [RelationFingerprint(oid=16384, fingerprint="abc", row_count_estimate=42)]
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.fetch_fingerprints.side_effect = fetch_fingerprints
+            mock_introspector.introspect_relations.return_value = []
+            mock_introspector.introspect_enum_types.return_value = sample_schema.enum_types
+            mock_introspector_class.return_value = mock_introspector
+
+            restored = await cache.restore_snapshot("test_db", MagicMock())
+
+            assert restored == sample_schema
+            assert cache.get("test_db") is restored
+            assert cache.get_stats()["test_db"]["loading"] is True
+
+            validated.set()
+            await cache._inflight["test_db"]
+
+            mock_introspector.introspect.assert_not_called()
+            mock_introspector.introspect_relations.assert_awaited_once_with([])
+
+        assert cache.get("test_db") == sample_schema
+        stats = cache.get_stats()["test_db"]
+        assert stats["snapshot_restores"] == 1
+        assert stats["loads"] == 0
+
+    @pytest.mark.asyncio
+    async def test_restore_keeps_snapshot_age(self, tmp_path: Path, sample_schema: DatabaseSchema):
+        """Test that a restored snapshot reports its real age until revalidated."""
+        path = SchemaSnapshotStore(tmp_path).save(sample_schema)
+        payload = json.loads(path.read_text())
+        payload["saved_at"] = (datetime.now(UTC) - timedelta(hours=2)).isoformat()
+        path.write_text(json.dumps(payload))
+        cache = SchemaCache(CacheConfig(snapshot_dir=tmp_path, schema_ttl=3600))
+        validated = asyncio.Event()
+
+        async def fetch_fingerprints() -> list[RelationFingerprint]:
+            await validated.wait()
+            return [RelationFingerprint(oid=16384, fingerprint="abc", row_count_estimate=42)]
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.fetch_fingerprints.side_effect = fetch_fingerprints
+            mock_introspector.introspect_relations.return_value = []
+            mock_introspector.introspect_enum_types.return_value = sample_schema.enum_types
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.restore_snapshot("test_db", MagicMock())
+
+            age = cache.get_cache_age("test_db")
+            assert age is not None and age >= 7200
+            # Older than the TTL, but served until revalidation completes
+            assert cache.get("test_db") == sample_schema
+
+            validated.set()
+            await cache._inflight["test_db"]
+
+        age = cache.get_cache_age("test_db")
+        assert age is not None and age < 60
+
+    @pytest.mark.asyncio
+    async def test_load_during_validation_joins_it(
+        self, tmp_path: Path, sample_schema: DatabaseSchema
+    ):
+        """Test that an explicit load waits for the running validation."""
+        SchemaSnapshotStore(tmp_path).save(sample_schema)
+        cache = SchemaCache(CacheConfig(snapshot_dir=tmp_path))
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.fetch_fingerprints.return_value = [
+                RelationFingerprint(oid=16384, fingerprint="changed", row_count_estimate=1)
+            ]
+            mock_introspector.introspect_relations.return_value = [
+                TableInfo(table_name="orders", oid=16384, fingerprint="changed")
+            ]
+            mock_introspector.introspect_enum_types.return_value = []
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.restore_snapshot("test_db", MagicMock())
+            schema = await cache.load("test_db", MagicMock())
+
+            mock_introspector.introspect.assert_not_called()
+
+        assert schema.tables[0].fingerprint == "changed"
+        assert cache.get_stats()["test_db"]["coalesced_loads"] == 1
+        # The validated schema replaces the snapshot on disk
+        assert SchemaSnapshotStore(tmp_path).load("test_db") == schema
+
+    @pytest.mark.asyncio
+    async def test_restore_without_snapshot_returns_none(self, tmp_path: Path):
+        """Test that restore is a no-op when no snapshot exists or it is disabled."""
+        assert (
+            await SchemaCache(CacheConfig(snapshot_dir=tmp_path)).restore_snapshot(
+                "test_db", MagicMock()
+            )
+            is None
+        )
+        assert await SchemaCache(CacheConfig()).restore_snapshot("test_db", MagicMock()) is None
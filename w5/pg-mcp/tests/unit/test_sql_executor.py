@@ -15,7 +15,13 @@ import asyncpg
 import pytest
 
 from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
-from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError
+from pg_mcp.models.errors import (
+    DatabaseError,
+    ExecutionTimeoutError,
+    QueryCostExceededError,
+    RateLimitExceededError,
+)
+from pg_mcp.resilience.rate_limiter import RateLimiter
 from pg_mcp.services.sql_executor import SQLExecutor
 
 
@@ -29,7 +35,8 @@ def create_mock_record(data: dict[str, Any]) -> MagicMock:
         MagicMock that behaves like an asyncpg.Record.
     """
     mock_record = MagicMock()
-    mock_record.__iter__ = MagicMock(return_value=iter(data.items()))
+    # Like asyncpg.Record, iterating yields the values in column order
+    mock_record.__iter__ = lambda self: iter(data.values())
     mock_record.keys = MagicMock(return_value=list(data.keys()))
     mock_record.values = MagicMock(return_value=list(data.values()))
     mock_record.items = MagicMock(return_value=list(data.items()))
@@ -38,6 +45,26 @@ def create_mock_record(data: dict[str, Any]) -> MagicMock:
     return mock_record
 
 
+def set_cursor_rows(conn: MagicMock, records: list[MagicMock]) -> None:
+    """Make the mock connection's cursor yield the given records.
+
+    Like a server-side cursor, ``fetch(n)`` returns at most ``n`` records. The
+    statement reports columns of an unknown type, so values go through the
+    generic serializer.
+
+    Args:
+        conn: Mock connection created by the ``mock_connection`` fixture.
+        records: Records produced by the query.
+    """
+    statement = conn.prepare.return_value
+    statement.cursor.return_value.fetch.side_effect = lambda n: records[:n]
+    unknown = asyncpg.types.Type(0, "unknown", "scalar", "public")
+    names = records[0].keys() if records else []
+    statement.get_attributes.return_value = tuple(
+        asyncpg.types.Attribute(name, unknown) for name in names
+    )
+
+
 @pytest.fixture
 def security_config() -> SecurityConfig:
     """Create a default security configuration for testing."""
@@ -78,6 +105,16 @@ def mock_connection() -> MagicMock:
     conn = MagicMock()
     conn.execute = AsyncMock()
     conn.fetch = AsyncMock()
+    conn.fetchval = AsyncMock()
+
+    # Setup prepared statement returned by ``await conn.prepare(sql)`` and
+    # its server-side cursor
+    cursor = MagicMock()
+    cursor.fetch = AsyncMock(return_value=[])
+    statement = MagicMock()
+    statement.cursor = AsyncMock(return_value=cursor)
+    statement.get_attributes = MagicMock(return_value=())
+    conn.prepare = AsyncMock(return_value=statement)
 
     # Setup transaction context manager
     transaction_mock = MagicMock()
@@ -134,13 +171,16 @@ class TestSQLExecutor:
             create_mock_record({"id": 2, "name": "Bob"}),
         ]
 
-        mock_connection.fetch.return_value = mock_records
+        set_cursor_rows(mock_connection, mock_records)
 
         # Act
-        results, count = await executor.execute(sql)
+        result = await executor.execute(sql)
+        results = result.rows
 
         # Assert
-        assert count == 2
+        assert result.total_row_count == 2
+        assert result.total_row_count_exact is True
+        assert result.truncated is False
         assert len(results) == 2
         assert results[0]["id"] == 1
         assert results[0]["name"] == "Alice"
@@ -149,7 +189,11 @@ class TestSQLExecutor:
 
         # Verify session parameters were set
         assert mock_connection.execute.call_count >= 2  # timeout and search_path
-        mock_connection.fetch.assert_called_once_with(sql)
+        mock_connection.prepare.assert_awaited_once_with(sql)
+        mock_connection.prepare.return_value.cursor.return_value.fetch.assert_awaited_once_with(
+            10001
+        )
+        mock_connection.fetch.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_with_custom_timeout_and_max_rows(
@@ -166,15 +210,15 @@ class TestSQLExecutor:
 
         # Create 200 mock records
         mock_records = [create_mock_record({"id": i, "value": f"row_{i}"}) for i in range(200)]
-        mock_connection.fetch.return_value = mock_records
+        set_cursor_rows(mock_connection, mock_records)
 
         # Act
-        results, count = await executor.execute(
-            sql, timeout=custom_timeout, max_rows=custom_max_rows
-        )
+        result = await executor.execute(sql, timeout=custom_timeout, max_rows=custom_max_rows)
+        results = result.rows
 
         # Assert
-        assert count == 200  # Total count before limiting
+        assert result.truncated is True
+        assert result.total_row_count is None  # Counting disabled by default
         assert len(results) == 100  # Limited to max_rows
         assert results[0]["id"] == 0
         assert results[99]["id"] == 99
@@ -194,7 +238,7 @@ class TestSQLExecutor:
         async def slow_fetch(*args: Any, **kwargs: Any) -> None:
             await asyncio.sleep(10)
 
-        mock_connection.fetch = slow_fetch
+        mock_connection.prepare.return_value.cursor.return_value.fetch = slow_fetch
 
         # Act & Assert
         with pytest.raises(ExecutionTimeoutError) as exc_info:
@@ -216,7 +260,7 @@ class TestSQLExecutor:
         pg_error = asyncpg.PostgresError("relation 'nonexistent_table' does not exist")
         pg_error.sqlstate = "42P01"
 
-        mock_connection.fetch.side_effect = pg_error
+        mock_connection.prepare.side_effect = pg_error
 
         # Act & Assert
         with pytest.raises(DatabaseError) as exc_info:
@@ -225,6 +269,40 @@ class TestSQLExecutor:
         assert "database query failed" in str(exc_info.value.message).lower()
         assert exc_info.value.details["error_code"] == "42P01"
 
+    @pytest.mark.asyncio
+    async def test_pool_exhausted_error(
+        self,
+        executor: SQLExecutor,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Test that waiting too long for a pooled connection fails the query."""
+        mock_pool.acquire.return_value.__aenter__.side_effect = TimeoutError()
+
+        with pytest.raises(DatabaseError) as exc_info:
+            await executor.execute("SELECT 1")
+
+        assert "waiting for a connection to database 'testdb'" in exc_info.value.message
+        mock_pool.acquire.assert_called_once_with(timeout=30.0)
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_before_connection(
+        self,
+        mock_pool: MagicMock,
+        security_config: SecurityConfig,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that a full query limiter fails before taking a connection."""
+        limiter = RateLimiter(max_concurrent=1, name="queries", queue_timeout=0.01)
+        executor = SQLExecutor(mock_pool, security_config, db_config, rate_limiter=limiter)
+        await limiter.acquire()
+
+        with pytest.raises(RateLimitExceededError):
+            await executor.execute("SELECT 1")
+
+        mock_pool.acquire.assert_not_called()
+        limiter.release()
+        assert limiter.active_count == 0
+
     @pytest.mark.asyncio
     async def test_session_params_basic(
         self,
@@ -235,7 +313,7 @@ class TestSQLExecutor:
         """Test that basic session parameters are set correctly."""
         # Arrange
         sql = "SELECT 1"
-        mock_connection.fetch.return_value = [create_mock_record({"column": 1})]
+        set_cursor_rows(mock_connection, [create_mock_record({"column": 1})])
 
         # Act
         await executor.execute(sql, timeout=15.0)
@@ -272,7 +350,7 @@ class TestSQLExecutor:
             db_config=db_config,
         )
         sql = "SELECT 1"
-        mock_connection.fetch.return_value = [create_mock_record({"column": 1})]
+        set_cursor_rows(mock_connection, [create_mock_record({"column": 1})])
 
         # Act
         await executor.execute(sql)
@@ -351,6 +429,75 @@ class TestSQLExecutor:
         assert "invalid readonly_role" in str(exc_info.value.message).lower()
 
 
+class TestPerConnectionSessionSetup:
+    """Test suite for executing with per-connection session setup."""
+
+    @pytest.fixture
+    def executor(self, mock_pool: MagicMock, db_config: DatabaseConfig) -> SQLExecutor:
+        """Create an executor whose pool applies search_path and role per connection."""
+        return SQLExecutor(
+            pool=mock_pool,
+            security_config=SecurityConfig(
+                session_setup="per_connection", readonly_role="readonly_user"
+            ),
+            db_config=db_config,
+        )
+
+    @pytest.mark.asyncio
+    async def test_single_setup_round_trip(
+        self, executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that BEGIN and SET LOCAL are sent in one call and no SET is repeated."""
+        set_cursor_rows(mock_connection, [create_mock_record({"column": 1})])
+
+        result = await executor.execute("SELECT 1", timeout=15.0)
+
+        assert result.rows == [{"column": 1}]
+        commands = [call.args[0] for call in mock_connection.execute.call_args_list]
+        assert commands == [
+            "BEGIN READ ONLY; SET LOCAL statement_timeout = 15000",
+            "COMMIT",
+        ]
+        mock_connection.transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rollback_on_error(
+        self, executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that a failing query rolls the transaction back."""
+        mock_connection.prepare.side_effect = asyncpg.PostgresError("boom")
+
+        with pytest.raises(DatabaseError):
+            await executor.execute("SELECT 1")
+
+        commands = [call.args[0] for call in mock_connection.execute.call_args_list]
+        assert commands[-1] == "ROLLBACK"
+        assert "COMMIT" not in commands
+
+    @pytest.mark.asyncio
+    async def test_row_count_uses_savepoint(
+        self, mock_pool: MagicMock, mock_connection: MagicMock, db_config: DatabaseConfig
+    ) -> None:
+        """Test that counting a truncated result runs in a plain SAVEPOINT."""
+        executor = SQLExecutor(
+            mock_pool,
+            SecurityConfig(session_setup="per_connection", row_count_mode="capped"),
+            db_config,
+        )
+        set_cursor_rows(mock_connection, [create_mock_record({"id": i}) for i in range(20)])
+        mock_connection.fetchval.return_value = 20
+
+        result = await executor.execute("SELECT id FROM t", max_rows=10)
+
+        assert result.total_row_count == 20
+        commands = [call.args[0] for call in mock_connection.execute.call_args_list]
+        assert commands[1:] == [
+            "SAVEPOINT pg_mcp_row_count",
+            "RELEASE SAVEPOINT pg_mcp_row_count",
+            "COMMIT",
+        ]
+
+
 class TestResultSerialization:
     """Test suite for result serialization."""
 
@@ -580,14 +727,17 @@ class TestRowLimiting:
 
         # Create 100 mock records
         mock_records = [create_mock_record({"id": i, "value": f"row_{i}"}) for i in range(100)]
-        mock_connection.fetch.return_value = mock_records
+        set_cursor_rows(mock_connection, mock_records)
 
         # Act
-        results, count = await executor.execute(sql, max_rows=max_rows)
+        result = await executor.execute(sql, max_rows=max_rows)
+        results = result.rows
 
         # Assert
-        assert count == 100  # Total count
+        assert result.truncated is True
         assert len(results) == 10  # Limited results
+        # Only one row past the limit is fetched from the cursor
+        mock_connection.prepare.return_value.cursor.return_value.fetch.assert_awaited_once_with(11)
         # Verify we got the first N rows
         for i in range(10):
             assert results[i]["id"] == i
@@ -606,11 +756,190 @@ class TestRowLimiting:
 
         # Create only 10 records
         mock_records = [create_mock_record({"id": i, "value": f"row_{i}"}) for i in range(10)]
-        mock_connection.fetch.return_value = mock_records
+        set_cursor_rows(mock_connection, mock_records)
 
         # Act
-        results, count = await executor.execute(sql, max_rows=max_rows)
+        result = await executor.execute(sql, max_rows=max_rows)
 
         # Assert
-        assert count == 10
-        assert len(results) == 10  # All results returned
+        assert result.truncated is False
+        assert result.total_row_count == 10
+        assert len(result.rows) == 10  # All results returned
+        mock_connection.fetchval.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_capped_count_reports_exact_total(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that a count below the cap is reported as exact."""
+        executor = SQLExecutor(
+            mock_pool, SecurityConfig(row_count_mode="capped", row_count_cap=1000), db_config
+        )
+        set_cursor_rows(mock_connection, [create_mock_record({"id": i}) for i in range(100)])
+        mock_connection.fetchval.return_value = 100
+
+        result = await executor.execute("SELECT id FROM t;", max_rows=10)
+
+        assert result.truncated is True
+        assert result.total_row_count == 100
+        assert result.total_row_count_exact is True
+        count_sql = mock_connection.fetchval.call_args[0][0]
+        assert "(SELECT id FROM t\n) AS q LIMIT 1001" in count_sql
+
+    @pytest.mark.asyncio
+    async def test_count_ignores_pushed_down_limit(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that the total is counted from count_sql, not the limited SQL."""
+        executor = SQLExecutor(
+            mock_pool, SecurityConfig(row_count_mode="capped", row_count_cap=1000), db_config
+        )
+        set_cursor_rows(mock_connection, [create_mock_record({"id": i}) for i in range(11)])
+        mock_connection.fetchval.return_value = 500
+
+        result = await executor.execute(
+            "SELECT id FROM t LIMIT 11", max_rows=10, count_sql="SELECT id FROM t"
+        )
+
+        assert result.truncated is True
+        assert result.total_row_count == 500
+        assert result.total_row_count_exact is True
+        count_sql = mock_connection.fetchval.call_args[0][0]
+        assert "(SELECT id FROM t\n) AS q LIMIT 1001" in count_sql
+        assert "LIMIT 11" not in count_sql
+
+    @pytest.mark.asyncio
+    async def test_capped_count_reaching_cap_is_inexact(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that a count above the cap reports the cap as a lower bound."""
+        executor = SQLExecutor(
+            mock_pool, SecurityConfig(row_count_mode="capped", row_count_cap=50), db_config
+        )
+        set_cursor_rows(mock_connection, [create_mock_record({"id": i}) for i in range(100)])
+        mock_connection.fetchval.return_value = 51
+
+        result = await executor.execute("SELECT id FROM t", max_rows=10)
+
+        assert result.total_row_count == 50
+        assert result.total_row_count_exact is False
+
+    @pytest.mark.asyncio
+    async def test_estimate_count_uses_planner_rows(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that estimate mode reads the planner row estimate."""
+        executor = SQLExecutor(mock_pool, SecurityConfig(row_count_mode="estimate"), db_config)
+        set_cursor_rows(mock_connection, [create_mock_record({"id": i}) for i in range(100)])
+        mock_connection.fetchval.return_value = '[{"Plan": {"Plan Rows": 12345}}]'
+
+        result = await executor.execute("SELECT id FROM t", max_rows=10)
+
+        assert result.total_row_count == 12345
+        assert result.total_row_count_exact is False
+        assert mock_connection.fetchval.call_args[0][0].startswith("EXPLAIN (FORMAT JSON)")
+
+    @pytest.mark.asyncio
+    async def test_estimate_count_ignores_pushed_down_limit(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that the plan estimated is the one without the row limit."""
+        executor = SQLExecutor(mock_pool, SecurityConfig(row_count_mode="estimate"), db_config)
+        set_cursor_rows(mock_connection, [create_mock_record({"id": i}) for i in range(11)])
+        mock_connection.fetchval.return_value = '[{"Plan": {"Plan Rows": 12345}}]'
+
+        result = await executor.execute(
+            "SELECT id FROM t LIMIT 11", max_rows=10, count_sql="SELECT id FROM t"
+        )
+
+        assert result.total_row_count == 12345
+        assert mock_connection.fetchval.call_args[0][0] == "EXPLAIN (FORMAT JSON) SELECT id FROM t"
+
+    @pytest.mark.asyncio
+    async def test_count_failure_reports_unknown_total(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that a failing count does not fail the query."""
+        executor = SQLExecutor(mock_pool, SecurityConfig(row_count_mode="capped"), db_config)
+        set_cursor_rows(mock_connection, [create_mock_record({"id": i}) for i in range(100)])
+        mock_connection.fetchval.side_effect = asyncpg.PostgresError("canceling statement")
+
+        result = await executor.execute("SELECT id FROM t", max_rows=10)
+
+        assert len(result.rows) == 10
+        assert result.truncated is True
+        assert result.total_row_count is None
+
+
+class TestCostGate:
+    """Test the EXPLAIN cost gate."""
+
+    @pytest.mark.asyncio
+    async def test_expensive_plan_rejected_before_fetching(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that a plan above the limits is rejected without running the query."""
+        executor = SQLExecutor(mock_pool, SecurityConfig(max_plan_cost=1000.0), db_config)
+        mock_connection.fetchval.return_value = (
+            '[{"Plan": {"Node Type": "Seq Scan", "Relation Name": "events", '
+            '"Plan Rows": 50000000, "Total Cost": 900000.0}}]'
+        )
+
+        with pytest.raises(QueryCostExceededError, match="seq scan on events"):
+            await executor.execute("SELECT * FROM events;")
+
+        assert mock_connection.fetchval.call_args[0][0] == (
+            "EXPLAIN (FORMAT JSON) SELECT * FROM events"
+        )
+        mock_connection.prepare.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cheap_plan_executes(
+        self,
+        mock_pool: MagicMock,
+        mock_connection: MagicMock,
+        db_config: DatabaseConfig,
+    ) -> None:
+        """Test that a plan within the limits runs in the same transaction."""
+        executor = SQLExecutor(mock_pool, SecurityConfig(max_plan_rows=1000), db_config)
+        mock_connection.fetchval.return_value = (
+            '[{"Plan": {"Node Type": "Index Scan", "Plan Rows": 1, "Total Cost": 8.3}}]'
+        )
+        set_cursor_rows(mock_connection, [create_mock_record({"id": 1})])
+
+        result = await executor.execute("SELECT id FROM users WHERE id = 1")
+
+        assert len(result.rows) == 1
+        mock_connection.transaction.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_gate_disabled_by_default(
+        self,
+        executor: SQLExecutor,
+        mock_connection: MagicMock,
+    ) -> None:
+        """Test that no EXPLAIN is sent without cost limits."""
+        await executor.execute("SELECT 1")
+
+        mock_connection.fetchval.assert_not_called()
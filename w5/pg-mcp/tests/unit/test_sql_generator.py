@@ -10,7 +10,12 @@ import pytest
 from pydantic import SecretStr
 
 from pg_mcp.config.settings import OpenAIConfig
-from pg_mcp.models.errors import LLMError, LLMTimeoutError, LLMUnavailableError
+from pg_mcp.models.errors import (
+    LLMError,
+    LLMTimeoutError,
+    LLMUnavailableError,
+    RateLimitExceededError,
+)
 from pg_mcp.models.schema import (
     ColumnInfo,
     DatabaseSchema,
@@ -18,6 +23,7 @@ from pg_mcp.models.schema import (
     IndexInfo,
     TableInfo,
 )
+from pg_mcp.resilience.rate_limiter import RateLimiter
 from pg_mcp.services.sql_generator import SQLGenerator
 
 
@@ -509,6 +515,26 @@ LIMIT 10;"""
             assert call_kwargs["temperature"] == 0.5
             assert call_kwargs["max_tokens"] == 1000
 
+    @pytest.mark.asyncio
+    async def test_generate_with_usage(
+        self, generator: SQLGenerator, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that a temperature override is used and token usage returned."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="```sql\nSELECT 1;\n```"))]
+        mock_response.usage = MagicMock(total_tokens=321)
+
+        with patch.object(
+            generator.client.chat.completions, "create", new=AsyncMock(return_value=mock_response)
+        ) as mock_create:
+            sql, tokens = await generator.generate_with_usage(
+                "Test query", mock_schema, temperature=0.8
+            )
+
+            assert mock_create.call_args.kwargs["temperature"] == 0.8
+            assert sql == "SELECT 1;"
+            assert tokens == 321
+
     @pytest.mark.asyncio
     async def test_generate_includes_schema_context(
         self, generator: SQLGenerator, mock_schema: DatabaseSchema
@@ -530,6 +556,25 @@ LIMIT 10;"""
             assert "orders" in user_prompt
             assert "PostgreSQL Version: 15.0" in user_prompt
 
+    @pytest.mark.asyncio
+    async def test_generate_uses_schema_context_override(
+        self, generator: SQLGenerator, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that a pre-rendered schema context replaces the full schema."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="```sql\nSELECT 1;\n```"))]
+
+        with patch.object(
+            generator.client.chat.completions, "create", new=AsyncMock(return_value=mock_response)
+        ) as mock_create:
+            await generator.generate(
+                "Test query", mock_schema, schema_context="Table: public.orders_only"
+            )
+
+            user_prompt = mock_create.call_args.kwargs["messages"][1]["content"]
+            assert "Table: public.orders_only" in user_prompt
+            assert "Table: public.users" not in user_prompt
+
     @pytest.mark.asyncio
     async def test_generate_generic_error(
         self, generator: SQLGenerator, mock_schema: DatabaseSchema
@@ -545,3 +590,40 @@ LIMIT 10;"""
 
             assert "OpenAI API request failed" in str(exc_info.value)
             assert exc_info.value.details["error"] == "Unknown error occurred"
+
+    @pytest.mark.asyncio
+    async def test_generate_holds_rate_limiter_slot(
+        self, config: OpenAIConfig, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that the API call runs inside an LLM rate limiter slot."""
+        limiter = RateLimiter(max_concurrent=1, name="llm")
+        generator = SQLGenerator(config, rate_limiter=limiter)
+        active_during_call: list[int] = []
+
+        async def create(**_kwargs: object) -> MagicMock:
+            active_during_call.append(limiter.active_count)
+            return MagicMock(choices=[MagicMock(message=MagicMock(content="SELECT 1;"))])
+
+        with patch.object(generator.client.chat.completions, "create", new=create):
+            await generator.generate("Count users", mock_schema)
+
+        assert active_during_call == [1]
+        assert limiter.active_count == 0
+
+    @pytest.mark.asyncio
+    async def test_generate_rate_limited(
+        self, config: OpenAIConfig, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that a full LLM limiter fails fast without calling OpenAI."""
+        limiter = RateLimiter(max_concurrent=1, name="llm", queue_timeout=0.01)
+        generator = SQLGenerator(config, rate_limiter=limiter)
+        await limiter.acquire()
+
+        with (
+            patch.object(generator.client.chat.completions, "create", new=AsyncMock()) as create,
+            pytest.raises(RateLimitExceededError) as exc_info,
+        ):
+            await generator.generate("Count users", mock_schema)
+
+        create.assert_not_called()
+        assert exc_info.value.details["limiter"] == "llm"
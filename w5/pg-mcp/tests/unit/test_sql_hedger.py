@@ -0,0 +1,191 @@
+"""Unit tests for hedged SQL generation."""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pg_mcp.config.settings import HedgingConfig, SecurityConfig
+from pg_mcp.models.errors import LLMError, LLMTimeoutError
+from pg_mcp.models.schema import DatabaseSchema
+from pg_mcp.services.sql_hedger import MIN_LATENCY_SAMPLES, SQLHedger
+from pg_mcp.services.sql_validator import SQLValidator
+
+VALID_SQL = "SELECT id FROM users"
+INVALID_SQL = "DELETE FROM users"
+
+
+class ScriptedGenerator:
+    """Generator whose calls follow a script of (delay, SQL or error, tokens)."""
+
+    def __init__(self, *script: tuple[float, str | Exception, int | None]) -> None:
+        self.script = list(script)
+        self.calls: list[dict[str, Any]] = []
+        self.cancelled: list[int] = []
+
+    async def generate_with_usage(self, **kwargs: Any) -> tuple[str, int | None]:
+        index = len(self.calls)
+        self.calls.append(kwargs)
+        delay, result, tokens = self.script[index]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(index)
+            raise
+        if isinstance(result, Exception):
+            raise result
+        return result, tokens
+
+
+@pytest.fixture
+def schema() -> DatabaseSchema:
+    """Create an empty schema."""
+    return DatabaseSchema(database_name="db")
+
+
+def make_hedger(generator: ScriptedGenerator, **config: Any) -> SQLHedger:
+    """Create a hedger with a real validator."""
+    return SQLHedger(
+        generator,  # type: ignore[arg-type]
+        SQLValidator(SecurityConfig()),
+        HedgingConfig(enabled=True, **config),
+        metrics=MagicMock(),
+    )
+
+
+class TestSQLHedger:
+    """Test suite for SQLHedger."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self, schema: DatabaseSchema) -> None:
+        """Test that a valid answer within the delay costs one call."""
+        generator = ScriptedGenerator((0.0, VALID_SQL, 100), (0.0, VALID_SQL, 100))
+        hedger = make_hedger(generator, initial_delay=1.0)
+
+        result = await hedger.generate(question="q", schema=schema)
+
+        assert result.valid is True
+        assert result.sql == VALID_SQL
+        assert result.winner == 0
+        assert result.candidates == 1
+        assert result.tokens_used == 100
+        assert len(generator.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self, schema: DatabaseSchema) -> None:
+        """Test that a hedge launched after the delay can win."""
+        generator = ScriptedGenerator((10.0, VALID_SQL, None), (0.0, VALID_SQL, 80))
+        hedger = make_hedger(generator, initial_delay=0.01)
+
+        result = await asyncio.wait_for(hedger.generate(question="q", schema=schema), 1.0)
+
+        assert result.winner == 1
+        assert result.candidates == 2
+        assert generator.cancelled == [0]
+        stats = hedger.get_stats()
+        assert stats["hedge_wins"] == 1
+        assert stats["cancelled"] == 1
+        assert stats["hedged_attempts"] == 1
+        hedger.metrics.increment_sql_hedge_candidate.assert_any_call("cancelled")  # type: ignore[union-attr]
+        hedger.metrics.observe_sql_generation.assert_called_once()  # type: ignore[union-attr]
+        assert hedger.metrics.observe_sql_generation.call_args.kwargs["hedged"] is True  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_candidate_latency_is_recorded(self, schema: DatabaseSchema) -> None:
+        """Test that a cancelled slow candidate still adds a latency sample."""
+        generator = ScriptedGenerator((10.0, VALID_SQL, None), (0.0, VALID_SQL, 80))
+        hedger = make_hedger(generator, initial_delay=0.05)
+
+        await asyncio.wait_for(hedger.generate(question="q", schema=schema), 1.0)
+
+        assert generator.cancelled == [0]
+        assert hedger.get_stats()["latency_samples"] == 2
+        assert max(hedger._latencies) >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_invalid_primary_hedges_immediately(self, schema: DatabaseSchema) -> None:
+        """Test that an invalid candidate does not wait out the delay."""
+        generator = ScriptedGenerator((0.0, INVALID_SQL, 50), (0.0, VALID_SQL, 60))
+        hedger = make_hedger(generator, initial_delay=30.0, temperatures=[0.0, 0.7])
+
+        result = await asyncio.wait_for(hedger.generate(question="q", schema=schema), 1.0)
+
+        assert result.sql == VALID_SQL
+        assert result.winner == 1
+        assert result.tokens_used == 110
+        assert [call["temperature"] for call in generator.calls] == [0.0, 0.7]
+        assert hedger.get_stats()["discarded_tokens"] == 50
+        hedger.metrics.increment_sql_hedge_tokens.assert_any_call("discarded", 50)  # type: ignore[union-attr]
+        hedger.metrics.increment_sql_hedge_tokens.assert_any_call("accepted", 60)  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_parallel_first_valid_wins(self, schema: DatabaseSchema) -> None:
+        """Test that parallel mode launches every candidate and skips invalid ones."""
+        generator = ScriptedGenerator(
+            (0.0, INVALID_SQL, None), (0.02, VALID_SQL, None), (10.0, VALID_SQL, None)
+        )
+        hedger = make_hedger(generator, mode="parallel", max_candidates=3)
+
+        result = await asyncio.wait_for(hedger.generate(question="q", schema=schema), 1.0)
+
+        assert result.sql == VALID_SQL
+        assert result.winner == 1
+        assert result.candidates == 3
+        assert generator.cancelled == [2]
+
+    @pytest.mark.asyncio
+    async def test_no_valid_candidate(self, schema: DatabaseSchema) -> None:
+        """Test that the last invalid candidate is returned for feedback."""
+        generator = ScriptedGenerator((0.0, INVALID_SQL, None), (0.0, "DROP TABLE users", None))
+        hedger = make_hedger(generator)
+
+        result = await hedger.generate(question="q", schema=schema)
+
+        assert result.valid is False
+        assert result.sql == "DROP TABLE users"
+        assert result.winner is None
+
+    @pytest.mark.asyncio
+    async def test_failed_candidate_is_hedged(self, schema: DatabaseSchema) -> None:
+        """Test that an LLM error is absorbed while another candidate succeeds."""
+        generator = ScriptedGenerator(
+            (0.0, LLMTimeoutError(message="timed out"), None), (0.0, VALID_SQL, None)
+        )
+        hedger = make_hedger(generator, initial_delay=30.0)
+
+        result = await asyncio.wait_for(hedger.generate(question="q", schema=schema), 1.0)
+
+        assert result.winner == 1
+
+    @pytest.mark.asyncio
+    async def test_all_candidates_fail(self, schema: DatabaseSchema) -> None:
+        """Test that the first error is raised when every candidate fails."""
+        generator = ScriptedGenerator(
+            (0.0, LLMTimeoutError(message="timed out"), None),
+            (0.0, LLMError(message="bad response"), None),
+        )
+        hedger = make_hedger(generator)
+
+        with pytest.raises(LLMTimeoutError):
+            await hedger.generate(question="q", schema=schema)
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_cancels_candidates(self, schema: DatabaseSchema) -> None:
+        """Test that an unexpected error propagates and cancels the others."""
+        generator = ScriptedGenerator((0.0, RuntimeError("boom"), None), (10.0, VALID_SQL, None))
+        hedger = make_hedger(generator, mode="parallel")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await hedger.generate(question="q", schema=schema)
+
+        assert generator.cancelled == [1]
+
+    def test_hedge_delay_percentile(self) -> None:
+        """Test that the delay follows recent latencies once enough are known."""
+        hedger = make_hedger(ScriptedGenerator(), initial_delay=3.0, delay_percentile=90.0)
+        assert hedger.get_stats()["hedge_delay_seconds"] == 3.0
+
+        hedger._latencies.extend(float(i) for i in range(1, MIN_LATENCY_SAMPLES + 1))
+
+        assert hedger.get_stats()["hedge_delay_seconds"] == 18.0
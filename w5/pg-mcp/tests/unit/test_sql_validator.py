@@ -13,7 +13,7 @@ import pytest
 
 from pg_mcp.config.settings import SecurityConfig
 from pg_mcp.models.errors import SecurityViolationError, SQLParseError
-from pg_mcp.services.sql_validator import SQLValidator
+from pg_mcp.services.sql_validator import ParsedStatement, SQLValidator
 
 
 class TestValidStatements:
@@ -258,6 +258,13 @@ class TestDangerousFunctions:
             validator.validate_or_raise(sql)
         assert "pg_terminate_backend" in str(exc_info.value).lower()
 
+    def test_set_config_blocked(self, validator: SQLValidator) -> None:
+        """Test set_config, which could switch the session role, is blocked."""
+        sql = "SELECT set_config('role', 'postgres', false), * FROM users"
+        with pytest.raises(SecurityViolationError) as exc_info:
+            validator.validate_or_raise(sql)
+        assert "set_config" in str(exc_info.value).lower()
+
     def test_custom_blocked_function(self) -> None:
         """Test custom blocked function from config."""
         config = SecurityConfig(blocked_functions=["my_custom_func", "another_func"])
@@ -571,6 +578,178 @@ class TestValidatorHelperMethods:
         with pytest.raises(SQLParseError):
             validator.extract_tables(sql)
 
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            (
+                "SELECT * FROM orders WHERE created_at > now() - interval '1 day'",
+                ["current_timestamp"],
+            ),
+            ("SELECT current_date, random() FROM users", ["current_date", "random"]),
+            ("SELECT clock_timestamp(), nextval('seq')", ["clock_timestamp", "nextval"]),
+            ("SELECT * FROM users WHERE birthday = 'today'::date", ["today"]),
+            ("SELECT age(birthday), age(a, b) FROM users", ["age"]),
+            ("SELECT upper(name), count(*) FROM users GROUP BY 1", []),
+        ],
+    )
+    def test_extract_volatile_functions(
+        self, validator: SQLValidator, sql: str, expected: list[str]
+    ) -> None:
+        """Test that clock, random and sequence functions are found."""
+        assert validator.extract_volatile_functions(sql) == expected
+
+
+class TestRowLimitPushdown:
+    """Test pushing the row limit into validated SQL."""
+
+    @pytest.fixture
+    def validator(self) -> SQLValidator:
+        """Create validator with a small row limit."""
+        return SQLValidator(config=SecurityConfig(max_rows=100))
+
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            ("SELECT id FROM users;", "SELECT id FROM users LIMIT 101"),
+            (
+                "SELECT id FROM users UNION SELECT user_id FROM orders",
+                "SELECT id FROM users UNION SELECT user_id FROM orders LIMIT 101",
+            ),
+            (
+                "WITH recent AS (SELECT * FROM orders) SELECT * FROM recent",
+                "WITH recent AS (SELECT * FROM orders) SELECT * FROM recent LIMIT 101",
+            ),
+            (
+                "SELECT status, count(*) FROM orders GROUP BY status",
+                "SELECT status, COUNT(*) FROM orders GROUP BY status LIMIT 101",
+            ),
+            (
+                "SELECT id FROM users LIMIT 5000 OFFSET 10",
+                "SELECT id FROM users LIMIT 101 OFFSET 10",
+            ),
+            ("SELECT id FROM users LIMIT ALL", "SELECT id FROM users LIMIT 101"),
+            ("SELECT id FROM users FETCH FIRST 500 ROWS ONLY", "SELECT id FROM users LIMIT 101"),
+        ],
+    )
+    def test_limit_injected_or_tightened(
+        self, validator: SQLValidator, sql: str, expected: str
+    ) -> None:
+        """Test that an outer LIMIT of max_rows + 1 is added or tightened."""
+        assert validator.apply_row_limit(sql) == expected
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT count(*) FROM users",
+            "SELECT count(*), max(created_at) FROM orders WHERE total > 10",
+            "SELECT id FROM users ORDER BY id LIMIT 20",
+            "SELECT id FROM users FETCH FIRST 5 ROWS ONLY",
+            "SELECT id FROM users ORDER BY score FETCH FIRST 500 ROWS WITH TIES",
+            "SELECT id FROM users LIMIT $1",
+        ],
+    )
+    def test_sql_left_unchanged(self, validator: SQLValidator, sql: str) -> None:
+        """Test that aggregate-only queries and small or opaque limits are kept."""
+        assert validator.apply_row_limit(sql) == sql
+
+    def test_window_aggregate_is_limited(self, validator: SQLValidator) -> None:
+        """Test that window aggregates, which keep every row, get a limit."""
+        sql = "SELECT id, count(*) OVER () FROM users"
+        assert validator.apply_row_limit(sql).endswith("LIMIT 101")
+
+    def test_explicit_max_rows(self, validator: SQLValidator) -> None:
+        """Test overriding the configured row limit."""
+        assert validator.apply_row_limit("SELECT id FROM users", max_rows=9).endswith("LIMIT 10")
+
+    def test_invalid_sql(self, validator: SQLValidator) -> None:
+        """Test that unparsable SQL raises SQLParseError."""
+        with pytest.raises(SQLParseError):
+            validator.apply_row_limit("SELECT * FROM WHERE")
+
+
+class TestParseCache:
+    """Test that SQL is parsed once and shared between validation steps."""
+
+    @pytest.fixture
+    def validator(self) -> SQLValidator:
+        """Create validator with a small parse cache."""
+        return SQLValidator(config=SecurityConfig(max_rows=100), parse_cache_size=2)
+
+    def test_repeated_sql_is_parsed_once(self, validator: SQLValidator) -> None:
+        """Test that every step on the same SQL reuses one parse."""
+        sql = "SELECT id FROM users JOIN orders ON orders.user_id = users.id"
+
+        parsed = validator.validate_or_raise(sql)
+        assert validator.extract_tables(sql) == ["orders", "users"]
+        assert validator.normalize_sql(sql) == parsed.normalized
+        assert validator.parse(sql) is parsed
+
+        stats = validator.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 3
+
+    def test_parsed_statement_passed_through(self, validator: SQLValidator) -> None:
+        """Test that a parsed statement is accepted by every step."""
+        parsed = validator.parse("SELECT id FROM users")
+
+        assert isinstance(parsed, ParsedStatement)
+        assert validator.validate_or_raise(parsed) is parsed
+        assert validator.validate(parsed) == (True, None)
+        assert validator.extract_tables(parsed) == ["users"]
+        assert validator.apply_row_limit(parsed) == "SELECT id FROM users LIMIT 101"
+        assert validator.get_stats()["misses"] == 1
+
+    def test_row_limit_does_not_change_cached_statement(self, validator: SQLValidator) -> None:
+        """Test that the rewrite copies the shared tree and caches the result."""
+        sql = "SELECT id FROM users"
+        parsed = validator.parse(sql)
+
+        limited = validator.apply_row_limit(sql)
+
+        assert limited == "SELECT id FROM users LIMIT 101"
+        assert parsed.statement.args.get("limit") is None
+        assert validator.normalize_sql(sql) == "SELECT id FROM users"
+        misses = validator.get_stats()["misses"]
+        assert validator.extract_tables(limited) == ["users"]
+        assert validator.get_stats()["misses"] == misses
+
+    def test_least_recently_used_evicted(self, validator: SQLValidator) -> None:
+        """Test that the cache is bounded and evicts the least recently used SQL."""
+        first = validator.parse("SELECT 1")
+        validator.parse("SELECT 2")
+        validator.parse("SELECT 1")
+        validator.parse("SELECT 3")
+
+        assert validator.get_stats()["size"] == 2
+        assert validator.parse("SELECT 1") is first
+        assert validator.get_stats()["misses"] == 3
+        validator.parse("SELECT 2")
+        assert validator.get_stats()["misses"] == 4
+
+    def test_cache_disabled(self) -> None:
+        """Test that a zero-sized cache parses every time."""
+        validator = SQLValidator(config=SecurityConfig(), parse_cache_size=0)
+
+        assert validator.parse("SELECT 1") is not validator.parse("SELECT 1")
+        assert validator.get_stats()["size"] == 0
+
+    def test_parse_errors_not_cached(self, validator: SQLValidator) -> None:
+        """Test that unparsable SQL raises every time and is not stored."""
+        for _ in range(2):
+            with pytest.raises(SQLParseError):
+                validator.parse("SELECT * FROM WHERE")
+        assert validator.get_stats()["size"] == 0
+
+    def test_multiple_statements(self, validator: SQLValidator) -> None:
+        """Test that helpers still cover every statement of multi-statement SQL."""
+        sql = "SELECT 1 FROM a; SELECT 2 FROM b"
+
+        assert validator.extract_tables(sql) == ["a", "b"]
+        assert validator.normalize_sql(sql) == "SELECT 1 FROM a; SELECT 2 FROM b"
+        assert validator.apply_row_limit(sql) == sql
+        with pytest.raises(SecurityViolationError):
+            validator.validate_or_raise(sql)
+
 
 class TestCTEWithDangerousOperations:
     """Test CTE (Common Table Expressions) with dangerous operations."""
@@ -0,0 +1,195 @@
+"""Unit tests for request spans and span export."""
+
+import asyncio
+import io
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from pg_mcp.observability.instrumentation import Stage, stage_timer
+from pg_mcp.observability.tracing import (
+    JsonLinesSpanExporter,
+    RequestTrace,
+    get_current_trace,
+    span,
+    trace_scope,
+)
+
+REQUEST_ID = "1b4e28ba-2fa1-41d2-883f-0016d3cca427"
+
+
+class TestSpans:
+    """Test suite for span recording."""
+
+    def test_no_trace_records_nothing(self) -> None:
+        """Test that spans outside a trace are no-ops."""
+        assert get_current_trace() is None
+        with span("generate_sql") as attributes:
+            attributes["cached"] = True
+        with stage_timer(None, Stage.EXECUTE):
+            pass
+
+    def test_nested_spans(self) -> None:
+        """Test that spans nest in the span they were opened in."""
+        trace = RequestTrace(REQUEST_ID)
+
+        with trace_scope(trace):
+            with span("generate_sql", attempt=1) as attributes:
+                with stage_timer(None, Stage.LLM_GENERATE, "sales"):
+                    pass
+                attributes["cached"] = False
+            with stage_timer(None, Stage.EXECUTE, "sales"):
+                pass
+        root = trace.finish("query")
+
+        by_name = {s.name: s for s in trace.spans}
+        assert by_name["generate_sql"].parent_id == root.span_id
+        assert by_name["generate_sql"].attributes == {"attempt": 1, "cached": False}
+        assert by_name["llm_generate"].parent_id == by_name["generate_sql"].span_id
+        assert by_name["llm_generate"].attributes == {"database": "sales"}
+        assert by_name["execute"].parent_id == root.span_id
+        assert root.parent_id is None
+        assert root.attributes["request_id"] == REQUEST_ID
+        assert get_current_trace() is None
+
+    def test_failed_span_recorded(self) -> None:
+        """Test that a span is recorded when its operation raises."""
+        trace = RequestTrace(REQUEST_ID)
+
+        with trace_scope(trace), pytest.raises(ValueError), span("validate"):
+            raise ValueError("invalid")
+
+        assert [s.name for s in trace.spans] == ["validate"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_share_trace(self) -> None:
+        """Test that tasks started within a trace record into it."""
+        trace = RequestTrace(REQUEST_ID)
+
+        async def candidate() -> None:
+            with stage_timer(None, Stage.LLM_GENERATE):
+                await asyncio.sleep(0)
+
+        with trace_scope(trace), span("generate_sql"):
+            await asyncio.gather(candidate(), candidate())
+
+        names = sorted(s.name for s in trace.spans)
+        assert names == ["generate_sql", "llm_generate", "llm_generate"]
+
+
+class TestRequestTrace:
+    """Test suite for RequestTrace."""
+
+    def test_trace_id_from_request_id(self) -> None:
+        """Test that a UUID request ID is used as the trace ID."""
+        assert RequestTrace(REQUEST_ID).trace_id == REQUEST_ID.replace("-", "")
+        assert len(RequestTrace("custom-id").trace_id) == 32
+
+    def test_timings(self) -> None:
+        """Test the latency breakdown reported to clients."""
+        trace = RequestTrace(REQUEST_ID)
+        with trace_scope(trace):
+            with span("generate_sql"), stage_timer(None, Stage.PROMPT_BUILD, "db"):
+                pass
+            with stage_timer(None, Stage.EXECUTE, "db"):
+                pass
+        trace.finish("query")
+
+        timings = trace.timings()
+
+        assert [s.name for s in timings.spans] == ["generate_sql", "prompt_build", "execute"]
+        assert timings.spans[0].parent is None
+        assert timings.spans[1].parent == "generate_sql"
+        assert timings.spans[2].attributes == {"database": "db"}
+        assert all(s.start_ms <= timings.total_ms for s in timings.spans)
+        assert timings.total_ms >= sum(s.duration_ms for s in timings.spans if s.parent is None)
+
+    def test_to_otlp(self) -> None:
+        """Test OTLP/JSON conversion."""
+        trace = RequestTrace(REQUEST_ID)
+        with trace_scope(trace), span("execute", rows=3, cached=True, ratio=0.5):
+            pass
+        trace.finish("query", database="db")
+
+        document = trace.to_otlp()
+
+        resource_spans = document["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "pg-mcp"}}
+        ]
+        spans = {s["name"]: s for s in resource_spans["scopeSpans"][0]["spans"]}
+        assert spans["query"]["parentSpanId"] == ""
+        assert spans["execute"]["parentSpanId"] == spans["query"]["spanId"]
+        assert spans["execute"]["traceId"] == REQUEST_ID.replace("-", "")
+        assert int(spans["execute"]["endTimeUnixNano"]) >= int(
+            spans["execute"]["startTimeUnixNano"]
+        )
+        assert spans["execute"]["attributes"] == [
+            {"key": "rows", "value": {"intValue": "3"}},
+            {"key": "cached", "value": {"boolValue": True}},
+            {"key": "ratio", "value": {"doubleValue": 0.5}},
+        ]
+
+
+class TestJsonLinesSpanExporter:
+    """Test suite for JsonLinesSpanExporter."""
+
+    def _trace(self) -> RequestTrace:
+        trace = RequestTrace(REQUEST_ID)
+        with trace_scope(trace), span("execute"):
+            pass
+        trace.finish("query")
+        return trace
+
+    def test_export_to_stream(self) -> None:
+        """Test that each trace is written as one JSON line."""
+        stream = io.StringIO()
+        exporter = JsonLinesSpanExporter(stream=stream)
+
+        exporter.export(self._trace())
+        exporter.export(self._trace())
+        exporter.close()
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2
+        assert "resourceSpans" in json.loads(lines[0])
+
+    def test_export_to_file(self, tmp_path: Path) -> None:
+        """Test that traces are appended to the trace file."""
+        path = tmp_path / "traces.jsonl"
+        exporter = JsonLinesSpanExporter(path=path)
+
+        exporter.export(self._trace())
+        exporter.close()
+
+        document = json.loads(path.read_text())
+        spans = document["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert [s["name"] for s in spans] == ["execute", "query"]
+
+    def test_export_does_not_wait_for_writes(self) -> None:
+        """Test that a blocked stream does not block export."""
+        writing = threading.Event()
+        unblocked = threading.Event()
+
+        class BlockingStream(io.StringIO):
+            def write(self, text: str) -> int:
+                writing.set()
+                unblocked.wait()
+                return super().write(text)
+
+        stream = BlockingStream()
+        exporter = JsonLinesSpanExporter(stream=stream, max_pending=1)
+
+        exporter.export(self._trace())
+        assert writing.wait(timeout=5)
+        exporter.export(self._trace())
+        exporter.export(self._trace())
+
+        # The writer holds one trace, the queue one more; the third is dropped
+        assert stream.getvalue() == ""
+        assert exporter.dropped == 1
+        unblocked.set()
+        exporter.close()
+        assert len(stream.getvalue().splitlines()) == 2
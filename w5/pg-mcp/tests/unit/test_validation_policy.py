@@ -0,0 +1,96 @@
+"""Unit tests for the result validation policy."""
+
+import pytest
+
+from pg_mcp.config.settings import SecurityConfig, ValidationConfig
+from pg_mcp.services.sql_validator import SQLValidator
+from pg_mcp.services.validation_policy import (
+    ValidationDecision,
+    ValidationPolicy,
+    top_n,
+)
+
+
+@pytest.fixture
+def policy() -> ValidationPolicy:
+    """Create a policy validating every request the heuristics let through."""
+    return ValidationPolicy(ValidationConfig(), SQLValidator(SecurityConfig()))
+
+
+class TestHeuristics:
+    """Test suite for the local heuristics."""
+
+    @pytest.mark.parametrize(
+        ("question", "expected"),
+        [
+            ("Top 10 customers by revenue", {10}),
+            ("show the first 5 orders", {5}),
+            ("The 3 largest invoices", {3}),
+            ("销售额前10的产品", {10}),
+            ("前 20 名客户", {20}),
+            ("How many users signed up in 2024?", set()),
+        ],
+    )
+    def test_top_n(self, question: str, expected: set[int]) -> None:
+        """Test that the requested row count is extracted from questions."""
+        assert top_n(question) == expected
+
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            ("SELECT COUNT(*) FROM users", True),
+            ("SELECT sum(amount) AS total, avg(amount) FROM orders WHERE paid", True),
+            ("SELECT status, COUNT(*) FROM users GROUP BY status", False),
+            ("SELECT id FROM users", False),
+            ("SELECT id, COUNT(*) OVER () FROM users", False),
+            ("SELECT unnest(tags), COUNT(*) FROM users", False),
+            ("SELECT COUNT(*) FROM users; SELECT 1", False),
+        ],
+    )
+    def test_single_row_aggregate(self, policy: ValidationPolicy, sql: str, expected: bool) -> None:
+        """Test recognition of aggregates returning a single row."""
+        decision = policy.decide("How many?", sql, 1, "r1")
+        assert (decision == ValidationDecision.SINGLE_ROW_AGGREGATE) is expected
+
+
+class TestValidationPolicy:
+    """Test suite for ValidationPolicy."""
+
+    def test_empty_result(self, policy: ValidationPolicy) -> None:
+        """Test that empty results are not validated."""
+        decision = policy.decide("List admins", "SELECT * FROM users", 0, "r1")
+        assert decision == ValidationDecision.EMPTY_RESULT
+
+    def test_single_row_aggregate(self, policy: ValidationPolicy) -> None:
+        """Test that single-row aggregates are not validated."""
+        decision = policy.decide("How many users?", "SELECT COUNT(*) FROM users", 1, "r1")
+        assert decision == ValidationDecision.SINGLE_ROW_AGGREGATE
+
+    def test_top_n_row_count(self, policy: ValidationPolicy) -> None:
+        """Test that results with the row count asked for are not validated."""
+        sql = "SELECT name FROM products ORDER BY sales DESC LIMIT 5"
+        assert policy.decide("Top 5 products", sql, 5, "r1") == ValidationDecision.TOP_N
+        assert policy.decide("Top 5 products", sql, 4, "r1") == ValidationDecision.VALIDATE
+
+    def test_heuristics_disabled(self) -> None:
+        """Test that every sampled result is validated without heuristics."""
+        policy = ValidationPolicy(ValidationConfig(heuristics=False))
+        assert policy.decide("List admins", "SELECT 1", 0, "r1") == ValidationDecision.VALIDATE
+
+    def test_without_sql_validator(self) -> None:
+        """Test that aggregates are validated when SQL cannot be inspected."""
+        policy = ValidationPolicy(ValidationConfig())
+        decision = policy.decide("How many users?", "SELECT COUNT(*) FROM users", 1, "r1")
+        assert decision == ValidationDecision.VALIDATE
+
+    @pytest.mark.parametrize("rate", [0.0, 0.25, 0.5, 1.0])
+    def test_sample_rate(self, rate: float) -> None:
+        """Test that about sample_rate of requests are validated, consistently."""
+        policy = ValidationPolicy(ValidationConfig(sample_rate=rate))
+        request_ids = [f"request-{i}" for i in range(2000)]
+
+        decisions = [policy.decide("List users", "SELECT 1", 2, r) for r in request_ids]
+
+        validated = decisions.count(ValidationDecision.VALIDATE) / len(decisions)
+        assert abs(validated - rate) < 0.05
+        assert decisions == [policy.decide("List users", "SELECT 1", 2, r) for r in request_ids]
@@ -0,0 +1,214 @@
+"""Unit tests for background database warm-up."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pg_mcp.config.settings import DatabaseConfig, StartupConfig
+from pg_mcp.models.errors import DatabaseConnectionError, SchemaLoadError
+from pg_mcp.models.schema import DatabaseSchema, TableInfo
+from pg_mcp.services.warmup import DatabaseWarmup
+
+
+class FakePool:
+    """Stand-in for an uninitialized asyncpg pool; awaiting it connects."""
+
+    def __init__(self, error: Exception | None = None, delay: float = 0.0) -> None:
+        self.error = error
+        self.delay = delay
+        self.awaited = 0
+
+    def __await__(self) -> Any:
+        return self._initialize().__await__()
+
+    async def _initialize(self) -> "FakePool":
+        self.awaited += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self
+
+
+@pytest.fixture
+def schema() -> DatabaseSchema:
+    """Create a one-table schema."""
+    return DatabaseSchema(database_name="db", tables=[TableInfo(table_name="users")])
+
+
+@pytest.fixture
+def schema_cache(schema: DatabaseSchema) -> MagicMock:
+    """Create a schema cache mock without snapshots."""
+    cache = MagicMock()
+    cache.restore_snapshot = AsyncMock(return_value=None)
+    cache.load = AsyncMock(return_value=schema)
+    return cache
+
+
+def make_warmup(
+    pools: dict[str, Any],
+    schema_cache: MagicMock,
+    **startup: Any,
+) -> DatabaseWarmup:
+    """Create a warm-up for the given pools."""
+    return DatabaseWarmup(
+        [DatabaseConfig(name=name) for name in pools],
+        pools,
+        schema_cache,
+        StartupConfig(**startup),
+    )
+
+
+class TestDatabaseWarmup:
+    """Test suite for DatabaseWarmup."""
+
+    @pytest.mark.asyncio
+    async def test_start_does_not_block(self, schema_cache: MagicMock) -> None:
+        """Test that start returns before any database is connected."""
+        pool = FakePool(delay=10.0)
+        warmup = make_warmup({"db": pool}, schema_cache)
+
+        warmup.start()
+        assert warmup.get_status()["databases"]["db"]["state"] == "pending"
+
+        await asyncio.sleep(0)
+        assert warmup.get_status()["databases"]["db"]["state"] == "connecting"
+        await warmup.stop()
+
+    @pytest.mark.asyncio
+    async def test_wait_ready_loads_schema(self, schema_cache: MagicMock) -> None:
+        """Test that a database becomes ready once connected and introspected."""
+        pool = FakePool()
+        warmup = make_warmup({"db": pool}, schema_cache)
+        warmup.start()
+
+        await warmup.wait_ready("db")
+
+        status = warmup.get_status()
+        assert status["ready"] is True
+        assert status["states"] == {"ready": 1}
+        assert status["databases"]["db"]["schema_source"] == "introspection"
+        assert status["databases"]["db"]["tables"] == 1
+        schema_cache.load.assert_awaited_once_with("db", pool)
+
+    @pytest.mark.asyncio
+    async def test_schema_restored_from_snapshot(
+        self, schema_cache: MagicMock, schema: DatabaseSchema
+    ) -> None:
+        """Test that a snapshot is preferred over introspection."""
+        schema_cache.restore_snapshot.return_value = schema
+        warmup = make_warmup({"db": FakePool()}, schema_cache)
+
+        await warmup.wait_ready("db")
+
+        assert warmup.get_status()["databases"]["db"]["schema_source"] == "snapshot"
+        schema_cache.load.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_ready_is_per_database(self, schema_cache: MagicMock) -> None:
+        """Test that a ready database does not wait for a slow one."""
+        warmup = make_warmup({"fast": FakePool(), "slow": FakePool(delay=10.0)}, schema_cache)
+        warmup.start()
+
+        await asyncio.wait_for(warmup.wait_ready("fast"), timeout=1.0)
+
+        status = warmup.get_status()
+        assert status["ready"] is False
+        assert status["states"] == {"ready": 1, "connecting": 1}
+        await warmup.stop()
+
+    @pytest.mark.asyncio
+    async def test_wait_ready_timeout(self, schema_cache: MagicMock) -> None:
+        """Test that waiting gives up without cancelling the warm-up."""
+        pool = FakePool(delay=0.2)
+        warmup = make_warmup({"db": pool}, schema_cache, ready_timeout=0.01)
+        warmup.start()
+
+        with pytest.raises(SchemaLoadError, match="still warming up") as exc_info:
+            await warmup.wait_ready("db")
+        assert exc_info.value.details["state"] == "connecting"
+
+        await warmup.wait_ready("db", timeout=1.0)
+        assert pool.awaited == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_failure_replaces_pool(self, schema_cache: MagicMock) -> None:
+        """Test that a failed pool is swapped out and retried on demand."""
+        failed = FakePool(error=OSError("connection refused"))
+        replacement = FakePool()
+        pools: dict[str, Any] = {"db": failed}
+        executor = MagicMock(pool=failed)
+        warmup = DatabaseWarmup(
+            [DatabaseConfig(name="db")],
+            pools,
+            schema_cache,
+            StartupConfig(retry_delay=0.0),
+            sql_executors={"db": executor},
+        )
+
+        with (
+            patch("pg_mcp.services.warmup.build_pool", return_value=replacement),
+            pytest.raises(DatabaseConnectionError, match="connection refused"),
+        ):
+            await warmup.wait_all()
+
+        assert pools["db"] is replacement
+        assert executor.pool is replacement
+        assert warmup.get_status()["databases"]["db"]["failed_phase"] == "connecting"
+
+        await warmup.wait_ready("db")
+        assert warmup.get_status()["databases"]["db"]["attempts"] == 2
+        assert replacement.awaited == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_not_retried_within_delay(self, schema_cache: MagicMock) -> None:
+        """Test that a recent failure is reported without a new attempt."""
+        schema_cache.load.side_effect = RuntimeError("catalog unavailable")
+        pool = FakePool()
+        warmup = make_warmup({"db": pool}, schema_cache, retry_delay=60.0)
+        warmup.start()
+
+        with pytest.raises(SchemaLoadError, match="catalog unavailable"):
+            await warmup.wait_ready("db")
+        with pytest.raises(SchemaLoadError) as exc_info:
+            await warmup.wait_ready("db")
+
+        assert exc_info.value.details["attempts"] == 1
+        assert exc_info.value.details["retry_in_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_schema_retry_keeps_pool(
+        self, schema_cache: MagicMock, schema: DatabaseSchema
+    ) -> None:
+        """Test that retrying a failed schema load does not reconnect."""
+        schema_cache.load.side_effect = [RuntimeError("catalog unavailable"), schema]
+        pool = FakePool()
+        warmup = make_warmup({"db": pool}, schema_cache, retry_delay=0.0)
+
+        with pytest.raises(SchemaLoadError):
+            await warmup.wait_ready("db")
+        await warmup.wait_ready("db")
+
+        assert pool.awaited == 1
+        assert warmup.is_ready() is True
+
+    @pytest.mark.asyncio
+    async def test_unknown_database_is_ready(self, schema_cache: MagicMock) -> None:
+        """Test that databases not managed by the warm-up are not waited on."""
+        warmup = make_warmup({"db": FakePool()}, schema_cache)
+
+        await warmup.wait_ready("other")
+
+        assert warmup.get_status()["databases"]["db"]["state"] == "pending"
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_pending(self, schema_cache: MagicMock) -> None:
+        """Test that stop cancels warm-up still in progress."""
+        warmup = make_warmup({"db": FakePool(delay=10.0)}, schema_cache)
+        warmup.start()
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(warmup.stop(), timeout=1.0)
+
+        assert warmup.is_ready() is False